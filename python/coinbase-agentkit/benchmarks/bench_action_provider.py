@@ -0,0 +1,53 @@
+"""Benchmark action provider construction.
+
+Compares building providers with the class-level action registry against the
+previous approach of scanning ``dir(self)`` on every instance.
+
+Run with:
+
+    poetry run python benchmarks/bench_action_provider.py
+"""
+
+import timeit
+
+from coinbase_agentkit.action_providers import (
+    CompoundActionProvider,
+    ERC20ActionProvider,
+    WalletActionProvider,
+    WowActionProvider,
+)
+
+ITERATIONS = 20_000
+
+
+def scan_actions(provider):
+    """Collect actions the way ActionProvider.__init__ used to, via dir() and getattr()."""
+    actions = []
+    for method_name in dir(provider):
+        method = getattr(provider, method_name)
+        if hasattr(method, "_action_metadata"):
+            actions.append(method._action_metadata)
+    return actions
+
+
+def main():
+    """Run the benchmark and print per-construction timings."""
+    for provider_class in (
+        WalletActionProvider,
+        ERC20ActionProvider,
+        CompoundActionProvider,
+        WowActionProvider,
+    ):
+        registry = timeit.timeit(provider_class, number=ITERATIONS)
+        scanning = timeit.timeit(lambda cls=provider_class: scan_actions(cls()), number=ITERATIONS)
+
+        print(
+            f"{provider_class.__name__:<24} "
+            f"registry: {registry / ITERATIONS * 1e6:7.2f} us  "
+            f"dir() scan: {scanning / ITERATIONS * 1e6:7.2f} us  "
+            f"speedup: {scanning / registry:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark scanning the Compound positions of many accounts.
+
+Compares loading each account's position on its own, one multicall per account,
+against ``scan_positions``, which reads every account's balances in chunked
+multicalls sent concurrently. Reads go through a fake wallet that answers each
+multicall after a fixed round-trip latency, and the market and token metadata
+registries are warmed first, so only the per-scan RPC cost is measured.
+
+Run with:
+
+    poetry run python benchmarks/bench_compound_scanner.py
+"""
+
+import contextlib
+import time
+
+from coinbase_agentkit.action_providers.compound.position import CompoundPositionSnapshot
+from coinbase_agentkit.action_providers.compound.scanner import scan_positions
+
+ACCOUNTS = [f"0x{i:040x}" for i in range(1, 1_001)]
+COMET = "0x46e6b214b524310239732D51387075E0e70970bf"
+ASSETS = [f"0x{i:040x}" for i in range(0x1000, 0x1005)]
+
+# Simulated time for one multicall to reach the node and return
+ROUND_TRIP = 0.05
+
+
+class FakeNetwork:
+    """The network of the fake wallet."""
+
+    chain_id = "8453"
+
+
+class FakeWallet:
+    """A wallet that answers Comet, price feed and token reads after a fixed latency."""
+
+    def __init__(self):
+        """Initialize the fake wallet."""
+        self.address = ACCOUNTS[0]
+
+    def get_address(self):
+        """Get the account whose position is loaded."""
+        return self.address
+
+    def get_network(self):
+        """Get the network."""
+        return FakeNetwork()
+
+    def get_block_number(self):
+        """Get the latest block number."""
+        return 1
+
+    def read_snapshot(self):
+        """Pin reads to a block; a no-op here."""
+        return contextlib.nullcontext()
+
+    def read_contract_many(self, calls, block_identifier="latest"):
+        """Answer every call after one round trip."""
+        time.sleep(ROUND_TRIP)
+        return [self._answer(call) for call in calls]
+
+    def _answer(self, call):
+        """Answer a single call."""
+        name = call.function_name
+        if name == "numAssets":
+            return len(ASSETS)
+        if name == "baseToken":
+            return "0x" + "ba" * 20
+        if name == "baseTokenPriceFeed":
+            return "0x" + "fe" * 20
+        if name == "getAssetInfo":
+            index = call.args[0]
+            if index >= len(ASSETS):
+                return None
+            return (index, ASSETS[index], ASSETS[index], 10**18, 8 * 10**17, 85 * 10**16, 0, 0)
+        if name == "borrowBalanceOf":
+            return 1_000 * 10**6
+        if name == "collateralBalanceOf":
+            return 10**18
+        if name == "latestRoundData":
+            return (0, 2_000 * 10**8, 0, 0, 0)
+        return {"name": "Token", "symbol": "TKN", "decimals": 6}[name]
+
+
+def main():
+    """Run the benchmark and print the time per scan."""
+    wallet = FakeWallet()
+    scan_positions(wallet, ACCOUNTS[:1], [COMET])
+
+    start = time.perf_counter()
+    for account in ACCOUNTS:
+        wallet.address = account
+        CompoundPositionSnapshot.load(wallet, COMET).health_ratio()
+    one_by_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scan = scan_positions(wallet, ACCOUNTS, [COMET])
+    scanned = time.perf_counter() - start
+
+    print(
+        f"{len(scan)} positions  "
+        f"one by one: {one_by_one:6.2f} s  "
+        f"scanner: {scanned:6.2f} s  "
+        f"speedup: {one_by_one / scanned:5.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
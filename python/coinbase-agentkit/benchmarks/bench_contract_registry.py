@@ -0,0 +1,88 @@
+"""Benchmark calldata encoding and contract reads.
+
+Compares the shared contract ABI registry against building a fresh web3 contract
+object for every call, which is what action providers and ``read_contract`` used
+to do. Reads go through a web3 instance whose ``eth_call`` is answered locally,
+so only client-side overhead is measured.
+
+Run with:
+
+    poetry run python benchmarks/bench_contract_registry.py
+"""
+
+import timeit
+
+from web3 import Web3
+from web3.providers import BaseProvider
+
+from coinbase_agentkit.action_providers.compound.constants import COMET_ABI
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.action_providers.wow.constants import WOW_ABI
+from coinbase_agentkit.contracts import encode_function_data
+from coinbase_agentkit.wallet_providers.multicall import read_contract
+
+ITERATIONS = 2_000
+
+ADDRESS = "0x1234567890123456789012345678901234567890"
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+ENCODE_CASES = [
+    ("erc20 transfer", ERC20_ABI, "transfer", [ADDRESS, 1000]),
+    ("comet supply", COMET_ABI, "supply", [ADDRESS, 1000]),
+    ("wow buy", WOW_ABI, "buy", [ADDRESS, ADDRESS, ZERO_ADDRESS, "", 0, 1000, 0]),
+]
+
+
+class LocalCallProvider(BaseProvider):
+    """A provider that answers every request with an encoded uint256."""
+
+    def make_request(self, method, params):
+        """Return a fixed eth_call result."""
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x" + (1000).to_bytes(32, "big").hex()}
+
+
+def report(label, before, after):
+    """Print per-call timings for one case."""
+    print(
+        f"{label:<24} "
+        f"contract object: {before / ITERATIONS * 1e6:8.2f} us  "
+        f"registry: {after / ITERATIONS * 1e6:8.2f} us  "
+        f"speedup: {before / after:5.1f}x"
+    )
+
+
+def main():
+    """Run the benchmark and print per-call timings."""
+    print("encode")
+    for label, abi, function_name, args in ENCODE_CASES:
+        before = timeit.timeit(
+            lambda abi=abi, fn=function_name, args=args: (
+                Web3().eth.contract(address=ADDRESS, abi=abi).encode_abi(fn, args=args)
+            ),
+            number=ITERATIONS,
+        )
+        after = timeit.timeit(
+            lambda abi=abi, fn=function_name, args=args: encode_function_data(abi, fn, args),
+            number=ITERATIONS,
+        )
+        report(label, before, after)
+
+    print("read")
+    w3 = Web3(LocalCallProvider())
+    before = timeit.timeit(
+        lambda: (
+            w3.eth.contract(address=ADDRESS, abi=ERC20_ABI)
+            .functions["balanceOf"](ADDRESS)
+            .call(block_identifier="latest")
+        ),
+        number=ITERATIONS,
+    )
+    after = timeit.timeit(
+        lambda: read_contract(w3, ADDRESS, ERC20_ABI, "balanceOf", [ADDRESS]),
+        number=ITERATIONS,
+    )
+    report("erc20 balanceOf", before, after)
+
+
+if __name__ == "__main__":
+    main()
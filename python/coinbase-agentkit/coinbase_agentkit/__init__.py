@@ -2,6 +2,7 @@
 
 from .action_providers import (
     Action,
+    ActionCatalog,
     ActionProvider,
     basename_action_provider,
     cdp_api_action_provider,
@@ -21,6 +22,7 @@ from .agentkit import AgentKit, AgentKitConfig
 from .wallet_providers import (
     CdpWalletProvider,
     CdpWalletProviderConfig,
+    ContractCall,
     EthAccountWalletProvider,
     EthAccountWalletProviderConfig,
     EvmWalletProvider,
@@ -33,6 +35,7 @@ __all__ = [
     "AgentKit",
     "AgentKitConfig",
     "Action",
+    "ActionCatalog",
     "ActionProvider",
     "create_action",
     "basename_action_provider",
@@ -40,6 +43,7 @@ __all__ = [
     "CdpWalletProvider",
     "CdpWalletProviderConfig",
     "EvmWalletProvider",
+    "ContractCall",
     "EthAccountWalletProvider",
     "EthAccountWalletProviderConfig",
     "erc20_action_provider",
@@ -1,5 +1,6 @@
 """Action providers for AgentKit."""
 
+from .action_catalog import ActionCatalog
 from .action_decorator import create_action
 from .action_provider import Action, ActionProvider
 from .basename.basename_action_provider import (
@@ -23,6 +24,7 @@ from .wow.wow_action_provider import WowActionProvider, wow_action_provider
 
 __all__ = [
     "Action",
+    "ActionCatalog",
     "ActionProvider",
     "create_action",
     "BasenameActionProvider",
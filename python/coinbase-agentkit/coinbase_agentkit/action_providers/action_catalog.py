@@ -0,0 +1,88 @@
+"""Indexed catalog of the actions available to an agent."""
+
+from typing import Any
+
+from .action_provider import Action
+
+
+class ActionCatalog:
+    """An immutable, name-indexed collection of actions.
+
+    The catalog preserves the order actions were provided in and resolves action
+    names in constant time. When several actions share a name, the first one wins.
+    """
+
+    def __init__(self, actions: list[Action]):
+        """Initialize the catalog.
+
+        Args:
+            actions (list[Action]): The actions to index.
+
+        """
+        self._actions = tuple(actions)
+        self._by_name: dict[str, Action] = {}
+        for action in self._actions:
+            self._by_name.setdefault(action.name, action)
+
+    @property
+    def actions(self) -> tuple[Action, ...]:
+        """The actions in the catalog, in provider order."""
+        return self._actions
+
+    def __len__(self) -> int:
+        """Get the number of actions in the catalog."""
+        return len(self._actions)
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether an action with the given name is in the catalog."""
+        return name in self._by_name
+
+    def get(self, name: str) -> Action:
+        """Get an action by name.
+
+        Args:
+            name (str): The name of the action.
+
+        Returns:
+            Action: The action with the given name.
+
+        Raises:
+            ValueError: If no action with the given name exists
+
+        """
+        try:
+            return self._by_name[name]
+        except KeyError:
+            raise ValueError(f"Action {name} not found") from None
+
+    def invoke(self, name: str, args: dict[str, Any]) -> Any:
+        """Invoke an action by name.
+
+        Args:
+            name (str): The name of the action.
+            args (dict[str, Any]): The input arguments for the action.
+
+        Returns:
+            Any: The result of the action.
+
+        Raises:
+            ValueError: If no action with the given name exists
+
+        """
+        return self.get(name).invoke(args)
+
+    async def ainvoke(self, name: str, args: dict[str, Any]) -> Any:
+        """Invoke an action by name asynchronously.
+
+        Args:
+            name (str): The name of the action.
+            args (dict[str, Any]): The input arguments for the action.
+
+        Returns:
+            Any: The result of the action.
+
+        Raises:
+            ValueError: If no action with the given name exists
+
+        """
+        return await self.get(name).ainvoke(args)
@@ -1,30 +1,85 @@
 """Base class for action providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import Generic, TypeVar
+from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from ..network import Network
 from ..wallet_providers import WalletProvider
+from .action_decorator import ActionMetadata
 
 TWalletProvider = TypeVar("TWalletProvider", bound=WalletProvider)
 
 
+def run_coroutine_sync(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion from synchronous code.
+
+    If the calling thread is already running an event loop, the coroutine is run on
+    a separate thread with its own event loop.
+
+    Args:
+        coroutine: The coroutine to run.
+
+    Returns:
+        Any: The result of the coroutine.
+
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
 class Action(BaseModel):
-    """Represents an action that can be performed by an agent."""
+    """Represents an action that can be performed by an agent.
+
+    ``invoke`` runs the action synchronously and ``ainvoke`` returns an awaitable.
+    If no ``ainvoke`` is given, the synchronous ``invoke`` is run in a worker thread.
+    """
 
     name: str
     description: str
     args_schema: type[BaseModel] | None = None
     invoke: Callable = Field(..., exclude=True)
+    ainvoke: Callable | None = Field(None, exclude=True)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    @model_validator(mode="after")
+    def _default_ainvoke(self) -> "Action":
+        if self.ainvoke is None:
+            invoke = self.invoke
+            self.ainvoke = lambda args: asyncio.to_thread(invoke, args)
+        return self
+
 
 class ActionProvider(Generic[TWalletProvider], ABC):
-    """Base class for all action providers."""
+    """Base class for all action providers.
+
+    Methods decorated with ``create_action`` are collected once, when the subclass is
+    created, into an immutable registry shared by all instances of that class.
+    """
+
+    _actions: tuple[ActionMetadata, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Collect the actions defined on a subclass and its bases."""
+        super().__init_subclass__(**kwargs)
+
+        actions = []
+        for attribute_name in dir(cls):
+            action_metadata = getattr(getattr(cls, attribute_name, None), "_action_metadata", None)
+            if isinstance(action_metadata, ActionMetadata):
+                actions.append(action_metadata)
+
+        cls._actions = tuple(actions)
 
     def __init__(
         self, name: str, action_providers: list["ActionProvider[TWalletProvider]"]
@@ -32,34 +87,46 @@ class ActionProvider(Generic[TWalletProvider], ABC):
         self.name = name
         self.action_providers = action_providers
 
-        for method_name in dir(self):
-            method = getattr(self, method_name)
-            if hasattr(method, "_add_to_actions"):
-                method._add_to_actions(self)
-
     def get_actions(self, wallet_provider: TWalletProvider) -> list[Action]:
         """Get all actions from this provider and its sub-providers."""
         actions: list[Action] = []
         action_providers = [self, *self.action_providers]
 
         for provider in action_providers:
-            provider_actions = getattr(provider, "_actions", [])
-            for action_metadata in provider_actions:
-                actions.append(
-                    Action(
-                        name=action_metadata.name,
-                        description=action_metadata.description,
-                        args_schema=action_metadata.args_schema,
-                        invoke=lambda args, m=action_metadata, p=provider: (
-                            m.invoke(p, wallet_provider, args)
-                            if m.wallet_provider
-                            else m.invoke(p, args)
-                        ),
-                    )
-                )
+            for action_metadata in provider._actions:
+                actions.append(self._bind_action(provider, action_metadata, wallet_provider))
 
         return actions
 
+    @staticmethod
+    def _bind_action(
+        provider: "ActionProvider[TWalletProvider]",
+        action_metadata: ActionMetadata,
+        wallet_provider: TWalletProvider,
+    ) -> Action:
+        """Create an Action that invokes an action method on the given provider."""
+
+        def call(args: dict[str, Any]) -> Any:
+            if action_metadata.wallet_provider:
+                return action_metadata.invoke(provider, wallet_provider, args)
+            return action_metadata.invoke(provider, args)
+
+        if action_metadata.is_async:
+            return Action(
+                name=action_metadata.name,
+                description=action_metadata.description,
+                args_schema=action_metadata.args_schema,
+                invoke=lambda args: run_coroutine_sync(call(args)),
+                ainvoke=call,
+            )
+
+        return Action(
+            name=action_metadata.name,
+            description=action_metadata.description,
+            args_schema=action_metadata.args_schema,
+            invoke=call,
+        )
+
     @abstractmethod
     def supports_network(self, network: Network) -> bool:
         """Check if this provider supports the given network."""
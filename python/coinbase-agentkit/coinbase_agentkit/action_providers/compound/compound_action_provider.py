@@ -3,13 +3,13 @@
 from decimal import Decimal
 from typing import Any
 
-from web3 import Web3
-
+from ...contracts import encode_function_data
 from ...network import Network
-from ...wallet_providers import EvmWalletProvider
+from ...wallet_providers import EvmWalletProvider, TransactionPipelineError
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
-from ..erc20.constants import ERC20_ABI
+from ..erc20.token_metadata import get_token_decimals, get_token_symbol
+from ..erc20.utils import get_balance_and_allowance, send_with_approval
 from .constants import (
     ASSET_ADDRESSES,
     COMET_ABI,
@@ -18,6 +18,7 @@ from .constants import (
 )
 from .schemas import (
     CompoundBorrowSchema,
+    CompoundMaxAmountSchema,
     CompoundPortfolioSchema,
     CompoundRepaySchema,
     CompoundSupplySchema,
@@ -32,17 +33,24 @@ from .utils import (
     get_health_ratio_after_borrow,
     get_health_ratio_after_withdraw,
     get_portfolio_details_markdown,
-    get_token_balance,
-    get_token_decimals,
-    get_token_symbol,
+    get_position_snapshot,
 )
+from .what_if import HealthRatioEngine
 
 
 class CompoundActionProvider(ActionProvider[EvmWalletProvider]):
     """Provides actions for interacting with Compound protocol."""
 
-    def __init__(self):
+    def __init__(self, approve_max: bool = False):
+        """Initialize the Compound action provider.
+
+        Args:
+            approve_max (bool): Whether to approve Compound for the maximum amount on the first
+                supply or repay of a token, so later ones need no approval transaction.
+
+        """
         super().__init__("compound", [])
+        self.approve_max = approve_max
 
     def _get_comet_address(self, network: Network) -> str:
         """Get the appropriate Comet address based on network."""
@@ -91,7 +99,9 @@ Important notes:
             amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
 
             # Check wallet balance before proceeding
-            wallet_balance = get_token_balance(wallet_provider, token_address)
+            wallet_balance, allowance = get_balance_and_allowance(
+                wallet_provider, token_address, comet_address
+            )
             if wallet_balance < amount_atomic:
                 human_balance = format_amount_from_decimals(wallet_balance, decimals)
                 return f"Error: Insufficient balance. You have {human_balance}, but trying to supply {validated_args.amount}"
@@ -99,36 +109,28 @@ Important notes:
             # Get current health ratio for reference
             current_health = get_health_ratio(wallet_provider, comet_address)
 
-            # Approve Compound to spend tokens
-            token_contract = Web3().eth.contract(address=token_address, abi=ERC20_ABI)
-            encoded_data = token_contract.encode_abi("approve", args=[comet_address, amount_atomic])
-            params = {
-                "to": token_address,
-                "data": encoded_data,
-            }
-            try:
-                tx_hash = wallet_provider.send_transaction(params)
-                wallet_provider.wait_for_transaction_receipt(tx_hash)
-            except Exception as e:
-                return f"Error approving token: {e!s}"
-
             # Supply tokens to Compound
-            contract = Web3().eth.contract(address=comet_address, abi=COMET_ABI)
-            encoded_data = contract.encode_abi(
-                "supply",
-                args=[token_address, amount_atomic],
-            )
-
-            params = {
+            supply_params = {
                 "to": comet_address,
-                "data": encoded_data,
+                "data": encode_function_data(COMET_ABI, "supply", [token_address, amount_atomic]),
             }
 
+            # Approve Compound to spend tokens first if the allowance does not cover the amount
             try:
-                tx_hash = wallet_provider.send_transaction(params)
-                wallet_provider.wait_for_transaction_receipt(tx_hash)
-            except Exception as e:
+                results = send_with_approval(
+                    wallet_provider,
+                    token_address,
+                    comet_address,
+                    amount_atomic,
+                    supply_params,
+                    approve_max=self.approve_max,
+                    allowance=allowance,
+                )
+            except TransactionPipelineError as e:
+                if e.failed_index < len(e.results) - 1:
+                    return f"Error approving token: {e!s}"
                 return f"Error executing transaction: {e!s}"
+            tx_hash = results[-1].transaction_hash
 
             # Get new health ratio
             new_health = get_health_ratio(wallet_provider, comet_address)
@@ -188,27 +190,29 @@ Important notes:
             decimals = get_token_decimals(wallet_provider, token_address)
             amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
 
-            # Check that there is enough balance supplied to withdraw amount
-            collateral_balance = get_collateral_balance(
-                wallet_provider, comet_address, token_address
-            )
-            if amount_atomic > collateral_balance:
-                human_balance = format_amount_from_decimals(collateral_balance, decimals)
-                return f"Error: Insufficient balance. Trying to withdraw {validated_args.amount}, but only have {human_balance} supplied"
+            with wallet_provider.read_snapshot():
+                # Check that there is enough balance supplied to withdraw amount
+                collateral_balance = get_collateral_balance(
+                    wallet_provider, comet_address, token_address
+                )
+                if amount_atomic > collateral_balance:
+                    human_balance = format_amount_from_decimals(collateral_balance, decimals)
+                    return f"Error: Insufficient balance. Trying to withdraw {validated_args.amount}, but only have {human_balance} supplied"
 
-            # Check if position would be healthy after withdrawal
-            projected_health_ratio = get_health_ratio_after_withdraw(
-                wallet_provider, comet_address, token_address, amount_atomic
-            )
+                # Check if position would be healthy after withdrawal
+                projected_health_ratio = get_health_ratio_after_withdraw(
+                    wallet_provider, comet_address, token_address, amount_atomic
+                )
 
-            if projected_health_ratio < 1:
-                return f"Error: Withdrawing {validated_args.amount} would result in an unhealthy position. Health ratio would be {projected_health_ratio:.2f}"
+                if projected_health_ratio < 1:
+                    return f"Error: Withdrawing {validated_args.amount} would result in an unhealthy position. Health ratio would be {projected_health_ratio:.2f}"
+
+                # Get current health ratio for reference
+                current_health = get_health_ratio(wallet_provider, comet_address)
 
             # Withdraw from Compound
-            contract = Web3().eth.contract(address=comet_address, abi=COMET_ABI)
-            encoded_data = contract.encode_abi(
-                "withdraw",
-                args=[token_address, amount_atomic],
+            encoded_data = encode_function_data(
+                COMET_ABI, "withdraw", [token_address, amount_atomic]
             )
 
             params = {
@@ -222,12 +226,10 @@ Important notes:
             except Exception as e:
                 return f"Error executing transaction: {e!s}"
 
-            # Get current health ratio for reference
-            current_health = get_health_ratio(wallet_provider, comet_address)
-
-            # Get new health ratio
-            new_health = get_health_ratio(wallet_provider, comet_address)
-            token_symbol = get_token_symbol(wallet_provider, token_address)
+            with wallet_provider.read_snapshot():
+                # Get new health ratio
+                new_health = get_health_ratio(wallet_provider, comet_address)
+                token_symbol = get_token_symbol(wallet_provider, token_address)
 
             # Format health ratio strings and compose the final message
             if current_health == Decimal("Infinity") and new_health == Decimal("Infinity"):
@@ -275,31 +277,31 @@ Important notes:
         try:
             validated_args = CompoundBorrowSchema(**args)
             comet_address = self._get_comet_address(wallet_provider.get_network())
-            base_token_address = get_base_token_address(
-                wallet_provider.get_network(), comet_address
-            )
+            base_token_address = get_base_token_address(wallet_provider, comet_address)
             base_token_decimals = get_token_decimals(wallet_provider, base_token_address)
 
             # Convert human-readable amount to atomic amount
             amount_atomic = format_amount_with_decimals(validated_args.amount, base_token_decimals)
 
-            # Get current health ratio for reference
-            current_health = get_health_ratio(wallet_provider, comet_address)
-            current_health_str = (
-                "Infinity" if current_health == Decimal("Infinity") else f"{current_health:.2f}"
-            )
+            with wallet_provider.read_snapshot():
+                # Get current health ratio for reference
+                current_health = get_health_ratio(wallet_provider, comet_address)
+                current_health_str = (
+                    "Infinity" if current_health == Decimal("Infinity") else f"{current_health:.2f}"
+                )
 
-            # Check if position would be healthy after borrow
-            projected_health_ratio = get_health_ratio_after_borrow(
-                wallet_provider, comet_address, amount_atomic
-            )
+                # Check if position would be healthy after borrow
+                projected_health_ratio = get_health_ratio_after_borrow(
+                    wallet_provider, comet_address, amount_atomic
+                )
 
             if projected_health_ratio < 1:
                 return f"Error: Borrowing {validated_args.amount} USDC would result in an unhealthy position. Health ratio would be {projected_health_ratio:.2f}"
 
             # Use withdraw method to borrow from Compound
-            contract = Web3().eth.contract(address=comet_address, abi=COMET_ABI)
-            encoded_data = contract.encode_abi("withdraw", args=[base_token_address, amount_atomic])
+            encoded_data = encode_function_data(
+                COMET_ABI, "withdraw", [base_token_address, amount_atomic]
+            )
 
             params = {
                 "to": comet_address,
@@ -359,7 +361,9 @@ Important notes:
             )
 
             # Check wallet balance before proceeding
-            token_balance = get_token_balance(wallet_provider, token_address)
+            token_balance, allowance = get_balance_and_allowance(
+                wallet_provider, token_address, comet_address
+            )
             token_decimals = get_token_decimals(wallet_provider, token_address)
             amount_atomic = format_amount_with_decimals(validated_args.amount, token_decimals)
 
@@ -370,35 +374,28 @@ Important notes:
             # Get current health ratio for reference
             current_health = get_health_ratio(wallet_provider, comet_address)
 
-            # Approve Compound to spend tokens
-            token_contract = Web3().eth.contract(address=token_address, abi=ERC20_ABI)
-            encoded_data = token_contract.encode_abi("approve", args=[comet_address, amount_atomic])
-            params = {
-                "to": token_address,
-                "data": encoded_data,
-            }
-            try:
-                tx_hash = wallet_provider.send_transaction(params)
-                wallet_provider.wait_for_transaction_receipt(tx_hash)
-            except Exception as e:
-                return f"Error approving token: {e!s}"
-
             # Supply tokens to Compound (supplying base asset repays debt)
-            contract = Web3().eth.contract(address=comet_address, abi=COMET_ABI)
-            encoded_data = contract.encode_abi(
-                "supply",
-                args=[token_address, amount_atomic],
-            )
-
-            params = {
+            repay_params = {
                 "to": comet_address,
-                "data": encoded_data,
+                "data": encode_function_data(COMET_ABI, "supply", [token_address, amount_atomic]),
             }
+
+            # Approve Compound to spend tokens first if the allowance does not cover the amount
             try:
-                tx_hash = wallet_provider.send_transaction(params)
-                wallet_provider.wait_for_transaction_receipt(tx_hash)
-            except Exception as e:
+                results = send_with_approval(
+                    wallet_provider,
+                    token_address,
+                    comet_address,
+                    amount_atomic,
+                    repay_params,
+                    approve_max=self.approve_max,
+                    allowance=allowance,
+                )
+            except TransactionPipelineError as e:
+                if e.failed_index < len(e.results) - 1:
+                    return f"Error approving token: {e!s}"
                 return f"Error executing transaction: {e!s}"
+            tx_hash = results[-1].transaction_hash
 
             # Get new health ratio
             new_health = get_health_ratio(wallet_provider, comet_address)
@@ -444,11 +441,66 @@ Formatted in Markdown for readability.
         except Exception as e:
             return f"Error getting portfolio details: {e!s}"
 
+    @create_action(
+        name="get_max_amount",
+        description="""
+This tool finds the largest amount that can be borrowed from or withdrawn from Compound
+while keeping the position's health ratio at or above a target.
+It takes:
+- operation: Either `borrow` or `withdraw`
+- asset_id: The collateral asset to withdraw, one of `weth`, `cbeth`, `cbbtc` or `wsteth`; only used for `withdraw`
+- target_health_ratio: The lowest acceptable health ratio, defaults to 1
+Important notes:
+- A health ratio below 1 means the position cannot borrow more or withdraw collateral
+- Use a target above 1 to leave a safety margin against price moves
+""",
+        schema=CompoundMaxAmountSchema,
+    )
+    def get_max_amount(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Find the largest safe borrow or withdrawal from Compound.
+
+        Args:
+            wallet_provider: The wallet whose position to size.
+            args: The input arguments for the operation.
+
+        Returns:
+            str: A message containing the largest safe amount.
+
+        """
+        try:
+            validated_args = CompoundMaxAmountSchema(**args)
+            network = wallet_provider.get_network()
+            comet_address = self._get_comet_address(network)
+            target = Decimal(validated_args.target_health_ratio)
+
+            engine = HealthRatioEngine(get_position_snapshot(wallet_provider, comet_address))
+            position = engine.position
+
+            if validated_args.operation == "borrow":
+                amount = engine.max_borrow(target)
+                symbol, decimals = position.base_symbol, position.base_decimals
+            else:
+                if validated_args.asset_id is None:
+                    return "Error: asset_id is required to size a withdrawal"
+                asset = position.get_asset(
+                    self._get_asset_address(network, validated_args.asset_id)
+                )
+                amount = engine.max_withdraw(asset.address, target)
+                symbol, decimals = asset.symbol, asset.decimals
+
+            return (
+                f"You can {validated_args.operation} up to "
+                f"{format_amount_from_decimals(amount, decimals)} {symbol} "
+                f"while keeping a health ratio of at least {target:.2f}"
+            )
+        except Exception as e:
+            return f"Error finding the maximum amount: {e!s}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if network is supported by Compound."""
         return network.protocol_family == "evm" and network.network_id in SUPPORTED_NETWORKS
 
 
-def compound_action_provider() -> CompoundActionProvider:
+def compound_action_provider(approve_max: bool = False) -> CompoundActionProvider:
     """Create a new CompoundActionProvider instance."""
-    return CompoundActionProvider()
+    return CompoundActionProvider(approve_max=approve_max)
@@ -0,0 +1,309 @@
+"""Registry of Compound market configuration shared across calls."""
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from ...wallet_providers import ContractCall, EvmWalletProvider
+from .constants import COMET_ABI
+
+# Collateral assets probed in the first multicall; Comet markets list at most this many
+MAX_PROBED_ASSETS = 15
+
+# Seconds after which a market's configuration is read again
+DEFAULT_REFRESH_INTERVAL = 24 * 60 * 60
+
+# Topic of the proxy event emitted when governance deploys a new market configuration
+UPGRADED_TOPIC = "0xbc7cd75a20ee27fd9adebab32041f755214dbc6bffa90cc0225b39da2e5c2d3b"
+
+
+class CometAssetConfig(BaseModel):
+    """The configuration of a collateral asset in a Compound market."""
+
+    offset: int = Field(..., description="The index of the asset in the market")
+    address: str = Field(..., description="The address of the asset")
+    price_feed: str = Field(..., description="The address of the asset's price feed")
+    scale: int = Field(..., description="The asset's unit, 10 ** decimals")
+    borrow_collateral_factor: int = Field(
+        ...,
+        description="The fraction of the asset's value that can be borrowed against, scaled by 1e18",
+    )
+    liquidate_collateral_factor: int = Field(
+        ...,
+        description="The fraction of the asset's value below which a position is liquidated, scaled by 1e18",
+    )
+    liquidation_factor: int = Field(
+        ..., description="The fraction of the asset's value paid out on liquidation, scaled by 1e18"
+    )
+    supply_cap: int = Field(..., description="The most of the asset the market accepts")
+
+
+class CometMarket(BaseModel):
+    """The configuration of a Compound market, which changes only through governance."""
+
+    chain_id: str = Field(..., description="The chain ID the market is deployed on")
+    comet_address: str = Field(..., description="The lowercased address of the market")
+    base_token: str = Field(..., description="The address of the market's base token")
+    base_token_price_feed: str = Field(
+        ..., description="The address of the base token's price feed"
+    )
+    assets: list[CometAssetConfig] = Field(..., description="The market's collateral assets")
+    loaded_at: float = Field(..., description="The Unix time the configuration was read")
+
+
+class CometMarketRegistry:
+    """Caches Compound market configuration, keyed by chain ID and market address.
+
+    A market's base token, price feeds and collateral assets only change when
+    governance upgrades the market, so they are read once, in one multicall, and
+    answered from memory afterwards. Markets are read again after a refresh
+    interval, when invalidated, or when an upgrade event of the market is handed to
+    the registry. When a path is given, markets are persisted in a SQLite database
+    so that they survive restarts.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        refresh_interval: float | None = DEFAULT_REFRESH_INTERVAL,
+    ):
+        """Initialize the registry.
+
+        Args:
+            path (str | Path | None): The SQLite database to persist markets in, or None to
+                keep them in memory only.
+            refresh_interval (float | None): Seconds after which a market is read again, or
+                None to keep it until invalidated.
+
+        """
+        self.path = Path(path) if path is not None else None
+        self.refresh_interval = refresh_interval
+
+        self._markets: dict[tuple[str, str], CometMarket] = {}
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+
+        if self.path is not None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS comet_markets ("
+                "chain_id TEXT NOT NULL, address TEXT NOT NULL, market TEXT NOT NULL, "
+                "PRIMARY KEY (chain_id, address))"
+            )
+            self._db.commit()
+
+    def get(self, wallet: EvmWalletProvider, comet_address: str) -> CometMarket:
+        """Get a market's configuration, reading it from chain on first use or when stale.
+
+        Args:
+            wallet (EvmWalletProvider): The wallet to read the market with.
+            comet_address (str): The address of the Compound market.
+
+        Returns:
+            CometMarket: The market's configuration.
+
+        """
+        key = (str(wallet.get_network().chain_id), comet_address.lower())
+        market = self._lookup(key)
+        if market is None or self._is_stale(market):
+            market = self._load(wallet, key, comet_address)
+            self._store(market)
+        return market
+
+    def invalidate(self, chain_id: str, comet_address: str | None = None) -> None:
+        """Discard a market, or every market on a chain, so it is read again on next use.
+
+        Args:
+            chain_id (str): The chain ID of the market.
+            comet_address (str | None): The address of the market, or None for every market
+                on the chain.
+
+        """
+        address = comet_address.lower() if comet_address is not None else None
+        with self._lock:
+            for key in list(self._markets):
+                if key[0] == chain_id and address in (None, key[1]):
+                    del self._markets[key]
+            if self._db is not None:
+                if address is None:
+                    self._db.execute("DELETE FROM comet_markets WHERE chain_id = ?", (chain_id,))
+                else:
+                    self._db.execute(
+                        "DELETE FROM comet_markets WHERE chain_id = ? AND address = ?",
+                        (chain_id, address),
+                    )
+                self._db.commit()
+
+    def handle_logs(self, chain_id: str, logs: Iterable[dict[str, Any]]) -> None:
+        """Invalidate every market upgraded by governance in a batch of logs.
+
+        Args:
+            chain_id (str): The chain ID the logs were emitted on.
+            logs (Iterable[dict[str, Any]]): Logs, e.g. from a receipt or eth_getLogs.
+
+        """
+        for log in logs:
+            topics = log.get("topics") or []
+            if topics and _to_hex(topics[0]) == UPGRADED_TOPIC:
+                self.invalidate(chain_id, str(log["address"]))
+
+    def clear(self) -> None:
+        """Discard every known market, including those persisted on disk."""
+        with self._lock:
+            self._markets.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM comet_markets")
+                self._db.commit()
+
+    def _is_stale(self, market: CometMarket) -> bool:
+        """Check whether a market is older than the refresh interval."""
+        return (
+            self.refresh_interval is not None
+            and time.time() - market.loaded_at > self.refresh_interval
+        )
+
+    def _load(
+        self, wallet: EvmWalletProvider, key: tuple[str, str], comet_address: str
+    ) -> CometMarket:
+        """Read a market's configuration from chain."""
+
+        def comet_call(function_name: str, args: list[Any] | None = None, **kwargs: Any):
+            return ContractCall(
+                contract_address=comet_address,
+                abi=COMET_ABI,
+                function_name=function_name,
+                args=args or [],
+                **kwargs,
+            )
+
+        def asset_info_calls(indexes: range) -> list[ContractCall]:
+            return [comet_call("getAssetInfo", [i], allow_failure=True) for i in indexes]
+
+        num_assets, base_token, base_token_price_feed, *asset_infos = wallet.read_contract_many(
+            [
+                comet_call("numAssets"),
+                comet_call("baseToken"),
+                comet_call("baseTokenPriceFeed"),
+                *asset_info_calls(range(MAX_PROBED_ASSETS)),
+            ]
+        )
+        if num_assets > MAX_PROBED_ASSETS:
+            asset_infos += wallet.read_contract_many(
+                asset_info_calls(range(MAX_PROBED_ASSETS, num_assets))
+            )
+
+        return CometMarket(
+            chain_id=key[0],
+            comet_address=key[1],
+            base_token=base_token,
+            base_token_price_feed=base_token_price_feed,
+            assets=[
+                CometAssetConfig(
+                    offset=info[0],
+                    address=info[1],
+                    price_feed=info[2],
+                    scale=info[3],
+                    borrow_collateral_factor=info[4],
+                    liquidate_collateral_factor=info[5],
+                    liquidation_factor=info[6],
+                    supply_cap=info[7],
+                )
+                for info in asset_infos[:num_assets]
+            ],
+            loaded_at=time.time(),
+        )
+
+    def _lookup(self, key: tuple[str, str]) -> CometMarket | None:
+        """Look up a market in memory, falling back to the database."""
+        with self._lock:
+            market = self._markets.get(key)
+            if market is not None or self._db is None:
+                return market
+
+            row = self._db.execute(
+                "SELECT market FROM comet_markets WHERE chain_id = ? AND address = ?", key
+            ).fetchone()
+            if row is None:
+                return None
+
+            market = CometMarket.model_validate_json(row[0])
+            self._markets[key] = market
+            return market
+
+    def _store(self, market: CometMarket) -> None:
+        """Remember a market in memory and persist it."""
+        with self._lock:
+            self._markets[(market.chain_id, market.comet_address)] = market
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO comet_markets VALUES (?, ?, ?)",
+                    (market.chain_id, market.comet_address, market.model_dump_json()),
+                )
+                self._db.commit()
+
+
+def _to_hex(topic: Any) -> str:
+    """Normalize a log topic given as bytes or a hex string."""
+    if isinstance(topic, bytes | bytearray):
+        return "0x" + bytes(topic).hex()
+    return str(topic).lower()
+
+
+_registry: CometMarketRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_comet_market_registry() -> CometMarketRegistry:
+    """Get the process-wide market registry, creating an in-memory one on first use.
+
+    Returns:
+        CometMarketRegistry: The shared registry.
+
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = CometMarketRegistry()
+        return _registry
+
+
+def configure_comet_markets(
+    path: str | Path | None = None,
+    refresh_interval: float | None = DEFAULT_REFRESH_INTERVAL,
+) -> CometMarketRegistry:
+    """Replace the process-wide market registry, e.g. to persist it on disk.
+
+    Args:
+        path (str | Path | None): The SQLite database to persist markets in, or None to
+            keep them in memory only.
+        refresh_interval (float | None): Seconds after which a market is read again, or
+            None to keep it until invalidated.
+
+    Returns:
+        CometMarketRegistry: The new shared registry.
+
+    """
+    global _registry
+    registry = CometMarketRegistry(path, refresh_interval)
+    with _registry_lock:
+        _registry = registry
+    return registry
+
+
+def get_comet_market(wallet: EvmWalletProvider, comet_address: str) -> CometMarket:
+    """Get a market's configuration from the shared registry.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet to read the market with.
+        comet_address (str): The address of the Compound market.
+
+    Returns:
+        CometMarket: The market's configuration.
+
+    """
+    return get_comet_market_registry().get(wallet, comet_address)
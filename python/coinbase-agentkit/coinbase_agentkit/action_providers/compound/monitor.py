@@ -0,0 +1,407 @@
+"""Block-paced monitoring of Compound positions for liquidation risk."""
+
+import contextlib
+import threading
+import warnings
+from collections import deque
+from collections.abc import Callable, Sequence
+from decimal import Decimal
+from typing import Literal
+
+from pydantic import BaseModel, Field
+from web3 import Web3
+
+from ...wallet_providers import ContractCall, EvmWalletProvider
+from ...wallet_providers.multicall import MULTICALL_BATCH_SIZE
+from ...wallet_providers.receipt_watcher import DEFAULT_BLOCK_TIME, MIN_POLL_INTERVAL
+from ..erc20.token_metadata import get_token_decimals
+from .constants import PRICE_FEED_ABI
+from .market_metadata import (
+    UPGRADED_TOPIC,
+    CometMarket,
+    get_comet_market,
+    get_comet_market_registry,
+)
+from .position import PRICE_DECIMALS
+from .scanner import (
+    DEFAULT_MAX_WORKERS,
+    PositionValue,
+    Ratio,
+    position_calls,
+    price_feeds,
+    read_chunked,
+    value_position,
+)
+
+# Health ratio thresholds alerted on by default
+DEFAULT_THRESHOLDS = (Decimal("1.2"), Decimal(1))
+
+# Positions whose balances are read again per block
+DEFAULT_BALANCE_BUDGET = 100
+
+
+class HealthAlert(BaseModel):
+    """A position's health ratio crossing a threshold."""
+
+    account: str = Field(..., description="The account of the position")
+    comet_address: str = Field(..., description="The Compound market of the position")
+    block_number: int = Field(..., description="The block the crossing was observed at")
+    threshold: Decimal = Field(..., description="The health ratio threshold crossed")
+    direction: Literal["below", "above"] = Field(
+        ..., description="Whether the health ratio fell below or recovered above the threshold"
+    )
+    health_ratio: Ratio = Field(..., description="The health ratio after the crossing")
+    previous_health_ratio: Ratio | None = Field(
+        None, description="The health ratio before the crossing, or None for a new position"
+    )
+    liquidation_ratio: Ratio = Field(
+        ..., description="The liquidation ratio after the crossing; below 1 can be liquidated"
+    )
+
+
+class LiquidationMonitor:
+    """Watches Compound positions and alerts when their health ratio crosses thresholds.
+
+    Once per block, the monitor reads the round of every price feed the watched
+    markets use in one multicall, and the balances of at most ``balance_budget``
+    positions, least recently read first, in chunked multicalls. Only positions
+    whose balances were read, or whose market's prices moved to a new round, are
+    valued again; every other position keeps its last health ratio. The RPC cost
+    of a block is therefore bounded regardless of how many positions are watched.
+    Governance upgrades of the watched markets are picked up from their logs, and
+    the positions in an upgraded market are read again first.
+
+    Alerts are passed to every subscribed callback and returned by ``poll``.
+    ``start`` polls in a background thread paced to the block time; a poll that
+    fails there is passed to ``on_error``, or emitted as a ``RuntimeWarning``, and
+    retried on the next tick.
+    """
+
+    def __init__(
+        self,
+        wallet: EvmWalletProvider,
+        thresholds: Sequence[Decimal] = DEFAULT_THRESHOLDS,
+        balance_budget: int = DEFAULT_BALANCE_BUDGET,
+        block_time: float = DEFAULT_BLOCK_TIME,
+        chunk_size: int = MULTICALL_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        on_error: Callable[[Exception], None] | None = None,
+    ):
+        """Initialize the monitor.
+
+        Args:
+            wallet (EvmWalletProvider): The wallet to read with; any account can be watched.
+            thresholds (Sequence[Decimal]): The health ratios to alert on crossing.
+            balance_budget (int): The number of positions whose balances are read per block.
+            block_time (float): Seconds between blocks, used to pace polling.
+            chunk_size (int): The number of calls per multicall.
+            max_workers (int): The number of multicalls sent concurrently.
+            on_error (Callable[[Exception], None] | None): Called with the error of each failed
+                background poll. Failures are emitted as warnings if not given.
+
+        Raises:
+            ValueError: If the balance budget is not positive
+
+        """
+        if balance_budget < 1:
+            raise ValueError(f"Balance budget must be positive, got {balance_budget}")
+
+        self.wallet = wallet
+        self.thresholds = sorted(thresholds, reverse=True)
+        self.balance_budget = balance_budget
+        self.block_time = block_time
+        self.poll_interval = max(block_time / 4, MIN_POLL_INTERVAL)
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.on_error = on_error
+
+        self._callbacks: list[Callable[[HealthAlert], None]] = []
+        self._markets: dict[str, CometMarket] = {}
+        self._base_decimals: dict[str, int] = {}
+        self._queue: deque[tuple[str, str]] = deque()
+        self._balances: dict[tuple[str, str], list[int]] = {}
+        self._values: dict[tuple[str, str], PositionValue] = {}
+        self._rounds: dict[str, int] = {}
+        self._prices: dict[str, Decimal] = {}
+        self._last_block: int | None = None
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self, callback: Callable[[HealthAlert], None]) -> None:
+        """Call a function with every alert.
+
+        Args:
+            callback (Callable[[HealthAlert], None]): The function to call.
+
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def watch(self, account: str, comet_address: str) -> None:
+        """Start watching an account's position in a market.
+
+        The position's balances are read on a following poll, ahead of positions
+        already watched.
+
+        Args:
+            account (str): The account to watch.
+            comet_address (str): The address of the Compound market.
+
+        """
+        key = _position_key(account, comet_address)
+        if key[1] not in self._markets:
+            market = get_comet_market(self.wallet, comet_address)
+            base_decimals = get_token_decimals(self.wallet, market.base_token)
+            with self._lock:
+                self._markets[key[1]] = market
+                self._base_decimals[key[1]] = base_decimals
+
+        with self._lock:
+            if key not in self._balances and key not in self._queue:
+                self._queue.appendleft(key)
+
+    def unwatch(self, account: str, comet_address: str) -> None:
+        """Stop watching an account's position in a market.
+
+        Args:
+            account (str): The account to stop watching.
+            comet_address (str): The address of the Compound market.
+
+        """
+        key = _position_key(account, comet_address)
+        with self._lock:
+            with contextlib.suppress(ValueError):
+                self._queue.remove(key)
+            self._balances.pop(key, None)
+            self._values.pop(key, None)
+
+    def health_ratio(self, account: str, comet_address: str) -> Decimal | None:
+        """Get the last health ratio of a watched position.
+
+        Args:
+            account (str): The account of the position.
+            comet_address (str): The address of the Compound market.
+
+        Returns:
+            Decimal | None: The health ratio, or None if the position was not read yet.
+
+        """
+        with self._lock:
+            value = self._values.get(_position_key(account, comet_address))
+        return value.health_ratio if value is not None else None
+
+    def poll(self) -> list[HealthAlert]:
+        """Re-evaluate the watched positions if a new block arrived.
+
+        Nothing is recorded until every read for the block has succeeded, so a failed
+        poll is retried in full on the next tick.
+
+        Returns:
+            list[HealthAlert]: The thresholds crossed since the last poll.
+
+        """
+        block_number = self.wallet.get_block_number()
+        with self._lock:
+            if block_number == self._last_block:
+                return []
+            last_block = self._last_block
+            markets = dict(self._markets)
+            refreshed = list(self._queue)[: self.balance_budget]
+
+        upgraded = self._read_upgrades(markets, last_block, block_number)
+        markets.update({comet_address: market for comet_address, (market, _) in upgraded.items()})
+
+        feeds = list(
+            dict.fromkeys(feed for market in markets.values() for feed in price_feeds(market))
+        )
+        rounds = self._read_rounds(feeds, block_number)
+
+        calls = [
+            call
+            for account, comet_address in refreshed
+            for call in position_calls(markets[comet_address], comet_address, account)
+        ]
+        results = read_chunked(self.wallet, calls, block_number, self.chunk_size, self.max_workers)
+
+        alerts = []
+        with self._lock:
+            moved = {
+                feed for feed, (round_id, _) in rounds.items() if self._rounds.get(feed) != round_id
+            }
+            for feed in moved:
+                self._rounds[feed], self._prices[feed] = rounds[feed]
+
+            for comet_address, (market, base_decimals) in upgraded.items():
+                self._markets[comet_address] = market
+                self._base_decimals[comet_address] = base_decimals
+
+            offset = 0
+            for key in refreshed:
+                count = 1 + len(markets[key[1]].assets)
+                if key in self._queue:
+                    self._balances[key] = results[offset : offset + count]
+                    # Move the position behind those not read for longer
+                    self._queue.remove(key)
+                    self._queue.append(key)
+                offset += count
+
+            # Balances read before an upgrade may not match the market's new assets
+            refreshed_keys = set(refreshed)
+            for key in [k for k in self._balances if k[1] in upgraded and k not in refreshed_keys]:
+                del self._balances[key]
+                self._queue.remove(key)
+                self._queue.appendleft(key)
+
+            moved_markets = {
+                comet_address
+                for comet_address, market in markets.items()
+                if moved.intersection(price_feeds(market))
+            }
+            for key, balances in self._balances.items():
+                if key not in refreshed_keys and key[1] not in moved_markets:
+                    continue
+                value = value_position(
+                    markets[key[1]], self._base_decimals[key[1]], self._prices, balances
+                )
+                alerts += self._crossings(key, self._values.get(key), value, block_number)
+                self._values[key] = value
+
+            self._last_block = block_number
+            callbacks = list(self._callbacks)
+
+        for alert in alerts:
+            for callback in callbacks:
+                # A failing callback must not stop the others or the monitor
+                with contextlib.suppress(Exception):
+                    callback(alert)
+        return alerts
+
+    def start(self) -> None:
+        """Poll in a background thread until stopped."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="liquidation-monitor", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and wait for it to exit."""
+        self._stop.set()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        """Poll every fraction of a block until stopped."""
+        while True:
+            try:
+                self.poll()
+            except Exception as e:
+                # Transient RPC errors are retried on the next tick
+                self._report(e)
+            if self._stop.wait(self.poll_interval):
+                return
+
+    def _report(self, error: Exception) -> None:
+        """Pass a background poll's error to ``on_error``, or warn if there is none."""
+        if self.on_error is None:
+            warnings.warn(
+                f"Liquidation monitor poll failed: {error!s}", RuntimeWarning, stacklevel=2
+            )
+            return
+        # A failing error handler must not stop the monitor
+        with contextlib.suppress(Exception):
+            self.on_error(error)
+
+    def _read_upgrades(
+        self, markets: dict[str, CometMarket], last_block: int | None, block_number: int
+    ) -> dict[str, tuple[CometMarket, int]]:
+        """Reload the markets upgraded since the last poll, without recording them."""
+        if last_block is None or not markets:
+            return {}
+
+        try:
+            logs = self.wallet.get_logs(
+                {
+                    "fromBlock": last_block + 1,
+                    "toBlock": block_number,
+                    "address": [Web3.to_checksum_address(address) for address in markets],
+                    "topics": [UPGRADED_TOPIC],
+                }
+            )
+        except NotImplementedError:
+            # Without logs, markets keep the configuration read when they were first watched
+            return {}
+        if not logs:
+            return {}
+
+        get_comet_market_registry().handle_logs(str(self.wallet.get_network().chain_id), logs)
+        upgraded = {str(log["address"]).lower() for log in logs}.intersection(markets)
+        reloaded = {}
+        for comet_address in upgraded:
+            market = get_comet_market(self.wallet, comet_address)
+            reloaded[comet_address] = (market, get_token_decimals(self.wallet, market.base_token))
+        return reloaded
+
+    def _read_rounds(self, feeds: list[str], block_number: int) -> dict[str, tuple[int, Decimal]]:
+        """Read every feed's latest round ID and price without recording them."""
+        if not feeds:
+            return {}
+
+        round_data = self.wallet.read_contract_many(
+            [
+                ContractCall(
+                    contract_address=feed, abi=PRICE_FEED_ABI, function_name="latestRoundData"
+                )
+                for feed in feeds
+            ],
+            block_identifier=block_number,
+        )
+        return {
+            feed: (round_id, Decimal(answer) / Decimal(10**PRICE_DECIMALS))
+            for feed, (round_id, answer, *_) in zip(feeds, round_data, strict=True)
+        }
+
+    def _crossings(
+        self,
+        key: tuple[str, str],
+        previous: PositionValue | None,
+        value: PositionValue,
+        block_number: int,
+    ) -> list[HealthAlert]:
+        """Build an alert for every threshold a position's health ratio crossed."""
+        before = previous.health_ratio if previous is not None else Decimal("Infinity")
+        # Report thresholds in the order the health ratio crossed them
+        falling = value.health_ratio < before
+        alerts = []
+        for threshold in self.thresholds if falling else reversed(self.thresholds):
+            if before >= threshold > value.health_ratio:
+                direction: Literal["below", "above"] = "below"
+            elif value.health_ratio >= threshold > before:
+                direction = "above"
+            else:
+                continue
+            alerts.append(
+                HealthAlert(
+                    account=key[0],
+                    comet_address=key[1],
+                    block_number=block_number,
+                    threshold=threshold,
+                    direction=direction,
+                    health_ratio=value.health_ratio,
+                    previous_health_ratio=previous.health_ratio if previous is not None else None,
+                    liquidation_ratio=value.liquidation_ratio,
+                )
+            )
+        return alerts
+
+
+def _position_key(account: str, comet_address: str) -> tuple[str, str]:
+    """Key a position by lowercased account and market address."""
+    return account.lower(), comet_address.lower()
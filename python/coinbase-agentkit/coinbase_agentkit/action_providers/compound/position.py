@@ -0,0 +1,290 @@
+"""A wallet's Compound position loaded in one multicall."""
+
+from decimal import Decimal
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from ...wallet_providers import ContractCall, EvmWalletProvider
+from ..erc20.token_metadata import get_token_metadata_registry
+from .constants import COMET_ABI, PRICE_FEED_ABI
+from .market_metadata import get_comet_market
+
+# Chainlink price feeds used by Comet report USD prices with 8 decimals
+PRICE_DECIMALS = 8
+
+# Comet collateral factors are scaled by 1e18
+FACTOR_SCALE = Decimal(10**18)
+
+
+class CompoundAsset(BaseModel):
+    """A collateral asset of a Compound market and the wallet's supply of it."""
+
+    address: str = Field(..., description="The address of the asset")
+    symbol: str = Field(..., description="The token symbol of the asset")
+    decimals: int = Field(..., description="The number of decimals of the asset")
+    price: Decimal = Field(..., description="The price of the asset in USD")
+    collateral_factor: Decimal = Field(
+        ..., description="The fraction of the asset's value that can be borrowed against"
+    )
+    liquidate_collateral_factor: Decimal = Field(
+        ..., description="The fraction of the asset's value below which a position is liquidated"
+    )
+    balance: int = Field(..., description="The wallet's supplied amount in atomic units")
+
+    @property
+    def supply_amount(self) -> Decimal:
+        """The wallet's supplied amount in whole tokens."""
+        return Decimal(self.balance) / Decimal(10**self.decimals)
+
+    @property
+    def value(self) -> Decimal:
+        """The USD value of the wallet's supply."""
+        return self.supply_amount * self.price
+
+
+class CompoundPositionSnapshot(BaseModel):
+    """A wallet's supply and borrow in a Compound market, read at a single block.
+
+    Everything needed to describe the position and evaluate health ratios is read up
+    front: balances and prices in one multicall, and the market's configuration and
+    token metadata from the shared registries, which read the chain only on first use.
+    Every calculation afterwards runs in memory.
+    """
+
+    comet_address: str = Field(..., description="The address of the Compound market")
+    base_token: str = Field(..., description="The address of the market's base token")
+    base_symbol: str = Field(..., description="The token symbol of the base token")
+    base_decimals: int = Field(..., description="The number of decimals of the base token")
+    base_price: Decimal = Field(..., description="The price of the base token in USD")
+    borrow_balance: int = Field(..., description="The wallet's borrowed amount in atomic units")
+    assets: list[CompoundAsset] = Field(..., description="The market's collateral assets")
+
+    @classmethod
+    def load(cls, wallet: EvmWalletProvider, comet_address: str) -> "CompoundPositionSnapshot":
+        """Read a wallet's position in a Compound market.
+
+        Args:
+            wallet (EvmWalletProvider): The wallet whose position to read.
+            comet_address (str): The address of the Compound market.
+
+        Returns:
+            CompoundPositionSnapshot: The position.
+
+        Raises:
+            ValueError: If the base token or a collateral asset has no decimals
+
+        """
+        account = wallet.get_address()
+
+        with wallet.read_snapshot():
+            market = get_comet_market(wallet, comet_address)
+            tokens = get_token_metadata_registry().get_many(
+                wallet, [market.base_token, *(asset.address for asset in market.assets)]
+            )
+            for token in tokens:
+                if token.decimals is None:
+                    raise ValueError(f"Token {token.address} does not have decimals")
+
+            price_feeds = [market.base_token_price_feed, *(a.price_feed for a in market.assets)]
+            borrow_balance, *results = wallet.read_contract_many(
+                [
+                    ContractCall(
+                        contract_address=comet_address,
+                        abi=COMET_ABI,
+                        function_name="borrowBalanceOf",
+                        args=[account],
+                    ),
+                    *(
+                        ContractCall(
+                            contract_address=comet_address,
+                            abi=COMET_ABI,
+                            function_name="collateralBalanceOf",
+                            args=[account, asset.address],
+                        )
+                        for asset in market.assets
+                    ),
+                    *(
+                        ContractCall(
+                            contract_address=price_feed,
+                            abi=PRICE_FEED_ABI,
+                            function_name="latestRoundData",
+                        )
+                        for price_feed in price_feeds
+                    ),
+                ]
+            )
+
+        num_assets = len(market.assets)
+        balances = results[:num_assets]
+        base_price, *asset_prices = (
+            Decimal(round_data[1]) / Decimal(10**PRICE_DECIMALS)
+            for round_data in results[num_assets:]
+        )
+
+        base_metadata, *asset_metadata = tokens
+        return cls(
+            comet_address=comet_address,
+            base_token=market.base_token,
+            base_symbol=base_metadata.symbol or market.base_token,
+            base_decimals=base_metadata.decimals,
+            base_price=base_price,
+            borrow_balance=borrow_balance,
+            assets=[
+                CompoundAsset(
+                    address=config.address,
+                    symbol=metadata.symbol or config.address,
+                    decimals=metadata.decimals,
+                    price=price,
+                    collateral_factor=Decimal(config.borrow_collateral_factor) / FACTOR_SCALE,
+                    liquidate_collateral_factor=(
+                        Decimal(config.liquidate_collateral_factor) / FACTOR_SCALE
+                    ),
+                    balance=balance,
+                )
+                for config, metadata, price, balance in zip(
+                    market.assets, asset_metadata, asset_prices, balances, strict=True
+                )
+            ],
+        )
+
+    @property
+    def supplied(self) -> list[CompoundAsset]:
+        """The collateral assets the wallet has supplied."""
+        return [asset for asset in self.assets if asset.balance > 0]
+
+    @property
+    def borrow_amount(self) -> Decimal:
+        """The wallet's borrowed amount in whole base tokens."""
+        return Decimal(self.borrow_balance) / Decimal(10**self.base_decimals)
+
+    @property
+    def borrow_value(self) -> Decimal:
+        """The USD value of the wallet's borrow."""
+        return self.borrow_amount * self.base_price
+
+    def get_asset(self, asset_address: str) -> CompoundAsset:
+        """Get a collateral asset of the market by address.
+
+        Args:
+            asset_address (str): The address of the asset.
+
+        Returns:
+            CompoundAsset: The asset.
+
+        Raises:
+            ValueError: If the asset is not collateral in the market
+
+        """
+        for asset in self.assets:
+            if asset.address.lower() == asset_address.lower():
+                return asset
+        raise ValueError(f"Asset {asset_address} is not collateral in market {self.comet_address}")
+
+    def health_ratio(
+        self, borrow_amount: int = 0, withdrawals: dict[str, int] | None = None
+    ) -> Decimal:
+        """Calculate the position's health ratio, optionally after a borrow and withdrawals.
+
+        The ratio is the borrowing capacity of the collateral divided by the value of
+        the borrow. A ratio of at least 1 indicates a healthy position.
+
+        Args:
+            borrow_amount (int): An additional borrow of the base token in atomic units.
+            withdrawals (dict[str, int] | None): Collateral to withdraw in atomic units, by
+                asset address.
+
+        Returns:
+            Decimal: The health ratio, or infinity if there would be no borrow.
+
+        """
+        withdrawals = {address.lower(): amount for address, amount in (withdrawals or {}).items()}
+
+        borrow_value = (
+            Decimal(self.borrow_balance + borrow_amount)
+            / Decimal(10**self.base_decimals)
+            * self.base_price
+        )
+
+        capacity = Decimal(0)
+        for asset in self.supplied:
+            supply_amount = asset.supply_amount - Decimal(
+                withdrawals.get(asset.address.lower(), 0)
+            ) / Decimal(10**asset.decimals)
+            capacity += supply_amount * asset.price * asset.collateral_factor
+
+        return Decimal("Infinity") if borrow_value == 0 else capacity / borrow_value
+
+    def get_borrow_details(self) -> dict[str, Any]:
+        """Describe the wallet's borrow.
+
+        Returns:
+            dict[str, Any]: The base token's symbol, the borrowed amount and the base token price.
+
+        """
+        return {
+            "Token Symbol": self.base_symbol,
+            "Borrow Amount": self.borrow_amount,
+            "Price": self.base_price,
+        }
+
+    def get_supply_details(self) -> list[dict[str, Any]]:
+        """Describe every asset the wallet has supplied.
+
+        Returns:
+            list[dict[str, Any]]: The symbol, supplied amount, price, collateral factor and
+                decimals of each supplied asset.
+
+        """
+        return [
+            {
+                "Token Symbol": asset.symbol,
+                "Supply Amount": asset.supply_amount,
+                "Price": asset.price,
+                "Collateral Factor": asset.collateral_factor,
+                "Decimals": asset.decimals,
+            }
+            for asset in self.supplied
+        ]
+
+    def to_markdown(self) -> str:
+        """Format the position as markdown.
+
+        Returns:
+            str: The supply, borrow and health of the position.
+
+        """
+        markdown_output = "# Portfolio Details\n\n"
+
+        markdown_output += "## Supply Details\n\n"
+        total_supply_value = Decimal(0)
+
+        if self.supplied:
+            for asset in self.supplied:
+                markdown_output += f"### {asset.symbol}\n"
+                markdown_output += (
+                    f"- **Supply Amount:** {format(asset.supply_amount, f'.{asset.decimals}f')}\n"
+                )
+                markdown_output += f"- **Price:** ${asset.price:.2f}\n"
+                markdown_output += f"- **Collateral Factor:** {asset.collateral_factor:.2f}\n"
+                markdown_output += f"- **Asset Value:** ${asset.value:.2f}\n\n"
+                total_supply_value += asset.value
+        else:
+            markdown_output += "No supplied assets found in your Compound position.\n\n"
+
+        markdown_output += f"### Total Supply Value: ${total_supply_value:.2f}\n\n"
+
+        markdown_output += "## Borrow Details\n\n"
+
+        if self.borrow_amount > 0:
+            markdown_output += f"### {self.base_symbol}\n"
+            markdown_output += f"- **Borrow Amount:** {self.borrow_amount:.6f}\n"
+            markdown_output += f"- **Price:** ${self.base_price:.2f}\n"
+            markdown_output += f"- **Borrow Value:** ${self.borrow_value:.2f}\n\n"
+        else:
+            markdown_output += "No borrowed assets found in your Compound position.\n\n"
+
+        markdown_output += "## Overall Health\n\n"
+        markdown_output += f"- **Health Ratio:** {self.health_ratio():.2f}\n"
+
+        return markdown_output
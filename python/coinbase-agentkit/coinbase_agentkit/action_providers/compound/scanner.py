@@ -0,0 +1,312 @@
+"""Compound positions of many accounts across many markets, read in chunked multicalls."""
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Annotated, Any
+
+from pydantic import BaseModel, Field
+
+from ...wallet_providers import ContractCall, EvmWalletProvider
+from ...wallet_providers.multicall import MULTICALL_BATCH_SIZE
+from ..erc20.token_metadata import get_token_decimals, prefetch_token_metadata
+from .constants import COMET_ABI, PRICE_FEED_ABI
+from .market_metadata import CometMarket, get_comet_market
+from .position import FACTOR_SCALE, PRICE_DECIMALS
+
+# Number of chunks read concurrently
+DEFAULT_MAX_WORKERS = 8
+
+# A health or liquidation ratio, which is infinite for positions without a borrow
+Ratio = Annotated[Decimal, Field(allow_inf_nan=True)]
+
+
+class CompoundPortfolioScan(BaseModel):
+    """The positions of many accounts in many Compound markets, read at a single block.
+
+    Results are columnar: row ``i`` of every column describes the position of
+    ``accounts[i]`` in ``comet_addresses[i]``, and rows are ordered by account, then
+    by market. Values are in USD.
+    """
+
+    block_number: int = Field(..., description="The block the positions were read at")
+    accounts: list[str] = Field(..., description="The account of each row")
+    comet_addresses: list[str] = Field(..., description="The Compound market of each row")
+    borrow_values: list[Decimal] = Field(..., description="The value of each borrow")
+    collateral_values: list[Decimal] = Field(..., description="The value of each collateral")
+    health_ratios: list[Ratio] = Field(
+        ...,
+        description="The borrowing capacity divided by the borrow value, infinity without a borrow",
+    )
+    liquidation_ratios: list[Ratio] = Field(
+        ...,
+        description="The liquidation threshold of the collateral divided by the borrow value; "
+        "positions below 1 can be liquidated",
+    )
+
+    def __len__(self) -> int:
+        """Get the number of positions scanned."""
+        return len(self.accounts)
+
+    def rows(self) -> list[dict[str, Any]]:
+        """Convert the scan to one dictionary per position.
+
+        Returns:
+            list[dict[str, Any]]: The account, market, values and ratios of each position.
+
+        """
+        columns = {
+            "account": self.accounts,
+            "comet_address": self.comet_addresses,
+            "borrow_value": self.borrow_values,
+            "collateral_value": self.collateral_values,
+            "health_ratio": self.health_ratios,
+            "liquidation_ratio": self.liquidation_ratios,
+        }
+        return [dict(zip(columns, row, strict=True)) for row in zip(*columns.values(), strict=True)]
+
+    def below(self, health_ratio: Decimal = Decimal(1)) -> list[tuple[str, str]]:
+        """Find the positions whose health ratio is below a threshold.
+
+        Args:
+            health_ratio (Decimal): The threshold.
+
+        Returns:
+            list[tuple[str, str]]: The account and market of each position below it.
+
+        """
+        return [
+            (account, comet_address)
+            for account, comet_address, ratio in zip(
+                self.accounts, self.comet_addresses, self.health_ratios, strict=True
+            )
+            if ratio < health_ratio
+        ]
+
+
+class PositionValue(BaseModel):
+    """The value of one position, computed from its balances and market prices."""
+
+    borrow_value: Decimal = Field(..., description="The value of the borrow")
+    collateral_value: Decimal = Field(..., description="The value of the collateral")
+    health_ratio: Ratio = Field(..., description="The health ratio of the position")
+    liquidation_ratio: Ratio = Field(..., description="The liquidation ratio of the position")
+
+
+def position_calls(market: CometMarket, comet_address: str, account: str) -> list[ContractCall]:
+    """Build the calls reading an account's borrow and collateral balances in a market.
+
+    Args:
+        market (CometMarket): The market's configuration.
+        comet_address (str): The address of the market.
+        account (str): The account whose balances to read.
+
+    Returns:
+        list[ContractCall]: The borrowBalanceOf call, then a collateralBalanceOf call per
+            collateral asset in market order.
+
+    """
+    return [
+        ContractCall(
+            contract_address=comet_address,
+            abi=COMET_ABI,
+            function_name="borrowBalanceOf",
+            args=[account],
+        ),
+        *(
+            ContractCall(
+                contract_address=comet_address,
+                abi=COMET_ABI,
+                function_name="collateralBalanceOf",
+                args=[account, asset.address],
+            )
+            for asset in market.assets
+        ),
+    ]
+
+
+def price_feeds(market: CometMarket) -> list[str]:
+    """List the price feeds a market's positions are valued with.
+
+    Args:
+        market (CometMarket): The market's configuration.
+
+    Returns:
+        list[str]: The base token's price feed, then each collateral asset's.
+
+    """
+    return [market.base_token_price_feed, *(asset.price_feed for asset in market.assets)]
+
+
+def value_position(
+    market: CometMarket,
+    base_decimals: int,
+    prices: dict[str, Decimal],
+    balances: Sequence[int],
+) -> PositionValue:
+    """Value a position from the results of its position calls.
+
+    Args:
+        market (CometMarket): The market's configuration.
+        base_decimals (int): The number of decimals of the market's base token.
+        prices (dict[str, Decimal]): The USD price reported by each price feed.
+        balances (Sequence[int]): The results of the position's calls, in call order.
+
+    Returns:
+        PositionValue: The value and ratios of the position.
+
+    """
+    borrow_balance, *collateral_balances = balances
+    borrow_value = (
+        Decimal(borrow_balance) / Decimal(10**base_decimals) * prices[market.base_token_price_feed]
+    )
+
+    collateral_value = capacity = liquidation_capacity = Decimal(0)
+    for asset, balance in zip(market.assets, collateral_balances, strict=True):
+        if not balance:
+            continue
+        value = Decimal(balance) / Decimal(asset.scale) * prices[asset.price_feed]
+        collateral_value += value
+        capacity += value * asset.borrow_collateral_factor / FACTOR_SCALE
+        liquidation_capacity += value * asset.liquidate_collateral_factor / FACTOR_SCALE
+
+    if borrow_value == 0:
+        health_ratio = liquidation_ratio = Decimal("Infinity")
+    else:
+        health_ratio = capacity / borrow_value
+        liquidation_ratio = liquidation_capacity / borrow_value
+
+    return PositionValue(
+        borrow_value=borrow_value,
+        collateral_value=collateral_value,
+        health_ratio=health_ratio,
+        liquidation_ratio=liquidation_ratio,
+    )
+
+
+def read_prices(
+    wallet: EvmWalletProvider, feeds: Sequence[str], block_number: int
+) -> dict[str, Decimal]:
+    """Read the latest price of several Chainlink price feeds in one multicall.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet to read with.
+        feeds (Sequence[str]): The addresses of the price feeds.
+        block_number (int): The block to read at.
+
+    Returns:
+        dict[str, Decimal]: The USD price reported by each feed.
+
+    """
+    feeds = list(dict.fromkeys(feeds))
+    round_data = wallet.read_contract_many(
+        [
+            ContractCall(contract_address=feed, abi=PRICE_FEED_ABI, function_name="latestRoundData")
+            for feed in feeds
+        ],
+        block_identifier=block_number,
+    )
+    return {
+        feed: Decimal(data[1]) / Decimal(10**PRICE_DECIMALS)
+        for feed, data in zip(feeds, round_data, strict=True)
+    }
+
+
+def read_chunked(
+    wallet: EvmWalletProvider,
+    calls: list[ContractCall],
+    block_number: int,
+    chunk_size: int = MULTICALL_BATCH_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[Any]:
+    """Read many calls at one block as chunks of multicalls sent concurrently.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet to read with.
+        calls (list[ContractCall]): The calls to make.
+        block_number (int): The block to read at.
+        chunk_size (int): The number of calls per multicall.
+        max_workers (int): The number of chunks read concurrently.
+
+    Returns:
+        list[Any]: The decoded results in call order.
+
+    """
+    chunks = [calls[start : start + chunk_size] for start in range(0, len(calls), chunk_size)]
+    if len(chunks) <= 1:
+        return wallet.read_contract_many(calls, block_identifier=block_number) if calls else []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        results = executor.map(
+            lambda chunk: wallet.read_contract_many(chunk, block_identifier=block_number),
+            chunks,
+        )
+        return [result for chunk_results in results for result in chunk_results]
+
+
+def scan_positions(
+    wallet: EvmWalletProvider,
+    accounts: Sequence[str],
+    comet_addresses: Sequence[str],
+    chunk_size: int = MULTICALL_BATCH_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> CompoundPortfolioScan:
+    """Read the positions of many accounts in many Compound markets.
+
+    Market configuration and token decimals come from the shared registries. Every
+    price feed is read once, and every account's balances are read in chunked
+    multicalls sent concurrently, all at the same block.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet to read with; any account can be scanned.
+        accounts (Sequence[str]): The accounts to scan.
+        comet_addresses (Sequence[str]): The addresses of the Compound markets to scan.
+        chunk_size (int): The number of calls per multicall.
+        max_workers (int): The number of multicalls sent concurrently.
+
+    Returns:
+        CompoundPortfolioScan: The position of every account in every market.
+
+    Raises:
+        ValueError: If a market's base token has no decimals
+
+    """
+    markets = [get_comet_market(wallet, comet_address) for comet_address in comet_addresses]
+    prefetch_token_metadata(wallet, [market.base_token for market in markets])
+    base_decimals = [get_token_decimals(wallet, market.base_token) for market in markets]
+
+    block_number = wallet.get_block_number()
+    prices = read_prices(
+        wallet, [feed for market in markets for feed in price_feeds(market)], block_number
+    )
+
+    rows = [
+        (account, comet_address, market, decimals)
+        for account in accounts
+        for comet_address, market, decimals in zip(
+            comet_addresses, markets, base_decimals, strict=True
+        )
+    ]
+    calls = [
+        call
+        for account, comet_address, market, _ in rows
+        for call in position_calls(market, comet_address, account)
+    ]
+    results = read_chunked(wallet, calls, block_number, chunk_size, max_workers)
+
+    values = []
+    offset = 0
+    for _, _, market, decimals in rows:
+        count = 1 + len(market.assets)
+        values.append(value_position(market, decimals, prices, results[offset : offset + count]))
+        offset += count
+
+    return CompoundPortfolioScan(
+        block_number=block_number,
+        accounts=[row[0] for row in rows],
+        comet_addresses=[row[1] for row in rows],
+        borrow_values=[value.borrow_value for value in values],
+        collateral_values=[value.collateral_value for value in values],
+        health_ratios=[value.health_ratio for value in values],
+        liquidation_ratios=[value.liquidation_ratio for value in values],
+    )
@@ -61,3 +61,20 @@ class CompoundPortfolioSchema(BaseModel):
     """Input schema for getting portfolio details from Compound."""
 
     pass  # No inputs required
+
+
+class CompoundMaxAmountSchema(BaseModel):
+    """Input schema for finding the largest safe borrow or withdrawal from Compound."""
+
+    operation: Literal["borrow", "withdraw"] = Field(
+        ...,
+        description="The operation to size, either `borrow` or `withdraw`",
+    )
+    asset_id: Literal["weth", "cbeth", "cbbtc", "wsteth"] | None = Field(
+        None,
+        description="The collateral asset ID to withdraw, one of `weth`, `cbeth`, `cbbtc` or `wsteth`; required for `withdraw`",
+    )
+    target_health_ratio: str = Field(
+        "1",
+        description="The lowest health ratio the position should be left with, e.g. `1.5`",
+    )
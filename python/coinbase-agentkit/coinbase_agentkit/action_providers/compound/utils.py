@@ -6,35 +6,8 @@ from typing import Any
 from ...wallet_providers import EvmWalletProvider
 from ..erc20.constants import ERC20_ABI
 from .constants import COMET_ABI, PRICE_FEED_ABI
-
-
-def get_token_decimals(wallet: EvmWalletProvider, token_address: str) -> int:
-    """Get the number of decimals for a token using wallet.read_contract.
-
-    Args:
-        wallet: The wallet provider for reading from contracts.
-        token_address: The address of the token.
-
-    Returns:
-        int: The number of decimals for the token.
-
-    """
-    result = wallet.read_contract(token_address, ERC20_ABI, "decimals")
-    return result
-
-
-def get_token_symbol(wallet: EvmWalletProvider, token_address: str) -> str:
-    """Get a token's symbol from its contract using wallet.read_contract.
-
-    Args:
-        wallet: The wallet provider for reading from contracts.
-        token_address: The address of the token contract.
-
-    Returns:
-        str: The token symbol.
-
-    """
-    return wallet.read_contract(token_address, ERC20_ABI, "symbol")
+from .market_metadata import get_comet_market
+from .position import CompoundPositionSnapshot
 
 
 def get_token_balance(wallet: EvmWalletProvider, token_address: str) -> int:
@@ -118,6 +91,24 @@ def get_collateral_balance(
     )
 
 
+def get_position_snapshot(
+    wallet: EvmWalletProvider, compound_address: str
+) -> CompoundPositionSnapshot:
+    """Read a wallet's whole Compound position in one multicall.
+
+    Inside a read snapshot the position is read once and reused by every helper.
+
+    Args:
+        wallet: The wallet to read the position for.
+        compound_address: The address of the Compound market.
+
+    Returns:
+        CompoundPositionSnapshot: The position.
+
+    """
+    return CompoundPositionSnapshot.load(wallet, compound_address)
+
+
 def get_borrow_details(wallet: EvmWalletProvider, compound_address: str) -> dict[str, Any]:
     """Get the borrow amount, token symbol, and price for a wallet's position.
 
@@ -132,19 +123,7 @@ def get_borrow_details(wallet: EvmWalletProvider, compound_address: str) -> dict
             Price (Decimal): The price of the base token in USD.
 
     """
-    borrow_amount_raw = wallet.read_contract(
-        compound_address, COMET_ABI, "borrowBalanceOf", args=[wallet.get_address()]
-    )
-    base_token = wallet.read_contract(compound_address, COMET_ABI, "baseToken")
-    base_decimals = get_token_decimals(wallet, base_token)
-    base_token_symbol = get_token_symbol(wallet, base_token)
-    base_price_feed = wallet.read_contract(compound_address, COMET_ABI, "baseTokenPriceFeed")
-    base_price_raw, _ = get_price_feed_data(wallet, base_price_feed)
-
-    human_borrow_amount = Decimal(format_amount_from_decimals(borrow_amount_raw, base_decimals))
-    price = Decimal(base_price_raw) / Decimal(10**8)
-
-    return {"Token Symbol": base_token_symbol, "Borrow Amount": human_borrow_amount, "Price": price}
+    return get_position_snapshot(wallet, compound_address).get_borrow_details()
 
 
 def get_supply_details(wallet: EvmWalletProvider, compound_address: str) -> list[dict[str, Any]]:
@@ -167,34 +146,7 @@ def get_supply_details(wallet: EvmWalletProvider, compound_address: str) -> list
             Decimals (int): Number of decimals for the token.
 
     """
-    num_assets = wallet.read_contract(compound_address, COMET_ABI, "numAssets")
-    supply_details = []
-
-    for i in range(num_assets):
-        asset_info = wallet.read_contract(compound_address, COMET_ABI, "getAssetInfo", args=[i])
-        asset_address = asset_info[1]
-        collateral_balance = get_collateral_balance(wallet, compound_address, asset_address)
-
-        if collateral_balance > 0:
-            token_symbol = get_token_symbol(wallet, asset_address)
-            decimals = get_token_decimals(wallet, asset_address)
-            price_raw, _ = get_price_feed_data(wallet, asset_info[2])
-
-            human_supply_amount = Decimal(format_amount_from_decimals(collateral_balance, decimals))
-            price = Decimal(price_raw) / Decimal(10**8)
-            collateral_factor = Decimal(asset_info[4]) / Decimal(10**18)
-
-            supply_details.append(
-                {
-                    "Token Symbol": token_symbol,
-                    "Supply Amount": human_supply_amount,
-                    "Price": price,
-                    "Collateral Factor": collateral_factor,
-                    "Decimals": decimals,
-                }
-            )
-
-    return supply_details
+    return get_position_snapshot(wallet, compound_address).get_supply_details()
 
 
 def get_health_ratio(wallet: EvmWalletProvider, compound_address: str) -> Decimal:
@@ -214,18 +166,7 @@ def get_health_ratio(wallet: EvmWalletProvider, compound_address: str) -> Decima
         Decimal: The current health ratio.
 
     """
-    borrow_details = get_borrow_details(wallet, compound_address)
-    supply_details = get_supply_details(wallet, compound_address)
-
-    borrow_value = Decimal(borrow_details["Borrow Amount"]) * Decimal(borrow_details["Price"])
-
-    total_adjusted_collateral = Decimal(0)
-    for supply in supply_details:
-        collateral_value = Decimal(supply["Supply Amount"]) * Decimal(supply["Price"])
-        adjusted_value = collateral_value * Decimal(supply["Collateral Factor"])
-        total_adjusted_collateral += adjusted_value
-
-    return Decimal("Infinity") if borrow_value == 0 else total_adjusted_collateral / borrow_value
+    return get_position_snapshot(wallet, compound_address).health_ratio()
 
 
 def get_health_ratio_after_borrow(
@@ -243,27 +184,8 @@ def get_health_ratio_after_borrow(
                Returns infinity if there would be no borrows.
 
     """
-    borrow_details = get_borrow_details(wallet, compound_address)
-    supply_details = get_supply_details(wallet, compound_address)
-
-    base_token = wallet.read_contract(compound_address, COMET_ABI, "baseToken")
-    base_decimals = get_token_decimals(wallet, base_token)
-    additional_borrow = Decimal(format_amount_from_decimals(int(borrow_amount), base_decimals))
-
-    current_borrow = Decimal(borrow_details["Borrow Amount"])
-    new_borrow = current_borrow + additional_borrow
-    new_borrow_value = new_borrow * Decimal(borrow_details["Price"])
-
-    total_adjusted_collateral = Decimal(0)
-    for supply in supply_details:
-        collateral_value = Decimal(supply["Supply Amount"]) * Decimal(supply["Price"])
-        total_adjusted_collateral += collateral_value * Decimal(supply["Collateral Factor"])
-
-    return (
-        Decimal("Infinity")
-        if new_borrow_value == 0
-        else total_adjusted_collateral / new_borrow_value
-    )
+    position = get_position_snapshot(wallet, compound_address)
+    return position.health_ratio(borrow_amount=int(borrow_amount))
 
 
 def get_health_ratio_after_withdraw(
@@ -282,28 +204,8 @@ def get_health_ratio_after_withdraw(
                Returns infinity if there would be no borrows.
 
     """
-    borrow_details = get_borrow_details(wallet, compound_address)
-    supply_details = get_supply_details(wallet, compound_address)
-
-    borrow_value = Decimal(borrow_details["Borrow Amount"]) * Decimal(borrow_details["Price"])
-
-    total_adjusted_collateral = Decimal(0)
-    for supply in supply_details:
-        if supply["Token Symbol"] == get_token_symbol(wallet, asset_address):
-            # Subtract the withdrawal amount from this asset's supply
-            decimals = get_token_decimals(wallet, asset_address)
-            withdraw_amount_human = Decimal(
-                format_amount_from_decimals(int(withdraw_amount), decimals)
-            )
-            supply_amount = Decimal(supply["Supply Amount"]) - withdraw_amount_human
-            asset_value = supply_amount * Decimal(supply["Price"])
-            total_adjusted_collateral += asset_value * Decimal(supply["Collateral Factor"])
-        else:
-            # Other assets remain unchanged
-            collateral_value = Decimal(supply["Supply Amount"]) * Decimal(supply["Price"])
-            total_adjusted_collateral += collateral_value * Decimal(supply["Collateral Factor"])
-
-    return Decimal("Infinity") if borrow_value == 0 else total_adjusted_collateral / borrow_value
+    position = get_position_snapshot(wallet, compound_address)
+    return position.health_ratio(withdrawals={asset_address: int(withdraw_amount)})
 
 
 def get_portfolio_details_markdown(wallet: EvmWalletProvider, comet_address: str) -> str:
@@ -317,59 +219,11 @@ def get_portfolio_details_markdown(wallet: EvmWalletProvider, comet_address: str
         str: Markdown formatted portfolio details
 
     """
-    markdown_output = "# Portfolio Details\n\n"
-
-    markdown_output += "## Supply Details\n\n"
-    total_supply_value = Decimal(0)
-
-    supply_details = get_supply_details(wallet, comet_address)
-
-    if supply_details:
-        for supply in supply_details:
-            token = supply["Token Symbol"]
-            supply_amount = supply["Supply Amount"]
-            price = supply["Price"]
-            decimals = supply["Decimals"]
-            collateral_factor = supply["Collateral Factor"]
-            asset_value = supply_amount * price
-
-            markdown_output += f"### {token}\n"
-            markdown_output += f"- **Supply Amount:** {format(supply_amount, f'.{decimals}f')}\n"
-            markdown_output += f"- **Price:** ${price:.2f}\n"
-            markdown_output += f"- **Collateral Factor:** {collateral_factor:.2f}\n"
-            markdown_output += f"- **Asset Value:** ${asset_value:.2f}\n\n"
-            total_supply_value += asset_value
-    else:
-        markdown_output += "No supplied assets found in your Compound position.\n\n"
-
-    markdown_output += f"### Total Supply Value: ${total_supply_value:.2f}\n\n"
-
-    markdown_output += "## Borrow Details\n\n"
-
-    borrow_details = get_borrow_details(wallet, comet_address)
-    borrow_amount = borrow_details["Borrow Amount"]
-
-    if borrow_amount > 0:
-        token = borrow_details["Token Symbol"]
-        price = borrow_details["Price"]
-        borrow_value = borrow_amount * price
-
-        markdown_output += f"### {token}\n"
-        markdown_output += f"- **Borrow Amount:** {borrow_amount:.6f}\n"
-        markdown_output += f"- **Price:** ${price:.2f}\n"
-        markdown_output += f"- **Borrow Value:** ${borrow_value:.2f}\n\n"
-    else:
-        markdown_output += "No borrowed assets found in your Compound position.\n\n"
-
-    markdown_output += "## Overall Health\n\n"
-    health_ratio = get_health_ratio(wallet, comet_address)
-    markdown_output += f"- **Health Ratio:** {health_ratio:.2f}\n"
-
-    return markdown_output
+    return get_position_snapshot(wallet, comet_address).to_markdown()
 
 
 def get_base_token_address(wallet: EvmWalletProvider, comet_address: str) -> str:
-    """Get the base token address from the Compound market.
+    """Get the base token address from the cached configuration of the Compound market.
 
     Args:
         wallet: The wallet provider for reading from contracts.
@@ -379,4 +233,4 @@ def get_base_token_address(wallet: EvmWalletProvider, comet_address: str) -> str
         str: The address of the base token.
 
     """
-    return wallet.read_contract(comet_address, COMET_ABI, "baseToken")
+    return get_comet_market(wallet, comet_address).base_token
@@ -0,0 +1,158 @@
+"""What-if health ratios of a Compound position, evaluated in memory."""
+
+from collections.abc import Sequence
+from decimal import ROUND_FLOOR, Decimal
+
+from .position import CompoundPositionSnapshot
+
+
+class HealthRatioEngine:
+    """Evaluates hypothetical borrows, withdrawals and supplies against one position.
+
+    A position's health ratio is its borrowing capacity divided by the value of its
+    borrow, and both are linear in the amount borrowed, withdrawn or supplied. The
+    engine reduces the position to those linear terms once, so any number of
+    candidate amounts is evaluated without reading the chain again, and the largest
+    amount that keeps a target health ratio is solved for directly.
+    """
+
+    def __init__(self, position: CompoundPositionSnapshot):
+        """Initialize the engine.
+
+        Args:
+            position (CompoundPositionSnapshot): The position to evaluate.
+
+        """
+        self.position = position
+
+        # USD value of one atomic unit of the base token
+        self._base_unit_value = position.base_price / Decimal(10**position.base_decimals)
+        self._borrow_value = position.borrow_balance * self._base_unit_value
+        self._capacity = sum(
+            (asset.value * asset.collateral_factor for asset in position.supplied), Decimal(0)
+        )
+
+    def after_borrow(self, amounts: Sequence[int]) -> list[Decimal]:
+        """Calculate the health ratio after each of several borrows.
+
+        Args:
+            amounts (Sequence[int]): Additional borrows of the base token in atomic units.
+
+        Returns:
+            list[Decimal]: The health ratio after each borrow.
+
+        """
+        return [
+            self._ratio(self._capacity, self._borrow_value + amount * self._base_unit_value)
+            for amount in amounts
+        ]
+
+    def after_withdraw(self, asset_address: str, amounts: Sequence[int]) -> list[Decimal]:
+        """Calculate the health ratio after each of several withdrawals of one asset.
+
+        Args:
+            asset_address (str): The address of the collateral asset.
+            amounts (Sequence[int]): Withdrawals of the asset in atomic units.
+
+        Returns:
+            list[Decimal]: The health ratio after each withdrawal.
+
+        Raises:
+            ValueError: If the asset is not collateral in the market
+
+        """
+        unit_capacity = self._unit_capacity(asset_address)
+        return [
+            self._ratio(self._capacity - amount * unit_capacity, self._borrow_value)
+            for amount in amounts
+        ]
+
+    def after_supply(self, asset_address: str, amounts: Sequence[int]) -> list[Decimal]:
+        """Calculate the health ratio after each of several supplies of one asset.
+
+        Args:
+            asset_address (str): The address of the collateral asset.
+            amounts (Sequence[int]): Supplies of the asset in atomic units.
+
+        Returns:
+            list[Decimal]: The health ratio after each supply.
+
+        Raises:
+            ValueError: If the asset is not collateral in the market
+
+        """
+        unit_capacity = self._unit_capacity(asset_address)
+        return [
+            self._ratio(self._capacity + amount * unit_capacity, self._borrow_value)
+            for amount in amounts
+        ]
+
+    def max_borrow(self, target_health_ratio: Decimal = Decimal(1)) -> int:
+        """Solve for the largest borrow that keeps the health ratio at or above a target.
+
+        Args:
+            target_health_ratio (Decimal): The lowest acceptable health ratio.
+
+        Returns:
+            int: The largest additional borrow of the base token in atomic units.
+
+        Raises:
+            ValueError: If the target health ratio is not positive
+
+        """
+        self._check_target(target_health_ratio)
+        if self._base_unit_value == 0:
+            raise ValueError(f"Market {self.position.comet_address} reports no base token price")
+
+        # capacity / ((borrow + amount) * unit value) >= target
+        headroom = self._capacity / target_health_ratio - self._borrow_value
+        return max(self._floor(headroom / self._base_unit_value), 0)
+
+    def max_withdraw(self, asset_address: str, target_health_ratio: Decimal = Decimal(1)) -> int:
+        """Solve for the largest withdrawal of an asset that keeps a target health ratio.
+
+        Args:
+            asset_address (str): The address of the collateral asset.
+            target_health_ratio (Decimal): The lowest acceptable health ratio.
+
+        Returns:
+            int: The largest withdrawal of the asset in atomic units, at most the supplied
+                balance.
+
+        Raises:
+            ValueError: If the target health ratio is not positive or the asset is not
+                collateral in the market
+
+        """
+        self._check_target(target_health_ratio)
+        balance = self.position.get_asset(asset_address).balance
+        unit_capacity = self._unit_capacity(asset_address)
+        if self._borrow_value == 0 or unit_capacity == 0:
+            return balance
+
+        # (capacity - amount * unit capacity) / borrow value >= target
+        headroom = self._capacity - target_health_ratio * self._borrow_value
+        return min(max(self._floor(headroom / unit_capacity), 0), balance)
+
+    def _unit_capacity(self, asset_address: str) -> Decimal:
+        """Get the borrowing capacity in USD of one atomic unit of a collateral asset."""
+        asset = self.position.get_asset(asset_address)
+        return asset.price * asset.collateral_factor / Decimal(10**asset.decimals)
+
+    @staticmethod
+    def _ratio(capacity: Decimal, borrow_value: Decimal) -> Decimal:
+        """Divide capacity by borrow value, or infinity if there is no borrow."""
+        return (
+            Decimal("Infinity") if borrow_value <= 0 else max(capacity, Decimal(0)) / borrow_value
+        )
+
+    @staticmethod
+    def _floor(amount: Decimal) -> int:
+        """Round an atomic amount down so the target ratio is never crossed."""
+        return int(amount.to_integral_value(rounding=ROUND_FLOOR))
+
+    @staticmethod
+    def _check_target(target_health_ratio: Decimal) -> None:
+        """Reject targets a position cannot be held to."""
+        if target_health_ratio <= 0:
+            raise ValueError(f"Target health ratio must be positive, got {target_health_ratio}")
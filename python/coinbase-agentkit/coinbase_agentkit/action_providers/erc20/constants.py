@@ -56,6 +56,26 @@ ERC20_ABI = [
             },
         ],
     },
+    {
+        "type": "function",
+        "name": "allowance",
+        "stateMutability": "view",
+        "inputs": [
+            {
+                "name": "owner",
+                "type": "address",
+            },
+            {
+                "name": "spender",
+                "type": "address",
+            },
+        ],
+        "outputs": [
+            {
+                "type": "uint256",
+            },
+        ],
+    },
     {
         "type": "function",
         "name": "decimals",
@@ -78,4 +98,120 @@ ERC20_ABI = [
             },
         ],
     },
+    {
+        "type": "function",
+        "name": "name",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [
+            {
+                "type": "string",
+            },
+        ],
+    },
+]
+
+# EIP-2612 extension used to approve spenders with an off-chain signature
+ERC20_PERMIT_ABI = [
+    {
+        "type": "function",
+        "name": "permit",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "owner", "type": "address"},
+            {"name": "spender", "type": "address"},
+            {"name": "value", "type": "uint256"},
+            {"name": "deadline", "type": "uint256"},
+            {"name": "v", "type": "uint8"},
+            {"name": "r", "type": "bytes32"},
+            {"name": "s", "type": "bytes32"},
+        ],
+        "outputs": [],
+    },
+    {
+        "type": "function",
+        "name": "nonces",
+        "stateMutability": "view",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"type": "uint256"}],
+    },
+    {
+        "type": "function",
+        "name": "DOMAIN_SEPARATOR",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"type": "bytes32"}],
+    },
+    {
+        "type": "function",
+        "name": "name",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"type": "string"}],
+    },
+    {
+        "type": "function",
+        "name": "version",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"type": "string"}],
+    },
+]
+
+# Well-known tokens scanned by get_balances when no contract addresses are given
+TOKEN_LISTS = {
+    "base-mainnet": {
+        "USDC": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
+        "USDbC": "0xd9aAEc86B65D86f6A7B5B1b0c42FFA531710b6CA",
+        "DAI": "0x50c5725949A6F0c72E6C4a641F24049A917DB0Cb",
+        "WETH": "0x4200000000000000000000000000000000000006",
+        "cbETH": "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22",
+        "wstETH": "0xc1CBa3fCea344f92D9239c08C0568f6F2F0ee452",
+        "cbBTC": "0xcbB7C0000aB88B473b1f5aFd9ef808440eed33Bf",
+        "AERO": "0x940181a94A35A4569E4529A3CDfB74e38FD98631",
+    },
+    "base-sepolia": {
+        "USDC": "0x036CbD53842c5426634e7929541eC2318f3dCF7e",
+        "WETH": "0x4200000000000000000000000000000000000006",
+        "cbETH": "0x774eD9EDB0C5202dF9A86183804b5D9E99dC6CA3",
+    },
+    "ethereum-mainnet": {
+        "USDC": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+        "USDT": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+        "DAI": "0x6B175474E89094C44Da98b954EedeAC495271d0F",
+        "WETH": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+        "WBTC": "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599",
+    },
+}
+
+DISPERSE_ABI = [
+    {
+        "type": "function",
+        "name": "disperseEther",
+        "stateMutability": "payable",
+        "inputs": [
+            {"name": "recipients", "type": "address[]"},
+            {"name": "values", "type": "uint256[]"},
+        ],
+        "outputs": [],
+    },
+    {
+        "type": "function",
+        "name": "disperseToken",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "token", "type": "address"},
+            {"name": "recipients", "type": "address[]"},
+            {"name": "values", "type": "uint256[]"},
+        ],
+        "outputs": [],
+    },
 ]
+
+# Disperse contracts that send to many recipients in one transaction, by network ID
+DISPERSE_ADDRESSES = {
+    "ethereum-mainnet": "0xD152f549545093347A162Dce210e7293f1452150",
+}
+
+# Recipients paid per disperse transaction, keeping each well under the block gas limit
+MAX_DISPERSE_RECIPIENTS = 200
@@ -4,12 +4,15 @@ from typing import Any
 
 from web3 import Web3
 
+from ...contracts import encode_function_data
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
-from .constants import ERC20_ABI
-from .schemas import GetBalanceSchema, TransferSchema
+from .constants import ERC20_ABI, TOKEN_LISTS
+from .schemas import BatchTransferSchema, GetBalanceSchema, GetBalancesSchema, TransferSchema
+from .token_metadata import get_token_decimals
+from .utils import batch_transfer, format_transfer_report, get_balances
 
 
 class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
@@ -47,17 +50,74 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
                 args=[wallet_provider.get_address()],
             )
 
-            decimals = wallet_provider.read_contract(
-                contract_address=validated_args.contract_address,
-                abi=ERC20_ABI,
-                function_name="decimals",
-                args=[],
-            )
+            decimals = get_token_decimals(wallet_provider, validated_args.contract_address)
 
-            return f"Balance of {validated_args.contract_address} is {balance / 10 ** decimals}"
+            return f"Balance of {validated_args.contract_address} is {balance / 10**decimals}"
         except Exception as e:
             return f"Error getting balance: {e!s}"
 
+    @create_action(
+        name="get_balances",
+        description="""
+        This tool will get the wallet's balances of many ERC20 tokens at once and return them as a table.
+
+        It takes the following inputs:
+        - contract_addresses: The contract addresses of the tokens to check. Leave empty to check well-known tokens on the current network
+        - include_zero: Whether to list tokens the wallet holds none of, defaults to false
+
+        Prefer this over calling get_balance once per token when checking more than one token.
+        """,
+        schema=GetBalancesSchema,
+    )
+    def get_balances(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Get the balances of many ERC20 tokens for the wallet's address.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = GetBalancesSchema(**args)
+
+            contract_addresses = validated_args.contract_addresses
+            if not contract_addresses:
+                network_id = wallet_provider.get_network().network_id
+                if network_id not in TOKEN_LISTS:
+                    return (
+                        f"Error getting balances: no built-in token list for network {network_id}, "
+                        "provide contract_addresses"
+                    )
+                contract_addresses = list(TOKEN_LISTS[network_id].values())
+
+            balances = get_balances(
+                wallet_provider, contract_addresses, include_zero=validated_args.include_zero
+            )
+            if not balances:
+                return (
+                    f"No token balances found for {wallet_provider.get_address()} "
+                    f"across {len(contract_addresses)} tokens"
+                )
+
+            rows = [
+                f"| {balance.symbol or 'Unknown'} | {balance.address} | "
+                f"{'Unavailable' if balance.amount is None else f'{balance.amount.normalize():f}'} |"
+                for balance in balances
+            ]
+            return "\n".join(
+                [
+                    f"Token balances for {wallet_provider.get_address()}:",
+                    "| Token | Contract | Balance |",
+                    "| --- | --- | --- |",
+                    *rows,
+                ]
+            )
+        except Exception as e:
+            return f"Error getting balances: {e!s}"
+
     @create_action(
         name="transfer",
         description="""
@@ -88,9 +148,8 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
         try:
             validated_args = TransferSchema(**args)
 
-            contract = Web3().eth.contract(address=validated_args.contract_address, abi=ERC20_ABI)
-            data = contract.encode_abi(
-                "transfer", [validated_args.destination, int(validated_args.amount)]
+            data = encode_function_data(
+                ERC20_ABI, "transfer", [validated_args.destination, int(validated_args.amount)]
             )
 
             tx_hash = wallet_provider.send_transaction(
@@ -110,6 +169,50 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
         except Exception as e:
             return f"Error transferring the asset: {e!s}"
 
+    @create_action(
+        name="batch_transfer",
+        description="""
+        This tool will transfer an ERC20 token from the wallet to many onchain addresses at once.
+
+        It takes the following inputs:
+        - contract_address: The contract address of the token to transfer
+        - transfers: The destinations and the amount in wei to send each of them
+
+        Important notes:
+        - Ensure sufficient balance of the token for the sum of all amounts
+        - Use this instead of calling transfer once per destination
+        - The result reports the outcome for every destination
+        """,
+        schema=BatchTransferSchema,
+    )
+    def batch_transfer(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Transfer ERC20 tokens to many destination addresses.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider to transfer from.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the outcome for every destination.
+
+        """
+        try:
+            validated_args = BatchTransferSchema(**args)
+
+            results = batch_transfer(
+                wallet_provider,
+                [transfer.destination for transfer in validated_args.transfers],
+                [int(transfer.amount) for transfer in validated_args.transfers],
+                token_address=validated_args.contract_address,
+            )
+
+            return (
+                f"Batch transfer of {validated_args.contract_address}:\n"
+                f"{format_transfer_report(results)}"
+            )
+        except Exception as e:
+            return f"Error transferring the asset: {e!s}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if the network is supported by this action provider.
 
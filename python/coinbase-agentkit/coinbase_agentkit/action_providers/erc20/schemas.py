@@ -14,6 +14,17 @@ class GetBalanceSchema(BaseModel):
     )
 
 
+class GetBalancesSchema(BaseModel):
+    """Schema for getting the balances of many ERC20 tokens."""
+
+    contract_addresses: list[str] | None = Field(
+        None,
+        description="The contract addresses of the tokens to get balances for. "
+        "Defaults to well-known tokens on the wallet's network",
+    )
+    include_zero: bool = Field(False, description="Whether to list tokens the wallet holds none of")
+
+
 class TransferSchema(BaseModel):
     """Schema for transferring ERC20 tokens."""
 
@@ -26,3 +37,25 @@ class TransferSchema(BaseModel):
     def validate_wei_amount(cls, v: str) -> str:
         """Validate wei amount."""
         return wei_amount_validator(v)
+
+
+class BatchTransferItem(BaseModel):
+    """A single payment in a batch transfer."""
+
+    destination: str = Field(description="The destination to transfer the funds")
+    amount: str = Field(description="The amount of the asset to transfer in wei")
+
+    @field_validator("amount")
+    @classmethod
+    def validate_wei_amount(cls, v: str) -> str:
+        """Validate wei amount."""
+        return wei_amount_validator(v)
+
+
+class BatchTransferSchema(BaseModel):
+    """Schema for transferring ERC20 tokens to many destinations."""
+
+    contract_address: str = Field(description="The contract address of the token to transfer")
+    transfers: list[BatchTransferItem] = Field(
+        ..., min_length=1, description="The destinations and amounts to transfer"
+    )
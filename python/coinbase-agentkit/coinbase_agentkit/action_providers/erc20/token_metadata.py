@@ -0,0 +1,306 @@
+"""Registry of immutable ERC20 and ERC721 token metadata shared across calls."""
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+
+from ...wallet_providers import ContractCall, EvmWalletProvider
+from .constants import ERC20_ABI
+
+# Number of tokens kept in memory
+MAX_CACHED_TOKENS = 4096
+
+# Metadata functions read for every token; ERC721 collections revert on decimals
+METADATA_FUNCTIONS = ("name", "symbol", "decimals")
+
+
+class TokenMetadata(BaseModel):
+    """The immutable metadata of a token contract."""
+
+    chain_id: str = Field(..., description="The chain ID the token is deployed on")
+    address: str = Field(..., description="The lowercased address of the token contract")
+    name: str | None = Field(None, description="The token name, if the contract has one")
+    symbol: str | None = Field(None, description="The token symbol, if the contract has one")
+    decimals: int | None = Field(
+        None, description="The number of decimals, or None for tokens without decimals"
+    )
+
+
+class TokenMetadataRegistry:
+    """Caches token metadata forever, keyed by chain ID and token address.
+
+    A token's name, symbol and decimals never change once deployed, so each is read
+    from chain once, in a single multicall, and answered from memory afterwards.
+    Tokens are kept in a bounded LRU and, when a path is given, in a SQLite database
+    so that they survive restarts. A token whose decimals could not be read is only
+    kept once a direct read confirms that ``decimals`` reverts, as it does for ERC721
+    collections; otherwise it is read again on next use.
+    """
+
+    def __init__(self, path: str | Path | None = None, max_entries: int = MAX_CACHED_TOKENS):
+        """Initialize the registry.
+
+        Args:
+            path (str | Path | None): The SQLite database to persist metadata in, or None to
+                keep it in memory only.
+            max_entries (int): Number of tokens kept in memory before the oldest are evicted.
+
+        """
+        self.path = Path(path) if path is not None else None
+        self.max_entries = max_entries
+
+        self._tokens: OrderedDict[tuple[str, str], TokenMetadata] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+
+        if self.path is not None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS token_metadata ("
+                "chain_id TEXT NOT NULL, address TEXT NOT NULL, "
+                "name TEXT, symbol TEXT, decimals INTEGER, "
+                "PRIMARY KEY (chain_id, address))"
+            )
+            self._db.commit()
+
+    def get(self, wallet: EvmWalletProvider, token_address: str) -> TokenMetadata:
+        """Get a token's metadata, reading it from chain on first use.
+
+        Args:
+            wallet (EvmWalletProvider): The wallet to read the token with.
+            token_address (str): The address of the token contract.
+
+        Returns:
+            TokenMetadata: The token's metadata.
+
+        Raises:
+            ValueError: If the address has no name, symbol or decimals
+
+        """
+        return self.get_many(wallet, [token_address])[0]
+
+    def get_many(
+        self, wallet: EvmWalletProvider, token_addresses: list[str]
+    ) -> list[TokenMetadata]:
+        """Get several tokens' metadata, reading every unknown token in one round trip.
+
+        Args:
+            wallet (EvmWalletProvider): The wallet to read the tokens with.
+            token_addresses (list[str]): The addresses of the token contracts.
+
+        Returns:
+            list[TokenMetadata]: The tokens' metadata in address order.
+
+        Raises:
+            ValueError: If an address has no name, symbol or decimals
+
+        """
+        chain_id = str(wallet.get_network().chain_id)
+        keys = [(chain_id, address.lower()) for address in token_addresses]
+        tokens = {key: self._lookup(key) for key in keys}
+
+        missing = [key for key, token in tokens.items() if token is None]
+        if missing:
+            results = wallet.read_contract_many(
+                [
+                    ContractCall(
+                        contract_address=address,
+                        abi=ERC20_ABI,
+                        function_name=function_name,
+                        allow_failure=True,
+                    )
+                    for _, address in missing
+                    for function_name in METADATA_FUNCTIONS
+                ]
+            )
+            for index, key in enumerate(missing):
+                name, symbol, decimals = results[index * 3 : index * 3 + 3]
+                if name is None and symbol is None and decimals is None:
+                    raise ValueError(f"{key[1]} is not a token contract on chain {chain_id}")
+                tokens[key] = TokenMetadata(
+                    chain_id=chain_id, address=key[1], name=name, symbol=symbol, decimals=decimals
+                )
+                # A failed decimals read may be transient, so a token without decimals is
+                # only kept once decimals is confirmed to revert, as for ERC721 collections
+                if decimals is not None or _decimals_reverts(wallet, key[1]):
+                    self._store(tokens[key])
+
+        return [tokens[key] for key in keys]
+
+    def prefetch(self, wallet: EvmWalletProvider, token_addresses: list[str]) -> None:
+        """Read every unknown token's metadata in one round trip ahead of use.
+
+        Args:
+            wallet (EvmWalletProvider): The wallet to read the tokens with.
+            token_addresses (list[str]): The addresses of the token contracts.
+
+        """
+        self.get_many(wallet, list(dict.fromkeys(token_addresses)))
+
+    def clear(self) -> None:
+        """Discard every known token, including those persisted on disk."""
+        with self._lock:
+            self._tokens.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM token_metadata")
+                self._db.commit()
+
+    def _lookup(self, key: tuple[str, str]) -> TokenMetadata | None:
+        """Look up a token in memory, falling back to the database."""
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is not None:
+                self._tokens.move_to_end(key)
+                return token
+            if self._db is None:
+                return None
+
+            row = self._db.execute(
+                "SELECT name, symbol, decimals FROM token_metadata WHERE chain_id = ? AND address = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+
+            token = TokenMetadata(
+                chain_id=key[0], address=key[1], name=row[0], symbol=row[1], decimals=row[2]
+            )
+            self._remember(key, token)
+            return token
+
+    def _store(self, token: TokenMetadata) -> None:
+        """Remember a token in memory and persist it."""
+        with self._lock:
+            self._remember((token.chain_id, token.address), token)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO token_metadata VALUES (?, ?, ?, ?, ?)",
+                    (token.chain_id, token.address, token.name, token.symbol, token.decimals),
+                )
+                self._db.commit()
+
+    def _remember(self, key: tuple[str, str], token: TokenMetadata) -> None:
+        """Add a token to the LRU, evicting the oldest. Requires the lock."""
+        self._tokens[key] = token
+        self._tokens.move_to_end(key)
+        while len(self._tokens) > self.max_entries:
+            self._tokens.popitem(last=False)
+
+
+def _decimals_reverts(wallet: EvmWalletProvider, token_address: str) -> bool:
+    """Check whether a token's decimals function reverts, as opposed to failing to be read."""
+    try:
+        wallet.read_contract(token_address, ERC20_ABI, "decimals")
+    except (ContractLogicError, BadFunctionCallOutput):
+        return True
+    except Exception:
+        return False
+    return False
+
+
+_registry: TokenMetadataRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_token_metadata_registry() -> TokenMetadataRegistry:
+    """Get the process-wide token metadata registry, creating an in-memory one on first use.
+
+    Returns:
+        TokenMetadataRegistry: The shared registry.
+
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = TokenMetadataRegistry()
+        return _registry
+
+
+def configure_token_metadata(
+    path: str | Path | None = None, max_entries: int = MAX_CACHED_TOKENS
+) -> TokenMetadataRegistry:
+    """Replace the process-wide token metadata registry, e.g. to persist it on disk.
+
+    Args:
+        path (str | Path | None): The SQLite database to persist metadata in, or None to
+            keep it in memory only.
+        max_entries (int): Number of tokens kept in memory.
+
+    Returns:
+        TokenMetadataRegistry: The new shared registry.
+
+    """
+    global _registry
+    registry = TokenMetadataRegistry(path, max_entries)
+    with _registry_lock:
+        _registry = registry
+    return registry
+
+
+def get_token_metadata(wallet: EvmWalletProvider, token_address: str) -> TokenMetadata:
+    """Get a token's metadata from the shared registry.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet to read the token with.
+        token_address (str): The address of the token contract.
+
+    Returns:
+        TokenMetadata: The token's metadata.
+
+    """
+    return get_token_metadata_registry().get(wallet, token_address)
+
+
+def prefetch_token_metadata(wallet: EvmWalletProvider, token_addresses: list[str]) -> None:
+    """Read every token not in the shared registry in one round trip.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet to read the tokens with.
+        token_addresses (list[str]): The addresses of the token contracts.
+
+    """
+    get_token_metadata_registry().prefetch(wallet, token_addresses)
+
+
+def get_token_decimals(wallet: EvmWalletProvider, token_address: str) -> int:
+    """Get the number of decimals of an ERC20 token.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet to read the token with.
+        token_address (str): The address of the token contract.
+
+    Returns:
+        int: The number of decimals.
+
+    Raises:
+        ValueError: If the contract has no decimals function
+
+    """
+    decimals = get_token_metadata(wallet, token_address).decimals
+    if decimals is None:
+        raise ValueError(f"Token {token_address} does not have decimals")
+    return decimals
+
+
+def get_token_symbol(wallet: EvmWalletProvider, token_address: str) -> str:
+    """Get the symbol of an ERC20 token or ERC721 collection.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet to read the token with.
+        token_address (str): The address of the token contract.
+
+    Returns:
+        str: The symbol.
+
+    Raises:
+        ValueError: If the contract has no symbol function
+
+    """
+    symbol = get_token_metadata(wallet, token_address).symbol
+    if symbol is None:
+        raise ValueError(f"Token {token_address} does not have a symbol")
+    return symbol
@@ -0,0 +1,682 @@
+"""Utility functions for ERC20 balances, transfers, allowances and EIP-2612 permits."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any, Literal
+
+from eth_abi import encode
+from pydantic import BaseModel, Field
+from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+from web3.types import TxParams
+
+from ...contracts import encode_function_data
+from ...wallet_providers import (
+    ContractCall,
+    EvmWalletProvider,
+    TransactionPipelineError,
+    TransactionResult,
+)
+from .constants import (
+    DISPERSE_ABI,
+    DISPERSE_ADDRESSES,
+    ERC20_ABI,
+    ERC20_PERMIT_ABI,
+    MAX_DISPERSE_RECIPIENTS,
+)
+from .token_metadata import get_token_metadata_registry
+
+# The largest approvable amount
+MAX_UINT256 = 2**256 - 1
+
+# Seconds a permit signature stays valid unless a deadline is given
+PERMIT_VALIDITY = 30 * 60
+
+# Seconds a cached allowance is trusted before it is read again
+ALLOWANCE_TTL = 60.0
+
+# Number of allowances kept in the cache
+MAX_CACHED_ALLOWANCES = 1024
+
+EIP712_DOMAIN_TYPEHASH = Web3.keccak(
+    text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
+)
+
+# Cached allowances and the monotonic time they expire at, least recently used first
+_allowances: OrderedDict[tuple[str, str, str, str], tuple[int, float]] = OrderedDict()
+_allowances_lock = threading.Lock()
+
+_permit_domains: dict[tuple[str, str], dict[str, Any] | None] = {}
+_permit_domains_lock = threading.Lock()
+
+
+class PermitSignature(BaseModel):
+    """An EIP-2612 permit signed by a token owner."""
+
+    owner: str = Field(..., description="The address of the token owner")
+    spender: str = Field(..., description="The address of the approved spender")
+    value: int = Field(..., description="The approved amount in atomic units")
+    deadline: int = Field(..., description="The Unix timestamp after which the permit expires")
+    v: int = Field(..., description="The recovery identifier of the signature")
+    r: bytes = Field(..., description="The r component of the signature")
+    s: bytes = Field(..., description="The s component of the signature")
+
+
+class TokenBalance(BaseModel):
+    """A wallet's balance of one token."""
+
+    address: str = Field(..., description="The address of the token contract")
+    symbol: str | None = Field(None, description="The token symbol, if the contract has one")
+    decimals: int | None = Field(
+        None, description="The number of decimals, or None for tokens without decimals"
+    )
+    balance: int | None = Field(
+        None, description="The balance in atomic units, or None if it could not be read"
+    )
+
+    @property
+    def amount(self) -> Decimal | None:
+        """The balance in whole tokens, or None if it could not be read."""
+        if self.balance is None:
+            return None
+        return Decimal(self.balance) / Decimal(10 ** (self.decimals or 0))
+
+
+def get_balances(
+    wallet: EvmWalletProvider, token_addresses: list[str], include_zero: bool = True
+) -> list[TokenBalance]:
+    """Read the wallet's balances of many tokens in a single multicall.
+
+    Symbols and decimals of the tokens come from the shared token metadata registry,
+    which reads every token it does not know yet in one further round trip.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet whose balances to read.
+        token_addresses (list[str]): The addresses of the token contracts.
+        include_zero (bool): Whether to return tokens the wallet holds none of.
+
+    Returns:
+        list[TokenBalance]: The balances in address order. Tokens whose balance could not
+            be read are returned with a balance of None.
+
+    """
+    owner = wallet.get_address()
+    balances = wallet.read_contract_many(
+        [
+            ContractCall(
+                contract_address=address,
+                abi=ERC20_ABI,
+                function_name="balanceOf",
+                args=[owner],
+                allow_failure=True,
+            )
+            for address in token_addresses
+        ]
+    )
+
+    listed = [
+        (address, balance)
+        for address, balance in zip(token_addresses, balances, strict=True)
+        if balance is None or balance > 0 or include_zero
+    ]
+    readable = [address for address, balance in listed if balance is not None]
+    metadata = dict(
+        zip(readable, get_token_metadata_registry().get_many(wallet, readable), strict=True)
+    )
+
+    return [
+        TokenBalance(
+            address=address,
+            symbol=metadata[address].symbol if address in metadata else None,
+            decimals=metadata[address].decimals if address in metadata else None,
+            balance=balance,
+        )
+        for address, balance in listed
+    ]
+
+
+def _allowance_key(
+    wallet: EvmWalletProvider, token_address: str, spender_address: str
+) -> tuple[str, str, str, str]:
+    """Key an allowance by network, owner, token and spender."""
+    return (
+        str(wallet.get_network().network_id),
+        wallet.get_address().lower(),
+        token_address.lower(),
+        spender_address.lower(),
+    )
+
+
+def _store_allowance(
+    wallet: EvmWalletProvider, token_address: str, spender_address: str, allowance: int
+) -> None:
+    """Cache an allowance for ``ALLOWANCE_TTL`` seconds."""
+    key = _allowance_key(wallet, token_address, spender_address)
+    with _allowances_lock:
+        _allowances[key] = (allowance, time.monotonic() + ALLOWANCE_TTL)
+        _allowances.move_to_end(key)
+        while len(_allowances) > MAX_CACHED_ALLOWANCES:
+            _allowances.popitem(last=False)
+
+
+def invalidate_allowance(
+    wallet: EvmWalletProvider, token_address: str, spender_address: str
+) -> None:
+    """Discard a cached allowance so the next lookup reads it from the token contract.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet that owns the tokens.
+        token_address (str): The address of the token contract.
+        spender_address (str): The address of the spender.
+
+    """
+    with _allowances_lock:
+        _allowances.pop(_allowance_key(wallet, token_address, spender_address), None)
+
+
+def get_allowance(wallet: EvmWalletProvider, token_address: str, spender_address: str) -> int:
+    """Get the amount a spender may spend on behalf of the wallet, reading it only on a cache miss.
+
+    Allowances are cached for ``ALLOWANCE_TTL`` seconds, as they can change through
+    transactions sent outside this process.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet that owns the tokens.
+        token_address (str): The address of the token contract.
+        spender_address (str): The address of the spender.
+
+    Returns:
+        int: The allowance in atomic units.
+
+    """
+    key = _allowance_key(wallet, token_address, spender_address)
+    with _allowances_lock:
+        cached = _allowances.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            _allowances.move_to_end(key)
+            return cached[0]
+
+    allowance = wallet.read_contract(
+        token_address, ERC20_ABI, "allowance", [wallet.get_address(), spender_address]
+    )
+    _store_allowance(wallet, token_address, spender_address, allowance)
+    return allowance
+
+
+def get_balance_and_allowance(
+    wallet: EvmWalletProvider, token_address: str, spender_address: str
+) -> tuple[int, int]:
+    """Read the wallet's token balance and a spender's allowance in a single round trip.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet that owns the tokens.
+        token_address (str): The address of the token contract.
+        spender_address (str): The address of the spender.
+
+    Returns:
+        tuple[int, int]: The balance and the allowance in atomic units.
+
+    """
+    owner = wallet.get_address()
+    balance, allowance = wallet.read_contract_many(
+        [
+            ContractCall(
+                contract_address=token_address,
+                abi=ERC20_ABI,
+                function_name="balanceOf",
+                args=[owner],
+            ),
+            ContractCall(
+                contract_address=token_address,
+                abi=ERC20_ABI,
+                function_name="allowance",
+                args=[owner, spender_address],
+            ),
+        ]
+    )
+    _store_allowance(wallet, token_address, spender_address, allowance)
+    return balance, allowance
+
+
+def _domain_separator(name: str, version: str, chain_id: int, token_address: str) -> bytes:
+    """Compute the EIP-712 domain separator of a token."""
+    return Web3.keccak(
+        encode(
+            ["bytes32", "bytes32", "bytes32", "uint256", "address"],
+            [
+                EIP712_DOMAIN_TYPEHASH,
+                Web3.keccak(text=name),
+                Web3.keccak(text=version),
+                chain_id,
+                Web3.to_checksum_address(token_address),
+            ],
+        )
+    )
+
+
+def get_permit_domain(wallet: EvmWalletProvider, token_address: str) -> dict[str, Any] | None:
+    """Get the EIP-712 domain a token's permits are signed in, if it supports EIP-2612.
+
+    Support is detected by matching the token's ``DOMAIN_SEPARATOR`` against its name
+    and version. The result is remembered per token unless the reads failed without
+    the token reverting.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet to read the token with.
+        token_address (str): The address of the token contract.
+
+    Returns:
+        dict[str, Any] | None: The EIP-712 domain, or None if the token does not support permits.
+
+    """
+    key = (str(wallet.get_network().network_id), token_address.lower())
+    with _permit_domains_lock:
+        if key in _permit_domains:
+            return _permit_domains[key]
+
+    name, version, separator = wallet.read_contract_many(
+        [
+            ContractCall(
+                contract_address=token_address,
+                abi=ERC20_PERMIT_ABI,
+                function_name=function_name,
+                allow_failure=True,
+            )
+            for function_name in ("name", "version", "DOMAIN_SEPARATOR")
+        ]
+    )
+
+    domain = None
+    if name is None or separator is None:
+        # A call missing from a batch may have hit a transient RPC error rather than a
+        # token without the function, so only a confirmed revert is remembered
+        missing = "name" if name is None else "DOMAIN_SEPARATOR"
+        if not _reverts(wallet, token_address, missing):
+            return None
+    else:
+        chain_id = int(wallet.get_network().chain_id)
+        # Tokens without a version() function commonly sign with version "1"
+        for candidate in dict.fromkeys(v for v in (version, "1", "2") if v is not None):
+            if _domain_separator(name, candidate, chain_id, token_address) == bytes(separator):
+                domain = {
+                    "name": name,
+                    "version": candidate,
+                    "chainId": chain_id,
+                    "verifyingContract": Web3.to_checksum_address(token_address),
+                }
+                break
+
+    with _permit_domains_lock:
+        _permit_domains[key] = domain
+    return domain
+
+
+def _reverts(wallet: EvmWalletProvider, token_address: str, function_name: str) -> bool:
+    """Check whether a permit token function reverts, as opposed to failing to be read."""
+    try:
+        wallet.read_contract(token_address, ERC20_PERMIT_ABI, function_name)
+    except (ContractLogicError, BadFunctionCallOutput):
+        return True
+    except Exception:
+        return False
+    return False
+
+
+def supports_permit(wallet: EvmWalletProvider, token_address: str) -> bool:
+    """Check whether a token supports EIP-2612 permits.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet to read the token with.
+        token_address (str): The address of the token contract.
+
+    Returns:
+        bool: True if approvals can be signed off-chain.
+
+    """
+    return get_permit_domain(wallet, token_address) is not None
+
+
+def sign_permit(
+    wallet: EvmWalletProvider,
+    token_address: str,
+    spender_address: str,
+    value: int,
+    deadline: int | None = None,
+) -> PermitSignature:
+    """Sign an EIP-2612 permit approving a spender without an on-chain transaction.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet that owns the tokens.
+        token_address (str): The address of the token contract.
+        spender_address (str): The address of the spender.
+        value (int): The amount to approve in atomic units.
+        deadline (int | None): The Unix timestamp after which the permit expires.
+
+    Returns:
+        PermitSignature: The signed permit.
+
+    Raises:
+        ValueError: If the token does not support EIP-2612 permits
+
+    """
+    domain = get_permit_domain(wallet, token_address)
+    if domain is None:
+        raise ValueError(f"Token {token_address} does not support EIP-2612 permits")
+
+    owner = wallet.get_address()
+    deadline = deadline if deadline is not None else int(time.time()) + PERMIT_VALIDITY
+    nonce = wallet.read_contract(token_address, ERC20_PERMIT_ABI, "nonces", [owner])
+
+    signature = Web3.to_bytes(
+        hexstr=wallet.sign_typed_data(
+            {
+                "types": {
+                    "EIP712Domain": [
+                        {"name": "name", "type": "string"},
+                        {"name": "version", "type": "string"},
+                        {"name": "chainId", "type": "uint256"},
+                        {"name": "verifyingContract", "type": "address"},
+                    ],
+                    "Permit": [
+                        {"name": "owner", "type": "address"},
+                        {"name": "spender", "type": "address"},
+                        {"name": "value", "type": "uint256"},
+                        {"name": "nonce", "type": "uint256"},
+                        {"name": "deadline", "type": "uint256"},
+                    ],
+                },
+                "primaryType": "Permit",
+                "domain": domain,
+                "message": {
+                    "owner": owner,
+                    "spender": Web3.to_checksum_address(spender_address),
+                    "value": value,
+                    "nonce": nonce,
+                    "deadline": deadline,
+                },
+            }
+        )
+    )
+
+    v = signature[64]
+    return PermitSignature(
+        owner=owner,
+        spender=spender_address,
+        value=value,
+        deadline=deadline,
+        v=v + 27 if v < 27 else v,
+        r=signature[:32],
+        s=signature[32:64],
+    )
+
+
+def build_permit_transaction(token_address: str, permit: PermitSignature) -> TxParams:
+    """Build a transaction submitting a signed permit to the token contract.
+
+    Args:
+        token_address (str): The address of the token contract.
+        permit (PermitSignature): The signed permit.
+
+    Returns:
+        TxParams: The permit transaction parameters.
+
+    """
+    return {
+        "to": token_address,
+        "data": encode_function_data(
+            ERC20_PERMIT_ABI,
+            "permit",
+            [
+                permit.owner,
+                permit.spender,
+                permit.value,
+                permit.deadline,
+                permit.v,
+                permit.r,
+                permit.s,
+            ],
+        ),
+    }
+
+
+def send_with_approval(
+    wallet: EvmWalletProvider,
+    token_address: str,
+    spender_address: str,
+    amount: int,
+    transaction: TxParams,
+    approve_max: bool = False,
+    allowance: int | None = None,
+    permit_transaction: Callable[[PermitSignature], TxParams] | None = None,
+) -> list[TransactionResult]:
+    """Send a transaction that spends tokens, approving the spender first only if needed.
+
+    The approval and the transaction are sent as one pipeline. If the spender has an
+    entry point that consumes an EIP-2612 permit and the token supports permits, the
+    approval is signed off-chain instead and only that one transaction is sent. The
+    cached allowance is updated once the transactions are mined, and discarded if
+    any fails.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet that owns the tokens.
+        token_address (str): The address of the token contract.
+        spender_address (str): The address of the spender.
+        amount (int): The amount the transaction spends in atomic units.
+        transaction (TxParams): The transaction that spends the tokens.
+        approve_max (bool): Whether to approve the maximum amount, so later spends need no approval.
+        allowance (int | None): The current allowance, if already known.
+        permit_transaction (Callable[[PermitSignature], TxParams] | None): Builds the spending
+            transaction through a permit-enabled entry point, used in place of ``transaction``
+            and an approval when the token supports permits.
+
+    Returns:
+        list[TransactionResult]: The outcome of the approval, if one was sent, and the transaction.
+
+    Raises:
+        TransactionPipelineError: If the approval or the transaction does not succeed. A
+            ``failed_index`` before the last transaction means the approval failed.
+
+    """
+    if allowance is None:
+        allowance = get_allowance(wallet, token_address, spender_address)
+
+    transactions = [transaction]
+    if allowance < amount:
+        allowance = MAX_UINT256 if approve_max else amount
+        if permit_transaction is not None and supports_permit(wallet, token_address):
+            permit = sign_permit(wallet, token_address, spender_address, allowance)
+            transactions = [permit_transaction(permit)]
+        else:
+            transactions.insert(
+                0,
+                {
+                    "to": token_address,
+                    "data": encode_function_data(
+                        ERC20_ABI, "approve", [spender_address, allowance]
+                    ),
+                },
+            )
+
+    try:
+        results = wallet.send_transactions(transactions)
+    except TransactionPipelineError:
+        invalidate_allowance(wallet, token_address, spender_address)
+        raise
+
+    # Some tokens keep a maximum allowance unchanged on spends and others, e.g. USDC,
+    # decrement it, so the smaller of the two is cached
+    _store_allowance(wallet, token_address, spender_address, allowance - amount)
+    return results
+
+
+class TransferResult(BaseModel):
+    """The outcome of paying one recipient in a batch transfer."""
+
+    recipient: str = Field(..., description="The address of the recipient")
+    amount: int = Field(..., description="The amount sent in atomic units")
+    status: Literal["confirmed", "reverted", "failed", "skipped"] = Field(
+        ..., description="The status of the transaction that paid the recipient"
+    )
+    transaction_hash: str | None = Field(None, description="The transaction hash, if sent")
+    error: str | None = Field(None, description="Why the payment did not succeed")
+
+
+def batch_transfer(
+    wallet: EvmWalletProvider,
+    recipients: list[str],
+    amounts: list[int],
+    token_address: str | None = None,
+    use_disperse: bool = True,
+) -> list[TransferResult]:
+    """Pay many recipients in native currency or an ERC20 token.
+
+    On networks with a disperse contract, up to ``MAX_DISPERSE_RECIPIENTS`` recipients
+    are paid per transaction, approving the contract first if needed. Elsewhere every
+    recipient gets its own transfer. The transfers are sent with consecutive nonces
+    without waiting for each other, and their receipts are awaited together.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet to pay from.
+        recipients (list[str]): The addresses to pay.
+        amounts (list[int]): The amount to pay each recipient in atomic units.
+        token_address (str | None): The token to pay in, or None for native currency.
+        use_disperse (bool): Whether to pay through a disperse contract where one is available.
+
+    Returns:
+        list[TransferResult]: The outcome for each recipient, in order.
+
+    Raises:
+        ValueError: If recipients and amounts differ in length
+
+    """
+    if len(recipients) != len(amounts):
+        raise ValueError(f"Got {len(recipients)} recipients but {len(amounts)} amounts")
+
+    disperse_address = DISPERSE_ADDRESSES.get(wallet.get_network().network_id)
+    if not use_disperse or disperse_address is None:
+        return _transfer_each(wallet, recipients, amounts, token_address)
+
+    results = []
+    for start in range(0, len(recipients), MAX_DISPERSE_RECIPIENTS):
+        end = start + MAX_DISPERSE_RECIPIENTS
+        results.extend(
+            _disperse(
+                wallet, disperse_address, recipients[start:end], amounts[start:end], token_address
+            )
+        )
+    return results
+
+
+def format_transfer_report(
+    results: list[TransferResult], format_amount: Callable[[int], str] = str
+) -> str:
+    """Summarize a batch transfer as a table with a row per recipient.
+
+    Args:
+        results (list[TransferResult]): The outcome for each recipient.
+        format_amount (Callable[[int], str]): Formats an amount in atomic units for display.
+
+    Returns:
+        str: The summary and table.
+
+    """
+    confirmed = sum(result.status == "confirmed" for result in results)
+    rows = [
+        f"| {result.recipient} | {format_amount(result.amount)} | {result.status} | "
+        f"{result.transaction_hash or result.error or ''} |"
+        for result in results
+    ]
+    return "\n".join(
+        [
+            f"Paid {confirmed} of {len(results)} recipients.",
+            "| Recipient | Amount | Status | Transaction |",
+            "| --- | --- | --- | --- |",
+            *rows,
+        ]
+    )
+
+
+def _transfer_each(
+    wallet: EvmWalletProvider, recipients: list[str], amounts: list[int], token_address: str | None
+) -> list[TransferResult]:
+    """Pay each recipient with its own transaction, pipelined."""
+    transactions: list[TxParams] = [
+        {"to": Web3.to_checksum_address(recipient), "value": amount}
+        if token_address is None
+        else {
+            "to": token_address,
+            "data": encode_function_data(ERC20_ABI, "transfer", [recipient, amount]),
+        }
+        for recipient, amount in zip(recipients, amounts, strict=True)
+    ]
+
+    try:
+        outcomes = wallet.send_transactions(transactions)
+    except TransactionPipelineError as e:
+        outcomes = e.results
+
+    return [
+        _transfer_result(recipient, amount, outcome)
+        for recipient, amount, outcome in zip(recipients, amounts, outcomes, strict=True)
+    ]
+
+
+def _disperse(
+    wallet: EvmWalletProvider,
+    disperse_address: str,
+    recipients: list[str],
+    amounts: list[int],
+    token_address: str | None,
+) -> list[TransferResult]:
+    """Pay recipients in one transaction through a disperse contract."""
+    addresses = [Web3.to_checksum_address(recipient) for recipient in recipients]
+    total = sum(amounts)
+
+    try:
+        if token_address is None:
+            outcome = wallet.send_transactions(
+                [
+                    {
+                        "to": disperse_address,
+                        "value": total,
+                        "data": encode_function_data(
+                            DISPERSE_ABI, "disperseEther", [addresses, amounts]
+                        ),
+                    }
+                ]
+            )[-1]
+        else:
+            outcome = send_with_approval(
+                wallet,
+                token_address,
+                disperse_address,
+                total,
+                {
+                    "to": disperse_address,
+                    "data": encode_function_data(
+                        DISPERSE_ABI, "disperseToken", [token_address, addresses, amounts]
+                    ),
+                },
+            )[-1]
+    except TransactionPipelineError as e:
+        # Report the approval's failure if that is what stopped the disperse
+        outcome = e.results[e.failed_index]
+
+    return [
+        _transfer_result(recipient, amount, outcome)
+        for recipient, amount in zip(recipients, amounts, strict=True)
+    ]
+
+
+def _transfer_result(recipient: str, amount: int, outcome: TransactionResult) -> TransferResult:
+    """Describe a recipient's payment by the outcome of the transaction that made it."""
+    return TransferResult(
+        recipient=recipient,
+        amount=amount,
+        status=outcome.status,
+        transaction_hash=outcome.transaction_hash,
+        error=outcome.error,
+    )
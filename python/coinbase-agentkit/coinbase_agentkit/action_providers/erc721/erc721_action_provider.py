@@ -3,8 +3,8 @@
 from typing import Any
 
 from eth_typing import HexStr
-from web3 import Web3
 
+from ...contracts import encode_function_data
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
@@ -41,8 +41,7 @@ Do not use the contract address as the destination address. If you are unsure of
 
         """
         try:
-            contract = Web3().eth.contract(address=args["contract_address"], abi=ERC721_ABI)
-            data = contract.encode_abi("mint", args=[args["destination"], 1])
+            data = encode_function_data(ERC721_ABI, "mint", [args["destination"], 1])
 
             tx_hash = wallet_provider.send_transaction(
                 {
@@ -86,12 +85,12 @@ Important notes:
 
         """
         try:
-            contract = Web3().eth.contract(address=args["contract_address"], abi=ERC721_ABI)
             from_address = args.get("from_address") or wallet_provider.get_address()
 
-            data = contract.encode_abi(
+            data = encode_function_data(
+                ERC721_ABI,
                 "transferFrom",
-                args=[from_address, args["destination"], int(args["token_id"])],
+                [from_address, args["destination"], int(args["token_id"])],
             )
 
             tx_hash = wallet_provider.send_transaction(
@@ -7,14 +7,15 @@ from web3 import Web3
 
 from coinbase_agentkit.action_providers.action_decorator import create_action
 from coinbase_agentkit.action_providers.action_provider import ActionProvider
+from coinbase_agentkit.action_providers.erc20.utils import send_with_approval
 from coinbase_agentkit.action_providers.morpho.constants import METAMORPHO_ABI
 from coinbase_agentkit.action_providers.morpho.schemas import (
     MorphoDepositSchema,
     MorphoWithdrawSchema,
 )
-from coinbase_agentkit.action_providers.morpho.utils import approve
+from coinbase_agentkit.contracts import encode_function_data
 from coinbase_agentkit.network import Network
-from coinbase_agentkit.wallet_providers import EvmWalletProvider
+from coinbase_agentkit.wallet_providers import EvmWalletProvider, TransactionPipelineError
 
 SUPPORTED_NETWORKS = ["base-mainnet", "base-sepolia"]
 
@@ -22,8 +23,16 @@ SUPPORTED_NETWORKS = ["base-mainnet", "base-sepolia"]
 class MorphoActionProvider(ActionProvider[EvmWalletProvider]):
     """Provides actions for interacting with Morpho Vaults."""
 
-    def __init__(self):
+    def __init__(self, approve_max: bool = False):
+        """Initialize the Morpho action provider.
+
+        Args:
+            approve_max (bool): Whether to approve a vault for the maximum amount on the first
+                deposit of a token, so later deposits need no approval transaction.
+
+        """
         super().__init__("morpho", [])
+        self.approve_max = approve_max
 
     @create_action(
         name="deposit",
@@ -62,15 +71,8 @@ Important notes:
         try:
             atomic_assets = Web3.to_wei(assets, "ether")
 
-            try:
-                approve(wallet_provider, args["token_address"], args["vault_address"], atomic_assets)
-            except Exception as e:
-                return f"Error approving Morpho Vault as spender: {e!s}"
-
-            morpho_contract = Web3().eth.contract(address=args["vault_address"], abi=METAMORPHO_ABI)
-
-            encoded_data = morpho_contract.encode_abi(
-                "deposit", args=[atomic_assets, args["receiver"]]
+            encoded_data = encode_function_data(
+                METAMORPHO_ABI, "deposit", [atomic_assets, args["receiver"]]
             )
 
             params = {
@@ -78,8 +80,20 @@ Important notes:
                 "data": encoded_data,
             }
 
-            tx_hash = wallet_provider.send_transaction(params)
-            wallet_provider.wait_for_transaction_receipt(tx_hash)
+            try:
+                results = send_with_approval(
+                    wallet_provider,
+                    args["token_address"],
+                    args["vault_address"],
+                    atomic_assets,
+                    params,
+                    approve_max=self.approve_max,
+                )
+            except TransactionPipelineError as e:
+                if e.failed_index < len(e.results) - 1:
+                    return f"Error approving Morpho Vault as spender: {e!s}"
+                raise
+            tx_hash = results[-1].transaction_hash
 
             return f"Deposited {args['assets']} to Morpho Vault {args['vault_address']} with transaction hash: {tx_hash}"
 
@@ -114,9 +128,8 @@ This tool allows withdrawing assets from a Morpho Vault. It takes:
 
         atomic_assets = Web3.to_wei(assets, "ether")
 
-        contract = Web3().eth.contract(address=args["vault_address"], abi=METAMORPHO_ABI)
-        encoded_data = contract.encode_abi(
-            "withdraw", args=[atomic_assets, args["receiver"], args["receiver"]]
+        encoded_data = encode_function_data(
+            METAMORPHO_ABI, "withdraw", [atomic_assets, args["receiver"], args["receiver"]]
         )
 
         try:
@@ -146,11 +159,14 @@ This tool allows withdrawing assets from a Morpho Vault. It takes:
         return network.protocol_family == "evm" and network.network_id in SUPPORTED_NETWORKS
 
 
-def morpho_action_provider() -> MorphoActionProvider:
+def morpho_action_provider(approve_max: bool = False) -> MorphoActionProvider:
     """Create a new Morpho action provider.
 
+    Args:
+        approve_max (bool): Whether to approve vaults for the maximum amount on the first deposit.
+
     Returns:
         MorphoActionProvider: A new Morpho action provider instance.
 
     """
-    return MorphoActionProvider()
+    return MorphoActionProvider(approve_max=approve_max)
@@ -2,8 +2,7 @@
 
 from typing import Any
 
-from web3 import Web3
-
+from ...contracts import encode_function_data
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
@@ -45,13 +44,10 @@ Important notes:
 
         """
         try:
-            superfluid_host_contract = Web3().eth.contract(
-                address=SUPERFLUID_HOST_ADDRESS, abi=CREATE_ABI
-            )
-
-            encoded_data = superfluid_host_contract.encode_abi(
+            encoded_data = encode_function_data(
+                CREATE_ABI,
                 "createFlow",
-                args=[
+                [
                     args["token_address"],
                     wallet_provider.get_address(),
                     args["recipient"],
@@ -97,13 +93,10 @@ Important notes:
 
         """
         try:
-            superfluid_host_contract = Web3().eth.contract(
-                address=SUPERFLUID_HOST_ADDRESS, abi=UPDATE_ABI
-            )
-
-            encoded_data = superfluid_host_contract.encode_abi(
+            encoded_data = encode_function_data(
+                UPDATE_ABI,
                 "updateFlow",
-                args=[
+                [
                     args["token_address"],
                     wallet_provider.get_address(),
                     args["recipient"],
@@ -144,13 +137,10 @@ Inputs:
 
         """
         try:
-            superfluid_host_contract = Web3().eth.contract(
-                address=SUPERFLUID_HOST_ADDRESS, abi=DELETE_ABI
-            )
-
-            encoded_data = superfluid_host_contract.encode_abi(
+            encoded_data = encode_function_data(
+                DELETE_ABI,
                 "deleteFlow",
-                args=[
+                [
                     args["token_address"],
                     wallet_provider.get_address(),
                     args["recipient"],
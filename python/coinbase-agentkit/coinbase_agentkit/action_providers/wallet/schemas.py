@@ -33,3 +33,11 @@ class NativeTransferSchema(BaseModel):
     def validate_value(cls, v: str) -> str:
         """Validate the transfer value."""
         return positive_decimal_validator(v)
+
+
+class BatchNativeTransferSchema(BaseModel):
+    """Input schema for native asset transfers to many addresses."""
+
+    transfers: list[NativeTransferSchema] = Field(
+        ..., min_length=1, description="The destinations and amounts to transfer"
+    )
@@ -2,11 +2,20 @@
 
 from typing import Any
 
+from web3 import Web3
+
 from ...network import Network
+from ...wallet_providers.evm_wallet_provider import EvmWalletProvider
 from ...wallet_providers.wallet_provider import WalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
-from .schemas import GetBalanceSchema, GetWalletDetailsSchema, NativeTransferSchema
+from ..erc20.utils import batch_transfer, format_transfer_report
+from .schemas import (
+    BatchNativeTransferSchema,
+    GetBalanceSchema,
+    GetWalletDetailsSchema,
+    NativeTransferSchema,
+)
 
 
 class WalletActionProvider(ActionProvider[WalletProvider]):
@@ -111,6 +120,51 @@ Important notes:
         except Exception as e:
             return f"Error transferring native tokens: {e}"
 
+    @create_action(
+        name="batch_native_transfer",
+        description="""
+This tool will transfer native tokens from the wallet to many onchain addresses at once.
+
+It takes the following inputs:
+- transfers: A list of destinations, each with:
+  - to: The destination address to receive the funds
+  - value: The amount to transfer in whole units (e.g. '1.5' for 1.5 ETH)
+
+Important notes:
+- Ensure sufficient balance for the sum of all transfers AND their gas costs
+- Use this instead of calling native_transfer once per destination
+- The result reports the outcome for every destination
+- Only available on EVM networks
+""",
+        schema=BatchNativeTransferSchema,
+    )
+    def batch_native_transfer(self, wallet_provider: WalletProvider, args: dict[str, Any]) -> str:
+        """Transfer native tokens from the connected wallet to many destination addresses.
+
+        Args:
+            wallet_provider (WalletProvider): The wallet provider to transfer tokens from.
+            args (dict[str, Any]): Arguments containing the destinations and transfer amounts.
+
+        Returns:
+            str: A message containing the outcome for every destination.
+
+        """
+        try:
+            validated_args = BatchNativeTransferSchema(**args)
+            if not isinstance(wallet_provider, EvmWalletProvider):
+                return "Error transferring native tokens: batch transfers require an EVM wallet"
+
+            results = batch_transfer(
+                wallet_provider,
+                [transfer.to for transfer in validated_args.transfers],
+                [Web3.to_wei(transfer.value, "ether") for transfer in validated_args.transfers],
+            )
+            return format_transfer_report(
+                results, lambda amount: str(Web3.from_wei(amount, "ether"))
+            )
+        except Exception as e:
+            return f"Error transferring native tokens: {e}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if network is supported by wallet actions.
 
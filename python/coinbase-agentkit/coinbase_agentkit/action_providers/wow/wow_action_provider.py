@@ -5,6 +5,7 @@ from typing import Any
 
 from web3 import Web3
 
+from ...contracts import encode_function_data
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
@@ -73,11 +74,8 @@ Important notes:
 
             min_tokens = math.floor(float(token_quote) * 0.99)
 
-            contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(args["contract_address"]), abi=WOW_ABI
-            )
-
-            encoded_data = contract.encode_abi(
+            encoded_data = encode_function_data(
+                WOW_ABI,
                 "buy",
                 [
                     wallet_provider.get_address(),
@@ -142,10 +140,6 @@ Important notes:
 
             token_uri = args.get("token_uri") or GENERIC_TOKEN_METADATA_URI
 
-            contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(factory_address), abi=WOW_FACTORY_ABI
-            )
-
             creator_address = wallet_provider.get_address()
             deploy_args = [
                 Web3.to_checksum_address(creator_address),
@@ -155,7 +149,7 @@ Important notes:
                 args["symbol"],
             ]
 
-            encoded_data = contract.encode_abi("deploy", deploy_args)
+            encoded_data = encode_function_data(WOW_FACTORY_ABI, "deploy", deploy_args)
 
             tx = {
                 "to": factory_address,
@@ -220,11 +214,8 @@ Important notes:
 
             min_eth = math.floor(float(eth_quote) * 0.98)
 
-            contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(args["contract_address"]), abi=WOW_ABI
-            )
-
-            encoded_data = contract.encode_abi(
+            encoded_data = encode_function_data(
+                WOW_ABI,
                 "sell",
                 [
                     int(args["amount_tokens_in_wei"]),
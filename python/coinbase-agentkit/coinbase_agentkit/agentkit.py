@@ -1,8 +1,10 @@
 """AgentKit - The framework for enabling AI agents to take actions onchain."""
 
+from typing import Any
+
 from pydantic import BaseModel, ConfigDict
 
-from .action_providers import Action, ActionProvider, wallet_action_provider
+from .action_providers import Action, ActionCatalog, ActionProvider, wallet_action_provider
 from .wallet_providers import CdpWalletProvider, CdpWalletProviderConfig, WalletProvider
 
 
@@ -43,22 +45,92 @@ class AgentKit:
         )
         self.action_providers = config.action_providers or [wallet_action_provider()]
 
+        self._action_catalog: ActionCatalog | None = None
+        self._action_catalog_key: tuple[Any, ...] | None = None
+
     def get_actions(self) -> list[Action]:
         """Get all available actions for the current wallet and network.
 
+        The actions are built once per wallet provider, network and set of action
+        providers, and reused until one of them changes.
+
         Returns:
             list[Action]: List of available actions from all providers
 
         Raises:
             ValueError: If no wallet provider is configured
 
+        """
+        return list(self.get_action_catalog().actions)
+
+    def get_action_catalog(self) -> ActionCatalog:
+        """Get the indexed catalog of actions for the current wallet and network.
+
+        Returns:
+            ActionCatalog: The catalog of available actions
+
+        Raises:
+            ValueError: If no wallet provider is configured
+
         """
         if not self.wallet_provider:
             raise ValueError("No wallet provider configured")
 
-        actions: list[Action] = []
-        for provider in self.action_providers:
-            if provider.supports_network(self.wallet_provider.get_network()):
-                actions.extend(provider.get_actions(self.wallet_provider))
+        network = self.wallet_provider.get_network()
+        catalog_key = (
+            self.wallet_provider,
+            network.protocol_family,
+            network.network_id,
+            network.chain_id,
+            tuple(self.action_providers),
+        )
+
+        catalog = self._action_catalog
+        if catalog is None or catalog_key != self._action_catalog_key:
+            actions: list[Action] = []
+            for provider in self.action_providers:
+                if provider.supports_network(network):
+                    actions.extend(provider.get_actions(self.wallet_provider))
+
+            catalog = ActionCatalog(actions)
+            self._action_catalog = catalog
+            self._action_catalog_key = catalog_key
+
+        return catalog
+
+    def invalidate_actions(self) -> None:
+        """Discard the cached action catalog so it is rebuilt on next use."""
+        self._action_catalog = None
+        self._action_catalog_key = None
+
+    def invoke(self, name: str, args: dict[str, Any]) -> Any:
+        """Invoke an action by name.
 
-        return actions
+        Args:
+            name (str): The name of the action to invoke
+            args (dict[str, Any]): The input arguments for the action
+
+        Returns:
+            Any: The result of the action
+
+        Raises:
+            ValueError: If no wallet provider is configured or the action does not exist
+
+        """
+        return self.get_action_catalog().invoke(name, args)
+
+    async def ainvoke(self, name: str, args: dict[str, Any]) -> Any:
+        """Invoke an action by name asynchronously.
+
+        Args:
+            name (str): The name of the action to invoke
+            args (dict[str, Any]): The input arguments for the action
+
+        Returns:
+            Any: The result of the action
+
+        Raises:
+            ValueError: If no wallet provider is configured or the action does not exist
+
+        """
+        return await self.get_action_catalog().ainvoke(name, args)
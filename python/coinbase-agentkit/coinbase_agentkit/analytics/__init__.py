@@ -1,5 +1,11 @@
 """Analytics module for tracking metrics in AgentKit."""
 
+from .analytics_dispatcher import AnalyticsDispatcher, get_analytics_dispatcher
 from .send_analytics_event import RequiredEventData, send_analytics_event
 
-__all__ = ["RequiredEventData", "send_analytics_event"]
+__all__ = [
+    "AnalyticsDispatcher",
+    "RequiredEventData",
+    "get_analytics_dispatcher",
+    "send_analytics_event",
+]
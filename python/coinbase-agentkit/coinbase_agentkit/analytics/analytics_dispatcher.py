@@ -0,0 +1,221 @@
+"""Background dispatcher for analytics events."""
+
+import atexit
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from typing import Any
+
+import requests
+
+ANALYTICS_API_ENDPOINT = "https://cca-lite.coinbase.com"
+ANALYTICS_EVENT_PATH = "/amp"
+
+
+class AnalyticsDispatcher:
+    """Delivers analytics events from a bounded in-memory queue on a background thread.
+
+    Enqueuing never blocks the caller. Events are drained by a single worker thread,
+    grouped into batches and sent as one POST per batch over a pooled HTTP session.
+    A batch is sent once it reaches ``batch_size`` events or ``flush_interval`` seconds
+    after its first event, whichever comes first. When the queue is full, new events
+    are dropped rather than slowing down the caller.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = f"{ANALYTICS_API_ENDPOINT}{ANALYTICS_EVENT_PATH}",
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        request_timeout: float = 5.0,
+        session: requests.Session | None = None,
+    ):
+        """Initialize the analytics dispatcher.
+
+        Args:
+            endpoint (str): The URL events are posted to.
+            max_queue_size (int): Maximum number of pending events before new events are dropped.
+            batch_size (int): Maximum number of events sent in a single request.
+            flush_interval (float): Maximum time in seconds an event waits before its batch is sent.
+            request_timeout (float): Timeout in seconds for each HTTP request.
+            session (requests.Session | None): Session used to send events. A new session is
+                created on first use if not provided.
+
+        """
+        self.endpoint = endpoint
+        self.batch_size = max(batch_size, 1)
+        self.flush_interval = flush_interval
+        self.request_timeout = request_timeout
+
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue_size)
+        self._session = session
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self._worker_pid: int | None = None
+        self._closed = False
+
+        self.dropped_events = 0
+        self.failed_batches = 0
+
+    def enqueue(self, event: dict[str, Any]) -> bool:
+        """Queue an event for delivery without blocking.
+
+        Args:
+            event (dict[str, Any]): The fully formed analytics event.
+
+        Returns:
+            bool: True if the event was queued, False if it was dropped.
+
+        """
+        if self._closed:
+            return False
+
+        self._ensure_worker()
+
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped_events += 1
+            return False
+
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send all events queued so far and wait for delivery to complete.
+
+        Args:
+            timeout (float | None): Maximum time in seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            bool: True if all queued events were processed within the timeout.
+
+        """
+        if self._worker is None or not self._worker.is_alive():
+            return self._queue.empty()
+
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 2.0) -> None:
+        """Flush pending events and stop accepting new ones.
+
+        Args:
+            timeout (float | None): Maximum time in seconds to wait for pending events.
+
+        """
+        self.flush(timeout)
+        self._closed = True
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread if it is not running in the current process."""
+        pid = os.getpid()
+        if self._worker is not None and self._worker_pid == pid and self._worker.is_alive():
+            return
+
+        with self._lock:
+            if self._worker is not None and self._worker_pid == pid and self._worker.is_alive():
+                return
+
+            self._worker = threading.Thread(
+                target=self._run, name="agentkit-analytics", daemon=True
+            )
+            self._worker_pid = pid
+            self._worker.start()
+
+    def _run(self) -> None:
+        """Drain the queue, sending events in batches."""
+        while True:
+            item = self._queue.get()
+            batch: list[dict[str, Any]] = []
+            flush_requests: list[threading.Event] = []
+
+            if isinstance(item, threading.Event):
+                flush_requests.append(item)
+            else:
+                batch.append(item)
+                deadline = time.monotonic() + self.flush_interval
+
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+
+                    if isinstance(item, threading.Event):
+                        flush_requests.append(item)
+                        break
+                    batch.append(item)
+
+            if batch:
+                try:
+                    self._post_batch(batch)
+                except Exception:
+                    self.failed_batches += 1
+
+            for flush_request in flush_requests:
+                flush_request.set()
+
+    def _post_batch(self, events: list[dict[str, Any]]) -> None:
+        """Send a batch of events in a single request.
+
+        Args:
+            events (list[dict[str, Any]]): The events to send.
+
+        Raises:
+            requests.exceptions.RequestException: If the HTTP request fails
+
+        """
+        if self._session is None:
+            self._session = requests.Session()
+
+        stringified_event_data = json.dumps(events)
+        upload_time = str(int(time.time() * 1000))
+
+        checksum = hashlib.md5((stringified_event_data + upload_time).encode("utf-8")).hexdigest()
+
+        analytics_service_data = {
+            "e": stringified_event_data,
+            "checksum": checksum,
+        }
+
+        response = self._session.post(
+            self.endpoint,
+            json=analytics_service_data,
+            headers={"Content-Type": "application/json"},
+            timeout=self.request_timeout,
+        )
+        response.raise_for_status()
+
+
+_default_dispatcher: AnalyticsDispatcher | None = None
+_default_dispatcher_lock = threading.Lock()
+
+
+def get_analytics_dispatcher() -> AnalyticsDispatcher:
+    """Get the process-wide analytics dispatcher, creating it on first use.
+
+    Returns:
+        AnalyticsDispatcher: The shared analytics dispatcher.
+
+    """
+    global _default_dispatcher
+
+    if _default_dispatcher is None:
+        with _default_dispatcher_lock:
+            if _default_dispatcher is None:
+                _default_dispatcher = AnalyticsDispatcher()
+                atexit.register(_default_dispatcher.close)
+
+    return _default_dispatcher
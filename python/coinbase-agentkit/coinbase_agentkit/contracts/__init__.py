@@ -0,0 +1,15 @@
+"""Contract ABI utilities shared across action and wallet providers."""
+
+from .contract_registry import (
+    ContractAbi,
+    ContractFunction,
+    encode_function_data,
+    get_contract_abi,
+)
+
+__all__ = [
+    "ContractAbi",
+    "ContractFunction",
+    "encode_function_data",
+    "get_contract_abi",
+]
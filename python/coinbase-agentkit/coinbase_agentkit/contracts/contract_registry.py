@@ -0,0 +1,203 @@
+"""Registry of preprocessed contract ABIs shared across calls."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any
+
+from eth_abi import abi as eth_abi
+from eth_utils import (
+    function_abi_to_4byte_selector,
+    get_abi_input_types,
+    get_abi_output_types,
+    get_aligned_abi_inputs,
+    get_normalized_abi_inputs,
+)
+from web3 import Web3
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import (
+    BASE_RETURN_NORMALIZERS,
+    abi_address_to_hex,
+    abi_bytes_to_bytes,
+    abi_string_to_text,
+)
+from web3.types import HexStr
+from web3.utils.abi import get_abi_element
+
+# Maximum number of distinct ABIs kept in the registry
+MAX_REGISTERED_ABIS = 256
+
+_REQUEST_NORMALIZERS = [abi_address_to_hex, abi_bytes_to_bytes, abi_string_to_text]
+
+
+class ContractFunction:
+    """A contract function with its selector and argument types resolved once."""
+
+    def __init__(self, abi: dict[str, Any]):
+        """Initialize the contract function.
+
+        Args:
+            abi (dict[str, Any]): The ABI entry of the function.
+
+        """
+        self.abi = abi
+        self.name: str = abi["name"]
+        self.selector = function_abi_to_4byte_selector(abi)
+        self.input_types = get_abi_input_types(abi)
+        self.output_types = get_abi_output_types(abi)
+        self._has_tuple_inputs = any(t.startswith("(") for t in self.input_types)
+
+    def encode(self, args: list[Any] | tuple[Any, ...] | None = None) -> bytes:
+        """Encode a call to this function.
+
+        Args:
+            args (list[Any] | tuple[Any, ...] | None): The function arguments.
+
+        Returns:
+            bytes: The selector followed by the ABI-encoded arguments.
+
+        """
+        arguments = list(args or [])
+        if self._has_tuple_inputs:
+            # Struct arguments may be given as dicts and need aligning with the ABI components
+            _, aligned = get_aligned_abi_inputs(
+                self.abi, get_normalized_abi_inputs(self.abi, *arguments)
+            )
+            arguments = list(aligned)
+        arguments = map_abi_data(_REQUEST_NORMALIZERS, self.input_types, arguments)
+        return self.selector + eth_abi.encode(self.input_types, arguments)
+
+    def decode(self, data: bytes) -> Any:
+        """Decode the return data of a call to this function like a web3 contract call.
+
+        Args:
+            data (bytes): The raw return data.
+
+        Returns:
+            Any: The decoded value, or a list of values for functions with several outputs.
+
+        """
+        decoded = map_abi_data(
+            BASE_RETURN_NORMALIZERS, self.output_types, eth_abi.decode(self.output_types, data)
+        )
+        return decoded[0] if len(decoded) == 1 else decoded
+
+
+class ContractAbi:
+    """A contract ABI with its functions preprocessed for encoding and decoding."""
+
+    def __init__(self, abi: list[dict[str, Any]]):
+        """Initialize the contract ABI.
+
+        Args:
+            abi (list[dict[str, Any]]): The contract ABI.
+
+        """
+        self.abi = abi
+        self._functions: dict[str, list[ContractFunction]] = {}
+        for entry in abi:
+            if entry.get("type", "function") == "function" and "name" in entry:
+                self._functions.setdefault(entry["name"], []).append(ContractFunction(entry))
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """A digest of the ABI's content, equal for equal ABIs whatever their identity."""
+        canonical = json.dumps(self.abi, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get_function(
+        self, function_name: str, args: list[Any] | tuple[Any, ...] | None = None
+    ) -> ContractFunction:
+        """Get a function by name, resolving overloads from the arguments when needed.
+
+        Args:
+            function_name (str): The name of the function.
+            args (list[Any] | tuple[Any, ...] | None): The function arguments.
+
+        Returns:
+            ContractFunction: The matching function.
+
+        Raises:
+            ValueError: If the ABI has no function with the given name
+
+        """
+        functions = self._functions.get(function_name)
+        if not functions:
+            raise ValueError(f"Function {function_name} not found in ABI")
+        if len(functions) == 1:
+            return functions[0]
+
+        fn_abi = get_abi_element(self.abi, function_name, *(args or []))
+        return next(function for function in functions if function.abi == fn_abi)
+
+    def encode_function_data(
+        self, function_name: str, args: list[Any] | tuple[Any, ...] | None = None
+    ) -> HexStr:
+        """Encode calldata for a function call.
+
+        Args:
+            function_name (str): The name of the function.
+            args (list[Any] | tuple[Any, ...] | None): The function arguments.
+
+        Returns:
+            HexStr: The calldata as a hex string.
+
+        """
+        return Web3.to_hex(self.get_function(function_name, args).encode(args))
+
+
+_registry: OrderedDict[int, ContractAbi] = OrderedDict()
+_registry_lock = threading.Lock()
+
+
+def get_contract_abi(abi: list[dict[str, Any]]) -> ContractAbi:
+    """Get the preprocessed form of an ABI, building it on first use.
+
+    ABIs are keyed by identity, so module-level ABI constants are processed only once.
+
+    Args:
+        abi (list[dict[str, Any]]): The contract ABI.
+
+    Returns:
+        ContractAbi: The preprocessed ABI.
+
+    """
+    key = id(abi)
+    with _registry_lock:
+        contract_abi = _registry.get(key)
+        if contract_abi is not None and contract_abi.abi is abi:
+            _registry.move_to_end(key)
+            return contract_abi
+
+    contract_abi = ContractAbi(abi)
+    with _registry_lock:
+        _registry[key] = contract_abi
+        _registry.move_to_end(key)
+        while len(_registry) > MAX_REGISTERED_ABIS:
+            _registry.popitem(last=False)
+
+    return contract_abi
+
+
+def encode_function_data(
+    abi: list[dict[str, Any]],
+    function_name: str,
+    args: list[Any] | tuple[Any, ...] | None = None,
+) -> HexStr:
+    """Encode calldata for a contract function call.
+
+    Equivalent to ``Web3().eth.contract(abi=abi).encode_abi(function_name, args)``
+    without rebuilding a contract object for every call.
+
+    Args:
+        abi (list[dict[str, Any]]): The contract ABI.
+        function_name (str): The name of the function.
+        args (list[Any] | tuple[Any, ...] | None): The function arguments.
+
+    Returns:
+        HexStr: The calldata as a hex string.
+
+    """
+    return get_contract_abi(abi).encode_function_data(function_name, args)
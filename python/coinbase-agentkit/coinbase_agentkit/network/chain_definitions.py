@@ -41,6 +41,8 @@ class Chain(BaseModel):
     block_explorers: dict[str, BlockExplorer]
     contracts: dict[str, Contract]
     testnet: bool | None = False
+    # Average time between blocks in seconds
+    block_time: float | None = None
 
 
 # Convert existing dictionaries to Chain instances
@@ -73,6 +75,7 @@ mainnet = Chain(
             "block_created": 14_353_601,
         },
     },
+    block_time=12,
 )
 
 sepolia = Chain(
@@ -103,6 +106,7 @@ sepolia = Chain(
         },
     },
     testnet=True,
+    block_time=12,
 )
 
 base_sepolia = Chain(
@@ -143,6 +147,7 @@ base_sepolia = Chain(
         },
     },
     testnet=True,
+    block_time=2,
 )
 
 arbitrum_sepolia = Chain(
@@ -172,6 +177,7 @@ arbitrum_sepolia = Chain(
         },
     },
     testnet=True,
+    block_time=0.25,
 )
 
 optimism_sepolia = Chain(
@@ -209,6 +215,7 @@ optimism_sepolia = Chain(
         },
     },
     testnet=True,
+    block_time=2,
 )
 
 base = Chain(
@@ -247,6 +254,7 @@ base = Chain(
             "block_created": 17482143,
         },
     },
+    block_time=2,
 )
 
 arbitrum = Chain(
@@ -271,6 +279,7 @@ arbitrum = Chain(
             "block_created": 7654707,
         },
     },
+    block_time=0.25,
 )
 
 optimism = Chain(
@@ -307,6 +316,7 @@ optimism = Chain(
             "address": "0x99C9fc46f92E8a1c0deC1b1747d010903E884bE1",
         },
     },
+    block_time=2,
 )
 
 polygon_mumbai = Chain(
@@ -332,6 +342,7 @@ polygon_mumbai = Chain(
         },
     },
     testnet=True,
+    block_time=2,
 )
 
 polygon = Chain(
@@ -356,4 +367,5 @@ polygon = Chain(
             "block_created": 25770160,
         },
     },
+    block_time=2,
 )
@@ -3,11 +3,20 @@
 from .cdp_wallet_provider import CdpProviderConfig, CdpWalletProvider, CdpWalletProviderConfig
 from .eth_account_wallet_provider import EthAccountWalletProvider, EthAccountWalletProviderConfig
 from .evm_wallet_provider import EvmWalletProvider
+from .multicall import ContractCall
+from .read_cache import ReadCacheStats
+from .read_snapshot import ReadSnapshot
+from .transaction_pipeline import TransactionPipelineError, TransactionResult
 from .wallet_provider import WalletProvider
 
 __all__ = [
     "WalletProvider",
     "EvmWalletProvider",
+    "ContractCall",
+    "ReadCacheStats",
+    "ReadSnapshot",
+    "TransactionPipelineError",
+    "TransactionResult",
     "CdpProviderConfig",
     "CdpWalletProvider",
     "CdpWalletProviderConfig",
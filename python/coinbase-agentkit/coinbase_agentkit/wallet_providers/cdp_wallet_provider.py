@@ -17,10 +17,24 @@ from cdp import (
 from eth_account.typed_transactions import DynamicFeeTransaction
 from pydantic import BaseModel, Field
 from web3 import Web3
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
 
 from ..network import NETWORK_ID_TO_CHAIN, Network
-from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .evm_wallet_provider import EvmGasConfig, EvmRpcConfig, EvmWalletProvider
+from .fee_oracle import get_fee_oracle
+from .gas_model import get_gas_model
+from .multicall import ContractCall, get_multicall_address, read_contract, read_contract_many
+from .nonce_manager import get_nonce_manager
+from .read_cache import get_read_cache
+from .receipt_watcher import get_receipt_watcher
+from .rpc_pool import get_rpc_pool
 
 
 class CdpProviderConfig(BaseModel):
@@ -37,6 +51,10 @@ class CdpWalletProviderConfig(CdpProviderConfig):
     mnemonic_phrase: str | None = Field(None, description="The mnemonic phrase of the wallet")
     wallet_data: str | None = Field(None, description="The data of the CDP Wallet as a JSON string")
     gas: EvmGasConfig | None = Field(None, description="Gas configuration settings")
+    rpc: EvmRpcConfig | None = Field(None, description="RPC endpoint settings")
+    cache_reads: bool | None = Field(
+        None, description="Whether to reuse contract reads and balances until the next block"
+    )
 
 
 class CdpWalletProvider(EvmWalletProvider):
@@ -70,7 +88,6 @@ class CdpWalletProvider(EvmWalletProvider):
 
             network_id = config.network_id or os.getenv("NETWORK_ID", "base-sepolia")
             chain = NETWORK_ID_TO_CHAIN[network_id]
-            rpc_url = chain.rpc_urls["default"].http[0]
 
             if not network_id:
                 raise ValueError("NETWORK_ID is required")
@@ -90,7 +107,16 @@ class CdpWalletProvider(EvmWalletProvider):
                 network_id=network_id,
                 chain_id=chain.id,
             )
-            self._web3 = Web3(Web3.HTTPProvider(rpc_url))
+            self._web3 = Web3(get_rpc_pool(chain, config.rpc))
+            self._multicall_address = get_multicall_address(chain)
+            self._fee_oracle = get_fee_oracle(chain, self._web3)
+            self._receipt_watcher = get_receipt_watcher(chain, self._web3)
+            self._read_cache = get_read_cache(chain, self._web3) if config.cache_reads else None
+            self._nonce_manager = get_nonce_manager(
+                int(chain.id),
+                self._address,
+                lambda: self._web3.eth.get_transaction_count(self._address, "pending"),
+            )
 
             self._gas_limit_multiplier = (
                 max(config.gas.gas_limit_multiplier, 1)
@@ -104,6 +130,17 @@ class CdpWalletProvider(EvmWalletProvider):
                 else 1
             )
 
+            self._fee_strategy = (
+                config.gas.fee_strategy
+                if config and config.gas and config.gas.fee_strategy is not None
+                else "standard"
+            )
+
+            self._gas_model = (
+                get_gas_model(int(chain.id))
+                if config and config.gas and config.gas.learn_gas_limits
+                else None
+            )
 
         except ImportError as e:
             raise ImportError(
@@ -134,9 +171,35 @@ class CdpWalletProvider(EvmWalletProvider):
         if not self._wallet:
             raise Exception("Wallet not initialized")
 
-        balance = self._wallet.balance("eth")
+        if self._read_cache is not None:
+            balance = self._read_cache.get(
+                ("balance", self._address.lower()), lambda: self._wallet.balance("eth")
+            )
+        else:
+            balance = self._wallet.balance("eth")
         return Decimal(str(Web3.to_wei(balance, "ether")))
 
+    def get_block_number(self) -> int:
+        """Get the number of the latest block.
+
+        Returns:
+            int: The latest block number
+
+        """
+        return self._web3.eth.block_number
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The block range, addresses and topics to match.
+
+        Returns:
+            list[LogReceipt]: The matching logs.
+
+        """
+        return self._web3.eth.get_logs(filter_params)
+
     def get_name(self) -> str:
         """Get the name of the wallet provider.
 
@@ -181,6 +244,7 @@ class CdpWalletProvider(EvmWalletProvider):
             )
 
             transfer_result.wait()
+            self._invalidate_reads()
             tx_hash = transfer_result.transaction_hash
 
             if not tx_hash:
@@ -189,6 +253,9 @@ class CdpWalletProvider(EvmWalletProvider):
             return tx_hash
         except Exception as e:
             raise Exception(f"Failed to transfer native tokens: {e!s}") from e
+        finally:
+            # CDP signs this server-side with the account's next nonce
+            self._nonce_manager.resync()
 
     def read_contract(
         self,
@@ -214,11 +281,47 @@ class CdpWalletProvider(EvmWalletProvider):
             Exception: If the contract call fails or wallet is not initialized
 
         """
-        contract = self._web3.eth.contract(address=contract_address, abi=abi)
-        func = contract.functions[function_name]
-        if args is None:
-            args = []
-        return func(*args).call(block_identifier=block_identifier)
+        return self._read_through(
+            ContractCall(
+                contract_address=contract_address,
+                abi=abi,
+                function_name=function_name,
+                args=args or [],
+            ),
+            block_identifier,
+            lambda block: read_contract(
+                self._web3, contract_address, abi, function_name, args, block
+            ),
+        )
+
+    def read_contract_many(
+        self,
+        calls: list[ContractCall],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[Any]:
+        """Read many contract functions in a single round trip.
+
+        Calls are aggregated through Multicall3 where the chain has it deployed, and sent
+        as one JSON-RPC batch request otherwise.
+
+        Args:
+            calls (list[ContractCall]): The calls to make
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[Any]: The decoded results in call order. Failed calls that allow failure yield None.
+
+        Raises:
+            Exception: If a call that does not allow failure fails
+
+        """
+        return self._read_many_through(
+            calls,
+            block_identifier,
+            lambda missing, block: read_contract_many(
+                self._web3, missing, block, self._multicall_address
+            ),
+        )
 
     def sign_message(self, message: str | bytes) -> HexStr:
         """Sign a message using the wallet's private key.
@@ -302,24 +405,41 @@ class CdpWalletProvider(EvmWalletProvider):
         """
         self._prepare_transaction(transaction)
 
-        signature = self.sign_transaction(transaction)
+        def send(nonce: int) -> HexStr:
+            unsigned_transaction = {**transaction, "nonce": nonce}
+            signature = self.sign_transaction(unsigned_transaction)
 
-        transaction["r"] = int(signature[2:66], 16)
-        transaction["s"] = int(signature[66:130], 16)
-        transaction["v"] = int(signature[130:132], 16) - 27
+            signed_transaction = {
+                **unsigned_transaction,
+                "r": int(signature[2:66], 16),
+                "s": int(signature[66:130], 16),
+                "v": int(signature[130:132], 16) - 27,
+            }
 
-        signed_dynamic_fee_tx = DynamicFeeTransaction.from_dict(transaction)
+            signed_dynamic_fee_tx = DynamicFeeTransaction.from_dict(signed_transaction)
 
-        signed_bytes = signed_dynamic_fee_tx.payload()
+            signed_bytes = signed_dynamic_fee_tx.payload()
 
-        external_address = ExternalAddress(
-            self._wallet.network_id, self._wallet.default_address.address_id
-        )
-        broadcasted_transaction = external_address.broadcast_external_transaction(
-            "02" + signed_bytes.hex()
-        )
+            external_address = ExternalAddress(
+                self._wallet.network_id, self._wallet.default_address.address_id
+            )
+            broadcasted_transaction = external_address.broadcast_external_transaction(
+                "02" + signed_bytes.hex()
+            )
 
-        return broadcasted_transaction.transaction_hash
+            return broadcasted_transaction.transaction_hash
+
+        try:
+            tx_hash = self._nonce_manager.send(send)
+        except Exception:
+            if self._gas_model:
+                self._gas_model.forget(transaction)
+            raise
+
+        if self._gas_model:
+            self._gas_model.track(tx_hash, transaction)
+        self._invalidate_reads()
+        return tx_hash
 
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
@@ -329,18 +449,20 @@ class CdpWalletProvider(EvmWalletProvider):
         Args:
             tx_hash (HexStr): The transaction hash to wait for
             timeout (float): Maximum time to wait in seconds, defaults to 120
-            poll_latency (float): Time between polling attempts in seconds, defaults to 0.1
+            poll_latency (float): Unused, polling is paced by the chain's block time
 
         Returns:
             dict[str, Any]: The transaction receipt as a dictionary
 
         Raises:
-            TimeoutError: If transaction is not mined within timeout period
+            TimeExhausted: If transaction is not mined within timeout period
 
         """
-        return self._web3.eth.wait_for_transaction_receipt(
-            tx_hash, timeout=timeout, poll_latency=poll_latency
-        )
+        receipt = self._receipt_watcher.wait(tx_hash, timeout=timeout)
+        if self._gas_model:
+            self._gas_model.observe(tx_hash, receipt)
+        self._invalidate_reads()
+        return receipt
 
     def _prepare_transaction(self, transaction: TxParams) -> TxParams:
         """Prepare EIP-1559 transaction for signing.
@@ -348,6 +470,8 @@ class CdpWalletProvider(EvmWalletProvider):
         Args:
             transaction (TxParams): Raw transaction parameters
 
+        The nonce is assigned when the transaction is sent.
+
         Returns:
             TxParams: Transaction parameters with gas estimation and fee calculation
 
@@ -365,9 +489,6 @@ class CdpWalletProvider(EvmWalletProvider):
         transaction["type"] = 2
         transaction["chainId"] = int(self._network.chain_id)
 
-        nonce = self._web3.eth.get_transaction_count(self._address)
-        transaction["nonce"] = nonce
-
         data_field = transaction.get("data", b"")
         if isinstance(data_field, str) and data_field.startswith("0x"):
             data_bytes = bytes.fromhex(data_field[2:])
@@ -378,7 +499,17 @@ class CdpWalletProvider(EvmWalletProvider):
         transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
         transaction["maxFeePerGas"] = max_fee_per_gas
 
-        gas = int(self._web3.eth.estimate_gas(transaction) * self._gas_limit_multiplier)
+        gas = transaction.get("gas") or (
+            self._gas_model.estimate(transaction, self._gas_limit_multiplier)
+            if self._gas_model
+            else None
+        )
+        if gas is None:
+            # Pending state includes this wallet's unmined transactions, so a step spending
+            # a pending approval can be estimated before the approval is mined
+            gas = int(
+                self._web3.eth.estimate_gas(transaction, "pending") * self._gas_limit_multiplier
+            )
         transaction["gas"] = gas
 
         del transaction["from"]
@@ -392,23 +523,13 @@ class CdpWalletProvider(EvmWalletProvider):
             tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
 
         """
+        max_priority_fee_per_gas, max_fee_per_gas = self._fee_oracle.get_fees(self._fee_strategy)
 
-        def get_base_fee():
-            latest_block = self._web3.eth.get_block("latest")
-            base_fee = latest_block["baseFeePerGas"]
-            # Multiply the configured fee multiplier to give some buffer
-            return int(base_fee * self._fee_per_gas_multiplier)
-
-        def get_max_priority_fee():
-            max_priority_fee_per_gas = Web3.to_wei(0.1, "gwei")
-            # Multiply the configured fee multiplier to give some buffer
-            return int(max_priority_fee_per_gas * self._fee_per_gas_multiplier)
-
-        base_fee_per_gas = get_base_fee()
-        max_priority_fee_per_gas = get_max_priority_fee()
-        max_fee_per_gas = base_fee_per_gas + max_priority_fee_per_gas
-
-        return (max_priority_fee_per_gas, max_fee_per_gas)
+        # Multiply the configured fee multiplier to give some buffer
+        return (
+            int(max_priority_fee_per_gas * self._fee_per_gas_multiplier),
+            int(max_fee_per_gas * self._fee_per_gas_multiplier),
+        )
 
     def export_wallet(self) -> WalletData:
         """Export the wallet data for persistence.
@@ -459,6 +580,8 @@ class CdpWalletProvider(EvmWalletProvider):
             )
         except Exception as e:
             raise Exception(f"Failed to deploy contract: {e!s}") from e
+        finally:
+            self._nonce_manager.resync()
 
     def deploy_nft(self, name: str, symbol: str, base_uri: str) -> Any:
         """Deploy a new NFT (ERC-721) smart contract.
@@ -486,6 +609,8 @@ class CdpWalletProvider(EvmWalletProvider):
             )
         except Exception as e:
             raise Exception(f"Failed to deploy NFT: {e!s}") from e
+        finally:
+            self._nonce_manager.resync()
 
     def deploy_token(self, name: str, symbol: str, total_supply: str) -> Any:
         """Deploy an ERC20 token contract.
@@ -513,6 +638,8 @@ class CdpWalletProvider(EvmWalletProvider):
             )
         except Exception as e:
             raise Exception(f"Failed to deploy token: {e!s}") from e
+        finally:
+            self._nonce_manager.resync()
 
     def trade(self, amount: str, from_asset_id: str, to_asset_id: str) -> str:
         """Trade a specified amount of one asset for another.
@@ -538,6 +665,7 @@ class CdpWalletProvider(EvmWalletProvider):
                 from_asset_id=from_asset_id,
                 to_asset_id=to_asset_id,
             ).wait()
+            self._invalidate_reads()
 
             return "\n".join(
                 [
@@ -548,3 +676,5 @@ class CdpWalletProvider(EvmWalletProvider):
             )
         except Exception as e:
             raise Exception(f"Error trading assets: {e!s}") from e
+        finally:
+            self._nonce_manager.resync()
@@ -7,12 +7,32 @@ from eth_account.account import LocalAccount
 from eth_account.datastructures import SignedTransaction
 from eth_account.messages import encode_defunct
 from pydantic import BaseModel, Field
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 from web3.middleware import SignAndSendRawMiddlewareBuilder
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
 
 from ..network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN, Network
-from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .evm_wallet_provider import EvmGasConfig, EvmRpcConfig, EvmWalletProvider
+from .fee_oracle import get_fee_oracle
+from .gas_model import get_gas_model
+from .multicall import (
+    ContractCall,
+    async_read_contract,
+    get_multicall_address,
+    read_contract,
+    read_contract_many,
+)
+from .nonce_manager import get_nonce_manager
+from .read_cache import get_read_cache
+from .receipt_watcher import get_receipt_watcher
+from .rpc_pool import AsyncRpcPoolProvider, get_rpc_pool
 
 
 class EthAccountWalletProviderConfig(BaseModel):
@@ -21,6 +41,10 @@ class EthAccountWalletProviderConfig(BaseModel):
     account: LocalAccount
     chain_id: str
     gas: EvmGasConfig | None = Field(None, description="Gas configuration settings")
+    rpc: EvmRpcConfig | None = Field(None, description="RPC endpoint settings")
+    cache_reads: bool | None = Field(
+        None, description="Whether to reuse contract reads and balances until the next block"
+    )
 
     class Config:
         """Configuration for EthAccountWalletProvider."""
@@ -42,12 +66,22 @@ class EthAccountWalletProvider(EvmWalletProvider):
         self.account = config.account
 
         chain = NETWORK_ID_TO_CHAIN[CHAIN_ID_TO_NETWORK_ID[config.chain_id]]
-        rpc_url = chain.rpc_urls["default"].http[0]
+        rpc_pool = get_rpc_pool(chain, config.rpc)
 
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+        self.web3 = Web3(rpc_pool)
         self.web3.middleware_onion.inject(
             SignAndSendRawMiddlewareBuilder.build(self.account), layer=0
         )
+        self.async_web3 = AsyncWeb3(AsyncRpcPoolProvider(rpc_pool))
+        self._multicall_address = get_multicall_address(chain)
+        self._fee_oracle = get_fee_oracle(chain, self.web3)
+        self._receipt_watcher = get_receipt_watcher(chain, self.web3)
+        self._read_cache = get_read_cache(chain, self.web3) if config.cache_reads else None
+        self._nonce_manager = get_nonce_manager(
+            int(chain.id),
+            self.account.address,
+            lambda: self.web3.eth.get_transaction_count(self.account.address, "pending"),
+        )
 
         self._network = Network(
             protocol_family="evm",
@@ -67,6 +101,18 @@ class EthAccountWalletProvider(EvmWalletProvider):
             else 1
         )
 
+        self._fee_strategy = (
+            config.gas.fee_strategy
+            if config and config.gas and config.gas.fee_strategy is not None
+            else "standard"
+        )
+
+        self._gas_model = (
+            get_gas_model(int(chain.id))
+            if config and config.gas and config.gas.learn_gas_limits
+            else None
+        )
+
     def get_address(self) -> str:
         """Get the wallet address.
 
@@ -92,9 +138,52 @@ class EthAccountWalletProvider(EvmWalletProvider):
             Decimal: The wallet's balance in wei as a Decimal
 
         """
-        balance_wei = self.web3.eth.get_balance(self.account.address)
+        if self._read_cache is not None:
+            balance_wei = self._read_cache.get(
+                ("balance", self.account.address.lower()),
+                lambda: self.web3.eth.get_balance(self.account.address),
+            )
+        else:
+            balance_wei = self.web3.eth.get_balance(self.account.address)
         return Decimal(str(balance_wei))
 
+    async def async_get_balance(self) -> Decimal:
+        """Get the wallet balance in native currency using the async web3 client.
+
+        Returns:
+            Decimal: The wallet's balance in wei as a Decimal
+
+        """
+        if self._read_cache is not None:
+            balance_wei = await self._read_cache.async_get(
+                ("balance", self.account.address.lower()),
+                lambda: self.async_web3.eth.get_balance(self.account.address),
+            )
+        else:
+            balance_wei = await self.async_web3.eth.get_balance(self.account.address)
+        return Decimal(str(balance_wei))
+
+    def get_block_number(self) -> int:
+        """Get the number of the latest block.
+
+        Returns:
+            int: The latest block number
+
+        """
+        return self.web3.eth.block_number
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The block range, addresses and topics to match.
+
+        Returns:
+            list[LogReceipt]: The matching logs.
+
+        """
+        return self.web3.eth.get_logs(filter_params)
+
     def get_name(self) -> str:
         """Get the name of the wallet provider.
 
@@ -153,33 +242,36 @@ class EthAccountWalletProvider(EvmWalletProvider):
     def estimate_fees(self):
         """Estimate gas fees for a transaction, applying the configured fee multipliers.
 
+        Fees come from the chain's shared fee oracle, so transactions sent within the
+        same block do not refetch fee data.
+
         Returns:
             tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
 
         """
+        max_priority_fee_per_gas, max_fee_per_gas = self._fee_oracle.get_fees(self._fee_strategy)
 
-        def get_base_fee():
-            """Get the base fee from the latest block and apply the multiplier.
-
-            Returns:
-                int: The adjusted base fee in wei
+        # Multiply the configured fee multiplier to give some buffer
+        return (
+            int(max_priority_fee_per_gas * self._fee_per_gas_multiplier),
+            int(max_fee_per_gas * self._fee_per_gas_multiplier),
+        )
 
-            """
-            latest_block = self.web3.eth.get_block("latest")
-            base_fee = latest_block["baseFeePerGas"]
-            # Multiply the configured fee multiplier to give some buffer
-            return int(base_fee * self._fee_per_gas_multiplier)
+    async def async_estimate_fees(self) -> tuple[int, int]:
+        """Estimate gas fees for a transaction without blocking the event loop.
 
-        def get_max_priority_fee():
-            max_priority_fee_per_gas = Web3.to_wei(0.1, "gwei")
-            # Multiply the configured fee multiplier to give some buffer
-            return int(max_priority_fee_per_gas * self._fee_per_gas_multiplier)
+        Returns:
+            tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
 
-        base_fee_per_gas = get_base_fee()
-        max_priority_fee_per_gas = get_max_priority_fee()
-        max_fee_per_gas = base_fee_per_gas + max_priority_fee_per_gas
+        """
+        max_priority_fee_per_gas, max_fee_per_gas = await self._fee_oracle.async_get_fees(
+            self.async_web3, self._fee_strategy
+        )
 
-        return (max_priority_fee_per_gas, max_fee_per_gas)
+        return (
+            int(max_priority_fee_per_gas * self._fee_per_gas_multiplier),
+            int(max_fee_per_gas * self._fee_per_gas_multiplier),
+        )
 
     def send_transaction(self, transaction: TxParams) -> HexStr:
         """Send a signed transaction to the network.
@@ -197,19 +289,97 @@ class EthAccountWalletProvider(EvmWalletProvider):
         transaction["from"] = self.account.address
         transaction["chainId"] = int(self._network.chain_id)
 
-        nonce = self.web3.eth.get_transaction_count(self.account.address)
-        transaction["nonce"] = nonce
-
         max_priority_fee_per_gas, max_fee_per_gas = self.estimate_fees()
         transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
         transaction["maxFeePerGas"] = max_fee_per_gas
 
+        gas = self._learned_gas_limit(transaction)
+        if gas is None:
+            # Pending state includes this wallet's unmined transactions, so a step spending
+            # a pending approval can be estimated before the approval is mined
+            gas = int(
+                self.web3.eth.estimate_gas(transaction, "pending") * self._gas_limit_multiplier
+            )
+        transaction["gas"] = gas
+
+        def send(nonce: int) -> HexStr:
+            transaction["nonce"] = nonce
+            return Web3.to_hex(self.web3.eth.send_transaction(transaction))
+
+        try:
+            tx_hash = self._nonce_manager.send(send)
+        except Exception:
+            if self._gas_model:
+                self._gas_model.forget(transaction)
+            raise
+
+        if self._gas_model:
+            self._gas_model.track(tx_hash, transaction)
+        self._invalidate_reads()
+        return tx_hash
+
+    async def async_send_transaction(self, transaction: TxParams) -> HexStr:
+        """Sign and send a transaction to the network using the async web3 client.
+
+        Args:
+            transaction (TxParams): Transaction parameters including to, value, and data
+
+        Returns:
+            HexStr: The transaction hash as a hex string
+
+        Raises:
+            Exception: If transaction preparation or sending fails
 
-        gas = int(self.web3.eth.estimate_gas(transaction) * self._gas_limit_multiplier)
+        """
+        transaction["from"] = self.account.address
+        transaction["chainId"] = int(self._network.chain_id)
+
+        max_priority_fee_per_gas, max_fee_per_gas = await self.async_estimate_fees()
+        transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
+        transaction["maxFeePerGas"] = max_fee_per_gas
+
+        gas = self._learned_gas_limit(transaction)
+        if gas is None:
+            gas = int(
+                await self.async_web3.eth.estimate_gas(transaction, "pending")
+                * self._gas_limit_multiplier
+            )
         transaction["gas"] = gas
 
-        hash = self.web3.eth.send_transaction(transaction)
-        return Web3.to_hex(hash)
+        async def send(nonce: int) -> HexStr:
+            transaction["nonce"] = nonce
+            signed = self.account.sign_transaction(transaction)
+            return Web3.to_hex(
+                await self.async_web3.eth.send_raw_transaction(signed.raw_transaction)
+            )
+
+        async def fetch_nonce() -> int:
+            return await self.async_web3.eth.get_transaction_count(self.account.address, "pending")
+
+        try:
+            tx_hash = await self._nonce_manager.async_send(send, fetch_nonce)
+        except Exception:
+            if self._gas_model:
+                self._gas_model.forget(transaction)
+            raise
+
+        if self._gas_model:
+            self._gas_model.track(tx_hash, transaction)
+        self._invalidate_reads()
+        return tx_hash
+
+    def _learned_gas_limit(self, transaction: TxParams) -> int | None:
+        """Get the caller's gas limit, or one learned from earlier transactions of the same shape.
+
+        Returns:
+            int | None: The gas limit, or None if gas should be estimated.
+
+        """
+        if transaction.get("gas"):
+            return int(transaction["gas"])
+        if not self._gas_model:
+            return None
+        return self._gas_model.estimate(transaction, self._gas_limit_multiplier)
 
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
@@ -219,18 +389,43 @@ class EthAccountWalletProvider(EvmWalletProvider):
         Args:
             tx_hash (HexStr): The transaction hash to wait for
             timeout (float): Maximum time to wait in seconds, defaults to 120
-            poll_latency (float): Time between polling attempts in seconds, defaults to 0.1
+            poll_latency (float): Unused, polling is paced by the chain's block time
 
         Returns:
             dict[str, Any]: The transaction receipt as a dictionary
 
         Raises:
-            TimeoutError: If transaction is not mined within timeout period
+            TimeExhausted: If transaction is not mined within timeout period
 
         """
-        return self.web3.eth.wait_for_transaction_receipt(
-            tx_hash, timeout=timeout, poll_latency=poll_latency
-        )
+        receipt = self._receipt_watcher.wait(tx_hash, timeout=timeout)
+        if self._gas_model:
+            self._gas_model.observe(tx_hash, receipt)
+        self._invalidate_reads()
+        return receipt
+
+    async def async_wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation using the async web3 client.
+
+        Args:
+            tx_hash (HexStr): The transaction hash to wait for
+            timeout (float): Maximum time to wait in seconds, defaults to 120
+            poll_latency (float): Unused, polling is paced by the chain's block time
+
+        Returns:
+            dict[str, Any]: The transaction receipt as a dictionary
+
+        Raises:
+            TimeExhausted: If transaction is not mined within timeout period
+
+        """
+        receipt = await self._receipt_watcher.async_wait(tx_hash, timeout=timeout)
+        if self._gas_model:
+            self._gas_model.observe(tx_hash, receipt)
+        self._invalidate_reads()
+        return receipt
 
     def read_contract(
         self,
@@ -253,11 +448,81 @@ class EthAccountWalletProvider(EvmWalletProvider):
             Any: The result of the contract function call
 
         """
-        contract = self.web3.eth.contract(address=contract_address, abi=abi)
-        func = contract.functions[function_name]
-        if args is None:
-            args = []
-        return func(*args).call(block_identifier=block_identifier)
+        return self._read_through(
+            ContractCall(
+                contract_address=contract_address,
+                abi=abi,
+                function_name=function_name,
+                args=args or [],
+            ),
+            block_identifier,
+            lambda block: read_contract(
+                self.web3, contract_address, abi, function_name, args, block
+            ),
+        )
+
+    def read_contract_many(
+        self,
+        calls: list[ContractCall],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[Any]:
+        """Read many contract functions in a single round trip.
+
+        Calls are aggregated through Multicall3 where the chain has it deployed, and sent
+        as one JSON-RPC batch request otherwise.
+
+        Args:
+            calls (list[ContractCall]): The calls to make
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[Any]: The decoded results in call order. Failed calls that allow failure yield None.
+
+        Raises:
+            Exception: If a call that does not allow failure fails
+
+        """
+        return self._read_many_through(
+            calls,
+            block_identifier,
+            lambda missing, block: read_contract_many(
+                self.web3, missing, block, self._multicall_address
+            ),
+        )
+
+    async def async_read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract using the async web3 client.
+
+        Args:
+            contract_address (ChecksumAddress): The address of the contract to read from
+            abi (list[dict[str, Any]]): The ABI of the contract
+            function_name (str): The name of the function to call
+            args (list[Any] | None): Arguments to pass to the function call, defaults to empty list
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            Any: The result of the contract function call
+
+        """
+        return await self._async_read_through(
+            ContractCall(
+                contract_address=contract_address,
+                abi=abi,
+                function_name=function_name,
+                args=args or [],
+            ),
+            block_identifier,
+            lambda block: async_read_contract(
+                self.async_web3, contract_address, abi, function_name, args, block
+            ),
+        )
 
     def native_transfer(self, to: str, value: Decimal) -> str:
         """Transfer the native asset of the network.
@@ -1,12 +1,26 @@
 """Base class for EVM-compatible wallet providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from decimal import Decimal
 from typing import Any
 
 from eth_account.datastructures import SignedTransaction
 from pydantic import BaseModel, Field
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.types import BlockIdentifier, ChecksumAddress, FilterParams, HexStr, LogReceipt, TxParams
 
+from ..network import NETWORK_ID_TO_CHAIN
+from .multicall import MULTICALL3_ABI, ContractCall, get_multicall_address
+from .read_cache import ReadCache, ReadCacheStats
+from .read_snapshot import (
+    ReadSnapshot,
+    activate_snapshot,
+    deactivate_snapshot,
+    get_active_snapshot,
+)
+from .transaction_pipeline import TransactionResult, run_transaction_pipeline
 from .wallet_provider import WalletProvider
 
 
@@ -15,9 +29,29 @@ class EvmGasConfig(BaseModel):
 
     gas_limit_multiplier: float | None = Field(None, description="An internal multiplier on gas limit estimation")
     fee_per_gas_multiplier: float | None = Field(None, description="An internal multiplier on fee per gas estimation")
+    fee_strategy: str | None = Field(None, description="The fee strategy to price transactions with: 'slow', 'standard' or 'fast'")
+    learn_gas_limits: bool | None = Field(None, description="Whether to reuse the gas used by earlier transactions of the same shape instead of estimating gas")
+
+class EvmRpcConfig(BaseModel):
+    """Configuration for the pool of RPC endpoints."""
+
+    urls: list[str] | None = Field(None, description="RPC URLs to prefer over the chain's default endpoints")
+    hedge_after: float | None = Field(None, description="Seconds after which a slow read is also sent to a second endpoint")
+    failure_threshold: int | None = Field(None, description="Consecutive failures after which an endpoint is taken out of rotation")
+    cooldown: float | None = Field(None, description="Seconds a failing endpoint stays out of rotation")
+    pool_size: int | None = Field(None, description="Connections kept open to each RPC host, shared by every wallet provider on the chain")
+    timeout: float | None = Field(None, description="Seconds to wait for an RPC response")
 
 class EvmWalletProvider(WalletProvider, ABC):
-    """Abstract base class for all EVM wallet providers."""
+    """Abstract base class for all EVM wallet providers.
+
+    The ``async_*`` methods are the asynchronous counterparts of the blocking wallet
+    operations. By default they run the blocking method in a worker thread; providers
+    with a native async client override them.
+    """
+
+    # Shared cache for ``latest`` reads, set by providers configured to cache reads
+    _read_cache: ReadCache | None = None
 
     @abstractmethod
     def sign_message(self, message: str | bytes) -> HexStr:
@@ -46,6 +80,43 @@ class EvmWalletProvider(WalletProvider, ABC):
         """Wait for transaction confirmation and return receipt."""
         pass
 
+    def get_block_number(self) -> int:
+        """Get the number of the latest block.
+
+        This default implementation reads it from the chain's Multicall3 contract.
+        Providers with direct RPC access override it to call ``eth_blockNumber``.
+
+        Returns:
+            int: The latest block number
+
+        Raises:
+            ValueError: If the chain has no known Multicall3 deployment
+
+        """
+        network = self.get_network()
+        chain = NETWORK_ID_TO_CHAIN.get(network.network_id or "")
+        multicall_address = get_multicall_address(chain) if chain is not None else None
+        if multicall_address is None:
+            raise ValueError(f"Cannot read the block number on network {network.network_id}")
+        return self.read_contract(multicall_address, MULTICALL3_ABI, "getBlockNumber")
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the logs matching a filter.
+
+        Providers with direct RPC access override this to call ``eth_getLogs``.
+
+        Args:
+            filter_params (FilterParams): The block range, addresses and topics to match.
+
+        Returns:
+            list[LogReceipt]: The matching logs.
+
+        Raises:
+            NotImplementedError: If the provider cannot read logs
+
+        """
+        raise NotImplementedError(f"{self.get_name()} cannot read logs")
+
     @abstractmethod
     def read_contract(
         self,
@@ -57,3 +128,207 @@ class EvmWalletProvider(WalletProvider, ABC):
     ) -> Any:
         """Read data from a smart contract."""
         pass
+
+    def read_contract_many(
+        self,
+        calls: list[ContractCall],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[Any]:
+        """Read many contract functions, returning the decoded results in call order.
+
+        This default implementation reads each call individually. Providers with direct
+        RPC access override it to aggregate the calls into a single round trip.
+
+        Args:
+            calls (list[ContractCall]): The calls to make
+            block_identifier (BlockIdentifier): The block number to read from, defaults to 'latest'
+
+        Returns:
+            list[Any]: The decoded results. Failed calls that allow failure yield None.
+
+        """
+        results = []
+        for call in calls:
+            try:
+                results.append(
+                    self.read_contract(
+                        call.contract_address,
+                        call.abi,
+                        call.function_name,
+                        call.args,
+                        block_identifier,
+                    )
+                )
+            except Exception:
+                if not call.allow_failure:
+                    raise
+                results.append(None)
+        return results
+
+    @contextmanager
+    def read_snapshot(self, block_number: int | None = None) -> Iterator[ReadSnapshot]:
+        """Pin every ``latest`` read made through this wallet to a single block.
+
+        Reads inside the context see consistent chain state, and each distinct read is
+        only sent once. A nested context reuses the enclosing snapshot unless it asks
+        for a different block.
+
+        Args:
+            block_number (int | None): The block to pin reads to, defaults to the latest block
+
+        Yields:
+            ReadSnapshot: The active snapshot
+
+        """
+        snapshot = get_active_snapshot(self)
+        if snapshot is not None and block_number in (None, snapshot.block_number):
+            yield snapshot
+            return
+
+        token = activate_snapshot(self, ReadSnapshot(self.get_block_number, block_number))
+        try:
+            yield get_active_snapshot(self)
+        finally:
+            deactivate_snapshot(token)
+
+    def get_read_snapshot(
+        self, block_identifier: BlockIdentifier = "latest"
+    ) -> ReadSnapshot | None:
+        """Get the snapshot a read should be answered from, if one is active.
+
+        Args:
+            block_identifier (BlockIdentifier): The block the read was requested at
+
+        Returns:
+            ReadSnapshot | None: The active snapshot for ``latest`` reads, otherwise None
+
+        """
+        return get_active_snapshot(self) if block_identifier == "latest" else None
+
+    def get_read_cache_stats(self) -> ReadCacheStats | None:
+        """Get the hit, miss and invalidation counters of the read cache.
+
+        Returns:
+            ReadCacheStats | None: The counters, or None if reads are not cached
+
+        """
+        return self._read_cache.stats() if self._read_cache is not None else None
+
+    def _invalidate_reads(self) -> None:
+        """Discard cached reads after the wallet changed chain state."""
+        if self._read_cache is not None:
+            self._read_cache.invalidate()
+
+    def _read_through(
+        self,
+        call: ContractCall,
+        block_identifier: BlockIdentifier,
+        read: Callable[[BlockIdentifier], Any],
+    ) -> Any:
+        """Answer a read from the active snapshot or the read cache, or make it directly."""
+        snapshot = self.get_read_snapshot(block_identifier)
+        if snapshot is not None:
+            return snapshot.read(call, read)
+        if self._read_cache is not None and block_identifier == "latest":
+            return self._read_cache.read(call, lambda: read(block_identifier))
+        return read(block_identifier)
+
+    async def _async_read_through(
+        self,
+        call: ContractCall,
+        block_identifier: BlockIdentifier,
+        read: Callable[[BlockIdentifier], Awaitable[Any]],
+    ) -> Any:
+        """Answer a read like ``_read_through`` without blocking the event loop."""
+        snapshot = self.get_read_snapshot(block_identifier)
+        if snapshot is not None:
+            return await snapshot.async_read(call, read)
+        if self._read_cache is not None and block_identifier == "latest":
+            return await self._read_cache.async_read(call, lambda: read(block_identifier))
+        return await read(block_identifier)
+
+    def _read_many_through(
+        self,
+        calls: list[ContractCall],
+        block_identifier: BlockIdentifier,
+        read_many: Callable[[list[ContractCall], BlockIdentifier], list[Any]],
+    ) -> list[Any]:
+        """Answer reads from the active snapshot or the read cache, making the rest in one go."""
+        snapshot = self.get_read_snapshot(block_identifier)
+        if snapshot is not None:
+            return snapshot.read_many(calls, read_many)
+        if self._read_cache is not None and block_identifier == "latest":
+            return self._read_cache.read_many(
+                calls, lambda missing: read_many(missing, block_identifier)
+            )
+        return read_many(calls, block_identifier)
+
+    def send_transactions(
+        self, transactions: list[TxParams], timeout: float = 120
+    ) -> list[TransactionResult]:
+        """Send an ordered sequence of transactions, then wait for all of their receipts.
+
+        Transactions get consecutive nonces. A transaction whose gas limit does not depend
+        on the earlier ones being mined, e.g. one with ``gas`` set, is sent without waiting
+        for them; otherwise it is sent once they are mined. See ``run_transaction_pipeline``.
+
+        Args:
+            transactions (list[TxParams]): The transactions to send, in order
+            timeout (float): Maximum time to wait for each receipt in seconds, defaults to 120
+
+        Returns:
+            list[TransactionResult]: The outcome of each transaction, in order
+
+        Raises:
+            TransactionPipelineError: If any transaction fails to send, reverts or is not mined
+
+        """
+        return run_transaction_pipeline(
+            self.send_transaction,
+            lambda tx_hash, timeout: self.wait_for_transaction_receipt(tx_hash, timeout=timeout),
+            transactions,
+            timeout,
+        )
+
+    async def async_get_balance(self) -> Decimal:
+        """Get the wallet balance in native currency without blocking the event loop."""
+        return await asyncio.to_thread(self.get_balance)
+
+    async def async_send_transaction(self, transaction: TxParams) -> HexStr:
+        """Send a transaction to the network without blocking the event loop."""
+        return await asyncio.to_thread(self.send_transaction, transaction)
+
+    async def async_send_transactions(
+        self, transactions: list[TxParams], timeout: float = 120
+    ) -> list[TransactionResult]:
+        """Send an ordered sequence of transactions without blocking the event loop."""
+        return await asyncio.to_thread(self.send_transactions, transactions, timeout)
+
+    async def async_wait_for_transaction_receipt(
+        self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
+    ) -> dict[str, Any]:
+        """Wait for transaction confirmation without blocking the event loop."""
+        return await asyncio.to_thread(
+            self.wait_for_transaction_receipt, tx_hash, timeout, poll_latency
+        )
+
+    async def async_read_contract(
+        self,
+        contract_address: ChecksumAddress,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        args: list[Any] | None = None,
+        block_identifier: BlockIdentifier = "latest",
+    ) -> Any:
+        """Read data from a smart contract without blocking the event loop."""
+        return await asyncio.to_thread(
+            self.read_contract, contract_address, abi, function_name, args, block_identifier
+        )
+
+    async def async_read_contract_many(
+        self,
+        calls: list[ContractCall],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> list[Any]:
+        """Read many contract functions without blocking the event loop."""
+        return await asyncio.to_thread(self.read_contract_many, calls, block_identifier)
@@ -0,0 +1,235 @@
+"""Block-scoped EIP-1559 fee estimation shared across wallet providers."""
+
+import statistics
+import threading
+import time
+from typing import Any
+
+from pydantic import BaseModel, Field
+from web3 import AsyncWeb3, Web3
+
+from ..network.chain_definitions import Chain
+
+# Block time assumed for chains without one in their definition
+DEFAULT_BLOCK_TIME = 2.0
+
+# Priority fee used when the node does not support eth_feeHistory
+FALLBACK_PRIORITY_FEE = Web3.to_wei(0.1, "gwei")
+
+
+class FeeStrategy(BaseModel):
+    """How aggressively to price a transaction."""
+
+    name: str = Field(..., description="The name of the strategy")
+    reward_percentile: float = Field(
+        ...,
+        ge=0,
+        le=100,
+        description="Percentile of recent priority fees paid to use as the priority fee",
+    )
+    base_fee_multiplier: float = Field(
+        1.0,
+        ge=1,
+        description="Headroom applied to the next block's base fee in the max fee per gas",
+    )
+
+
+FEE_STRATEGIES: dict[str, FeeStrategy] = {
+    "slow": FeeStrategy(name="slow", reward_percentile=10, base_fee_multiplier=1.0),
+    "standard": FeeStrategy(name="standard", reward_percentile=50, base_fee_multiplier=1.125),
+    "fast": FeeStrategy(name="fast", reward_percentile=90, base_fee_multiplier=1.25),
+}
+
+
+class FeeOracle:
+    """Estimates EIP-1559 fees from ``eth_feeHistory``, cached for one block.
+
+    A single ``eth_feeHistory`` request covers every registered strategy, and its
+    result is reused until the chain is expected to have produced a new block, so
+    a burst of transactions within one block costs one fee request in total.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        block_time: float = DEFAULT_BLOCK_TIME,
+        history_blocks: int = 5,
+        min_priority_fee: int = FALLBACK_PRIORITY_FEE,
+    ):
+        """Initialize the fee oracle.
+
+        Args:
+            web3 (Web3): The web3 instance used to fetch fee history.
+            block_time (float): Seconds between blocks, used as the cache lifetime.
+            history_blocks (int): Number of recent blocks to sample priority fees from.
+            min_priority_fee (int): Lower bound for the priority fee in wei, defaults to the
+                fallback priority fee.
+
+        """
+        self.web3 = web3
+        self.block_time = block_time
+        self.history_blocks = history_blocks
+        self.min_priority_fee = min_priority_fee
+
+        self._percentiles = sorted({s.reward_percentile for s in FEE_STRATEGIES.values()})
+        self._fee_data: tuple[int, dict[float, int]] | None = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def get_fees(self, strategy: FeeStrategy | str = "standard") -> tuple[int, int]:
+        """Get fees for a transaction in the next block.
+
+        Args:
+            strategy (FeeStrategy | str): The strategy, or the name of a registered strategy.
+
+        Returns:
+            tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
+
+        """
+        strategy = self._resolve_strategy(strategy)
+
+        with self._lock:
+            fee_data = self._cached_fee_data(strategy)
+            if fee_data is None:
+                fee_data = self._store(self._fetch(), time.monotonic())
+
+        return self._price(fee_data, strategy)
+
+    async def async_get_fees(
+        self, async_web3: AsyncWeb3, strategy: FeeStrategy | str = "standard"
+    ) -> tuple[int, int]:
+        """Get fees for a transaction in the next block without blocking the event loop.
+
+        Args:
+            async_web3 (AsyncWeb3): The async web3 instance used on a cache miss.
+            strategy (FeeStrategy | str): The strategy, or the name of a registered strategy.
+
+        Returns:
+            tuple[int, int]: Tuple of (max_priority_fee_per_gas, max_fee_per_gas) in wei
+
+        """
+        strategy = self._resolve_strategy(strategy)
+
+        with self._lock:
+            fee_data = self._cached_fee_data(strategy)
+            percentiles = list(self._percentiles)
+
+        if fee_data is None:
+            requested_at = time.monotonic()
+            try:
+                history = await async_web3.eth.fee_history(
+                    self.history_blocks, "latest", percentiles
+                )
+                fetched = self._parse_fee_history(history, percentiles)
+            except Exception:
+                block = await async_web3.eth.get_block("latest")
+                fetched = self._fallback_fee_data(block, percentiles)
+
+            with self._lock:
+                fee_data = self._store(fetched, requested_at)
+
+        return self._price(fee_data, strategy)
+
+    def invalidate(self) -> None:
+        """Discard cached fee data, e.g. after a transaction was rejected as underpriced."""
+        with self._lock:
+            self._fee_data = None
+            self._expires_at = 0.0
+
+    def _resolve_strategy(self, strategy: FeeStrategy | str) -> FeeStrategy:
+        """Look up a strategy by name."""
+        if isinstance(strategy, FeeStrategy):
+            return strategy
+        try:
+            return FEE_STRATEGIES[strategy]
+        except KeyError:
+            raise ValueError(f"Unknown fee strategy: {strategy}") from None
+
+    def _cached_fee_data(self, strategy: FeeStrategy) -> tuple[int, dict[float, int]] | None:
+        """Get the cached fee data if still fresh and covering the strategy. Requires the lock."""
+        if strategy.reward_percentile not in self._percentiles:
+            self._percentiles = sorted({*self._percentiles, strategy.reward_percentile})
+            self._fee_data = None
+
+        if self._fee_data is not None and time.monotonic() < self._expires_at:
+            return self._fee_data
+        return None
+
+    def _store(
+        self, fee_data: tuple[int, dict[float, int]], requested_at: float
+    ) -> tuple[int, dict[float, int]]:
+        """Cache fee data until the next block is expected. Requires the lock."""
+        self._fee_data = fee_data
+        self._expires_at = requested_at + self.block_time
+        return fee_data
+
+    def _fetch(self) -> tuple[int, dict[float, int]]:
+        """Fetch the next base fee and priority fees per percentile."""
+        percentiles = list(self._percentiles)
+        try:
+            history = self.web3.eth.fee_history(self.history_blocks, "latest", percentiles)
+            return self._parse_fee_history(history, percentiles)
+        except Exception:
+            return self._fallback_fee_data(self.web3.eth.get_block("latest"), percentiles)
+
+    @staticmethod
+    def _parse_fee_history(history: Any, percentiles: list[float]) -> tuple[int, dict[float, int]]:
+        """Reduce a fee history response to the next base fee and per-percentile priority fees.
+
+        The last base fee in the response is the base fee of the next block. Priority
+        fees are the median across the sampled blocks, ignoring empty blocks.
+        """
+        next_base_fee = int(history["baseFeePerGas"][-1])
+        rewards = [
+            block_rewards
+            for block_rewards, gas_used_ratio in zip(
+                history.get("reward") or [], history.get("gasUsedRatio") or [], strict=False
+            )
+            if gas_used_ratio > 0
+        ] or (history.get("reward") or [])
+
+        priority_fees = {
+            percentile: int(statistics.median(int(r[i]) for r in rewards)) if rewards else 0
+            for i, percentile in enumerate(percentiles)
+        }
+        return next_base_fee, priority_fees
+
+    @staticmethod
+    def _fallback_fee_data(block: Any, percentiles: list[float]) -> tuple[int, dict[float, int]]:
+        """Build fee data from the latest block for nodes without eth_feeHistory."""
+        return int(block["baseFeePerGas"]), dict.fromkeys(percentiles, FALLBACK_PRIORITY_FEE)
+
+    def _price(
+        self, fee_data: tuple[int, dict[float, int]], strategy: FeeStrategy
+    ) -> tuple[int, int]:
+        """Apply a strategy to fee data."""
+        base_fee, priority_fees = fee_data
+        max_priority_fee_per_gas = max(
+            priority_fees.get(strategy.reward_percentile, 0), self.min_priority_fee
+        )
+        max_fee_per_gas = int(base_fee * strategy.base_fee_multiplier) + max_priority_fee_per_gas
+        return max_priority_fee_per_gas, max_fee_per_gas
+
+
+_fee_oracles: dict[int, FeeOracle] = {}
+_fee_oracles_lock = threading.Lock()
+
+
+def get_fee_oracle(chain: Chain, web3: Web3) -> FeeOracle:
+    """Get the process-wide fee oracle for a chain, creating it on first use.
+
+    Args:
+        chain (Chain): The chain definition.
+        web3 (Web3): The web3 instance used if the oracle has to be created.
+
+    Returns:
+        FeeOracle: The shared fee oracle.
+
+    """
+    chain_id = int(chain.id)
+    with _fee_oracles_lock:
+        oracle = _fee_oracles.get(chain_id)
+        if oracle is None:
+            oracle = FeeOracle(web3, block_time=chain.block_time or DEFAULT_BLOCK_TIME)
+            _fee_oracles[chain_id] = oracle
+        return oracle
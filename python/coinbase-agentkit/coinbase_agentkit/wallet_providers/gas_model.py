@@ -0,0 +1,188 @@
+"""Gas limits learned from the receipts of earlier transactions."""
+
+import math
+import threading
+from collections import OrderedDict, deque
+from typing import Any
+
+from web3 import Web3
+
+# Number of successful receipts needed before a transaction shape is served locally
+MIN_GAS_SAMPLES = 3
+
+# Number of most recent receipts kept per transaction shape
+MAX_GAS_SAMPLES = 50
+
+# Number of sent transactions whose shape is remembered until their receipt arrives
+MAX_PENDING_TRANSACTIONS = 1024
+
+TransactionShape = tuple[str, str]
+
+
+def get_transaction_shape(transaction: Any) -> TransactionShape | None:
+    """Get the shape of a transaction: its recipient and 4-byte function selector.
+
+    Args:
+        transaction (Any): The transaction parameters.
+
+    Returns:
+        TransactionShape | None: The lowercase recipient address and selector as hex, or
+            None for contract deployments.
+
+    """
+    to = transaction.get("to")
+    if not to:
+        return None
+    to = Web3.to_hex(to) if isinstance(to, bytes) else to
+
+    data = transaction.get("data") or b""
+    data = Web3.to_bytes(hexstr=data) if isinstance(data, str) else bytes(data)
+
+    return to.lower(), Web3.to_hex(data[:4])
+
+
+class GasModel:
+    """Serves gas limits for repeated transactions from the gas they actually used.
+
+    Receipts of successful transactions are recorded per transaction shape, keyed by
+    the recipient and function selector. Once a shape has enough samples, its gas
+    limit is a high percentile of the recorded gas used, so the ``eth_estimateGas``
+    round trip can be skipped. Unknown shapes, and shapes whose last transaction
+    reverted, are left to ``eth_estimateGas``.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        min_samples: int = MIN_GAS_SAMPLES,
+        max_samples: int = MAX_GAS_SAMPLES,
+    ):
+        """Initialize the gas model.
+
+        Args:
+            percentile (float): Percentile of the recorded gas used to serve as the limit.
+            min_samples (int): Number of receipts needed before a shape is served.
+            max_samples (int): Number of most recent receipts kept per shape.
+
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+
+        self._samples: dict[TransactionShape, deque[int]] = {}
+        self._pending: OrderedDict[str, TransactionShape] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def estimate(self, transaction: Any, multiplier: float = 1.0) -> int | None:
+        """Get a gas limit for a transaction from the receipts of earlier ones.
+
+        Args:
+            transaction (Any): The transaction parameters.
+            multiplier (float): Margin applied to the recorded gas used.
+
+        Returns:
+            int | None: The gas limit, or None if the gas should be estimated instead.
+
+        """
+        shape = get_transaction_shape(transaction)
+        if shape is None:
+            return None
+
+        with self._lock:
+            samples = self._samples.get(shape)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+
+        rank = max(math.ceil(self.percentile / 100 * len(ordered)), 1)
+        return int(ordered[rank - 1] * multiplier)
+
+    def track(self, tx_hash: str, transaction: Any) -> None:
+        """Remember the shape of a sent transaction until its receipt is observed.
+
+        Args:
+            tx_hash (str): The transaction hash.
+            transaction (Any): The transaction parameters.
+
+        """
+        shape = get_transaction_shape(transaction)
+        if shape is None:
+            return
+
+        with self._lock:
+            self._pending[normalize_tx_hash(tx_hash)] = shape
+            while len(self._pending) > MAX_PENDING_TRANSACTIONS:
+                self._pending.popitem(last=False)
+
+    def observe(self, tx_hash: str, receipt: Any) -> None:
+        """Record the gas used by a tracked transaction.
+
+        A reverted transaction discards the samples of its shape, so the next
+        transaction of that shape is estimated again.
+
+        Args:
+            tx_hash (str): The transaction hash.
+            receipt (Any): The transaction receipt.
+
+        """
+        with self._lock:
+            shape = self._pending.pop(normalize_tx_hash(tx_hash), None)
+            if shape is None:
+                return
+
+            if receipt.get("status", 1) == 0:
+                self._samples.pop(shape, None)
+                return
+
+            samples = self._samples.get(shape)
+            if samples is None:
+                samples = self._samples[shape] = deque(maxlen=self.max_samples)
+            samples.append(int(receipt["gasUsed"]))
+
+    def forget(self, transaction: Any) -> None:
+        """Discard the recorded gas used for a transaction's shape.
+
+        Args:
+            transaction (Any): The transaction parameters.
+
+        """
+        shape = get_transaction_shape(transaction)
+        with self._lock:
+            self._samples.pop(shape, None)
+
+
+def normalize_tx_hash(tx_hash: str | bytes) -> str:
+    """Normalize a transaction hash to lowercase hex with a 0x prefix.
+
+    Args:
+        tx_hash (str | bytes): The transaction hash.
+
+    Returns:
+        str: The normalized transaction hash.
+
+    """
+    tx_hash = Web3.to_hex(tx_hash) if isinstance(tx_hash, bytes) else tx_hash
+    tx_hash = tx_hash.lower()
+    return tx_hash if tx_hash.startswith("0x") else f"0x{tx_hash}"
+
+
+_gas_models: dict[int, GasModel] = {}
+_gas_models_lock = threading.Lock()
+
+
+def get_gas_model(chain_id: int) -> GasModel:
+    """Get the process-wide gas model for a chain, creating it on first use.
+
+    Args:
+        chain_id (int): The chain ID.
+
+    Returns:
+        GasModel: The shared gas model.
+
+    """
+    with _gas_models_lock:
+        model = _gas_models.get(chain_id)
+        if model is None:
+            model = GasModel()
+            _gas_models[chain_id] = model
+        return model
@@ -0,0 +1,136 @@
+"""Keep-alive HTTP sessions shared by every wallet provider on a chain."""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import HTTPProvider
+from web3._utils.http_session_manager import HTTPSessionManager
+
+from ..network.chain_definitions import Chain
+
+# Connections kept open to each RPC host
+DEFAULT_POOL_SIZE = 20
+
+# Seconds to wait for an RPC response
+DEFAULT_TIMEOUT = 30.0
+
+
+class _SharedSessionManager(HTTPSessionManager):
+    """Session manager that hands every thread the same session.
+
+    Some web3 7.x releases cache the session passed to ``HTTPProvider`` only for
+    the constructing thread and open a fresh one for every other thread.
+    """
+
+    def __init__(self, session: requests.Session):
+        """Initialize the session manager.
+
+        Args:
+            session (requests.Session): The session every request is sent through.
+
+        """
+        super().__init__()
+        self._shared_session = session
+
+    def cache_and_return_session(
+        self,
+        endpoint_uri: str,
+        session: requests.Session | None = None,
+        request_timeout: float | None = None,
+    ) -> requests.Session:
+        """Return the shared session whichever thread is asking."""
+        return self._shared_session
+
+
+class _SessionHTTPProvider(HTTPProvider):
+    """HTTP provider that sends every request through one session from any thread."""
+
+    def __init__(self, endpoint_uri: str, session: requests.Session, **kwargs):
+        """Initialize the provider.
+
+        Args:
+            endpoint_uri (str): The endpoint URL.
+            session (requests.Session): The session every request is sent through.
+            **kwargs: Further ``HTTPProvider`` arguments.
+
+        """
+        super().__init__(endpoint_uri, session=session, **kwargs)
+        self._request_session_manager = _SharedSessionManager(session)
+
+
+class HttpTransport:
+    """A keep-alive HTTP session and request timeout for a chain's RPC traffic.
+
+    The session keeps up to ``pool_size`` connections open to each RPC host, so
+    sockets and TLS sessions are reused across requests and across every wallet
+    provider sending through the transport, whatever thread they run on.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT):
+        """Initialize the transport.
+
+        Args:
+            pool_size (int): Connections kept open to each RPC host.
+            timeout (float): Seconds to wait for an RPC response.
+
+        """
+        self.pool_size = pool_size
+        self.timeout = timeout
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def create_provider(self, url: str) -> HTTPProvider:
+        """Create a web3 provider for an endpoint that sends through this transport.
+
+        Args:
+            url (str): The endpoint URL.
+
+        Returns:
+            HTTPProvider: The provider.
+
+        """
+        # RPC pools fail over to the next endpoint, so retrying one endpoint only delays that
+        return _SessionHTTPProvider(
+            url,
+            session=self.session,
+            request_kwargs={"timeout": self.timeout},
+            exception_retry_configuration=None,
+        )
+
+    def close(self) -> None:
+        """Close every open connection."""
+        self.session.close()
+
+
+_http_transports: dict[tuple[str, int, float], HttpTransport] = {}
+_http_transports_lock = threading.Lock()
+
+
+def get_http_transport(
+    chain: Chain, pool_size: int | None = None, timeout: float | None = None
+) -> HttpTransport:
+    """Get the process-wide HTTP transport for a chain, creating it on first use.
+
+    Args:
+        chain (Chain): The chain definition.
+        pool_size (int | None): Connections kept open to each RPC host.
+        timeout (float | None): Seconds to wait for an RPC response.
+
+    Returns:
+        HttpTransport: The shared transport.
+
+    """
+    pool_size = pool_size or DEFAULT_POOL_SIZE
+    timeout = timeout or DEFAULT_TIMEOUT
+
+    key = (chain.id, pool_size, timeout)
+    with _http_transports_lock:
+        transport = _http_transports.get(key)
+        if transport is None:
+            transport = HttpTransport(pool_size=pool_size, timeout=timeout)
+            _http_transports[key] = transport
+        return transport
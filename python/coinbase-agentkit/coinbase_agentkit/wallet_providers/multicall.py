@@ -0,0 +1,306 @@
+"""Batched contract reads through Multicall3 or JSON-RPC batching."""
+
+from typing import Any
+
+from eth_utils import function_abi_to_4byte_selector
+from pydantic import BaseModel, Field, SkipValidation
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import BadFunctionCallOutput
+from web3.types import BlockIdentifier, RPCEndpoint
+
+from ..contracts import ContractFunction, get_contract_abi
+from ..network.chain_definitions import Chain
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "getBlockNumber",
+        "outputs": [{"internalType": "uint256", "name": "blockNumber", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+AGGREGATE3_SELECTOR = function_abi_to_4byte_selector(MULTICALL3_ABI[0])
+
+# Maximum number of calls aggregated into a single eth_call
+MULTICALL_BATCH_SIZE = 100
+
+
+class ContractCall(BaseModel):
+    """A single read-only contract function call."""
+
+    contract_address: str = Field(..., description="The address of the contract to call")
+    # Not validated, so the caller's ABI object is kept and its preprocessed form is reused
+    abi: SkipValidation[list[dict[str, Any]]] = Field(..., description="The ABI of the contract")
+    function_name: str = Field(..., description="The name of the function to call")
+    args: list[Any] = Field(default_factory=list, description="Arguments for the function call")
+    allow_failure: bool = Field(
+        False, description="Whether a failed call yields None instead of failing the batch"
+    )
+
+
+def get_multicall_address(chain: Chain) -> str | None:
+    """Get the Multicall3 address for a chain, if it has one deployed.
+
+    Args:
+        chain (Chain): The chain definition.
+
+    Returns:
+        str | None: The checksummed Multicall3 address, or None if not deployed.
+
+    """
+    contract = chain.contracts.get("multicall3")
+    return Web3.to_checksum_address(contract.address) if contract else None
+
+
+def encode_call(call: ContractCall) -> tuple[ContractFunction, bytes]:
+    """Encode the calldata for a contract call.
+
+    Args:
+        call (ContractCall): The call to encode.
+
+    Returns:
+        tuple[ContractFunction, bytes]: The called function and the encoded calldata.
+
+    """
+    function = get_contract_abi(call.abi).get_function(call.function_name, call.args)
+    return function, function.encode(call.args)
+
+
+def read_contract(
+    web3: Web3,
+    contract_address: str,
+    abi: list[dict[str, Any]],
+    function_name: str,
+    args: list[Any] | None = None,
+    block_identifier: BlockIdentifier = "latest",
+) -> Any:
+    """Read a contract function with a single eth_call, reusing the preprocessed ABI.
+
+    Args:
+        web3 (Web3): The web3 instance to read with.
+        contract_address (str): The address of the contract to read from.
+        abi (list[dict[str, Any]]): The ABI of the contract.
+        function_name (str): The name of the function to call.
+        args (list[Any] | None): Arguments to pass to the function call.
+        block_identifier (BlockIdentifier): The block to read at, defaults to 'latest'.
+
+    Returns:
+        Any: The decoded result of the call.
+
+    """
+    function, data = encode_call(
+        ContractCall(
+            contract_address=contract_address, abi=abi, function_name=function_name, args=args or []
+        )
+    )
+    return_data = web3.eth.call(
+        {"to": Web3.to_checksum_address(contract_address), "data": Web3.to_hex(data)},
+        block_identifier=block_identifier,
+    )
+    return _decode_return_data(function, contract_address, return_data)
+
+
+async def async_read_contract(
+    web3: AsyncWeb3,
+    contract_address: str,
+    abi: list[dict[str, Any]],
+    function_name: str,
+    args: list[Any] | None = None,
+    block_identifier: BlockIdentifier = "latest",
+) -> Any:
+    """Read a contract function with a single eth_call on an async web3 client.
+
+    Args:
+        web3 (AsyncWeb3): The async web3 instance to read with.
+        contract_address (str): The address of the contract to read from.
+        abi (list[dict[str, Any]]): The ABI of the contract.
+        function_name (str): The name of the function to call.
+        args (list[Any] | None): Arguments to pass to the function call.
+        block_identifier (BlockIdentifier): The block to read at, defaults to 'latest'.
+
+    Returns:
+        Any: The decoded result of the call.
+
+    """
+    function, data = encode_call(
+        ContractCall(
+            contract_address=contract_address, abi=abi, function_name=function_name, args=args or []
+        )
+    )
+    return_data = await web3.eth.call(
+        {"to": Web3.to_checksum_address(contract_address), "data": Web3.to_hex(data)},
+        block_identifier=block_identifier,
+    )
+    return _decode_return_data(function, contract_address, return_data)
+
+
+def _decode_return_data(function: ContractFunction, contract_address: str, data: bytes) -> Any:
+    """Decode the result of a single call, raising like web3 contract calls on empty output."""
+    try:
+        return function.decode(data)
+    except Exception as e:
+        raise BadFunctionCallOutput(
+            f"Could not decode contract function call to {function.name} with return data "
+            f"{data!r} on {contract_address}: {e!s}"
+        ) from e
+
+
+def read_contract_many(
+    web3: Web3,
+    calls: list[ContractCall],
+    block_identifier: BlockIdentifier = "latest",
+    multicall_address: str | None = None,
+) -> list[Any]:
+    """Read many contract functions in as few round trips as possible.
+
+    Calls are aggregated through Multicall3 when the chain has it deployed and fall
+    back to a single JSON-RPC batch request otherwise.
+
+    Args:
+        web3 (Web3): The web3 instance to read with.
+        calls (list[ContractCall]): The calls to make.
+        block_identifier (BlockIdentifier): The block to read at, defaults to 'latest'.
+        multicall_address (str | None): The Multicall3 address, or None to use JSON-RPC batching.
+
+    Returns:
+        list[Any]: The decoded results in call order. Failed calls that allow failure yield None.
+
+    Raises:
+        Exception: If a call that does not allow failure fails
+
+    """
+    encoded = [encode_call(call) for call in calls]
+
+    if multicall_address:
+        raw_results = []
+        for start in range(0, len(calls), MULTICALL_BATCH_SIZE):
+            raw_results.extend(
+                _aggregate3(
+                    web3,
+                    multicall_address,
+                    calls[start : start + MULTICALL_BATCH_SIZE],
+                    [data for _, data in encoded[start : start + MULTICALL_BATCH_SIZE]],
+                    block_identifier,
+                )
+            )
+    else:
+        raw_results = _batch_eth_call(web3, calls, [data for _, data in encoded], block_identifier)
+
+    results = []
+    for call, (function, _), (success, data) in zip(calls, encoded, raw_results, strict=True):
+        if success:
+            try:
+                results.append(function.decode(data))
+                continue
+            except Exception as e:
+                if not call.allow_failure:
+                    raise Exception(
+                        f"Failed to decode result of {call.function_name} "
+                        f"on {call.contract_address}: {e!s}"
+                    ) from e
+        elif not call.allow_failure:
+            raise Exception(f"Call to {call.function_name} on {call.contract_address} failed")
+
+        results.append(None)
+
+    return results
+
+
+def _aggregate3(
+    web3: Web3,
+    multicall_address: str,
+    calls: list[ContractCall],
+    calldata: list[bytes],
+    block_identifier: BlockIdentifier,
+) -> list[tuple[bool, bytes]]:
+    """Execute one Multicall3 aggregate3 call."""
+    payload = AGGREGATE3_SELECTOR + web3.codec.encode(
+        ["(address,bool,bytes)[]"],
+        [
+            [
+                (Web3.to_checksum_address(call.contract_address), call.allow_failure, data)
+                for call, data in zip(calls, calldata, strict=True)
+            ]
+        ],
+    )
+
+    try:
+        return_data = web3.eth.call(
+            {"to": multicall_address, "data": payload}, block_identifier=block_identifier
+        )
+    except Exception as e:
+        raise Exception(f"Multicall failed: {e!s}") from e
+
+    (results,) = web3.codec.decode(["(bool,bytes)[]"], return_data)
+    return [(success, data) for success, data in results]
+
+
+def _batch_eth_call(
+    web3: Web3,
+    calls: list[ContractCall],
+    calldata: list[bytes],
+    block_identifier: BlockIdentifier,
+) -> list[tuple[bool, bytes]]:
+    """Execute calls as a single JSON-RPC batch, or one by one if batching is unavailable."""
+    if isinstance(block_identifier, int):
+        block_param: Any = hex(block_identifier)
+    elif isinstance(block_identifier, bytes):
+        block_param = {"blockHash": Web3.to_hex(block_identifier)}
+    else:
+        block_param = block_identifier
+
+    requests = [
+        (
+            RPCEndpoint("eth_call"),
+            [
+                {"to": Web3.to_checksum_address(call.contract_address), "data": Web3.to_hex(data)},
+                block_param,
+            ],
+        )
+        for call, data in zip(calls, calldata, strict=True)
+    ]
+
+    try:
+        responses = web3.provider.make_batch_request(requests)
+    except NotImplementedError:
+        responses = [web3.provider.make_request(method, params) for method, params in requests]
+
+    if not isinstance(responses, list):
+        raise Exception(f"Batch request failed: {responses.get('error')}")
+
+    return [
+        (True, Web3.to_bytes(hexstr=response["result"]))
+        if "result" in response and "error" not in response
+        else (False, b"")
+        for response in responses
+    ]
@@ -0,0 +1,198 @@
+"""Local nonce management for EVM wallets."""
+
+import threading
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# Substrings of node errors that mean the locally tracked nonce is out of sync
+NONCE_ERROR_MESSAGES = (
+    "nonce too low",
+    "nonce too high",
+    "invalid nonce",
+    "nonce has already been used",
+    "replacement transaction underpriced",
+)
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """Check whether an error was caused by a stale or conflicting nonce.
+
+    Args:
+        error (Exception): The error raised while sending a transaction.
+
+    Returns:
+        bool: True if the nonce should be resynchronized with the network.
+
+    """
+    message = str(error).lower()
+    return any(fragment in message for fragment in NONCE_ERROR_MESSAGES)
+
+
+class NonceManager:
+    """Hands out nonces for a single address without a network round trip per send.
+
+    The first reservation reads the pending transaction count from the network.
+    Subsequent reservations are served locally, so several transactions from the
+    same address can be in flight at once. The manager resynchronizes with the
+    network after a send fails with a nonce error.
+    """
+
+    def __init__(self, address: str, fetch_nonce: Callable[[], int]):
+        """Initialize the nonce manager.
+
+        Args:
+            address (str): The address nonces are managed for.
+            fetch_nonce (Callable[[], int]): Returns the address's pending transaction count.
+
+        """
+        self.address = address
+        self._fetch_nonce = fetch_nonce
+        self._next_nonce: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def synced(self) -> bool:
+        """Whether the next nonce is known locally."""
+        return self._next_nonce is not None
+
+    def sync(self, pending_nonce: int) -> None:
+        """Set the next nonce from a pending transaction count, unless already known.
+
+        Args:
+            pending_nonce (int): The address's pending transaction count.
+
+        """
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = pending_nonce
+
+    def reserve(self) -> int:
+        """Reserve the next nonce.
+
+        Returns:
+            int: A nonce not handed out to any other in-flight transaction.
+
+        """
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = self._fetch_nonce()
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    def release(self, nonce: int) -> None:
+        """Return a reserved nonce whose transaction was never broadcast.
+
+        If later nonces have been handed out since, the manager resynchronizes on
+        the next reservation instead, so the gap is not left open.
+
+        Args:
+            nonce (int): The nonce to release.
+
+        """
+        with self._lock:
+            if self._next_nonce == nonce + 1:
+                self._next_nonce = nonce
+            else:
+                self._next_nonce = None
+
+    def resync(self) -> None:
+        """Discard the local nonce so the next reservation reads it from the network."""
+        with self._lock:
+            self._next_nonce = None
+
+    def send(self, send: Callable[[int], T], retries: int = 1) -> T:
+        """Send a transaction with a reserved nonce.
+
+        Args:
+            send (Callable[[int], T]): Signs and broadcasts the transaction with the given nonce.
+            retries (int): Number of times to retry with a fresh nonce after a nonce error.
+
+        Returns:
+            T: The result of ``send``.
+
+        Raises:
+            Exception: If sending fails
+
+        """
+        attempt = 0
+        while True:
+            nonce = self.reserve()
+            try:
+                return send(nonce)
+            except Exception as e:
+                if not is_nonce_error(e):
+                    self.release(nonce)
+                    raise
+                self.resync()
+                if attempt >= retries:
+                    raise
+                attempt += 1
+
+    async def async_send(
+        self,
+        send: Callable[[int], Awaitable[T]],
+        fetch_nonce: Callable[[], Awaitable[int]],
+        retries: int = 1,
+    ) -> T:
+        """Send a transaction with a reserved nonce without blocking the event loop.
+
+        Args:
+            send (Callable[[int], Awaitable[T]]): Signs and broadcasts the transaction with the
+                given nonce.
+            fetch_nonce (Callable[[], Awaitable[int]]): Returns the address's pending transaction
+                count, used when the manager is not synchronized.
+            retries (int): Number of times to retry with a fresh nonce after a nonce error.
+
+        Returns:
+            T: The result of ``send``.
+
+        Raises:
+            Exception: If sending fails
+
+        """
+        attempt = 0
+        while True:
+            if not self.synced:
+                self.sync(await fetch_nonce())
+            nonce = self.reserve()
+            try:
+                return await send(nonce)
+            except Exception as e:
+                if not is_nonce_error(e):
+                    self.release(nonce)
+                    raise
+                self.resync()
+                if attempt >= retries:
+                    raise
+                attempt += 1
+
+
+_nonce_managers: dict[tuple[int, str], NonceManager] = {}
+_nonce_managers_lock = threading.Lock()
+
+
+def get_nonce_manager(chain_id: int, address: str, fetch_nonce: Callable[[], int]) -> NonceManager:
+    """Get the process-wide nonce manager for an address on a chain, creating it on first use.
+
+    Wallet providers for the same account and chain share one manager, so their
+    transactions never collide on a nonce.
+
+    Args:
+        chain_id (int): The chain ID.
+        address (str): The address nonces are managed for.
+        fetch_nonce (Callable[[], int]): Returns the address's pending transaction count.
+
+    Returns:
+        NonceManager: The shared nonce manager.
+
+    """
+    key = (chain_id, address.lower())
+    with _nonce_managers_lock:
+        manager = _nonce_managers.get(key)
+        if manager is None:
+            manager = NonceManager(address, fetch_nonce)
+            _nonce_managers[key] = manager
+        return manager
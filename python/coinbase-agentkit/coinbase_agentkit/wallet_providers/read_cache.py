@@ -0,0 +1,243 @@
+"""Read-through caching of contract reads and balances until the next block."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from pydantic import BaseModel, Field
+from web3 import Web3
+
+from ..network.chain_definitions import Chain
+from .multicall import ContractCall
+from .read_snapshot import call_key, copy_result
+
+# Block time assumed for chains without one in their definition
+DEFAULT_BLOCK_TIME = 2.0
+
+# Number of results kept per chain
+MAX_CACHED_READS = 10_000
+
+
+class ReadCacheStats(BaseModel):
+    """Counters describing how well a read cache is working."""
+
+    hits: int = Field(0, description="Reads answered from the cache")
+    misses: int = Field(0, description="Reads sent to the chain")
+    invalidations: int = Field(0, description="Times the cache was cleared")
+    size: int = Field(0, description="Results currently cached")
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of reads answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ReadCache:
+    """Caches ``latest`` reads for as long as the chain head does not move.
+
+    Results are keyed by the head block they were read at. The head is checked
+    with ``eth_blockNumber`` at most once per block time; when it has moved, or
+    when a wallet on the chain sends a transaction, every cached result is
+    discarded.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        block_time: float = DEFAULT_BLOCK_TIME,
+        max_entries: int = MAX_CACHED_READS,
+    ):
+        """Initialize the read cache.
+
+        Args:
+            web3 (Web3): The web3 instance used to check the chain head.
+            block_time (float): Seconds between blocks, used to pace head checks.
+            max_entries (int): Number of results kept before the oldest are evicted.
+
+        """
+        self.web3 = web3
+        self.block_time = block_time
+        self.max_entries = max_entries
+
+        self._head: int | None = None
+        self._head_expires_at = 0.0
+        self._results: OrderedDict[tuple, Any] = OrderedDict()
+        self._stats = ReadCacheStats()
+        self._lock = threading.Lock()
+
+    def read(self, call: ContractCall, read: Callable[[], Any]) -> Any:
+        """Answer a contract read from the cache, or make it and cache the result.
+
+        Args:
+            call (ContractCall): The call being read.
+            read (Callable[[], Any]): Makes the read at the latest block.
+
+        Returns:
+            Any: The decoded result.
+
+        """
+        return self.get(("call", *call_key(call)), read)
+
+    def read_many(
+        self, calls: list[ContractCall], read_many: Callable[[list[ContractCall]], list[Any]]
+    ) -> list[Any]:
+        """Answer contract reads from the cache, making only those not cached in one round trip.
+
+        Args:
+            calls (list[ContractCall]): The calls being read.
+            read_many (Callable[[list[ContractCall]], list[Any]]): Makes several reads at the
+                latest block.
+
+        Returns:
+            list[Any]: The decoded results in call order.
+
+        """
+        head = self._get_head()
+        keys = [(head, "call", *call_key(call)) for call in calls]
+        results = [self._lookup(key) for key in keys]
+
+        missing = [index for index, (hit, _) in enumerate(results) if not hit]
+        fetched = read_many([calls[index] for index in missing]) if missing else []
+        values = [value for _, value in results]
+        for index, result in zip(missing, fetched, strict=True):
+            values[index] = result
+            self._store(keys[index], result)
+
+        return values
+
+    def get(self, key: tuple, fetch: Callable[[], Any]) -> Any:
+        """Answer a read from the cache, or fetch it and cache the result.
+
+        Args:
+            key (tuple): Identifies the read within a block.
+            fetch (Callable[[], Any]): Makes the read at the latest block.
+
+        Returns:
+            Any: The result.
+
+        """
+        key = (self._get_head(), *key)
+        hit, result = self._lookup(key)
+        if hit:
+            return result
+
+        result = fetch()
+        self._store(key, result)
+        return result
+
+    async def async_read(self, call: ContractCall, read: Callable[[], Awaitable[Any]]) -> Any:
+        """Answer a contract read from the cache without blocking the event loop.
+
+        Args:
+            call (ContractCall): The call being read.
+            read (Callable[[], Awaitable[Any]]): Makes the read at the latest block.
+
+        Returns:
+            Any: The decoded result.
+
+        """
+        return await self.async_get(("call", *call_key(call)), read)
+
+    async def async_get(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Answer a read from the cache, or fetch it without blocking the event loop.
+
+        Args:
+            key (tuple): Identifies the read within a block.
+            fetch (Callable[[], Awaitable[Any]]): Makes the read at the latest block.
+
+        Returns:
+            Any: The result.
+
+        """
+        key = (await asyncio.to_thread(self._get_head), *key)
+        hit, result = self._lookup(key)
+        if hit:
+            return result
+
+        result = await fetch()
+        self._store(key, result)
+        return result
+
+    def invalidate(self) -> None:
+        """Discard every cached result and check the head again on the next read."""
+        with self._lock:
+            self._clear()
+            self._head_expires_at = 0.0
+
+    def stats(self) -> ReadCacheStats:
+        """Get the cache's hit, miss and invalidation counters.
+
+        Returns:
+            ReadCacheStats: A copy of the counters.
+
+        """
+        with self._lock:
+            return self._stats.model_copy(update={"size": len(self._results)})
+
+    def _get_head(self) -> int:
+        """Get the chain head, checking it at most once per block time."""
+        now = time.monotonic()
+        with self._lock:
+            if self._head is not None and now < self._head_expires_at:
+                return self._head
+
+        head = self.web3.eth.block_number
+
+        with self._lock:
+            if head != self._head:
+                self._clear()
+                self._head = head
+            self._head_expires_at = now + self.block_time
+            return head
+
+    def _lookup(self, key: tuple) -> tuple[bool, Any]:
+        """Look up a result, counting the hit or miss."""
+        with self._lock:
+            if key in self._results:
+                self._stats.hits += 1
+                self._results.move_to_end(key)
+                return True, copy_result(self._results[key])
+            self._stats.misses += 1
+            return False, None
+
+    def _store(self, key: tuple, result: Any) -> None:
+        """Cache a result if it was read at the current head. Failed reads are not cached."""
+        with self._lock:
+            if result is None or key[0] != self._head:
+                return
+            self._results[key] = copy_result(result)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+
+    def _clear(self) -> None:
+        """Discard every cached result. Requires the lock."""
+        if self._results:
+            self._results.clear()
+            self._stats.invalidations += 1
+
+
+_read_caches: dict[str, ReadCache] = {}
+_read_caches_lock = threading.Lock()
+
+
+def get_read_cache(chain: Chain, web3: Web3) -> ReadCache:
+    """Get the process-wide read cache for a chain, creating it on first use.
+
+    Args:
+        chain (Chain): The chain definition.
+        web3 (Web3): The web3 instance used if the cache has to be created.
+
+    Returns:
+        ReadCache: The shared read cache.
+
+    """
+    with _read_caches_lock:
+        cache = _read_caches.get(chain.id)
+        if cache is None:
+            cache = ReadCache(web3, block_time=chain.block_time or DEFAULT_BLOCK_TIME)
+            _read_caches[chain.id] = cache
+        return cache
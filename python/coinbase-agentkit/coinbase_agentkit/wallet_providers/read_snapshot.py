@@ -0,0 +1,180 @@
+"""Contract reads pinned to one block and memoized for the duration of an action."""
+
+import copy
+import threading
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any
+
+from ..contracts import get_contract_abi
+from .multicall import ContractCall
+
+_MISSING = object()
+
+# The snapshot each wallet provider's reads are pinned to in the current context, by provider id
+_active_snapshots: ContextVar[dict[int, "ReadSnapshot"]] = ContextVar("read_snapshots")
+
+
+class ReadSnapshot:
+    """A view of chain state at a single block.
+
+    Every ``latest`` read made through a wallet provider while the snapshot is active
+    is sent at the snapshot's block, so reads spread over several calls see the same
+    state. Because that state cannot change, each distinct read is made once and
+    answered from memory afterwards.
+
+    The block number is resolved on the first read. Transactions sent while a
+    snapshot is active are not reflected in its reads.
+    """
+
+    def __init__(self, get_block_number: Callable[[], int], block_number: int | None = None):
+        """Initialize the snapshot.
+
+        Args:
+            get_block_number (Callable[[], int]): Fetches the latest block number.
+            block_number (int | None): The block to pin reads to, or None for the latest block.
+
+        """
+        self._get_block_number = get_block_number
+        self._block_number = block_number
+        self._results: dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def block_number(self) -> int:
+        """The block number reads are pinned to."""
+        with self._lock:
+            if self._block_number is None:
+                self._block_number = self._get_block_number()
+            return self._block_number
+
+    def read(self, call: ContractCall, read: Callable[[int], Any]) -> Any:
+        """Make a read at the snapshot's block, or answer it from memory.
+
+        Args:
+            call (ContractCall): The call being read.
+            read (Callable[[int], Any]): Makes the read at a block number.
+
+        Returns:
+            Any: The decoded result.
+
+        """
+        key = call_key(call)
+        with self._lock:
+            result = self._results.get(key, _MISSING)
+        if result is not _MISSING:
+            return copy_result(result)
+
+        result = read(self.block_number)
+        self._store(key, result)
+        return result
+
+    async def async_read(self, call: ContractCall, read: Callable[[int], Awaitable[Any]]) -> Any:
+        """Make a read at the snapshot's block without blocking the event loop.
+
+        Args:
+            call (ContractCall): The call being read.
+            read (Callable[[int], Awaitable[Any]]): Makes the read at a block number.
+
+        Returns:
+            Any: The decoded result.
+
+        """
+        key = call_key(call)
+        with self._lock:
+            result = self._results.get(key, _MISSING)
+        if result is not _MISSING:
+            return copy_result(result)
+
+        result = await read(self.block_number)
+        self._store(key, result)
+        return result
+
+    def read_many(
+        self, calls: list[ContractCall], read_many: Callable[[list[ContractCall], int], list[Any]]
+    ) -> list[Any]:
+        """Make many reads at the snapshot's block, reading only those not made before.
+
+        Args:
+            calls (list[ContractCall]): The calls being read.
+            read_many (Callable[[list[ContractCall], int], list[Any]]): Makes several reads
+                at a block number in one round trip.
+
+        Returns:
+            list[Any]: The decoded results in call order.
+
+        """
+        keys = [call_key(call) for call in calls]
+        with self._lock:
+            results = [self._results.get(key, _MISSING) for key in keys]
+        results = [copy_result(result) for result in results]
+
+        missing = [index for index, result in enumerate(results) if result is _MISSING]
+        if missing:
+            fetched = read_many([calls[index] for index in missing], self.block_number)
+            for index, result in zip(missing, fetched, strict=True):
+                results[index] = result
+                self._store(keys[index], result)
+
+        return results
+
+    def _store(self, key: tuple, result: Any) -> None:
+        """Remember a result. Failed reads that yielded None are not remembered."""
+        if result is None:
+            return
+        with self._lock:
+            self._results[key] = copy_result(result)
+
+
+def call_key(call: ContractCall) -> tuple:
+    """Identify a read by its contract, ABI, function and arguments."""
+    return (
+        call.contract_address.lower(),
+        get_contract_abi(call.abi).fingerprint,
+        call.function_name,
+        repr(call.args),
+    )
+
+
+def copy_result(result: Any) -> Any:
+    """Copy a remembered result so callers cannot change it for later readers."""
+    if isinstance(result, list | tuple | dict):
+        return copy.deepcopy(result)
+    return result
+
+
+def get_active_snapshot(owner: object) -> ReadSnapshot | None:
+    """Get the snapshot an object's reads are pinned to in the current context.
+
+    Args:
+        owner (object): The wallet provider.
+
+    Returns:
+        ReadSnapshot | None: The active snapshot, or None if reads are not pinned.
+
+    """
+    return _active_snapshots.get({}).get(id(owner))
+
+
+def activate_snapshot(owner: object, snapshot: ReadSnapshot) -> Any:
+    """Pin an object's reads to a snapshot in the current context.
+
+    Args:
+        owner (object): The wallet provider.
+        snapshot (ReadSnapshot): The snapshot.
+
+    Returns:
+        Any: A token that restores the previous state when passed to ``deactivate_snapshot``.
+
+    """
+    return _active_snapshots.set({**_active_snapshots.get({}), id(owner): snapshot})
+
+
+def deactivate_snapshot(token: Any) -> None:
+    """Restore the snapshots active before ``activate_snapshot`` was called.
+
+    Args:
+        token (Any): The token returned by ``activate_snapshot``.
+
+    """
+    _active_snapshots.reset(token)
@@ -0,0 +1,237 @@
+"""Block-paced receipt polling shared by every transaction waited on for a chain."""
+
+import asyncio
+import contextlib
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+from web3 import Web3
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from web3.types import RPCEndpoint
+
+from ..network.chain_definitions import Chain
+from .gas_model import normalize_tx_hash
+
+try:
+    from web3._utils.method_formatters import receipt_formatter
+except ImportError:  # private to web3, so receipts are fetched one by one if it moves
+    receipt_formatter = None
+
+# Block time assumed for chains without one in their definition
+DEFAULT_BLOCK_TIME = 2.0
+
+# Lower bound on the time between block number checks in seconds
+MIN_POLL_INTERVAL = 0.1
+
+
+class ReceiptWatcher:
+    """Waits for many transaction receipts with one poll per block.
+
+    Pending transaction hashes are collected from all waiters. A single background
+    thread checks the block number a few times per block and, whenever a new block
+    appears, fetches the receipts of every pending hash in one JSON-RPC batch
+    request, resolving the waiters whose transactions were included. The thread
+    stops when nothing is pending.
+    """
+
+    def __init__(self, web3: Web3, block_time: float = DEFAULT_BLOCK_TIME):
+        """Initialize the receipt watcher.
+
+        Args:
+            web3 (Web3): The web3 instance used to poll for receipts.
+            block_time (float): Seconds between blocks, used to pace polling.
+
+        """
+        self.web3 = web3
+        self.block_time = block_time
+        self.poll_interval = max(block_time / 4, MIN_POLL_INTERVAL)
+
+        self._pending: dict[str, Future] = {}
+        self._deadlines: dict[str, float] = {}
+        self._unchecked: set[str] = set()
+        self._last_block: int | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def watch(self, tx_hash: str | bytes, timeout: float = 120) -> Future:
+        """Start watching for a transaction's receipt.
+
+        Args:
+            tx_hash (str | bytes): The transaction hash.
+            timeout (float): Seconds after which the returned future fails with TimeExhausted.
+
+        Returns:
+            Future: Resolves to the transaction receipt.
+
+        """
+        tx_hash = normalize_tx_hash(tx_hash)
+        deadline = time.monotonic() + timeout
+
+        with self._lock:
+            future = self._pending.get(tx_hash)
+            if future is None:
+                future = self._pending[tx_hash] = Future()
+                self._unchecked.add(tx_hash)
+            self._deadlines[tx_hash] = max(self._deadlines.get(tx_hash, 0.0), deadline)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="receipt-watcher", daemon=True
+                )
+                self._thread.start()
+
+        return future
+
+    def wait(self, tx_hash: str | bytes, timeout: float = 120) -> Any:
+        """Wait for a transaction's receipt.
+
+        Args:
+            tx_hash (str | bytes): The transaction hash.
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            Any: The transaction receipt.
+
+        Raises:
+            TimeExhausted: If the transaction is not mined within the timeout
+
+        """
+        future = self.watch(tx_hash, timeout)
+        try:
+            return future.result(timeout=timeout + self.poll_interval)
+        except FutureTimeoutError:
+            raise _time_exhausted(tx_hash, timeout) from None
+
+    async def async_wait(self, tx_hash: str | bytes, timeout: float = 120) -> Any:
+        """Wait for a transaction's receipt without blocking the event loop.
+
+        Args:
+            tx_hash (str | bytes): The transaction hash.
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            Any: The transaction receipt.
+
+        Raises:
+            TimeExhausted: If the transaction is not mined within the timeout
+
+        """
+        future = asyncio.wrap_future(self.watch(tx_hash, timeout))
+        try:
+            return await asyncio.wait_for(future, timeout + self.poll_interval)
+        except asyncio.TimeoutError:
+            raise _time_exhausted(tx_hash, timeout) from None
+
+    def _run(self) -> None:
+        """Poll until no transactions are pending."""
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+
+            # Transient RPC errors are retried on the next tick; waiters time out otherwise
+            with contextlib.suppress(Exception):
+                self._poll()
+
+            self._expire()
+            time.sleep(self.poll_interval)
+
+    def _poll(self) -> None:
+        """Fetch receipts for pending transactions if a new block arrived or hashes were added."""
+        block_number = self.web3.eth.block_number
+
+        with self._lock:
+            if block_number == self._last_block and not self._unchecked:
+                return
+            tx_hashes = list(self._pending)
+
+        receipts = self._fetch_receipts(tx_hashes)
+
+        with self._lock:
+            self._last_block = block_number
+            self._unchecked.difference_update(tx_hashes)
+            for tx_hash, receipt in zip(tx_hashes, receipts, strict=True):
+                if receipt is None:
+                    continue
+                future = self._pending.pop(tx_hash, None)
+                self._deadlines.pop(tx_hash, None)
+                if future is not None and not future.done():
+                    future.set_result(receipt)
+
+    def _fetch_receipts(self, tx_hashes: list[str]) -> list[Any]:
+        """Fetch receipts as one JSON-RPC batch, or one by one if batching is unavailable."""
+        if receipt_formatter is None:
+            return [self._fetch_receipt(tx_hash) for tx_hash in tx_hashes]
+
+        requests = [(RPCEndpoint("eth_getTransactionReceipt"), [tx_hash]) for tx_hash in tx_hashes]
+
+        try:
+            responses = self.web3.provider.make_batch_request(requests)
+        except NotImplementedError:
+            responses = [
+                self.web3.provider.make_request(method, params) for method, params in requests
+            ]
+
+        if not isinstance(responses, list):
+            raise Exception(f"Batch request failed: {responses.get('error')}")
+
+        return [
+            AttributeDict.recursive(receipt_formatter(response["result"]))
+            if response.get("result")
+            else None
+            for response in responses
+        ]
+
+    def _fetch_receipt(self, tx_hash: str) -> Any:
+        """Fetch a single receipt through web3's formatted API."""
+        try:
+            return self.web3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+
+    def _expire(self) -> None:
+        """Fail waiters whose deadline has passed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [tx_hash for tx_hash, deadline in self._deadlines.items() if deadline <= now]
+            for tx_hash in expired:
+                del self._deadlines[tx_hash]
+                self._unchecked.discard(tx_hash)
+                future = self._pending.pop(tx_hash)
+                if not future.done():
+                    future.set_exception(_time_exhausted(tx_hash, None))
+
+
+def _time_exhausted(tx_hash: str | bytes, timeout: float | None) -> TimeExhausted:
+    """Build the error raised when a transaction is not mined in time."""
+    waited = f" after {timeout} seconds" if timeout is not None else ""
+    return TimeExhausted(f"Transaction {normalize_tx_hash(tx_hash)} is not in the chain{waited}")
+
+
+_receipt_watchers: dict[int, ReceiptWatcher] = {}
+_receipt_watchers_lock = threading.Lock()
+
+
+def get_receipt_watcher(chain: Chain, web3: Web3) -> ReceiptWatcher:
+    """Get the process-wide receipt watcher for a chain, creating it on first use.
+
+    Args:
+        chain (Chain): The chain definition.
+        web3 (Web3): The web3 instance used if the watcher has to be created.
+
+    Returns:
+        ReceiptWatcher: The shared receipt watcher.
+
+    """
+    chain_id = int(chain.id)
+    with _receipt_watchers_lock:
+        watcher = _receipt_watchers.get(chain_id)
+        if watcher is None:
+            watcher = ReceiptWatcher(web3, block_time=chain.block_time or DEFAULT_BLOCK_TIME)
+            _receipt_watchers[chain_id] = watcher
+        return watcher
@@ -0,0 +1,460 @@
+"""A web3 provider that spreads requests over a pool of RPC endpoints."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ConnectTimeout
+from urllib3.exceptions import NewConnectionError
+from web3 import HTTPProvider, Web3
+from web3.providers import JSONBaseProvider
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from ..network.chain_definitions import Chain
+from .evm_wallet_provider import EvmRpcConfig
+from .http_transport import HttpTransport, get_http_transport
+
+# Methods that change chain state; they are never hedged
+WRITE_METHODS = frozenset({"eth_sendRawTransaction", "eth_sendTransaction"})
+
+# Error messages with which nodes reject a transaction they already have
+KNOWN_TRANSACTION_ERRORS = ("already known", "known transaction", "already imported")
+
+# JSON-RPC error codes returned when the endpoint, rather than the request, is at fault
+ENDPOINT_ERROR_CODES = frozenset({-32005, 429})
+
+# Consecutive failures after which an endpoint is taken out of rotation
+DEFAULT_FAILURE_THRESHOLD = 3
+
+# Seconds a failing endpoint stays out of rotation
+DEFAULT_COOLDOWN = 30.0
+
+# Weight of the newest sample in the latency and error rate moving averages
+EWMA_SMOOTHING = 0.2
+
+Request = Callable[[HTTPProvider], Any]
+
+
+class EndpointError(Exception):
+    """Raised when an endpoint answers with an error that says it cannot serve requests."""
+
+    def __init__(self, response: Any):
+        """Initialize the error.
+
+        Args:
+            response (Any): The JSON-RPC error response.
+
+        """
+        self.response = response
+        super().__init__(str(response.get("error") if isinstance(response, dict) else response))
+
+
+class RpcEndpoint:
+    """Health statistics for one RPC endpoint."""
+
+    def __init__(self, url: str, provider: HTTPProvider):
+        """Initialize the endpoint.
+
+        Args:
+            url (str): The endpoint URL.
+            provider (HTTPProvider): The provider that sends requests to the endpoint.
+
+        """
+        self.url = url
+        self.provider = provider
+        self.latency: float | None = None
+        self.error_rate = 0.0
+        self.failures = 0
+        self.open_until = 0.0
+
+    @property
+    def score(self) -> float:
+        """Expected seconds to get an answer, counting retries after errors.
+
+        Endpoints without a measured latency score zero, so each is tried early on.
+        """
+        return (self.latency or 0.0) / max(1 - self.error_rate, 0.01)
+
+
+class RpcPoolProvider(JSONBaseProvider):
+    """Sends JSON-RPC requests to the healthiest of several endpoints.
+
+    Each endpoint's latency and error rate are tracked as exponentially weighted
+    moving averages, and requests go to the endpoint with the lowest expected
+    response time. An endpoint that fails ``failure_threshold`` times in a row is
+    taken out of rotation for ``cooldown`` seconds, after which a single request is
+    let through to probe it. Reads that fail on one endpoint are retried on the
+    next. Writes are only retried when the failed endpoint cannot have received
+    them, so a transaction is never broadcast through two endpoints. If
+    ``hedge_after`` is set, a read that has not been answered in that many seconds
+    is also sent to the second-best endpoint and the first answer wins.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        transport: HttpTransport | None = None,
+        hedge_after: float | None = None,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+    ):
+        """Initialize the pool.
+
+        Args:
+            urls (list[str]): The endpoint URLs, in order of preference.
+            transport (HttpTransport | None): The HTTP transport requests are sent through.
+            hedge_after (float | None): Seconds after which a slow read is also sent to
+                a second endpoint, or None to never hedge.
+            failure_threshold (int): Consecutive failures after which an endpoint is taken
+                out of rotation.
+            cooldown (float): Seconds an endpoint stays out of rotation.
+
+        Raises:
+            ValueError: If no URLs are given
+
+        """
+        if not urls:
+            raise ValueError("At least one RPC URL is required")
+
+        super().__init__()
+        self.transport = transport or HttpTransport()
+        self.endpoints = [RpcEndpoint(url, self.transport.create_provider(url)) for url in urls]
+        self.hedge_after = hedge_after
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        """Describe the pool."""
+        return f"RPC pool {', '.join(endpoint.url for endpoint in self.endpoints)}"
+
+    @property
+    def endpoint_uri(self) -> str:
+        """The URL of the endpoint requests currently go to first."""
+        return self._rank()[0].url
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a JSON-RPC request.
+
+        Args:
+            method (RPCEndpoint): The JSON-RPC method.
+            params (Any): The method parameters.
+
+        Returns:
+            RPCResponse: The response.
+
+        """
+        if method in WRITE_METHODS:
+            response = self._send_write(lambda provider: provider.make_request(method, params))
+            return _resolve_known_transaction(method, params, response)
+        return self._send(lambda provider: provider.make_request(method, params))
+
+    def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        """Send several JSON-RPC requests in one batch.
+
+        Args:
+            requests (list[tuple[RPCEndpoint, Any]]): The methods and their parameters.
+
+        Returns:
+            list[RPCResponse] | RPCResponse: The responses, or a single error response.
+
+        """
+        if not any(method in WRITE_METHODS for method, _ in requests):
+            return self._send(lambda provider: provider.make_batch_request(requests))
+
+        responses = self._send_write(lambda provider: provider.make_batch_request(requests))
+        if not isinstance(responses, list) or len(responses) != len(requests):
+            return responses
+        return [
+            _resolve_known_transaction(method, params, response)
+            for (method, params), response in zip(requests, responses, strict=True)
+        ]
+
+    def _send(self, request: Request) -> Any:
+        """Send a read, hedging it if configured."""
+        endpoints = self._rank()
+        if self.hedge_after is not None and len(endpoints) > 1:
+            return self._send_hedged(request, endpoints)
+        return self._send_with_failover(request, endpoints)
+
+    def _send_write(self, request: Request) -> Any:
+        """Send a write, moving to the next endpoint only if the last never received it.
+
+        A timeout or dropped connection may come after the node accepted the
+        transaction, so retrying elsewhere could broadcast it twice; such errors
+        are raised instead.
+        """
+        error: Exception | None = None
+        for endpoint in self._rank():
+            try:
+                return self._call(endpoint, request)
+            except Exception as e:
+                if not _never_reached(e):
+                    raise
+                error = e
+        return self._raise(error)
+
+    def _rank(self) -> list[RpcEndpoint]:
+        """Order endpoints by expected response time, leaving out those out of rotation.
+
+        If every endpoint is out of rotation, all are returned, soonest back first.
+        """
+        now = time.monotonic()
+        with self._lock:
+            available = [endpoint for endpoint in self.endpoints if endpoint.open_until <= now]
+            if available:
+                return sorted(available, key=lambda endpoint: endpoint.score)
+            return sorted(self.endpoints, key=lambda endpoint: endpoint.open_until)
+
+    def _send_with_failover(self, request: Request, endpoints: list[RpcEndpoint]) -> Any:
+        """Try endpoints in order until one answers."""
+        error: Exception | None = None
+        for endpoint in endpoints:
+            try:
+                return self._call(endpoint, request)
+            except Exception as e:
+                error = e
+        return self._raise(error)
+
+    def _send_hedged(self, request: Request, endpoints: list[RpcEndpoint]) -> Any:
+        """Send to the best endpoint, and to the next one too if the first is slow."""
+        executor = self._get_executor()
+        futures: set[Future] = {executor.submit(self._call, endpoints[0], request)}
+        tried = 1
+        done, _ = wait(futures, timeout=self.hedge_after)
+        if not done:
+            futures.add(executor.submit(self._call, endpoints[1], request))
+            tried = 2
+
+        error: Exception | None = None
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+
+        if len(endpoints) > tried:
+            return self._send_with_failover(request, endpoints[tried:])
+        return self._raise(error)
+
+    def _call(self, endpoint: RpcEndpoint, request: Request) -> Any:
+        """Send a request to one endpoint and record how it went."""
+        started = time.monotonic()
+        try:
+            response = request(endpoint.provider)
+            if _is_endpoint_error(response):
+                raise EndpointError(response)
+        except Exception:
+            self._record_failure(endpoint)
+            raise
+        self._record_success(endpoint, time.monotonic() - started)
+        return response
+
+    def _record_success(self, endpoint: RpcEndpoint, latency: float) -> None:
+        """Fold a successful request into an endpoint's statistics."""
+        with self._lock:
+            endpoint.latency = (
+                latency
+                if endpoint.latency is None
+                else (1 - EWMA_SMOOTHING) * endpoint.latency + EWMA_SMOOTHING * latency
+            )
+            endpoint.error_rate *= 1 - EWMA_SMOOTHING
+            endpoint.failures = 0
+            endpoint.open_until = 0.0
+
+    def _record_failure(self, endpoint: RpcEndpoint) -> None:
+        """Fold a failed request into an endpoint's statistics, opening its circuit if needed."""
+        with self._lock:
+            endpoint.error_rate = (1 - EWMA_SMOOTHING) * endpoint.error_rate + EWMA_SMOOTHING
+            endpoint.failures += 1
+            if endpoint.failures >= self.failure_threshold:
+                endpoint.open_until = time.monotonic() + self.cooldown
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool hedged requests run on, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2 * len(self.endpoints), thread_name_prefix="rpc-pool"
+                )
+            return self._executor
+
+    @staticmethod
+    def _raise(error: Exception | None) -> Any:
+        """Surface the last failure, returning endpoint error responses as web3 expects."""
+        if isinstance(error, EndpointError):
+            return error.response
+        raise error or Exception("No RPC endpoint answered")
+
+
+class AsyncRpcPoolProvider(AsyncJSONBaseProvider):
+    """Sends async JSON-RPC requests through an RPC pool.
+
+    Requests run on a worker thread, so async traffic is ranked, failed over and
+    circuit broken together with sync traffic, and reuses the pool's connections.
+    """
+
+    def __init__(self, pool: RpcPoolProvider):
+        """Initialize the provider.
+
+        Args:
+            pool (RpcPoolProvider): The pool requests are sent through.
+
+        """
+        super().__init__()
+        self.pool = pool
+
+    def __str__(self) -> str:
+        """Describe the pool."""
+        return str(self.pool)
+
+    @property
+    def endpoint_uri(self) -> str:
+        """The URL of the endpoint requests currently go to first."""
+        return self.pool.endpoint_uri
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a JSON-RPC request.
+
+        Args:
+            method (RPCEndpoint): The JSON-RPC method.
+            params (Any): The method parameters.
+
+        Returns:
+            RPCResponse: The response.
+
+        """
+        return await asyncio.to_thread(self.pool.make_request, method, params)
+
+    async def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        """Send several JSON-RPC requests in one batch.
+
+        Args:
+            requests (list[tuple[RPCEndpoint, Any]]): The methods and their parameters.
+
+        Returns:
+            list[RPCResponse] | RPCResponse: The responses, or a single error response.
+
+        """
+        return await asyncio.to_thread(self.pool.make_batch_request, requests)
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        """Check whether the best endpoint answers.
+
+        Args:
+            show_traceback (bool): Whether to raise the error if it does not.
+
+        Returns:
+            bool: Whether the endpoint answered.
+
+        """
+        return await asyncio.to_thread(self.pool.is_connected, show_traceback)
+
+
+def _never_reached(error: Exception) -> bool:
+    """Check whether a failed request certainly did not reach the node.
+
+    Rate limit responses, refused connections, failed DNS lookups and connect
+    timeouts all happen before the node sees the request.
+    """
+    if isinstance(error, EndpointError | ConnectTimeout):
+        return True
+    if isinstance(error, RequestsConnectionError) and error.args:
+        reason = getattr(error.args[0], "reason", error.args[0])
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def _resolve_known_transaction(method: str, params: Any, response: Any) -> Any:
+    """Turn a node's rejection of a transaction it already has into a success.
+
+    The transaction was broadcast earlier, so its hash is returned as if this
+    send had been accepted.
+    """
+    if method != "eth_sendRawTransaction" or not isinstance(response, dict):
+        return response
+    error = response.get("error")
+    message = str(error.get("message", "")).lower() if isinstance(error, dict) else ""
+    if not any(known in message for known in KNOWN_TRANSACTION_ERRORS):
+        return response
+    return {
+        "jsonrpc": response.get("jsonrpc", "2.0"),
+        "id": response.get("id"),
+        "result": Web3.to_hex(Web3.keccak(hexstr=params[0])),
+    }
+
+
+def _is_endpoint_error(response: Any) -> bool:
+    """Check whether a response says the endpoint cannot serve requests right now."""
+    if not isinstance(response, dict):
+        return False
+    error = response.get("error")
+    return isinstance(error, dict) and error.get("code") in ENDPOINT_ERROR_CODES
+
+
+def get_rpc_urls(chain: Chain, urls: list[str] | None = None) -> list[str]:
+    """Get the RPC URLs for a chain, with user-provided URLs first.
+
+    Args:
+        chain (Chain): The chain definition.
+        urls (list[str] | None): URLs to prefer over the chain's own.
+
+    Returns:
+        list[str]: The URLs without duplicates, in order of preference.
+
+    """
+    chain_urls = [url for rpc_urls in chain.rpc_urls.values() for url in rpc_urls.http]
+    return list(dict.fromkeys([*(urls or []), *chain_urls]))
+
+
+_rpc_pools: dict[tuple, RpcPoolProvider] = {}
+_rpc_pools_lock = threading.Lock()
+
+
+def get_rpc_pool(chain: Chain, config: EvmRpcConfig | None = None) -> RpcPoolProvider:
+    """Get the process-wide RPC pool for a chain and settings, creating it on first use.
+
+    Sharing the pool lets every wallet provider on a chain learn from the same
+    endpoint statistics. Pools on the same chain send through one HTTP transport
+    per pool size and timeout, so they also share connections.
+
+    Args:
+        chain (Chain): The chain definition.
+        config (EvmRpcConfig | None): Preferred URLs, hedging, circuit breaking and
+            connection settings.
+
+    Returns:
+        RpcPoolProvider: The shared RPC pool.
+
+    """
+    config = config or EvmRpcConfig()
+    rpc_urls = get_rpc_urls(chain, config.urls)
+    failure_threshold = config.failure_threshold or DEFAULT_FAILURE_THRESHOLD
+    cooldown = config.cooldown if config.cooldown is not None else DEFAULT_COOLDOWN
+    transport = get_http_transport(chain, config.pool_size, config.timeout)
+
+    key = (chain.id, tuple(rpc_urls), transport, config.hedge_after, failure_threshold, cooldown)
+    with _rpc_pools_lock:
+        pool = _rpc_pools.get(key)
+        if pool is None:
+            pool = RpcPoolProvider(
+                rpc_urls,
+                transport=transport,
+                hedge_after=config.hedge_after,
+                failure_threshold=failure_threshold,
+                cooldown=cooldown,
+            )
+            _rpc_pools[key] = pool
+        return pool
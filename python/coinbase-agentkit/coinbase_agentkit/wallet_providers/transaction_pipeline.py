@@ -0,0 +1,130 @@
+"""Sending ordered sequences of dependent transactions without waiting between them."""
+
+from collections.abc import Callable
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+from web3.types import HexStr, TxParams
+
+
+class TransactionResult(BaseModel):
+    """The outcome of one transaction in a pipeline."""
+
+    status: Literal["confirmed", "reverted", "failed", "skipped"] = Field(
+        ...,
+        description="Whether the transaction was mined successfully, reverted, failed to send "
+        "or be mined, or was skipped after an earlier failure",
+    )
+    transaction_hash: str | None = Field(None, description="The transaction hash, if sent")
+    receipt: Any = Field(None, description="The transaction receipt, if mined")
+    error: str | None = Field(None, description="Why the transaction did not succeed")
+
+
+class TransactionPipelineError(Exception):
+    """Raised when a transaction in a pipeline does not succeed.
+
+    Transactions mined before the failure cannot be undone. ``results`` reports the
+    outcome of every transaction so callers can tell which steps took effect.
+    """
+
+    def __init__(self, results: list[TransactionResult]):
+        """Initialize the error.
+
+        Args:
+            results (list[TransactionResult]): The outcome of every transaction in the pipeline.
+
+        """
+        self.results = results
+        self.failed_index = next(
+            index for index, result in enumerate(results) if result.status != "confirmed"
+        )
+        super().__init__(results[self.failed_index].error)
+
+
+def run_transaction_pipeline(
+    send: Callable[[TxParams], HexStr],
+    wait: Callable[[HexStr, float], Any],
+    transactions: list[TxParams],
+    timeout: float = 120,
+) -> list[TransactionResult]:
+    """Send transactions in order without waiting for each to be mined.
+
+    The wallet's nonce manager gives the transactions consecutive nonces, so they are
+    mined in order. A transaction is only sent ahead of the earlier ones being mined
+    if its gas limit is known without them: set by the caller as ``gas``, learned
+    from earlier transactions of the same shape, or estimated against pending state
+    by a node that includes the wallet's pending transactions in it. Otherwise the
+    estimate reverts, and the pipeline waits for the earlier transactions and tries
+    once more. Once a transaction fails to send, or an earlier one reverted, the
+    remaining transactions are skipped.
+
+    Args:
+        send (Callable[[TxParams], HexStr]): Sends a transaction and returns its hash.
+        wait (Callable[[HexStr, float], Any]): Waits for a transaction's receipt with a timeout.
+        transactions (list[TxParams]): The transactions to send, in order.
+        timeout (float): Maximum time to wait for each receipt in seconds.
+
+    Returns:
+        list[TransactionResult]: The outcome of each transaction, in order.
+
+    Raises:
+        TransactionPipelineError: If any transaction fails to send, reverts or is not mined
+
+    """
+    results: list[TransactionResult | None] = [None] * len(transactions)
+    pending: list[tuple[int, HexStr]] = []
+
+    def wait_for_pending() -> None:
+        for index, tx_hash in pending:
+            results[index] = _wait_for_result(wait, tx_hash, timeout)
+        pending.clear()
+
+    for index, transaction in enumerate(transactions):
+        try:
+            tx_hash = send(dict(transaction))
+        except Exception as e:
+            if not pending:
+                results[index] = TransactionResult(status="failed", error=str(e))
+                break
+
+            wait_for_pending()
+            if any(result.status != "confirmed" for result in results[:index]):
+                break
+
+            try:
+                tx_hash = send(dict(transaction))
+            except Exception as e:
+                results[index] = TransactionResult(status="failed", error=str(e))
+                break
+
+        pending.append((index, tx_hash))
+
+    wait_for_pending()
+
+    completed = [
+        result
+        or TransactionResult(status="skipped", error="Skipped after an earlier transaction failed")
+        for result in results
+    ]
+    if any(result.status != "confirmed" for result in completed):
+        raise TransactionPipelineError(completed)
+    return completed
+
+
+def _wait_for_result(
+    wait: Callable[[HexStr, float], Any], tx_hash: HexStr, timeout: float
+) -> TransactionResult:
+    """Wait for a sent transaction and describe its outcome."""
+    try:
+        receipt = wait(tx_hash, timeout)
+    except Exception as e:
+        return TransactionResult(status="failed", transaction_hash=tx_hash, error=str(e))
+
+    if receipt.get("status", 1) == 0:
+        return TransactionResult(
+            status="reverted",
+            transaction_hash=tx_hash,
+            receipt=receipt,
+            error=f"Transaction {tx_hash} reverted",
+        )
+    return TransactionResult(status="confirmed", transaction_hash=tx_hash, receipt=receipt)
@@ -1,10 +1,21 @@
+from functools import partial
 from unittest.mock import MagicMock
 
 import pytest
 
+from coinbase_agentkit.action_providers.compound import market_metadata
 from coinbase_agentkit.action_providers.compound.compound_action_provider import (
     CompoundActionProvider,
 )
+from coinbase_agentkit.action_providers.erc20 import token_metadata
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+
+@pytest.fixture(autouse=True)
+def registries(monkeypatch):
+    """Give each test empty market and token metadata registries."""
+    monkeypatch.setattr(market_metadata, "_registry", None)
+    monkeypatch.setattr(token_metadata, "_registry", None)
 
 
 @pytest.fixture
@@ -30,4 +41,6 @@ def compound_wallet():
     fake_receipt = MagicMock()
     fake_receipt.transaction_link = "http://example.com/tx/0xTxHash"
     wallet.wait_for_transaction_receipt.return_value = fake_receipt
+    wallet.read_contract_many.return_value = [0, 0]
+    wallet.send_transactions.side_effect = partial(EvmWalletProvider.send_transactions, wallet)
     return wallet
@@ -1,5 +1,7 @@
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+from coinbase_agentkit.action_providers.compound.constants import COMET_ABI
 
 
 def test_borrow_action_success(compound_wallet, compound_provider):
@@ -8,6 +10,10 @@ def test_borrow_action_success(compound_wallet, compound_provider):
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
     with (
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals",
+            return_value=6,
+        ),
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_base_token_address",
             return_value="0xBaseToken",
@@ -22,19 +28,15 @@ def test_borrow_action_success(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.encode_function_data"
+        ) as mock_encode,
     ):
         atomic_amount = 1000000000  # 1000 USDC with 6 decimals
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_get_health_ratio.side_effect = [Decimal("Infinity"), Decimal("2.0")]
         mock_get_health_ratio_after_borrow.return_value = Decimal("2.0")
 
-        fake_contract = MagicMock()
-        fake_contract.encode_abi.return_value = "encoded_borrow_data"
-        fake_eth = MagicMock()
-        fake_eth.contract.return_value = fake_contract
-        mock_web3.return_value.eth = fake_eth
+        mock_encode.return_value = "encoded_borrow_data"
 
         result = provider.borrow(compound_wallet, input_args)
 
@@ -42,9 +44,7 @@ def test_borrow_action_success(compound_wallet, compound_provider):
         assert "Transaction hash: 0xTxHash" in result
         assert "Health ratio changed from Infinity to 2.00" in result
 
-        fake_contract.encode_abi.assert_called_once_with(
-            "withdraw", args=["0xBaseToken", atomic_amount]
-        )
+        mock_encode.assert_called_once_with(COMET_ABI, "withdraw", ["0xBaseToken", atomic_amount])
         compound_wallet.send_transaction.assert_called_once_with(
             {"to": "0xComet", "data": "encoded_borrow_data"}
         )
@@ -56,6 +56,14 @@ def test_borrow_unhealthy_position(compound_wallet, compound_provider):
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
     with (
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals",
+            return_value=6,
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_base_token_address",
+            return_value="0xBaseToken",
+        ),
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
@@ -83,6 +91,14 @@ def test_borrow_transaction_failure(compound_wallet, compound_provider):
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
     with (
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals",
+            return_value=6,
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_base_token_address",
+            return_value="0xBaseToken",
+        ),
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
@@ -93,19 +109,15 @@ def test_borrow_transaction_failure(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.encode_function_data"
+        ) as mock_encode,
     ):
         atomic_amount = 1000000000
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_get_health_ratio.return_value = Decimal("2.0")
         mock_get_health_ratio_after_borrow.return_value = Decimal("1.5")
 
-        fake_contract = MagicMock()
-        fake_contract.encode_abi.return_value = "encoded_borrow_data"
-        fake_eth = MagicMock()
-        fake_eth.contract.return_value = fake_contract
-        mock_web3.return_value.eth = fake_eth
+        mock_encode.return_value = "encoded_borrow_data"
 
         compound_wallet.send_transaction.side_effect = Exception("Transaction failed")
 
@@ -119,9 +131,19 @@ def test_borrow_general_error(compound_wallet, compound_provider):
     provider = compound_provider
     input_args = {"asset_id": "usdc", "amount": "1000"}
 
-    with patch(
-        "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
-    ) as mock_format_amount_with_decimals:
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals",
+            return_value=6,
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_base_token_address",
+            return_value="0xBaseToken",
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
+        ) as mock_format_amount_with_decimals,
+    ):
         mock_format_amount_with_decimals.side_effect = Exception("Unexpected error occurred")
 
         result = provider.borrow(compound_wallet, input_args)
@@ -0,0 +1,83 @@
+"""Tests for the Compound market metadata registry."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from coinbase_agentkit.action_providers.compound import market_metadata
+from coinbase_agentkit.action_providers.compound.market_metadata import (
+    UPGRADED_TOPIC,
+    CometMarketRegistry,
+)
+
+COMET = "0xC0MET"
+ASSET_INFO = (0, "0xWeth", "0xWethFeed", 10**18, 8 * 10**17, 85 * 10**16, 95 * 10**16, 10**24)
+
+
+@pytest.fixture
+def wallet():
+    """Create a wallet whose multicall returns a market with one collateral asset."""
+    wallet = MagicMock()
+    wallet.get_network.return_value.chain_id = "8453"
+    wallet.read_contract_many.return_value = [1, "0xBase", "0xBaseFeed", ASSET_INFO] + [None] * 14
+    return wallet
+
+
+def test_market_is_read_once(wallet):
+    """Test that a market's configuration is read in one multicall and then cached."""
+    registry = CometMarketRegistry()
+
+    market = registry.get(wallet, COMET)
+    assert registry.get(wallet, COMET.lower()) is market
+
+    wallet.read_contract_many.assert_called_once()
+    assert market.comet_address == COMET.lower()
+    assert market.base_token_price_feed == "0xBaseFeed"
+    assert [asset.address for asset in market.assets] == ["0xWeth"]
+    assert market.assets[0].borrow_collateral_factor == 8 * 10**17
+
+
+def test_market_refreshes_after_interval(wallet):
+    """Test that a market older than the refresh interval is read again."""
+    registry = CometMarketRegistry(refresh_interval=60)
+
+    with patch.object(market_metadata.time, "time", return_value=1_000.0):
+        registry.get(wallet, COMET)
+    with patch.object(market_metadata.time, "time", return_value=1_030.0):
+        registry.get(wallet, COMET)
+    with patch.object(market_metadata.time, "time", return_value=1_100.0):
+        registry.get(wallet, COMET)
+
+    assert wallet.read_contract_many.call_count == 2
+
+
+def test_upgrade_event_invalidates_market(wallet):
+    """Test that a governance upgrade of the market forces it to be read again."""
+    registry = CometMarketRegistry(refresh_interval=None)
+    registry.get(wallet, COMET)
+
+    registry.handle_logs("8453", [{"address": "0xOther", "topics": [UPGRADED_TOPIC]}])
+    registry.get(wallet, COMET)
+    assert wallet.read_contract_many.call_count == 1
+
+    registry.handle_logs(
+        "8453", [{"address": COMET, "topics": [bytes.fromhex(UPGRADED_TOPIC[2:])]}]
+    )
+    registry.get(wallet, COMET)
+    assert wallet.read_contract_many.call_count == 2
+
+
+def test_market_persists_across_registries(wallet, tmp_path):
+    """Test that a market stored on disk is loaded without reading the chain."""
+    path = tmp_path / "markets.db"
+    CometMarketRegistry(path).get(wallet, COMET)
+    wallet.read_contract_many.reset_mock()
+
+    market = CometMarketRegistry(path).get(wallet, COMET)
+
+    assert market.base_token == "0xBase"
+    wallet.read_contract_many.assert_not_called()
+
+    CometMarketRegistry(path).invalidate("8453")
+    CometMarketRegistry(path).get(wallet, COMET)
+    wallet.read_contract_many.assert_called_once()
@@ -0,0 +1,292 @@
+"""Tests for the Compound liquidation-risk monitor."""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.action_providers.compound.market_metadata import UPGRADED_TOPIC
+from coinbase_agentkit.action_providers.compound.monitor import LiquidationMonitor
+
+COMET = "0xc3d688B66703497DAA19211EEdff47f25384cdc3"
+WETH = "0xWeth"
+ASSET_INFO = (0, WETH, "0xWethFeed", 10**18, 8 * 10**17, 9 * 10**17, 95 * 10**16, 10**24)
+
+
+@pytest.fixture
+def chain():
+    """Create mutable chain state: the head, feed rounds and each account's position."""
+    return {
+        "block": 100,
+        "rounds": {"0xBaseFeed": (1, 1 * 10**8), "0xWethFeed": (1, 2000 * 10**8)},
+        "asset_info": ASSET_INFO,
+        # Borrow and WETH collateral of each account in atomic units
+        "positions": {"0xAlice": (1000 * 10**6, 10**18), "0xBob": (500 * 10**6, 10**18)},
+    }
+
+
+@pytest.fixture
+def wallet(chain):
+    """Create a wallet whose reads answer from the chain state."""
+    wallet = MagicMock()
+    wallet.get_network.return_value.chain_id = "8453"
+    wallet.get_block_number.side_effect = lambda: chain["block"]
+
+    def read_contract_many(calls, block_identifier="latest"):
+        positions = {account.lower(): position for account, position in chain["positions"].items()}
+        results = []
+        for call in calls:
+            if call.function_name == "numAssets":
+                results.append(1)
+            elif call.function_name == "baseToken":
+                results.append("0xBase")
+            elif call.function_name == "baseTokenPriceFeed":
+                results.append("0xBaseFeed")
+            elif call.function_name == "getAssetInfo":
+                results.append(chain["asset_info"] if call.args[0] == 0 else None)
+            elif call.function_name == "borrowBalanceOf":
+                results.append(positions[call.args[0].lower()][0])
+            elif call.function_name == "collateralBalanceOf":
+                results.append(positions[call.args[0].lower()][1])
+            elif call.function_name == "latestRoundData":
+                round_id, answer = chain["rounds"][call.contract_address]
+                results.append((round_id, answer, 0, 0, round_id))
+            else:
+                results.append(
+                    {"name": "USD Coin", "symbol": "USDC", "decimals": 6}[call.function_name]
+                )
+        return results
+
+    wallet.read_contract_many.side_effect = read_contract_many
+    wallet.get_logs.return_value = []
+    return wallet
+
+
+def balance_reads(wallet):
+    """Count the accounts whose balances were read."""
+    return sum(
+        1
+        for call in wallet.read_contract_many.call_args_list
+        for contract_call in call.args[0]
+        if contract_call.function_name == "borrowBalanceOf"
+    )
+
+
+def test_alerts_when_price_crosses_threshold(wallet, chain):
+    """Test that a price round moving a position below a threshold raises an alert."""
+    monitor = LiquidationMonitor(wallet, thresholds=[Decimal("1.2"), Decimal(1)])
+    alerts = []
+    monitor.subscribe(alerts.append)
+    monitor.watch("0xAlice", COMET)
+    monitor.watch("0xBob", COMET)
+
+    assert monitor.poll() == []
+    assert monitor.health_ratio("0xAlice", COMET) == Decimal("1.6")
+
+    chain["block"] += 1
+    chain["rounds"]["0xWethFeed"] = (2, 1400 * 10**8)
+    monitor.poll()
+
+    assert [(a.account, a.threshold, a.direction) for a in alerts] == [
+        ("0xalice", Decimal("1.2"), "below")
+    ]
+    assert alerts[0].health_ratio == Decimal("1.12")
+    assert alerts[0].previous_health_ratio == Decimal("1.6")
+
+    chain["block"] += 1
+    chain["rounds"]["0xWethFeed"] = (3, 2000 * 10**8)
+    monitor.poll()
+
+    assert alerts[-1].direction == "above"
+
+
+def test_new_position_below_threshold_alerts(wallet, chain):
+    """Test that a position already below a threshold alerts when first read."""
+    chain["positions"]["0xAlice"] = (1700 * 10**6, 10**18)
+    monitor = LiquidationMonitor(wallet)
+    monitor.watch("0xAlice", COMET)
+
+    alerts = monitor.poll()
+
+    assert [(a.threshold, a.previous_health_ratio) for a in alerts] == [
+        (Decimal("1.2"), None),
+        (Decimal(1), None),
+    ]
+
+
+def test_rpc_cost_is_bounded_per_block(wallet, chain):
+    """Test that each block reads at most the budgeted balances and nothing on the same block."""
+    monitor = LiquidationMonitor(wallet, balance_budget=1)
+    monitor.watch("0xAlice", COMET)
+    monitor.watch("0xBob", COMET)
+
+    monitor.poll()
+    assert balance_reads(wallet) == 1
+    assert monitor.health_ratio("0xAlice", COMET) is None
+
+    monitor.poll()
+    assert balance_reads(wallet) == 1
+
+    chain["block"] += 1
+    monitor.poll()
+    assert balance_reads(wallet) == 2
+    assert monitor.health_ratio("0xAlice", COMET) == Decimal("1.6")
+
+
+def test_unchanged_rounds_keep_health(wallet, chain):
+    """Test that positions not re-read are valued again only when a price round moves."""
+    monitor = LiquidationMonitor(wallet, balance_budget=1)
+    monitor.watch("0xAlice", COMET)
+    monitor.poll()
+
+    chain["block"] += 1
+    chain["positions"]["0xAlice"] = (1700 * 10**6, 10**18)
+    monitor.watch("0xBob", COMET)
+    monitor.poll()
+    assert monitor.health_ratio("0xAlice", COMET) == Decimal("1.6")
+
+    chain["block"] += 1
+    chain["rounds"]["0xBaseFeed"] = (2, 1 * 10**8)
+    monitor.poll()
+    assert monitor.health_ratio("0xAlice", COMET) == Decimal(1600) / Decimal(1700)
+
+
+def test_failing_callback_does_not_stop_others(wallet, chain):
+    """Test that every callback is called even if one raises."""
+    chain["positions"]["0xAlice"] = (1700 * 10**6, 10**18)
+    monitor = LiquidationMonitor(wallet, thresholds=[Decimal(1)])
+    received = []
+    monitor.subscribe(MagicMock(side_effect=Exception("boom")))
+    monitor.subscribe(received.append)
+    monitor.watch("0xAlice", COMET)
+
+    monitor.poll()
+
+    assert len(received) == 1
+
+
+def test_background_polling(wallet):
+    """Test that the monitor polls in a background thread until stopped."""
+    monitor = LiquidationMonitor(wallet, block_time=0.4)
+    monitor.watch("0xAlice", COMET)
+
+    monitor.start()
+    monitor.stop()
+
+    assert monitor.health_ratio("0xAlice", COMET) == Decimal("1.6")
+
+
+def test_background_poll_errors_are_reported(wallet):
+    """Test that a failed background poll is passed to the error handler."""
+    errors = []
+    monitor = LiquidationMonitor(wallet, block_time=0.4, on_error=errors.append)
+    wallet.get_block_number.side_effect = Exception("rate limited")
+
+    monitor.start()
+    monitor.stop()
+
+    assert [str(error) for error in errors] == ["rate limited"]
+
+
+def test_background_poll_errors_warn_without_handler(wallet):
+    """Test that a failed background poll is emitted as a warning if no handler is given."""
+    monitor = LiquidationMonitor(wallet, block_time=0.4)
+    wallet.get_block_number.side_effect = Exception("rate limited")
+
+    with pytest.warns(RuntimeWarning, match="Liquidation monitor poll failed: rate limited"):
+        monitor.start()
+        monitor.stop()
+
+
+def test_failed_poll_is_retried_in_full(wallet, chain):
+    """Test that a price move seen by a failed poll still revalues every position on retry."""
+    monitor = LiquidationMonitor(wallet, thresholds=[Decimal("1.2")], balance_budget=1)
+    monitor.watch("0xAlice", COMET)
+    monitor.poll()
+    chain["block"] += 1
+    monitor.watch("0xBob", COMET)
+    monitor.poll()
+
+    chain["block"] += 1
+    chain["rounds"]["0xWethFeed"] = (2, 1400 * 10**8)
+    read = wallet.read_contract_many.side_effect
+
+    def fail_balances(calls, block_identifier="latest"):
+        if calls[0].function_name == "borrowBalanceOf":
+            raise Exception("rate limited")
+        return read(calls, block_identifier)
+
+    wallet.read_contract_many.side_effect = fail_balances
+    with pytest.raises(Exception, match="rate limited"):
+        monitor.poll()
+
+    wallet.read_contract_many.side_effect = read
+    alerts = monitor.poll()
+
+    assert [alert.account for alert in alerts] == ["0xalice"]
+    assert monitor.health_ratio("0xAlice", COMET) == Decimal("1.12")
+
+
+def test_market_address_case_is_normalized(wallet):
+    """Test that the same position given in different case is watched once."""
+    monitor = LiquidationMonitor(wallet)
+    monitor.watch("0xAlice", COMET)
+    monitor.watch("0xALICE", "0x" + COMET[2:].upper())
+
+    monitor.poll()
+
+    assert balance_reads(wallet) == 1
+    assert monitor.health_ratio("0xalice", COMET.lower()) == Decimal("1.6")
+
+
+def test_market_upgrade_reloads_configuration(wallet, chain):
+    """Test that a governance upgrade seen in the logs revalues positions with the new config."""
+    monitor = LiquidationMonitor(wallet, thresholds=[Decimal("1.3")])
+    monitor.watch("0xAlice", COMET)
+    monitor.poll()
+    wallet.get_logs.assert_not_called()
+
+    chain["block"] += 1
+    chain["asset_info"] = (0, WETH, "0xWethFeed", 10**18, 6 * 10**17, 7 * 10**17, 10**18, 10**24)
+    wallet.get_logs.return_value = [{"address": COMET, "topics": [UPGRADED_TOPIC]}]
+    alerts = monitor.poll()
+
+    assert wallet.get_logs.call_args.args[0] == {
+        "fromBlock": 101,
+        "toBlock": 101,
+        "address": [COMET],
+        "topics": [UPGRADED_TOPIC],
+    }
+    assert [(a.threshold, a.direction) for a in alerts] == [(Decimal("1.3"), "below")]
+    assert monitor.health_ratio("0xAlice", COMET) == Decimal("1.2")
+
+
+def test_upgraded_positions_are_read_again_first(wallet, chain):
+    """Test that positions in an upgraded market are queued for a read ahead of the others."""
+    monitor = LiquidationMonitor(wallet, balance_budget=1)
+    monitor.watch("0xAlice", COMET)
+    monitor.poll()
+    chain["block"] += 1
+    monitor.watch("0xBob", COMET)
+    monitor.poll()
+
+    chain["block"] += 1
+    wallet.get_logs.return_value = [{"address": COMET, "topics": [UPGRADED_TOPIC]}]
+    monitor.poll()
+
+    # Alice was read in the upgrade's poll; Bob's older balances are dropped and read next
+    assert list(monitor._queue) == [("0xbob", COMET.lower()), ("0xalice", COMET.lower())]
+    assert list(monitor._balances) == [("0xalice", COMET.lower())]
+
+
+def test_polls_without_log_access(wallet):
+    """Test that wallets that cannot read logs are still monitored."""
+    wallet.get_logs.side_effect = NotImplementedError
+    monitor = LiquidationMonitor(wallet)
+    monitor.watch("0xAlice", COMET)
+    monitor.poll()
+    wallet.get_block_number.side_effect = lambda: 101
+
+    monitor.poll()
+
+    assert monitor.health_ratio("0xAlice", COMET) == Decimal("1.6")
@@ -0,0 +1,151 @@
+"""Tests for the Compound position snapshot."""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.action_providers.compound.position import CompoundPositionSnapshot
+from coinbase_agentkit.action_providers.compound.utils import (
+    get_health_ratio,
+    get_health_ratio_after_borrow,
+    get_health_ratio_after_withdraw,
+    get_portfolio_details_markdown,
+    get_supply_details,
+)
+
+BASE = "0xBase"
+WETH = "0xWeth"
+CBBTC = "0xCbbtc"
+
+ASSET_INFOS = {
+    0: (0, WETH, "0xWethFeed", 10**18, 8 * 10**17, 85 * 10**16, 0, 0),
+    1: (1, CBBTC, "0xCbbtcFeed", 10**8, 7 * 10**17, 8 * 10**17, 0, 0),
+}
+PRICES = {"0xBaseFeed": 1 * 10**8, "0xWethFeed": 2000 * 10**8, "0xCbbtcFeed": 60000 * 10**8}
+METADATA = {
+    BASE.lower(): ["USD Coin", "USDC", 6],
+    WETH.lower(): ["Wrapped Ether", "WETH", 18],
+    CBBTC.lower(): ["Coinbase Wrapped BTC", "cbBTC", 8],
+}
+
+
+@pytest.fixture
+def wallet():
+    """Create a wallet holding 1 WETH of collateral and a 1000 USDC borrow."""
+    wallet = MagicMock()
+    wallet.get_address.return_value = "0xWallet"
+    wallet.get_network.return_value.chain_id = "8453"
+
+    def read_contract_many(calls):
+        results = []
+        for call in calls:
+            if call.function_name == "numAssets":
+                results.append(len(ASSET_INFOS))
+            elif call.function_name == "baseToken":
+                results.append(BASE)
+            elif call.function_name == "baseTokenPriceFeed":
+                results.append("0xBaseFeed")
+            elif call.function_name == "borrowBalanceOf":
+                results.append(1000 * 10**6)
+            elif call.function_name == "getAssetInfo":
+                results.append(ASSET_INFOS.get(call.args[0]))
+            elif call.function_name == "collateralBalanceOf":
+                results.append(10**18 if call.args[1] == WETH else 0)
+            elif call.function_name == "latestRoundData":
+                results.append((0, PRICES[call.contract_address], 0, 0, 0))
+            else:
+                index = ["name", "symbol", "decimals"].index(call.function_name)
+                results.append(METADATA[call.contract_address][index])
+        return results
+
+    wallet.read_contract_many.side_effect = read_contract_many
+    return wallet
+
+
+def test_load_reads_position_in_few_round_trips(wallet):
+    """Test that the whole position is read in a handful of multicalls."""
+    position = CompoundPositionSnapshot.load(wallet, "0xComet")
+
+    assert wallet.read_contract_many.call_count == 3
+    wallet.read_contract.assert_not_called()
+    assert position.base_symbol == "USDC"
+    assert position.borrow_amount == Decimal(1000)
+    assert [asset.symbol for asset in position.supplied] == ["WETH"]
+    assert position.get_asset(CBBTC).collateral_factor == Decimal("0.7")
+
+
+def test_load_falls_back_to_address_for_missing_symbol(monkeypatch, wallet):
+    """Test that an asset without a symbol is shown by its address."""
+    monkeypatch.setitem(METADATA, CBBTC.lower(), ["Coinbase Wrapped BTC", None, 8])
+
+    position = CompoundPositionSnapshot.load(wallet, "0xComet")
+
+    assert position.get_asset(CBBTC).symbol == CBBTC
+
+
+def test_load_raises_for_asset_without_decimals(monkeypatch, wallet):
+    """Test that an asset whose decimals cannot be read gives a descriptive error."""
+    monkeypatch.setitem(METADATA, CBBTC.lower(), ["Coinbase Wrapped BTC", "cbBTC", None])
+
+    with pytest.raises(ValueError, match=f"Token {CBBTC.lower()} does not have decimals"):
+        CompoundPositionSnapshot.load(wallet, "0xComet")
+
+
+def test_later_loads_read_only_balances_and_prices(wallet):
+    """Test that once the market and tokens are cached a load is a single multicall."""
+    CompoundPositionSnapshot.load(wallet, "0xComet")
+    wallet.read_contract_many.reset_mock()
+
+    CompoundPositionSnapshot.load(wallet, "0xComet")
+
+    wallet.read_contract_many.assert_called_once()
+    calls = wallet.read_contract_many.call_args.args[0]
+    assert {call.function_name for call in calls} == {
+        "borrowBalanceOf",
+        "collateralBalanceOf",
+        "latestRoundData",
+    }
+
+
+def test_health_ratios(wallet):
+    """Test that health ratios, including what-ifs, are computed from one position."""
+    position = CompoundPositionSnapshot.load(wallet, "0xComet")
+
+    assert position.health_ratio() == Decimal("1.6")
+    assert position.health_ratio(borrow_amount=600 * 10**6) == Decimal(1)
+    assert position.health_ratio(withdrawals={WETH: 5 * 10**17}) == Decimal("0.8")
+
+
+def test_helpers_compute_from_snapshot(wallet):
+    """Test that the helpers describe the position the snapshot loads."""
+    assert get_health_ratio(wallet, "0xComet") == Decimal("1.6")
+    assert get_health_ratio_after_borrow(wallet, "0xComet", str(600 * 10**6)) == Decimal(1)
+    assert get_health_ratio_after_withdraw(wallet, "0xComet", WETH, str(10**18)) == 0
+    assert get_supply_details(wallet, "0xComet") == [
+        {
+            "Token Symbol": "WETH",
+            "Supply Amount": Decimal(1),
+            "Price": Decimal(2000),
+            "Collateral Factor": Decimal("0.8"),
+            "Decimals": 18,
+        }
+    ]
+
+
+def test_portfolio_markdown(wallet):
+    """Test that the portfolio markdown lists supply, borrow and health."""
+    markdown = get_portfolio_details_markdown(wallet, "0xComet")
+
+    assert "### WETH\n- **Supply Amount:** 1.000000000000000000\n" in markdown
+    assert "### Total Supply Value: $2000.00" in markdown
+    assert "- **Borrow Amount:** 1000.000000\n" in markdown
+    assert "- **Health Ratio:** 1.60" in markdown
+
+
+def test_get_asset_rejects_unknown_asset(wallet):
+    """Test that looking up an asset the market does not list fails."""
+    position = CompoundPositionSnapshot.load(wallet, "0xComet")
+
+    with pytest.raises(ValueError, match="is not collateral"):
+        position.get_asset("0xOther")
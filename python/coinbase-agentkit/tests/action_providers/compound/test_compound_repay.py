@@ -1,4 +1,7 @@
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import call, patch
+
+from coinbase_agentkit.action_providers.compound.constants import COMET_ABI
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
 
 
 def test_repay_action_success(compound_wallet, compound_provider):
@@ -8,8 +11,8 @@ def test_repay_action_success(compound_wallet, compound_provider):
 
     with (
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_balance_and_allowance"
+        ) as mock_get_balance_and_allowance,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
         ) as mock_get_token_decimals,
@@ -26,31 +29,23 @@ def test_repay_action_success(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_symbol"
         ) as mock_get_token_symbol,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.encode_function_data"
+        ) as mock_encode,
+        patch("coinbase_agentkit.action_providers.erc20.utils.encode_function_data", mock_encode),
     ):
         token_decimals = 6
         atomic_amount = 1000000000
-        mock_get_token_balance.return_value = atomic_amount
+        mock_get_balance_and_allowance.return_value = (atomic_amount, 0)
         mock_get_token_decimals.return_value = token_decimals
         mock_format_amount_with_decimals.return_value = atomic_amount
         mock_format_amount_from_decimals.return_value = "1000"
         mock_get_health_ratio.side_effect = [1.5, 2.5]
         mock_get_token_symbol.return_value = "USDC"
 
-        fake_comet_contract = MagicMock()
-        fake_comet_contract.encode_abi.return_value = "encoded_repay_data"
-        fake_token_contract = MagicMock()
-        fake_token_contract.encode_abi.return_value = "encoded_approve_data"
-
-        def get_contract(address, abi):
-            if address == "0xComet":
-                return fake_comet_contract
-            return fake_token_contract
+        def encode_function_data(abi, function_name, args):
+            return "encoded_approve_data" if function_name == "approve" else "encoded_repay_data"
 
-        fake_eth = MagicMock()
-        fake_eth.contract.side_effect = get_contract
-        mock_web3.return_value.eth = fake_eth
+        mock_encode.side_effect = encode_function_data
 
         result = provider.repay(compound_wallet, input_args)
 
@@ -58,11 +53,12 @@ def test_repay_action_success(compound_wallet, compound_provider):
         assert "Transaction hash: 0xTxHash" in result
         assert "Health ratio improved from 1.50 to 2.50" in result
 
-        fake_token_contract.encode_abi.assert_called_once_with(
-            "approve", args=["0xComet", atomic_amount]
-        )
-        fake_comet_contract.encode_abi.assert_called_once_with(
-            "supply", args=["0xToken", atomic_amount]
+        mock_encode.assert_has_calls(
+            [
+                call(ERC20_ABI, "approve", ["0xComet", atomic_amount]),
+                call(COMET_ABI, "supply", ["0xToken", atomic_amount]),
+            ],
+            any_order=True,
         )
 
         assert compound_wallet.send_transaction.call_count == 2
@@ -81,8 +77,8 @@ def test_repay_insufficient_balance(compound_wallet, compound_provider):
 
     with (
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_balance_and_allowance"
+        ) as mock_get_balance_and_allowance,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
         ) as mock_get_token_decimals,
@@ -99,7 +95,7 @@ def test_repay_insufficient_balance(compound_wallet, compound_provider):
 
         mock_get_token_decimals.return_value = token_decimals
         mock_format_amount_with_decimals.return_value = repay_amount
-        mock_get_token_balance.return_value = wallet_balance
+        mock_get_balance_and_allowance.return_value = (wallet_balance, 0)
         mock_format_amount_from_decimals.return_value = "500"
 
         result = provider.repay(compound_wallet, input_args)
@@ -115,8 +111,8 @@ def test_repay_approval_failure(compound_wallet, compound_provider):
 
     with (
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_balance_and_allowance"
+        ) as mock_get_balance_and_allowance,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
         ) as mock_get_token_decimals,
@@ -127,21 +123,18 @@ def test_repay_approval_failure(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.encode_function_data"
+        ) as mock_encode,
+        patch("coinbase_agentkit.action_providers.erc20.utils.encode_function_data", mock_encode),
     ):
         token_decimals = 6
         atomic_amount = 1000000000
         mock_get_token_decimals.return_value = token_decimals
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_token_balance.return_value = atomic_amount * 2
+        mock_get_balance_and_allowance.return_value = (atomic_amount * 2, 0)
         mock_get_health_ratio.return_value = 1.5
 
-        fake_contract = MagicMock()
-        fake_contract.encode_abi.return_value = "encoded_approve_data"
-        fake_eth = MagicMock()
-        fake_eth.contract.return_value = fake_contract
-        mock_web3.return_value.eth = fake_eth
+        mock_encode.return_value = "encoded_approve_data"
 
         compound_wallet.send_transaction.side_effect = Exception("Approval failed")
 
@@ -157,8 +150,8 @@ def test_repay_transaction_failure(compound_wallet, compound_provider):
 
     with (
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_balance_and_allowance"
+        ) as mock_get_balance_and_allowance,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals"
         ) as mock_get_token_decimals,
@@ -169,29 +162,21 @@ def test_repay_transaction_failure(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.encode_function_data"
+        ) as mock_encode,
+        patch("coinbase_agentkit.action_providers.erc20.utils.encode_function_data", mock_encode),
     ):
         token_decimals = 6
         atomic_amount = 1000000000
         mock_get_token_decimals.return_value = token_decimals
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_token_balance.return_value = atomic_amount * 2
+        mock_get_balance_and_allowance.return_value = (atomic_amount * 2, 0)
         mock_get_health_ratio.return_value = 1.5
 
-        fake_comet_contract = MagicMock()
-        fake_comet_contract.encode_abi.return_value = "encoded_repay_data"
-        fake_token_contract = MagicMock()
-        fake_token_contract.encode_abi.return_value = "encoded_approve_data"
-
-        def get_contract(address, abi):
-            if address == "0xComet":
-                return fake_comet_contract
-            return fake_token_contract
+        def encode_function_data(abi, function_name, args):
+            return "encoded_approve_data" if function_name == "approve" else "encoded_repay_data"
 
-        fake_eth = MagicMock()
-        fake_eth.contract.side_effect = get_contract
-        mock_web3.return_value.eth = fake_eth
+        mock_encode.side_effect = encode_function_data
 
         def mock_send_transaction(params):
             if params["data"] == "encoded_approve_data":
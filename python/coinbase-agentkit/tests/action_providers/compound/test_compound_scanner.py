@@ -0,0 +1,105 @@
+"""Tests for the multi-account Compound position scanner."""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.action_providers.compound.scanner import scan_positions
+
+WETH = "0xWeth"
+ASSET_INFO = (0, WETH, "0xWethFeed", 10**18, 8 * 10**17, 9 * 10**17, 95 * 10**16, 10**24)
+PRICES = {"0xBaseFeed": 1 * 10**8, "0xWethFeed": 2000 * 10**8}
+
+# Borrow and WETH collateral of each account in atomic units
+POSITIONS = {
+    "0xHealthy": (1000 * 10**6, 10**18),
+    "0xRisky": (1700 * 10**6, 10**18),
+    "0xEmpty": (0, 0),
+}
+
+
+@pytest.fixture
+def wallet():
+    """Create a wallet whose reads answer from the positions above."""
+    wallet = MagicMock()
+    wallet.get_network.return_value.chain_id = "8453"
+    wallet.get_block_number.return_value = 123
+
+    def read_contract_many(calls, block_identifier="latest"):
+        results = []
+        for call in calls:
+            if call.function_name == "numAssets":
+                results.append(1)
+            elif call.function_name == "baseToken":
+                results.append("0xBase")
+            elif call.function_name == "baseTokenPriceFeed":
+                results.append("0xBaseFeed")
+            elif call.function_name == "getAssetInfo":
+                results.append(ASSET_INFO if call.args[0] == 0 else None)
+            elif call.function_name == "borrowBalanceOf":
+                results.append(POSITIONS[call.args[0]][0])
+            elif call.function_name == "collateralBalanceOf":
+                results.append(POSITIONS[call.args[0]][1])
+            elif call.function_name == "latestRoundData":
+                results.append((0, PRICES[call.contract_address], 0, 0, 0))
+            else:
+                results.append(
+                    {"name": "USD Coin", "symbol": "USDC", "decimals": 6}[call.function_name]
+                )
+        return results
+
+    wallet.read_contract_many.side_effect = read_contract_many
+    return wallet
+
+
+def test_scan_returns_columnar_health(wallet):
+    """Test that every account is scanned in every market with its health ratio."""
+    scan = scan_positions(wallet, list(POSITIONS), ["0xComet"])
+
+    assert len(scan) == 3
+    assert scan.block_number == 123
+    assert scan.accounts == list(POSITIONS)
+    assert scan.comet_addresses == ["0xComet"] * 3
+    assert scan.borrow_values == [Decimal(1000), Decimal(1700), Decimal(0)]
+    assert scan.collateral_values == [Decimal(2000), Decimal(2000), Decimal(0)]
+    assert scan.health_ratios[:2] == [Decimal("1.6"), Decimal(1600) / Decimal(1700)]
+    assert scan.liquidation_ratios[0] == Decimal("1.8")
+    assert scan.health_ratios[2] == Decimal("Infinity")
+    assert scan.below() == [("0xRisky", "0xComet")]
+    assert scan.rows()[0]["health_ratio"] == Decimal("1.6")
+
+
+def test_scan_reads_chunks_at_one_block(wallet):
+    """Test that balances are read in chunks pinned to the scanned block."""
+    scan_positions(wallet, list(POSITIONS), ["0xComet"], chunk_size=2)
+
+    balance_reads = [
+        call
+        for call in wallet.read_contract_many.call_args_list
+        if call.args[0][0].function_name in ("borrowBalanceOf", "collateralBalanceOf")
+    ]
+    assert [len(call.args[0]) for call in balance_reads] == [2, 2, 2]
+    assert all(call.kwargs["block_identifier"] == 123 for call in balance_reads)
+
+
+def test_scan_reads_market_once(wallet):
+    """Test that a second scan only reads prices and balances."""
+    scan_positions(wallet, list(POSITIONS), ["0xComet"])
+    wallet.read_contract_many.reset_mock()
+
+    scan_positions(wallet, list(POSITIONS), ["0xComet"])
+
+    assert wallet.read_contract_many.call_count == 2
+
+
+def test_scan_rejects_base_token_without_decimals(wallet):
+    """Test that a base token without decimals fails with a descriptive error."""
+    read_contract_many = wallet.read_contract_many.side_effect
+    wallet.read_contract_many.side_effect = lambda calls, block_identifier="latest": [
+        None if call.function_name == "decimals" else result
+        for call, result in zip(calls, read_contract_many(calls, block_identifier), strict=True)
+    ]
+
+    with pytest.raises(ValueError, match="does not have decimals"):
+        scan_positions(wallet, list(POSITIONS), ["0xComet"])
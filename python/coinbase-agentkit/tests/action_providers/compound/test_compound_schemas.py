@@ -5,6 +5,7 @@ from pydantic import ValidationError
 
 from coinbase_agentkit.action_providers.compound.schemas import (
     CompoundBorrowSchema,
+    CompoundMaxAmountSchema,
     CompoundPortfolioSchema,
     CompoundRepaySchema,
     CompoundSupplySchema,
@@ -130,3 +131,13 @@ def test_portfolio_input_model_valid():
     """Test that CompoundPortfolioSchema works with no parameters required."""
     input_model = CompoundPortfolioSchema()
     assert isinstance(input_model, CompoundPortfolioSchema)
+
+
+def test_max_amount_input_model():
+    """Test that CompoundMaxAmountSchema defaults the target and validates the operation."""
+    input_model = CompoundMaxAmountSchema(operation="borrow")
+    assert input_model.target_health_ratio == "1"
+    assert input_model.asset_id is None
+
+    with pytest.raises(ValidationError):
+        CompoundMaxAmountSchema(operation="repay")
@@ -1,5 +1,8 @@
 from decimal import Decimal
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import call, patch
+
+from coinbase_agentkit.action_providers.compound.constants import COMET_ABI
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
 
 
 def test_supply_action_success(compound_wallet, compound_provider):
@@ -21,14 +24,15 @@ def test_supply_action_success(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_symbol"
         ) as mock_get_token_symbol,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.encode_function_data"
+        ) as mock_encode,
+        patch("coinbase_agentkit.action_providers.erc20.utils.encode_function_data", mock_encode),
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_balance_and_allowance"
+        ) as mock_get_balance_and_allowance,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
@@ -40,25 +44,16 @@ def test_supply_action_success(compound_wallet, compound_provider):
         mock_get_token_decimals.return_value = 18
         atomic_amount = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_token_balance.return_value = atomic_amount
+        mock_get_balance_and_allowance.return_value = (atomic_amount, 0)
         # First call returns current health, second call returns new health
         mock_get_health_ratio.side_effect = [Decimal("2.0"), Decimal("3.0")]
         mock_get_token_symbol.return_value = "WETH"
         mock_format_from_decimals.return_value = "1"
 
-        fake_comet_contract = MagicMock()
-        fake_comet_contract.encode_abi.return_value = "encoded_supply_data"
-        fake_token_contract = MagicMock()
-        fake_token_contract.encode_abi.return_value = "encoded_approve_data"
-
-        def get_contract(address, abi):
-            if address == "0xComet":
-                return fake_comet_contract
-            return fake_token_contract
+        def encode_function_data(abi, function_name, args):
+            return "encoded_approve_data" if function_name == "approve" else "encoded_supply_data"
 
-        fake_eth = MagicMock()
-        fake_eth.contract.side_effect = get_contract
-        mock_web3.return_value.eth = fake_eth
+        mock_encode.side_effect = encode_function_data
 
         # Act
         result = provider.supply(compound_wallet, input_args)
@@ -68,11 +63,12 @@ def test_supply_action_success(compound_wallet, compound_provider):
         assert "Transaction hash: 0xTxHash" in result
         assert "Health ratio changed from 2.00 to 3.00" in result
 
-        fake_token_contract.encode_abi.assert_called_once_with(
-            "approve", args=["0xComet", atomic_amount]
-        )
-        fake_comet_contract.encode_abi.assert_called_once_with(
-            "supply", args=["0xToken", atomic_amount]
+        mock_encode.assert_has_calls(
+            [
+                call(ERC20_ABI, "approve", ["0xComet", atomic_amount]),
+                call(COMET_ABI, "supply", ["0xToken", atomic_amount]),
+            ],
+            any_order=True,
         )
 
         assert compound_wallet.send_transaction.call_count == 2
@@ -84,6 +80,41 @@ def test_supply_action_success(compound_wallet, compound_provider):
         )
 
 
+def test_supply_skips_covered_approval(compound_wallet, compound_provider):
+    """Test that no approval is sent when the existing allowance covers the supply."""
+    input_args = {"asset_id": "weth", "amount": "1"}
+    atomic_amount = 10**18
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_decimals",
+            return_value=18,
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_balance_and_allowance",
+            return_value=(atomic_amount, atomic_amount),
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio",
+            return_value=Decimal("Infinity"),
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_symbol",
+            return_value="WETH",
+        ),
+        patch(
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.encode_function_data",
+            return_value="encoded_supply_data",
+        ),
+    ):
+        result = compound_provider.supply(compound_wallet, input_args)
+
+    assert "Supplied 1 WETH to Compound" in result
+    compound_wallet.send_transaction.assert_called_once_with(
+        {"to": "0xComet", "data": "encoded_supply_data"}
+    )
+
+
 def test_supply_insufficient_balance(compound_wallet, compound_provider):
     """Test supply action when wallet has insufficient balance."""
     provider = compound_provider
@@ -97,8 +128,8 @@ def test_supply_insufficient_balance(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_balance_and_allowance"
+        ) as mock_get_balance_and_allowance,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_from_decimals"
         ) as mock_format_from_decimals,
@@ -107,7 +138,7 @@ def test_supply_insufficient_balance(compound_wallet, compound_provider):
         supply_amount = int(Decimal("2.0") * Decimal(10**18))
         wallet_balance = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = supply_amount
-        mock_get_token_balance.return_value = wallet_balance
+        mock_get_balance_and_allowance.return_value = (wallet_balance, 0)
         mock_format_from_decimals.return_value = "1"
 
         result = provider.supply(compound_wallet, input_args)
@@ -129,26 +160,23 @@ def test_supply_approval_failure(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_balance_and_allowance"
+        ) as mock_get_balance_and_allowance,
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.encode_function_data"
+        ) as mock_encode,
+        patch("coinbase_agentkit.action_providers.erc20.utils.encode_function_data", mock_encode),
     ):
         mock_get_token_decimals.return_value = 18
         atomic_amount = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_token_balance.return_value = atomic_amount * 2
+        mock_get_balance_and_allowance.return_value = (atomic_amount * 2, 0)
         mock_get_health_ratio.return_value = Decimal("2.0")
 
-        fake_contract = MagicMock()
-        fake_contract.encode_abi.return_value = "encoded_approve_data"
-        fake_eth = MagicMock()
-        fake_eth.contract.return_value = fake_contract
-        mock_web3.return_value.eth = fake_eth
+        mock_encode.return_value = "encoded_approve_data"
 
         compound_wallet.send_transaction.side_effect = Exception("Approval failed")
         result = provider.supply(compound_wallet, input_args)
@@ -169,11 +197,12 @@ def test_supply_transaction_failure(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.get_balance_and_allowance"
+        ) as mock_get_balance_and_allowance,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.encode_function_data"
+        ) as mock_encode,
+        patch("coinbase_agentkit.action_providers.erc20.utils.encode_function_data", mock_encode),
         patch(
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
@@ -181,22 +210,13 @@ def test_supply_transaction_failure(compound_wallet, compound_provider):
         mock_get_token_decimals.return_value = 18
         atomic_amount = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_token_balance.return_value = atomic_amount * 2
+        mock_get_balance_and_allowance.return_value = (atomic_amount * 2, 0)
         mock_get_health_ratio.return_value = Decimal("2.0")
 
-        fake_comet_contract = MagicMock()
-        fake_comet_contract.encode_abi.return_value = "encoded_supply_data"
-        fake_token_contract = MagicMock()
-        fake_token_contract.encode_abi.return_value = "encoded_approve_data"
-
-        def get_contract(address, abi):
-            if address == "0xComet":
-                return fake_comet_contract
-            return fake_token_contract
+        def encode_function_data(abi, function_name, args):
+            return "encoded_approve_data" if function_name == "approve" else "encoded_supply_data"
 
-        fake_eth = MagicMock()
-        fake_eth.contract.side_effect = get_contract
-        mock_web3.return_value.eth = fake_eth
+        mock_encode.side_effect = encode_function_data
 
         def mock_send_transaction(params):
             if params["data"] == "encoded_approve_data":
@@ -13,10 +13,13 @@ from coinbase_agentkit.action_providers.compound.utils import (
     get_collateral_balance,
     get_price_feed_data,
     get_token_balance,
+)
+from coinbase_agentkit.action_providers.erc20 import token_metadata
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.action_providers.erc20.token_metadata import (
     get_token_decimals,
     get_token_symbol,
 )
-from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
 
 
 def test_format_amount_with_decimals():
@@ -77,35 +80,33 @@ def test_get_collateral_balance():
     assert balance == 5000
 
 
-def test_get_token_decimals():
-    """Test that get_token_decimals returns a predetermined value."""
-    # Create a mock wallet
+def test_get_token_decimals(monkeypatch):
+    """Test that get_token_decimals reads the token's metadata once and caches it."""
+    monkeypatch.setattr(token_metadata, "_registry", None)
     mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value.chain_id = "8453"
+    mock_wallet.read_contract_many.return_value = ["Wrapped Ether", "WETH", 18]
 
-    # Set up the mock to return decimals
-    mock_wallet.read_contract.return_value = 18
-
-    decimals = get_token_decimals(mock_wallet, "0xToken")
+    assert get_token_decimals(mock_wallet, "0xToken") == 18
+    assert get_token_decimals(mock_wallet, "0xToken") == 18
 
-    # Verify the correct method was called
-    mock_wallet.read_contract.assert_called_once_with("0xToken", ERC20_ABI, "decimals")
+    mock_wallet.read_contract_many.assert_called_once()
+    calls = mock_wallet.read_contract_many.call_args.args[0]
+    assert [call.function_name for call in calls] == ["name", "symbol", "decimals"]
+    assert all(call.abi == ERC20_ABI for call in calls)
 
-    assert decimals == 18
 
-
-def test_get_token_symbol():
-    """Test that get_token_symbol returns a predetermined symbol."""
-    # Create a mock wallet
+def test_get_token_symbol(monkeypatch):
+    """Test that get_token_symbol is answered from cached metadata."""
+    monkeypatch.setattr(token_metadata, "_registry", None)
     mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value.chain_id = "8453"
+    mock_wallet.read_contract_many.return_value = ["Wrapped Ether", "WETH", 18]
 
-    # Set up the mock to return a symbol
-    mock_wallet.read_contract.return_value = "WETH"
-
+    get_token_decimals(mock_wallet, "0xToken")
     symbol = get_token_symbol(mock_wallet, "0xToken")
 
-    # Verify the correct method was called
-    mock_wallet.read_contract.assert_called_once_with("0xToken", ERC20_ABI, "symbol")
-
+    mock_wallet.read_contract_many.assert_called_once()
     assert symbol == "WETH"
 
 
@@ -0,0 +1,115 @@
+"""Tests for the Compound what-if health ratio engine."""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from coinbase_agentkit.action_providers.compound.position import (
+    CompoundAsset,
+    CompoundPositionSnapshot,
+)
+from coinbase_agentkit.action_providers.compound.what_if import HealthRatioEngine
+
+WETH = "0xWeth"
+CBBTC = "0xCbbtc"
+
+
+@pytest.fixture
+def position():
+    """Create a position with 1 WETH of collateral and a 1000 USDC borrow."""
+    return CompoundPositionSnapshot(
+        comet_address="0xComet",
+        base_token="0xBase",
+        base_symbol="USDC",
+        base_decimals=6,
+        base_price=Decimal(1),
+        borrow_balance=1000 * 10**6,
+        assets=[
+            CompoundAsset(
+                address=WETH,
+                symbol="WETH",
+                decimals=18,
+                price=Decimal(2000),
+                collateral_factor=Decimal("0.8"),
+                liquidate_collateral_factor=Decimal("0.85"),
+                balance=10**18,
+            ),
+            CompoundAsset(
+                address=CBBTC,
+                symbol="cbBTC",
+                decimals=8,
+                price=Decimal(60000),
+                collateral_factor=Decimal("0.7"),
+                liquidate_collateral_factor=Decimal("0.8"),
+                balance=0,
+            ),
+        ],
+    )
+
+
+def test_candidates_match_position(position):
+    """Test that every candidate matches the position's own health ratio calculation."""
+    engine = HealthRatioEngine(position)
+    borrows = [0, 100 * 10**6, 600 * 10**6]
+    withdrawals = [0, 25 * 10**16, 10**18]
+
+    assert engine.after_borrow(borrows) == [position.health_ratio(borrow_amount=b) for b in borrows]
+    assert engine.after_withdraw(WETH, withdrawals) == [
+        position.health_ratio(withdrawals={WETH: w}) for w in withdrawals
+    ]
+    assert engine.after_supply(CBBTC, [10**8]) == [Decimal("43.6")]
+
+
+def test_max_borrow(position):
+    """Test that the largest borrow leaves exactly the target health ratio."""
+    engine = HealthRatioEngine(position)
+
+    assert engine.max_borrow() == 600 * 10**6
+    assert engine.max_borrow(Decimal(2)) == 0
+    assert engine.after_borrow([engine.max_borrow(Decimal("1.5"))]) >= [Decimal("1.5")]
+
+
+def test_max_withdraw(position):
+    """Test that the largest withdrawal is solved for and capped at the balance."""
+    engine = HealthRatioEngine(position)
+
+    assert engine.max_withdraw(WETH) == 375 * 10**15
+    assert engine.after_withdraw(WETH, [engine.max_withdraw(WETH)]) == [Decimal(1)]
+    assert engine.max_withdraw(CBBTC) == 0
+
+    position.borrow_balance = 0
+    assert HealthRatioEngine(position).max_withdraw(WETH) == 10**18
+
+
+def test_invalid_inputs(position):
+    """Test that unknown assets and non-positive targets are rejected."""
+    engine = HealthRatioEngine(position)
+
+    with pytest.raises(ValueError, match="is not collateral"):
+        engine.after_withdraw("0xOther", [1])
+    with pytest.raises(ValueError, match="must be positive"):
+        engine.max_borrow(Decimal(0))
+
+
+def test_get_max_amount_action(compound_wallet, compound_provider, position):
+    """Test that the action reports the largest safe borrow and withdrawal."""
+    compound_provider._get_asset_address = lambda network, asset_id: WETH
+
+    with patch(
+        "coinbase_agentkit.action_providers.compound.compound_action_provider.get_position_snapshot",
+        return_value=position,
+    ):
+        borrow = compound_provider.get_max_amount(compound_wallet, {"operation": "borrow"})
+        withdraw = compound_provider.get_max_amount(
+            compound_wallet,
+            {"operation": "withdraw", "asset_id": "weth", "target_health_ratio": "1.25"},
+        )
+        missing = compound_provider.get_max_amount(compound_wallet, {"operation": "withdraw"})
+
+    assert borrow == "You can borrow up to 600 USDC while keeping a health ratio of at least 1.00"
+    assert (
+        withdraw
+        == "You can withdraw up to 0.21875 WETH while keeping a health ratio of at least 1.25"
+    )
+    assert missing == "Error: asset_id is required to size a withdrawal"
@@ -1,4 +1,6 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+from coinbase_agentkit.action_providers.compound.constants import COMET_ABI
 
 
 def test_withdraw_action_success(compound_wallet, compound_provider):
@@ -29,8 +31,8 @@ def test_withdraw_action_success(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_token_symbol"
         ) as mock_get_token_symbol,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.encode_function_data"
+        ) as mock_encode,
     ):
         token_decimals = 6
         atomic_amount = 1000000000
@@ -42,21 +44,24 @@ def test_withdraw_action_success(compound_wallet, compound_provider):
         mock_get_health_ratio.side_effect = [2.0, 3.0]
         mock_get_token_symbol.return_value = "USDC"
 
-        fake_contract = MagicMock()
-        fake_contract.encode_abi.return_value = "encoded_withdraw_data"
-        fake_eth = MagicMock()
-        fake_eth.contract.return_value = fake_contract
-        mock_web3.return_value.eth = fake_eth
+        mock_encode.return_value = "encoded_withdraw_data"
+
+        health_reads_before_send = []
+
+        def send_transaction(params):
+            health_reads_before_send.append(mock_get_health_ratio.call_count)
+            return "0xTxHash"
+
+        compound_wallet.send_transaction.side_effect = send_transaction
 
         result = provider.withdraw(compound_wallet, input_args)
 
+        assert health_reads_before_send == [1]
         assert "Withdrawn 1000 USDC from Compound" in result
         assert "Transaction hash: 0xTxHash" in result
         assert "Health ratio changed from 2.00 to 3.00" in result
 
-        fake_contract.encode_abi.assert_called_once_with(
-            "withdraw", args=["0xToken", atomic_amount]
-        )
+        mock_encode.assert_called_once_with(COMET_ABI, "withdraw", ["0xToken", atomic_amount])
 
         compound_wallet.send_transaction.assert_called_once_with(
             {"to": "0xComet", "data": "encoded_withdraw_data"}
@@ -152,8 +157,8 @@ def test_withdraw_transaction_failure(compound_wallet, compound_provider):
             "coinbase_agentkit.action_providers.compound.compound_action_provider.get_health_ratio"
         ) as mock_get_health_ratio,
         patch(
-            "coinbase_agentkit.action_providers.compound.compound_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.compound.compound_action_provider.encode_function_data"
+        ) as mock_encode,
     ):
         token_decimals = 6
         atomic_amount = 1000000000
@@ -163,11 +168,7 @@ def test_withdraw_transaction_failure(compound_wallet, compound_provider):
         mock_get_health_ratio_after_withdraw.return_value = 1.5
         mock_get_health_ratio.return_value = 2.0
 
-        fake_contract = MagicMock()
-        fake_contract.encode_abi.return_value = "encoded_withdraw_data"
-        fake_eth = MagicMock()
-        fake_eth.contract.return_value = fake_contract
-        mock_web3.return_value.eth = fake_eth
+        mock_encode.return_value = "encoded_withdraw_data"
 
         compound_wallet.send_transaction.side_effect = Exception("Transaction failed")
         result = provider.withdraw(compound_wallet, input_args)
@@ -4,6 +4,8 @@ from unittest.mock import Mock
 
 import pytest
 
+from coinbase_agentkit.action_providers.erc20 import token_metadata
+from coinbase_agentkit.network import Network
 from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmWalletProvider
 
 MOCK_AMOUNT = "1000000000000000000"
@@ -18,5 +20,13 @@ def mock_wallet():
     """Create a mock wallet provider."""
     mock = Mock(spec=EvmWalletProvider)
     mock.get_address.return_value = MOCK_ADDRESS
+    mock.get_network.return_value = Network(protocol_family="evm", chain_id="84532")
     mock.read_contract.side_effect = [int(MOCK_AMOUNT), MOCK_DECIMALS]
+    mock.read_contract_many.return_value = ["Mock Token", "MOCK", MOCK_DECIMALS]
     return mock
+
+
+@pytest.fixture(autouse=True)
+def token_metadata_registry(monkeypatch):
+    """Give each test an empty token metadata registry."""
+    monkeypatch.setattr(token_metadata, "_registry", None)
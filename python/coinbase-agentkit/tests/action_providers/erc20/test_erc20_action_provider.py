@@ -1,18 +1,18 @@
 """Tests for the ERC20 action provider."""
 
-from unittest.mock import call
-
 import pytest
 from web3 import Web3
 
-from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI, TOKEN_LISTS
 from coinbase_agentkit.action_providers.erc20.erc20_action_provider import (
     erc20_action_provider,
 )
 from coinbase_agentkit.action_providers.erc20.schemas import GetBalanceSchema, TransferSchema
 from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import TransactionResult
 
 from .conftest import (
+    MOCK_ADDRESS,
     MOCK_AMOUNT,
     MOCK_CONTRACT_ADDRESS,
     MOCK_DECIMALS,
@@ -40,25 +40,15 @@ def test_get_balance_success(mock_wallet):
 
     response = provider.get_balance(mock_wallet, args)
 
-    mock_wallet.read_contract.assert_has_calls(
-        [
-            call(
-                contract_address=MOCK_CONTRACT_ADDRESS,
-                abi=ERC20_ABI,
-                function_name="balanceOf",
-                args=[mock_wallet.get_address()],
-            ),
-            call(
-                contract_address=MOCK_CONTRACT_ADDRESS,
-                abi=ERC20_ABI,
-                function_name="decimals",
-                args=[],
-            ),
-        ]
+    mock_wallet.read_contract.assert_called_once_with(
+        contract_address=MOCK_CONTRACT_ADDRESS,
+        abi=ERC20_ABI,
+        function_name="balanceOf",
+        args=[mock_wallet.get_address()],
     )
+    mock_wallet.read_contract_many.assert_called_once()
     assert (
-        f"Balance of {MOCK_CONTRACT_ADDRESS} is {int(MOCK_AMOUNT) / 10 ** MOCK_DECIMALS}"
-        in response
+        f"Balance of {MOCK_CONTRACT_ADDRESS} is {int(MOCK_AMOUNT) / 10**MOCK_DECIMALS}" in response
     )
 
 
@@ -80,6 +70,45 @@ def test_get_balance_error(mock_wallet):
     assert f"Error getting balance: {error!s}" in response
 
 
+def test_get_balances_success(mock_wallet):
+    """Test that get_balances returns a table of the given tokens."""
+    mock_wallet.read_contract_many.side_effect = [
+        [1_500_000, 0],
+        ["USD Coin", "USDC", MOCK_DECIMALS],
+    ]
+    args = {"contract_addresses": [MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION]}
+
+    response = erc20_action_provider().get_balances(mock_wallet, args)
+
+    assert f"| USDC | {MOCK_CONTRACT_ADDRESS} | 1.5 |" in response
+    assert MOCK_DESTINATION not in response
+    assert mock_wallet.read_contract_many.call_count == 2
+
+
+def test_get_balances_uses_token_list(mock_wallet):
+    """Test that get_balances scans the network's token list when no addresses are given."""
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-sepolia", chain_id="84532"
+    )
+    mock_wallet.read_contract_many.return_value = [0] * len(TOKEN_LISTS["base-sepolia"])
+
+    response = erc20_action_provider().get_balances(mock_wallet, {})
+
+    calls = mock_wallet.read_contract_many.call_args.args[0]
+    assert [call.contract_address for call in calls] == list(TOKEN_LISTS["base-sepolia"].values())
+    assert "No token balances found" in response
+
+
+def test_get_balances_unknown_network(mock_wallet):
+    """Test that get_balances asks for addresses on networks without a token list."""
+    mock_wallet.get_network.return_value = Network(protocol_family="evm", network_id="unknown")
+
+    response = erc20_action_provider().get_balances(mock_wallet, {})
+
+    assert "no built-in token list for network unknown" in response
+    mock_wallet.read_contract_many.assert_not_called()
+
+
 def test_transfer_schema_valid():
     """Test that the TransferSchema validates correctly."""
     valid_input = {
@@ -152,6 +181,31 @@ def test_transfer_error(mock_wallet):
     assert f"Error transferring the asset: {error!s}" in response
 
 
+def test_batch_transfer_success(mock_wallet):
+    """Test that batch_transfer reports the outcome for every destination."""
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-sepolia", chain_id="84532"
+    )
+    mock_wallet.send_transactions.return_value = [
+        TransactionResult(status="confirmed", transaction_hash="0x01"),
+        TransactionResult(status="confirmed", transaction_hash="0x02"),
+    ]
+    args = {
+        "contract_address": MOCK_CONTRACT_ADDRESS,
+        "transfers": [
+            {"destination": MOCK_DESTINATION, "amount": MOCK_AMOUNT},
+            {"destination": MOCK_ADDRESS, "amount": "5"},
+        ],
+    }
+
+    response = erc20_action_provider().batch_transfer(mock_wallet, args)
+
+    assert "Paid 2 of 2 recipients." in response
+    assert f"| {MOCK_DESTINATION} | {MOCK_AMOUNT} | confirmed | 0x01 |" in response
+    (transactions,) = mock_wallet.send_transactions.call_args.args
+    assert [tx["to"] for tx in transactions] == [MOCK_CONTRACT_ADDRESS] * 2
+
+
 def test_supports_network():
     """Test network support based on protocol family."""
     test_cases = [
@@ -0,0 +1,345 @@
+"""Tests for ERC20 balance and allowance utilities."""
+
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+from web3.exceptions import ContractLogicError
+
+from coinbase_agentkit.action_providers.erc20 import utils
+from coinbase_agentkit.action_providers.erc20.utils import (
+    MAX_UINT256,
+    PermitSignature,
+    batch_transfer,
+    build_permit_transaction,
+    get_allowance,
+    get_balance_and_allowance,
+    get_balances,
+    send_with_approval,
+    sign_permit,
+    supports_permit,
+)
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import EvmWalletProvider, TransactionPipelineError
+
+from .conftest import MOCK_ADDRESS, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION
+
+APPROVE_SELECTOR = "0x095ea7b3"
+TRANSFER_SELECTOR = "0xa9059cbb"
+DISPERSE_TOKEN_SELECTOR = "0xc73a2d60"
+PERMIT_SELECTOR = "0xd505accf"
+SPEND_TRANSACTION = {"to": MOCK_DESTINATION, "data": "0xb6b55f25"}
+NOT_A_TOKEN = "0x" + "33" * 20
+
+
+@pytest.fixture(autouse=True)
+def reset_allowances(monkeypatch):
+    """Give each test an empty allowance cache."""
+    monkeypatch.setattr(utils, "_allowances", utils.OrderedDict())
+    monkeypatch.setattr(utils, "_permit_domains", {})
+
+
+@pytest.fixture
+def wallet():
+    """Create a mock wallet whose send_transactions runs the real pipeline."""
+    mock = Mock(spec=EvmWalletProvider)
+    mock.get_address.return_value = MOCK_ADDRESS
+    mock.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-sepolia", chain_id="84532"
+    )
+    mock.send_transaction.side_effect = lambda tx: f"0x{mock.send_transaction.call_count:02x}"
+    mock.wait_for_transaction_receipt.return_value = {"status": 1}
+    mock.send_transactions.side_effect = partial(EvmWalletProvider.send_transactions, mock)
+    return mock
+
+
+def sent_data(wallet):
+    """Get the calldata of every sent transaction."""
+    return [c.args[0]["data"] for c in wallet.send_transaction.call_args_list]
+
+
+def test_get_balance_and_allowance_batches_reads(wallet):
+    """Test that balance and allowance are read together and the allowance is cached."""
+    wallet.read_contract_many.return_value = [500, 200]
+
+    assert get_balance_and_allowance(wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION) == (500, 200)
+    calls = wallet.read_contract_many.call_args.args[0]
+    assert [call.function_name for call in calls] == ["balanceOf", "allowance"]
+    assert calls[1].args == [MOCK_ADDRESS, MOCK_DESTINATION]
+
+    assert get_allowance(wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION) == 200
+    wallet.read_contract.assert_not_called()
+
+
+def test_cached_allowance_expires(monkeypatch, wallet):
+    """Test that a cached allowance is read again once it is older than the TTL."""
+    clock = Mock(return_value=1_000.0)
+    monkeypatch.setattr(utils.time, "monotonic", clock)
+    wallet.read_contract.side_effect = [200, 50]
+
+    assert get_allowance(wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION) == 200
+    clock.return_value += utils.ALLOWANCE_TTL - 1
+    assert get_allowance(wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION) == 200
+    clock.return_value += 1
+    assert get_allowance(wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION) == 50
+
+    assert wallet.read_contract.call_count == 2
+
+
+def test_allowance_cache_is_bounded(monkeypatch, wallet):
+    """Test that the least recently used allowances are evicted beyond the bound."""
+    monkeypatch.setattr(utils, "MAX_CACHED_ALLOWANCES", 2)
+    wallet.read_contract.return_value = 100
+    spenders = ["0x" + f"{i:02x}" * 20 for i in range(3)]
+
+    for spender in [spenders[0], spenders[1], spenders[0], spenders[2]]:
+        get_allowance(wallet, MOCK_CONTRACT_ADDRESS, spender)
+
+    assert [key[3] for key in utils._allowances] == [spenders[0], spenders[2]]
+
+
+def test_get_balances_reads_in_one_multicall(wallet):
+    """Test that balances are read together and only held tokens' metadata is fetched."""
+    wallet.read_contract_many.side_effect = [[5_000_000, 0, None], ["USD Coin", "USDC", 6]]
+
+    balances = get_balances(
+        wallet, [MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION, NOT_A_TOKEN], include_zero=False
+    )
+
+    assert [(b.symbol, b.balance) for b in balances] == [("USDC", 5_000_000), (None, None)]
+    assert str(balances[0].amount) == "5"
+    assert balances[1].amount is None
+    balance_calls, metadata_calls = (c.args[0] for c in wallet.read_contract_many.call_args_list)
+    assert [call.function_name for call in balance_calls] == ["balanceOf"] * 3
+    assert all(call.allow_failure for call in balance_calls)
+    assert {call.contract_address for call in metadata_calls} == {MOCK_CONTRACT_ADDRESS}
+
+
+def test_get_balances_includes_zero_balances(wallet):
+    """Test that tokens the wallet holds none of are listed when asked for."""
+    wallet.read_contract_many.side_effect = [[0], ["Dai", "DAI", 18]]
+
+    (balance,) = get_balances(wallet, [MOCK_CONTRACT_ADDRESS])
+
+    assert (balance.symbol, balance.amount) == ("DAI", 0)
+
+
+def test_batch_transfer_pipelines_transfers(wallet):
+    """Test that recipients are paid with pipelined transfers and failures are reported."""
+    wallet.wait_for_transaction_receipt.side_effect = [{"status": 1}, {"status": 0}]
+
+    results = batch_transfer(
+        wallet, [MOCK_DESTINATION, NOT_A_TOKEN], [10, 20], token_address=MOCK_CONTRACT_ADDRESS
+    )
+
+    assert [(r.recipient, r.amount, r.status) for r in results] == [
+        (MOCK_DESTINATION, 10, "confirmed"),
+        (NOT_A_TOKEN, 20, "reverted"),
+    ]
+    assert all(data.startswith(TRANSFER_SELECTOR) for data in sent_data(wallet))
+    assert wallet.send_transactions.call_count == 1
+
+
+def test_batch_transfer_uses_disperse_contract(wallet, monkeypatch):
+    """Test that recipients are paid through a disperse contract in chunks."""
+    monkeypatch.setattr(utils, "MAX_DISPERSE_RECIPIENTS", 2)
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="ethereum-mainnet", chain_id="1"
+    )
+    wallet.read_contract.return_value = 0
+
+    results = batch_transfer(
+        wallet, [MOCK_DESTINATION] * 3, [1, 2, 3], token_address=MOCK_CONTRACT_ADDRESS
+    )
+
+    assert [r.status for r in results] == ["confirmed"] * 3
+    assert results[0].transaction_hash == results[1].transaction_hash != results[2].transaction_hash
+    assert [data[:10] for data in sent_data(wallet)] == [
+        APPROVE_SELECTOR,
+        DISPERSE_TOKEN_SELECTOR,
+        APPROVE_SELECTOR,
+        DISPERSE_TOKEN_SELECTOR,
+    ]
+
+
+def test_batch_transfer_rejects_mismatched_amounts(wallet):
+    """Test that every recipient needs an amount."""
+    with pytest.raises(ValueError, match="2 recipients but 1 amounts"):
+        batch_transfer(wallet, [MOCK_DESTINATION, NOT_A_TOKEN], [1])
+
+
+def test_send_with_approval_approves_then_spends(wallet):
+    """Test that an insufficient allowance is raised to the amount before spending."""
+    wallet.read_contract.return_value = 0
+
+    results = send_with_approval(
+        wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION, 100, SPEND_TRANSACTION
+    )
+
+    assert len(results) == 2
+    approve_data, spend_data = sent_data(wallet)
+    assert approve_data.startswith(APPROVE_SELECTOR)
+    assert int(approve_data[-64:], 16) == 100
+    assert spend_data == SPEND_TRANSACTION["data"]
+    assert get_allowance(wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION) == 0
+
+
+def test_send_with_approval_skips_covered_approval(wallet):
+    """Test that no approval is sent when the allowance covers the amount."""
+    send_with_approval(
+        wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION, 100, SPEND_TRANSACTION, allowance=150
+    )
+
+    assert sent_data(wallet) == [SPEND_TRANSACTION["data"]]
+    assert get_allowance(wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION) == 50
+
+
+def test_send_with_approval_approve_max_once(wallet):
+    """Test that approving the maximum amount makes later spends skip approval."""
+    wallet.read_contract.return_value = 0
+
+    for _ in range(3):
+        send_with_approval(
+            wallet,
+            MOCK_CONTRACT_ADDRESS,
+            MOCK_DESTINATION,
+            100,
+            SPEND_TRANSACTION,
+            approve_max=True,
+        )
+
+    data = sent_data(wallet)
+    assert len(data) == 4
+    assert int(data[0][-64:], 16) == MAX_UINT256
+    wallet.read_contract.assert_called_once()
+
+
+def test_send_with_approval_failure_invalidates_cache(wallet):
+    """Test that a failed spend discards the cached allowance and reports the failing step."""
+    wallet.read_contract.side_effect = [1_000, 0]
+    wallet.wait_for_transaction_receipt.return_value = {"status": 0}
+
+    with pytest.raises(TransactionPipelineError) as exc_info:
+        send_with_approval(wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION, 100, SPEND_TRANSACTION)
+
+    assert exc_info.value.failed_index == len(exc_info.value.results) - 1
+    assert get_allowance(wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION) == 0
+    assert wallet.read_contract.call_count == 2
+
+
+@pytest.fixture
+def permit_wallet(wallet):
+    """Create a mock wallet that signs typed data with a real key and reads a permit token."""
+    account = Account.create()
+    wallet.get_address.return_value = account.address
+    wallet.sign_typed_data.side_effect = lambda typed_data: Account.sign_typed_data(
+        account.key, full_message=typed_data
+    ).signature.hex()
+
+    separator = utils._domain_separator("USD Coin", "2", 84532, MOCK_CONTRACT_ADDRESS)
+    wallet.read_contract_many.return_value = ["USD Coin", "2", separator]
+    wallet.read_contract.return_value = 0
+    return wallet
+
+
+def test_supports_permit_detects_domain_once(permit_wallet):
+    """Test that permit support is detected from the domain separator and cached."""
+    assert supports_permit(permit_wallet, MOCK_CONTRACT_ADDRESS)
+    assert supports_permit(permit_wallet, MOCK_CONTRACT_ADDRESS)
+    permit_wallet.read_contract_many.assert_called_once()
+
+
+def test_supports_permit_without_domain_separator(wallet):
+    """Test that tokens without a domain separator do not support permits."""
+    wallet.read_contract_many.return_value = ["Token", None, None]
+
+    assert not supports_permit(wallet, MOCK_CONTRACT_ADDRESS)
+
+
+def test_supports_permit_rereads_after_transient_failure(wallet):
+    """Test that a failed read that is not a revert is not remembered as no permit support."""
+    wallet.read_contract_many.return_value = ["Token", None, None]
+    wallet.read_contract.side_effect = Exception("429 Too Many Requests")
+
+    assert not supports_permit(wallet, MOCK_CONTRACT_ADDRESS)
+    assert not supports_permit(wallet, MOCK_CONTRACT_ADDRESS)
+    assert wallet.read_contract_many.call_count == 2
+
+
+def test_supports_permit_remembers_reverting_token(wallet):
+    """Test that a token whose DOMAIN_SEPARATOR reverts is remembered as without permits."""
+    wallet.read_contract_many.return_value = ["Token", None, None]
+    wallet.read_contract.side_effect = ContractLogicError("execution reverted")
+
+    assert not supports_permit(wallet, MOCK_CONTRACT_ADDRESS)
+    assert not supports_permit(wallet, MOCK_CONTRACT_ADDRESS)
+    wallet.read_contract_many.assert_called_once()
+
+
+def test_sign_permit_recovers_owner(permit_wallet):
+    """Test that the permit signature recovers to the token owner."""
+    permit = sign_permit(
+        permit_wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION, 100, deadline=2_000_000_000
+    )
+
+    typed_data = permit_wallet.sign_typed_data.call_args.args[0]
+    assert typed_data["message"]["nonce"] == 0
+    signer = Account.recover_message(
+        encode_typed_data(full_message=typed_data), vrs=(permit.v, permit.r, permit.s)
+    )
+    assert signer == permit.owner == permit_wallet.get_address()
+    assert permit.v in (27, 28)
+
+    transaction = build_permit_transaction(MOCK_CONTRACT_ADDRESS, permit)
+    assert transaction["data"].startswith(PERMIT_SELECTOR)
+
+
+def test_sign_permit_unsupported_token(wallet):
+    """Test that signing a permit for a token without EIP-2612 support fails."""
+    wallet.read_contract_many.return_value = [None, None, None]
+
+    with pytest.raises(ValueError, match="does not support EIP-2612"):
+        sign_permit(wallet, MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION, 100)
+
+
+def test_send_with_approval_uses_permit(permit_wallet):
+    """Test that a permit-enabled entry point replaces the approval transaction."""
+    permits: list[PermitSignature] = []
+
+    def permit_transaction(permit):
+        permits.append(permit)
+        return SPEND_TRANSACTION
+
+    results = send_with_approval(
+        permit_wallet,
+        MOCK_CONTRACT_ADDRESS,
+        MOCK_DESTINATION,
+        100,
+        {"to": MOCK_DESTINATION, "data": "0x"},
+        permit_transaction=permit_transaction,
+    )
+
+    assert len(results) == 1
+    assert sent_data(permit_wallet) == [SPEND_TRANSACTION["data"]]
+    assert permits[0].value == 100
+
+
+def test_send_with_approval_falls_back_to_approve(wallet):
+    """Test that tokens without permit support are approved on-chain."""
+    wallet.read_contract.return_value = 0
+    wallet.read_contract_many.return_value = [None, None, None]
+
+    send_with_approval(
+        wallet,
+        MOCK_CONTRACT_ADDRESS,
+        MOCK_DESTINATION,
+        100,
+        SPEND_TRANSACTION,
+        permit_transaction=lambda permit: pytest.fail("permit should not be used"),
+    )
+
+    approve_data, spend_data = sent_data(wallet)
+    assert approve_data.startswith(APPROVE_SELECTOR)
+    assert spend_data == SPEND_TRANSACTION["data"]
@@ -0,0 +1,165 @@
+"""Tests for the token metadata registry."""
+
+from unittest.mock import Mock
+
+import pytest
+from eth_abi import encode
+from eth_account import Account
+from web3.exceptions import ContractLogicError
+
+from coinbase_agentkit.action_providers.erc20.token_metadata import (
+    TokenMetadataRegistry,
+    get_token_decimals,
+    get_token_symbol,
+    prefetch_token_metadata,
+)
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import (
+    EthAccountWalletProvider,
+    EthAccountWalletProviderConfig,
+)
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmWalletProvider
+
+from .conftest import MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION
+
+USDC = ["USD Coin", "USDC", 6]
+NFT = ["Collection", "NFT", None]
+
+
+def create_wallet(chain_id="84532", results=None) -> Mock:
+    """Create a wallet whose multicall returns the given metadata."""
+    wallet = Mock(spec=EvmWalletProvider)
+    wallet.get_network.return_value = Network(protocol_family="evm", chain_id=chain_id)
+    wallet.read_contract_many.return_value = results or USDC
+    return wallet
+
+
+def test_metadata_is_read_once():
+    """Test that a token's metadata is read in one multicall and then cached."""
+    registry = TokenMetadataRegistry()
+    wallet = create_wallet()
+
+    token = registry.get(wallet, MOCK_CONTRACT_ADDRESS)
+    assert registry.get(wallet, MOCK_CONTRACT_ADDRESS) is token
+
+    assert (token.name, token.symbol, token.decimals) == ("USD Coin", "USDC", 6)
+    wallet.read_contract_many.assert_called_once()
+    calls = wallet.read_contract_many.call_args.args[0]
+    assert all(call.allow_failure for call in calls)
+
+
+def test_prefetch_reads_missing_tokens_in_one_round_trip():
+    """Test that prefetching batches every unknown token into a single multicall."""
+    registry = TokenMetadataRegistry()
+    wallet = create_wallet(results=USDC)
+    registry.get(wallet, MOCK_CONTRACT_ADDRESS)
+
+    wallet.read_contract_many.return_value = ["Other", "OTH", 18]
+    registry.prefetch(wallet, [MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION, MOCK_DESTINATION])
+
+    calls = wallet.read_contract_many.call_args.args[0]
+    assert {call.contract_address for call in calls} == {MOCK_DESTINATION}
+    assert registry.get(wallet, MOCK_DESTINATION).decimals == 18
+    assert wallet.read_contract_many.call_count == 2
+
+
+def test_reads_through_real_multicall_encoding():
+    """Test that metadata calls encode against the ERC20 ABI and decode the multicall."""
+    wallet = EthAccountWalletProvider(
+        EthAccountWalletProviderConfig(account=Account.create(), chain_id="84532")
+    )
+    results = [
+        (True, encode([kind], [value]))
+        for kind, value in zip(("string", "string", "uint8"), USDC, strict=True)
+    ]
+    wallet.web3.eth.call = Mock(return_value=encode(["(bool,bytes)[]"], [results]))
+
+    token = TokenMetadataRegistry().get(wallet, MOCK_CONTRACT_ADDRESS)
+
+    assert (token.name, token.symbol, token.decimals) == ("USD Coin", "USDC", 6)
+    wallet.web3.eth.call.assert_called_once()
+
+
+def test_collection_without_decimals_is_cached():
+    """Test that a token whose decimals reverts, like an ERC721 collection, is kept."""
+    registry = TokenMetadataRegistry()
+    wallet = create_wallet(results=NFT)
+    wallet.read_contract.side_effect = ContractLogicError("execution reverted")
+
+    assert registry.get(wallet, MOCK_CONTRACT_ADDRESS).symbol == "NFT"
+    assert registry.get(wallet, MOCK_CONTRACT_ADDRESS).decimals is None
+    wallet.read_contract_many.assert_called_once()
+
+
+def test_token_without_decimals_is_read_again(tmp_path):
+    """Test that metadata whose decimals failed to be read is neither cached nor persisted."""
+    registry = TokenMetadataRegistry(tmp_path / "tokens.db")
+    wallet = create_wallet(results=NFT)
+    wallet.read_contract.side_effect = Exception("429 Too Many Requests")
+
+    assert registry.get(wallet, MOCK_CONTRACT_ADDRESS).decimals is None
+
+    wallet.read_contract_many.return_value = USDC
+    assert registry.get(wallet, MOCK_CONTRACT_ADDRESS).decimals == 6
+    assert wallet.read_contract_many.call_count == 2
+
+
+def test_tokens_are_keyed_by_chain():
+    """Test that the same address on another chain is read separately."""
+    registry = TokenMetadataRegistry()
+    registry.get(create_wallet("84532"), MOCK_CONTRACT_ADDRESS)
+
+    other = create_wallet("8453", results=["Other", "OTH", 18])
+
+    assert registry.get(other, MOCK_CONTRACT_ADDRESS).decimals == 18
+
+
+def test_non_token_is_not_cached():
+    """Test that an address without metadata raises and is read again next time."""
+    registry = TokenMetadataRegistry()
+    wallet = create_wallet(results=[None, None, None])
+
+    with pytest.raises(ValueError, match="not a token contract"):
+        registry.get(wallet, MOCK_CONTRACT_ADDRESS)
+
+    wallet.read_contract_many.return_value = USDC
+    assert registry.get(wallet, MOCK_CONTRACT_ADDRESS).symbol == "USDC"
+
+
+def test_metadata_persists_across_registries(tmp_path):
+    """Test that metadata stored on disk is loaded without reading the chain."""
+    path = tmp_path / "tokens.db"
+    TokenMetadataRegistry(path).get(create_wallet(), MOCK_CONTRACT_ADDRESS)
+
+    wallet = create_wallet()
+    token = TokenMetadataRegistry(path).get(wallet, MOCK_CONTRACT_ADDRESS)
+
+    assert token.symbol == "USDC"
+    wallet.read_contract_many.assert_not_called()
+
+
+def test_evicts_least_recently_used():
+    """Test that the in-memory cache keeps at most max_entries tokens."""
+    registry = TokenMetadataRegistry(max_entries=1)
+    wallet = create_wallet()
+
+    registry.get(wallet, MOCK_CONTRACT_ADDRESS)
+    registry.get(wallet, MOCK_DESTINATION)
+    registry.get(wallet, MOCK_CONTRACT_ADDRESS)
+
+    assert wallet.read_contract_many.call_count == 3
+
+
+def test_shared_helpers():
+    """Test the helpers that read through the shared registry."""
+    wallet = create_wallet()
+    prefetch_token_metadata(wallet, [MOCK_CONTRACT_ADDRESS])
+
+    assert get_token_symbol(wallet, MOCK_CONTRACT_ADDRESS) == "USDC"
+    assert get_token_decimals(wallet, MOCK_CONTRACT_ADDRESS) == 6
+    wallet.read_contract_many.assert_called_once()
+
+    nft = create_wallet(results=NFT)
+    assert get_token_symbol(nft, MOCK_DESTINATION) == "NFT"
+    with pytest.raises(ValueError, match="does not have decimals"):
+        get_token_decimals(nft, MOCK_DESTINATION)
@@ -1,46 +1,59 @@
 import decimal
-from unittest.mock import MagicMock, patch
+from functools import partial
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
 from coinbase_agentkit.action_providers.morpho.morpho_action_provider import morpho_action_provider
 from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
 
 MOCK_VAULT_ADDRESS = "0x1234567890123456789012345678901234567890"
 MOCK_TOKEN_ADDRESS = "0x0987654321098765432109876543210987654321"
 MOCK_RECEIVER = "0x5555555555555555555555555555555555555555"
 MOCK_TX_HASH = "0xabcdef1234567890"
+MOCK_APPROVE_TX_HASH = "0x1234567890abcdef"
 
 
-# Deposit Tests
-def test_morpho_deposit_success():
-    """Test successful morpho deposit with valid parameters."""
+def create_pipeline_wallet() -> MagicMock:
+    """Create a mock wallet whose send_transactions runs the real pipeline."""
     mock_wallet = MagicMock()
-    mock_wallet.send_transaction.return_value = MOCK_TX_HASH
+    mock_wallet.send_transactions.side_effect = partial(
+        EvmWalletProvider.send_transactions, mock_wallet
+    )
+    mock_wallet.wait_for_transaction_receipt.return_value = {"status": 1}
+    mock_wallet.read_contract.return_value = 0
+    return mock_wallet
 
-    with patch(
-        "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
-    ) as mock_approve:
-        mock_approve.return_value = True
 
-        result = morpho_action_provider().deposit(
-            mock_wallet,
-            {
-                "vault_address": MOCK_VAULT_ADDRESS,
-                "token_address": MOCK_TOKEN_ADDRESS,
-                "assets": "1.0",
-                "receiver": MOCK_RECEIVER,
-            },
-        )
+# Deposit Tests
+def test_morpho_deposit_success():
+    """Test successful morpho deposit with valid parameters."""
+    mock_wallet = create_pipeline_wallet()
+    mock_wallet.send_transaction.side_effect = [MOCK_APPROVE_TX_HASH, MOCK_TX_HASH]
 
-        mock_approve.assert_called_once_with(
-            mock_wallet, MOCK_TOKEN_ADDRESS, MOCK_VAULT_ADDRESS, 1000000000000000000
-        )
+    result = morpho_action_provider().deposit(
+        mock_wallet,
+        {
+            "vault_address": MOCK_VAULT_ADDRESS,
+            "token_address": MOCK_TOKEN_ADDRESS,
+            "assets": "1.0",
+            "receiver": MOCK_RECEIVER,
+        },
+    )
 
-        assert MOCK_TX_HASH in result
-        assert "Deposited 1.0" in result
-        mock_wallet.send_transaction.assert_called_once()
-        mock_wallet.wait_for_transaction_receipt.assert_called_once_with(MOCK_TX_HASH)
+    assert MOCK_TX_HASH in result
+    assert "Deposited 1.0" in result
+    assert mock_wallet.send_transaction.call_count == 2
+    approve_params, deposit_params = (
+        c.args[0] for c in mock_wallet.send_transaction.call_args_list
+    )
+    assert approve_params["to"] == MOCK_TOKEN_ADDRESS
+    assert approve_params["data"].startswith("0x095ea7b3")
+    assert deposit_params["to"] == MOCK_VAULT_ADDRESS
+    mock_wallet.wait_for_transaction_receipt.assert_has_calls(
+        [call(MOCK_APPROVE_TX_HASH, timeout=120), call(MOCK_TX_HASH, timeout=120)]
+    )
 
 
 def test_morpho_deposit_zero_amount():
@@ -96,25 +109,43 @@ def test_morpho_deposit_invalid_amount():
 
 def test_morpho_deposit_approval_error():
     """Test morpho deposit with approval error."""
-    mock_wallet = MagicMock()
+    mock_wallet = create_pipeline_wallet()
+    mock_wallet.send_transaction.side_effect = Exception("Approval failed")
 
-    with patch(
-        "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
-    ) as mock_approve:
-        mock_approve.side_effect = Exception("Approval failed")
+    result = morpho_action_provider().deposit(
+        mock_wallet,
+        {
+            "vault_address": MOCK_VAULT_ADDRESS,
+            "token_address": MOCK_TOKEN_ADDRESS,
+            "assets": "1.0",
+            "receiver": MOCK_RECEIVER,
+        },
+    )
 
-        result = morpho_action_provider().deposit(
-            mock_wallet,
-            {
-                "vault_address": MOCK_VAULT_ADDRESS,
-                "token_address": MOCK_TOKEN_ADDRESS,
-                "assets": "1.0",
-                "receiver": MOCK_RECEIVER,
-            },
-        )
+    assert "Error approving Morpho Vault as spender: Approval failed" in result
+    mock_wallet.send_transaction.assert_called_once()
+
+
+def test_morpho_deposit_reverted_approval():
+    """Test that a reverted approval is reported even though the deposit was already sent."""
+    mock_wallet = create_pipeline_wallet()
+    mock_wallet.send_transaction.side_effect = [MOCK_APPROVE_TX_HASH, MOCK_TX_HASH]
+    mock_wallet.wait_for_transaction_receipt.side_effect = [{"status": 0}, {"status": 0}]
+
+    result = morpho_action_provider().deposit(
+        mock_wallet,
+        {
+            "vault_address": MOCK_VAULT_ADDRESS,
+            "token_address": MOCK_TOKEN_ADDRESS,
+            "assets": "1.0",
+            "receiver": MOCK_RECEIVER,
+        },
+    )
 
-        assert "Error approving Morpho Vault as spender" in result
-        mock_wallet.send_transaction.assert_not_called()
+    assert (
+        f"Error approving Morpho Vault as spender: Transaction {MOCK_APPROVE_TX_HASH} reverted"
+        in result
+    )
 
 
 # Withdraw Tests
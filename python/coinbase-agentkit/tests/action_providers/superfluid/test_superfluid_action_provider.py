@@ -88,11 +88,10 @@ def test_create_flow_success():
     """Test successful flow creation."""
     with (
         patch(
-            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
     ):
-        mock_contract = mock_web3.return_value.eth.contract.return_value
-        mock_contract.encode_abi.return_value = "0xencoded"
         mock_wallet = MagicMock()
         mock_wallet.send_transaction.return_value = MOCK_TX_HASH
         mock_wallet.wait_for_transaction_receipt.return_value = MOCK_RECEIPT
@@ -109,13 +108,10 @@ def test_create_flow_success():
         expected_response = f"Flow created successfully. Transaction hash: {MOCK_TX_HASH}"
         assert response == expected_response
 
-        mock_web3.return_value.eth.contract.assert_called_once_with(
-            address=SUPERFLUID_HOST_ADDRESS,
-            abi=CREATE_ABI,
-        )
-
-        mock_contract.encode_abi.assert_called_once_with(
-            "createFlow", args=["0xTokenAddress", MOCK_ADDRESS, "0xRecipientAddress", 1000, "0x"]
+        mock_encode.assert_called_once_with(
+            CREATE_ABI,
+            "createFlow",
+            ["0xTokenAddress", MOCK_ADDRESS, "0xRecipientAddress", 1000, "0x"],
         )
 
         mock_wallet.send_transaction.assert_called_once()
@@ -130,11 +126,10 @@ def test_update_flow_success():
     """Test successful flow update."""
     with (
         patch(
-            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
     ):
-        mock_contract = mock_web3.return_value.eth.contract.return_value
-        mock_contract.encode_abi.return_value = "0xencoded"
         mock_wallet = MagicMock()
         mock_wallet.send_transaction.return_value = MOCK_TX_HASH
         mock_wallet.wait_for_transaction_receipt.return_value = MOCK_RECEIPT
@@ -151,14 +146,10 @@ def test_update_flow_success():
         expected_response = f"Flow updated successfully. Transaction hash: {MOCK_TX_HASH}"
         assert response == expected_response
 
-        mock_web3.return_value.eth.contract.assert_called_once_with(
-            address=SUPERFLUID_HOST_ADDRESS,
-            abi=UPDATE_ABI,
-        )
-
-        mock_contract.encode_abi.assert_called_once_with(
+        mock_encode.assert_called_once_with(
+            UPDATE_ABI,
             "updateFlow",
-            args=[
+            [
                 "0xTokenAddress",
                 MOCK_ADDRESS,
                 "0xRecipientAddress",
@@ -179,11 +170,10 @@ def test_delete_flow_success():
     """Test successful flow deletion."""
     with (
         patch(
-            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
     ):
-        mock_contract = mock_web3.return_value.eth.contract.return_value
-        mock_contract.encode_abi.return_value = "0xencoded"
         mock_wallet = MagicMock()
         mock_wallet.send_transaction.return_value = MOCK_TX_HASH
         mock_wallet.wait_for_transaction_receipt.return_value = MOCK_RECEIPT
@@ -196,14 +186,10 @@ def test_delete_flow_success():
         expected_response = f"Flow deleted successfully. Transaction hash: {MOCK_TX_HASH}"
         assert response == expected_response
 
-        mock_web3.return_value.eth.contract.assert_called_once_with(
-            address=SUPERFLUID_HOST_ADDRESS,
-            abi=DELETE_ABI,
-        )
-
-        mock_contract.encode_abi.assert_called_once_with(
+        mock_encode.assert_called_once_with(
+            DELETE_ABI,
             "deleteFlow",
-            args=[
+            [
                 "0xTokenAddress",
                 MOCK_ADDRESS,
                 "0xRecipientAddress",
@@ -223,11 +209,10 @@ def test_create_flow_error():
     """Test flow creation when transaction fails."""
     with (
         patch(
-            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
     ):
-        mock_contract = mock_web3.return_value.eth.contract.return_value
-        mock_contract.encode_abi.return_value = "0xencoded"
         mock_wallet = MagicMock()
         mock_wallet.get_address.return_value = MOCK_ADDRESS
         mock_wallet.send_transaction.side_effect = Exception("Transaction failed")
@@ -244,13 +229,10 @@ def test_create_flow_error():
         expected_response = "Error creating flow: Transaction failed"
         assert response == expected_response
 
-        mock_web3.return_value.eth.contract.assert_called_once_with(
-            address=SUPERFLUID_HOST_ADDRESS,
-            abi=CREATE_ABI,
-        )
-
-        mock_contract.encode_abi.assert_called_once_with(
-            "createFlow", args=["0xTokenAddress", MOCK_ADDRESS, "0xRecipientAddress", 1000, "0x"]
+        mock_encode.assert_called_once_with(
+            CREATE_ABI,
+            "createFlow",
+            ["0xTokenAddress", MOCK_ADDRESS, "0xRecipientAddress", 1000, "0x"],
         )
 
         mock_wallet.send_transaction.assert_called_once()
@@ -263,11 +245,10 @@ def test_update_flow_error():
     """Test flow update when transaction fails."""
     with (
         patch(
-            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
     ):
-        mock_contract = mock_web3.return_value.eth.contract.return_value
-        mock_contract.encode_abi.return_value = "0xencoded"
         mock_wallet = MagicMock()
         mock_wallet.get_address.return_value = MOCK_ADDRESS
         mock_wallet.send_transaction.side_effect = Exception("Transaction failed")
@@ -283,14 +264,10 @@ def test_update_flow_error():
         expected_response = "Error updating flow: Transaction failed"
         assert response == expected_response
 
-        mock_web3.return_value.eth.contract.assert_called_once_with(
-            address=SUPERFLUID_HOST_ADDRESS,
-            abi=UPDATE_ABI,
-        )
-
-        mock_contract.encode_abi.assert_called_once_with(
+        mock_encode.assert_called_once_with(
+            UPDATE_ABI,
             "updateFlow",
-            args=[
+            [
                 "0xTokenAddress",
                 MOCK_ADDRESS,
                 "0xRecipientAddress",
@@ -309,11 +286,10 @@ def test_delete_flow_error():
     """Test flow deletion when transaction fails."""
     with (
         patch(
-            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.Web3"
-        ) as mock_web3,
+            "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
     ):
-        mock_contract = mock_web3.return_value.eth.contract.return_value
-        mock_contract.encode_abi.return_value = "0xencoded"
         mock_wallet = MagicMock()
         mock_wallet.get_address.return_value = MOCK_ADDRESS
         mock_wallet.send_transaction.side_effect = Exception("Transaction failed")
@@ -325,14 +301,10 @@ def test_delete_flow_error():
         expected_response = "Error deleting flow: Transaction failed"
         assert response == expected_response
 
-        mock_web3.return_value.eth.contract.assert_called_once_with(
-            address=SUPERFLUID_HOST_ADDRESS,
-            abi=DELETE_ABI,
-        )
-
-        mock_contract.encode_abi.assert_called_once_with(
+        mock_encode.assert_called_once_with(
+            DELETE_ABI,
             "deleteFlow",
-            args=[
+            [
                 "0xTokenAddress",
                 MOCK_ADDRESS,
                 "0xRecipientAddress",
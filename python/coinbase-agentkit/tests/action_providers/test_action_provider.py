@@ -0,0 +1,145 @@
+"""Tests for the ActionProvider base class."""
+
+import asyncio
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit import ActionProvider, AgentKit, AgentKitConfig, create_action
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import WalletProvider
+
+
+class BaseTestActionProvider(ActionProvider[WalletProvider]):
+    """Action provider with two actions."""
+
+    def __init__(self):
+        super().__init__("base", [])
+
+    @create_action(name="first", description="First action.")
+    def first(self, args: dict[str, Any]) -> str:
+        """Return the first result."""
+        return "first"
+
+    @create_action(name="second", description="Second action.")
+    def second(self, args: dict[str, Any]) -> str:
+        """Return the second result."""
+        return "second"
+
+    def supports_network(self, network: Network) -> bool:
+        """Support all networks."""
+        return True
+
+
+class DerivedTestActionProvider(BaseTestActionProvider):
+    """Action provider that inherits one action and replaces the other with a plain method."""
+
+    @create_action(name="third", description="Third action.")
+    def third(self, args: dict[str, Any]) -> str:
+        """Return the third result."""
+        return "third"
+
+    def second(self, args: dict[str, Any]) -> str:
+        """Override an action with a method that is not an action."""
+        return "not an action"
+
+
+def test_actions_are_registered_on_the_class():
+    """Test that actions are collected once per class and shared by instances."""
+    first_instance = BaseTestActionProvider()
+    second_instance = BaseTestActionProvider()
+
+    assert isinstance(BaseTestActionProvider._actions, tuple)
+    assert first_instance._actions is second_instance._actions is BaseTestActionProvider._actions
+    assert [action.name for action in BaseTestActionProvider._actions] == [
+        "BaseTestActionProvider_first",
+        "BaseTestActionProvider_second",
+    ]
+
+
+def test_subclass_registry_includes_inherited_actions():
+    """Test that subclasses inherit actions unless they override them."""
+    assert [action.name for action in DerivedTestActionProvider._actions] == [
+        "BaseTestActionProvider_first",
+        "DerivedTestActionProvider_third",
+    ]
+
+
+def test_get_actions_binds_the_instance():
+    """Test that actions returned by get_actions invoke the provider instance."""
+    provider = DerivedTestActionProvider()
+    actions = {action.name: action for action in provider.get_actions(None)}
+
+    assert actions["BaseTestActionProvider_first"].invoke({}) == "first"
+    assert actions["DerivedTestActionProvider_third"].invoke({}) == "third"
+
+
+class AsyncTestActionProvider(ActionProvider[WalletProvider]):
+    """Action provider with a native async action."""
+
+    def __init__(self):
+        super().__init__("async", [])
+
+    @create_action(name="sleepy", description="Async action.")
+    async def sleepy(self, wallet_provider: WalletProvider, args: dict[str, Any]) -> str:
+        """Return the wallet address after yielding to the event loop."""
+        await asyncio.sleep(0)
+        return f"{wallet_provider.get_address()}: {args['value']}"
+
+    def supports_network(self, network: Network) -> bool:
+        """Support all networks."""
+        return True
+
+
+@pytest.fixture
+def wallet():
+    """Create a mock wallet provider."""
+    wallet = Mock(spec=WalletProvider)
+    wallet.get_address.return_value = "0xWallet"
+    wallet.get_name.return_value = "mock"
+    wallet.get_network.return_value = Network(protocol_family="evm", chain_id="1")
+    return wallet
+
+
+def test_async_action_ainvoke(wallet):
+    """Test that async actions are awaited natively through ainvoke."""
+    (action,) = AsyncTestActionProvider().get_actions(wallet)
+
+    assert AsyncTestActionProvider._actions[0].is_async
+    assert asyncio.run(action.ainvoke({"value": 1})) == "0xWallet: 1"
+
+
+def test_async_action_invoke_from_sync_code(wallet):
+    """Test that async actions can still be invoked synchronously."""
+    (action,) = AsyncTestActionProvider().get_actions(wallet)
+
+    assert action.invoke({"value": 2}) == "0xWallet: 2"
+
+
+def test_async_action_invoke_inside_running_loop(wallet):
+    """Test that sync invocation of an async action works while an event loop is running."""
+    (action,) = AsyncTestActionProvider().get_actions(wallet)
+
+    async def call_sync():
+        return action.invoke({"value": 3})
+
+    assert asyncio.run(call_sync()) == "0xWallet: 3"
+
+
+def test_sync_action_ainvoke_runs_in_thread():
+    """Test that sync actions are awaitable through ainvoke."""
+    actions = {action.name: action for action in BaseTestActionProvider().get_actions(None)}
+
+    assert asyncio.run(actions["BaseTestActionProvider_first"].ainvoke({})) == "first"
+
+
+def test_agentkit_ainvoke(wallet):
+    """Test that AgentKit dispatches async invocations by name."""
+    agent_kit = AgentKit(
+        AgentKitConfig(wallet_provider=wallet, action_providers=[AsyncTestActionProvider()])
+    )
+
+    result = asyncio.run(agent_kit.ainvoke("AsyncTestActionProvider_sleepy", {"value": 4}))
+
+    assert result == "0xWallet: 4"
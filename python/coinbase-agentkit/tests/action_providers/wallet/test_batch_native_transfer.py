@@ -0,0 +1,58 @@
+"""Tests for batch native transfer functionality."""
+
+from functools import partial
+from unittest.mock import Mock
+
+import pytest
+from pydantic import ValidationError
+
+from coinbase_agentkit.action_providers.wallet.schemas import BatchNativeTransferSchema
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+from .conftest import MOCK_ADDRESS, MOCK_NETWORK
+
+OTHER_ADDRESS = "0x5154eae861cac3aa757d6016babaf972341354cf"
+
+
+@pytest.fixture
+def evm_wallet_provider():
+    """Create a mock EVM wallet provider whose send_transactions runs the real pipeline."""
+    mock = Mock(spec=EvmWalletProvider)
+    mock.get_address.return_value = MOCK_ADDRESS
+    mock.get_network.return_value = MOCK_NETWORK
+    mock.send_transaction.side_effect = lambda tx: f"0x{mock.send_transaction.call_count:02x}"
+    mock.wait_for_transaction_receipt.return_value = {"status": 1}
+    mock.send_transactions.side_effect = partial(EvmWalletProvider.send_transactions, mock)
+    return mock
+
+
+def test_batch_native_transfer_schema_requires_transfers():
+    """Test that an empty batch is rejected."""
+    with pytest.raises(ValidationError):
+        BatchNativeTransferSchema(transfers=[])
+
+
+def test_batch_native_transfer_success(wallet_action_provider, evm_wallet_provider):
+    """Test that every destination is paid in its own pipelined transaction."""
+    args = {
+        "transfers": [
+            {"to": MOCK_ADDRESS, "value": "1.5"},
+            {"to": OTHER_ADDRESS, "value": "0.25"},
+        ]
+    }
+
+    result = wallet_action_provider.batch_native_transfer(evm_wallet_provider, args)
+
+    assert "Paid 2 of 2 recipients." in result
+    assert f"| {OTHER_ADDRESS} | 0.25 | confirmed | 0x02 |" in result
+    sent = [c.args[0] for c in evm_wallet_provider.send_transaction.call_args_list]
+    assert [tx["value"] for tx in sent] == [1_500_000_000_000_000_000, 250_000_000_000_000_000]
+
+
+def test_batch_native_transfer_requires_evm_wallet(wallet_action_provider, mock_wallet_provider):
+    """Test that non-EVM wallets are told batch transfers are unavailable."""
+    args = {"transfers": [{"to": MOCK_ADDRESS, "value": "1"}]}
+
+    result = wallet_action_provider.batch_native_transfer(mock_wallet_provider, args)
+
+    assert result == "Error transferring native tokens: batch transfers require an EVM wallet"
@@ -62,10 +62,11 @@ def test_wrap_eth_input_model_missing_params():
 def test_wrap_eth_success():
     """Test successful ETH wrapping."""
     with (
-        patch("coinbase_agentkit.action_providers.weth.weth_action_provider.Web3") as mock_web3,
+        patch(
+            "coinbase_agentkit.action_providers.weth.weth_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
     ):
-        mock_contract = mock_web3.return_value.eth.contract.return_value
-        mock_contract.encode_abi.return_value = "0xencoded"
         mock_wallet = MagicMock()
         mock_wallet.send_transaction.return_value = MOCK_TX_HASH
         mock_wallet.wait_for_transaction_receipt.return_value = MOCK_RECEIPT
@@ -77,15 +78,7 @@ def test_wrap_eth_success():
         expected_response = f"Wrapped ETH with transaction hash: {MOCK_TX_HASH}"
         assert response == expected_response
 
-        mock_web3.return_value.eth.contract.assert_called_once_with(
-            address=WETH_ADDRESS,
-            abi=WETH_ABI,
-        )
-
-        mock_contract.encode_abi.assert_called_once_with(
-            "deposit",
-            args=[],
-        )
+        mock_encode.assert_called_once_with(WETH_ABI, "deposit")
 
         mock_wallet.send_transaction.assert_called_once()
         tx = mock_wallet.send_transaction.call_args[0][0]
@@ -120,10 +113,11 @@ def test_wrap_eth_validation_error():
 def test_wrap_eth_transaction_error():
     """Test wrap_eth when transaction fails."""
     with (
-        patch("coinbase_agentkit.action_providers.weth.weth_action_provider.Web3") as mock_web3,
+        patch(
+            "coinbase_agentkit.action_providers.weth.weth_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
     ):
-        mock_contract = mock_web3.return_value.eth.contract.return_value
-        mock_contract.encode_abi.return_value = "0xencoded"
         mock_wallet = MagicMock()
         mock_wallet.send_transaction.side_effect = Exception("Transaction failed")
 
@@ -134,10 +128,7 @@ def test_wrap_eth_transaction_error():
         expected_response = "Error wrapping ETH: Transaction failed"
         assert response == expected_response
 
-        mock_web3.return_value.eth.contract.assert_called_once_with(
-            address=WETH_ADDRESS,
-            abi=WETH_ABI,
-        )
+        mock_encode.assert_called_once_with(WETH_ABI, "deposit")
 
 
 def test_supports_network():
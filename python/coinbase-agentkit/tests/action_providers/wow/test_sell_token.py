@@ -57,7 +57,10 @@ def test_sell_token_input_model_missing_params():
 def test_sell_token_success():
     """Test successful token sale with valid parameters."""
     with (
-        patch("web3.eth.Eth.contract") as mock_contract,
+        patch(
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
@@ -70,9 +73,7 @@ def test_sell_token_success():
             return_value=False,
         ),
     ):
-        mock_contract.return_value.encode_abi.return_value = "0xencoded"
         mock_web3.to_checksum_address.side_effect = lambda x: x
-        mock_web3.return_value.eth.contract = mock_contract
         mock_wallet.get_address.return_value = MOCK_WALLET_ADDRESS
         mock_wallet.get_network.return_value.network_id = MOCK_NETWORK_ID
         mock_wallet.send_transaction.return_value = MOCK_TX_HASH
@@ -88,14 +89,10 @@ def test_sell_token_success():
         expected_response = f"Sold WoW ERC20 memecoin with transaction hash: {MOCK_TX_HASH}"
         assert response == expected_response
 
-        mock_contract.assert_called_once_with(
-            address=MOCK_CONTRACT_ADDRESS,
-            abi=WOW_ABI,
-        )
-
         min_eth = int(int(MOCK_ETH_QUOTE) * 0.98)
 
-        mock_contract.return_value.encode_abi.assert_called_once_with(
+        mock_encode.assert_called_once_with(
+            WOW_ABI,
             "sell",
             [
                 int(MOCK_AMOUNT_TOKENS),
@@ -121,7 +118,10 @@ def test_sell_token_success():
 def test_sell_token_graduated_pool():
     """Test token sale with graduated pool."""
     with (
-        patch("web3.eth.Eth.contract") as mock_contract,
+        patch(
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
@@ -134,9 +134,7 @@ def test_sell_token_graduated_pool():
             return_value=True,
         ),
     ):
-        mock_contract.return_value.encode_abi.return_value = "0xencoded"
         mock_web3.to_checksum_address.side_effect = lambda x: x
-        mock_web3.return_value.eth.contract = mock_contract
         mock_wallet.get_address.return_value = MOCK_WALLET_ADDRESS
         mock_wallet.get_network.return_value.network_id = MOCK_NETWORK_ID
         mock_wallet.send_transaction.return_value = MOCK_TX_HASH
@@ -154,7 +152,8 @@ def test_sell_token_graduated_pool():
 
         min_eth = int(int(MOCK_ETH_QUOTE) * 0.98)
 
-        mock_contract.return_value.encode_abi.assert_called_once_with(
+        mock_encode.assert_called_once_with(
+            WOW_ABI,
             "sell",
             [
                 int(MOCK_AMOUNT_TOKENS),
@@ -178,7 +177,10 @@ def test_sell_token_graduated_pool():
 def test_sell_token_error():
     """Test sell_token when error occurs."""
     with (
-        patch("web3.eth.Eth.contract") as mock_contract,
+        patch(
+            "coinbase_agentkit.action_providers.wow.wow_action_provider.encode_function_data",
+            return_value="0xencoded",
+        ) as mock_encode,
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
@@ -191,9 +193,7 @@ def test_sell_token_error():
             return_value=False,
         ),
     ):
-        mock_contract.return_value.encode_abi.return_value = "0xencoded"
         mock_web3.to_checksum_address.side_effect = lambda x: x
-        mock_web3.return_value.eth.contract = mock_contract
         mock_wallet.get_address.return_value = MOCK_WALLET_ADDRESS
         mock_wallet.get_network.return_value.network_id = MOCK_NETWORK_ID
         mock_wallet.send_transaction.side_effect = Exception("Transaction failed")
@@ -208,7 +208,4 @@ def test_sell_token_error():
         expected_response = "Error selling Zora Wow ERC20 memecoin: Transaction failed"
         assert response == expected_response
 
-        mock_contract.assert_called_once_with(
-            address=MOCK_CONTRACT_ADDRESS,
-            abi=WOW_ABI,
-        )
+        assert mock_encode.call_args.args[0] == WOW_ABI
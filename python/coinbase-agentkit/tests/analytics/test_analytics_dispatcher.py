@@ -0,0 +1,96 @@
+"""Tests for the background analytics dispatcher."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from coinbase_agentkit.analytics import AnalyticsDispatcher, send_analytics_event
+
+
+def _posted_events(session):
+    """Return the events sent in each POST made through a mock session."""
+    return [json.loads(call.kwargs["json"]["e"]) for call in session.post.call_args_list]
+
+
+def test_enqueue_batches_events_into_single_request():
+    """Test that events queued together are sent in a single POST."""
+    session = MagicMock()
+    dispatcher = AnalyticsDispatcher(batch_size=10, flush_interval=5, session=session)
+
+    for i in range(3):
+        assert dispatcher.enqueue({"event_type": f"event_{i}"})
+
+    assert dispatcher.flush(timeout=5)
+
+    assert session.post.call_count == 1
+    assert [e["event_type"] for e in _posted_events(session)[0]] == [
+        "event_0",
+        "event_1",
+        "event_2",
+    ]
+    assert session.post.call_args.kwargs["json"]["checksum"]
+
+
+def test_batches_are_split_at_batch_size():
+    """Test that a batch is sent as soon as it reaches the configured size."""
+    session = MagicMock()
+    dispatcher = AnalyticsDispatcher(batch_size=2, flush_interval=5, session=session)
+
+    for i in range(5):
+        dispatcher.enqueue({"event_type": f"event_{i}"})
+
+    assert dispatcher.flush(timeout=5)
+
+    assert [len(batch) for batch in _posted_events(session)] == [2, 2, 1]
+
+
+def test_enqueue_drops_events_when_queue_is_full():
+    """Test that events are dropped instead of blocking when the queue is full."""
+    dispatcher = AnalyticsDispatcher(max_queue_size=2, session=MagicMock())
+
+    with patch.object(dispatcher, "_ensure_worker"):
+        assert dispatcher.enqueue({"event_type": "a"})
+        assert dispatcher.enqueue({"event_type": "b"})
+        assert not dispatcher.enqueue({"event_type": "c"})
+
+    assert dispatcher.dropped_events == 1
+
+
+def test_failed_requests_do_not_stop_the_worker():
+    """Test that a failing batch is counted and later batches are still sent."""
+    session = MagicMock()
+    session.post.side_effect = [Exception("network unreachable"), MagicMock()]
+    dispatcher = AnalyticsDispatcher(session=session)
+
+    dispatcher.enqueue({"event_type": "first"})
+    assert dispatcher.flush(timeout=5)
+    dispatcher.enqueue({"event_type": "second"})
+    assert dispatcher.flush(timeout=5)
+
+    assert dispatcher.failed_batches == 1
+    assert session.post.call_count == 2
+
+
+def test_close_rejects_new_events():
+    """Test that a closed dispatcher no longer accepts events."""
+    dispatcher = AnalyticsDispatcher(session=MagicMock())
+    dispatcher.close(timeout=1)
+
+    assert not dispatcher.enqueue({"event_type": "late"})
+
+
+def test_send_analytics_event_only_enqueues():
+    """Test that send_analytics_event hands the event to the dispatcher without any I/O."""
+    dispatcher = MagicMock()
+
+    with patch(
+        "coinbase_agentkit.analytics.send_analytics_event.get_analytics_dispatcher",
+        return_value=dispatcher,
+    ):
+        send_analytics_event(
+            {"name": "agent_action_invocation", "action": "invoke", "component": "agent_action"}
+        )
+
+    event = dispatcher.enqueue.call_args.args[0]
+    assert event["event_type"] == "agent_action_invocation"
+    assert event["event_properties"]["component_type"] == "agent_action"
+    assert event["event_properties"]["agentkit_language"] == "python"
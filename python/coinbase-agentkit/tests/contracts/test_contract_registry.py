@@ -0,0 +1,91 @@
+"""Tests for the contract ABI registry."""
+
+import pytest
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.basename.constants import L2_RESOLVER_ABI, REGISTRAR_ABI
+from coinbase_agentkit.action_providers.compound.constants import COMET_ABI
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.contracts import contract_registry, encode_function_data, get_contract_abi
+
+MOCK_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_NAME_HASH = b"\x11" * 32
+
+
+@pytest.mark.parametrize(
+    ("abi", "function_name", "args"),
+    [
+        (ERC20_ABI, "transfer", [MOCK_ADDRESS, 1000]),
+        (ERC20_ABI, "approve", [MOCK_ADDRESS.lower(), 2**256 - 1]),
+        (COMET_ABI, "supply", [MOCK_ADDRESS, 5]),
+        (L2_RESOLVER_ABI, "setAddr", [MOCK_NAME_HASH, MOCK_ADDRESS]),
+        (L2_RESOLVER_ABI, "setName", [MOCK_NAME_HASH, "test.base.eth"]),
+        (
+            REGISTRAR_ABI,
+            "register",
+            [
+                {
+                    "name": "test",
+                    "owner": MOCK_ADDRESS,
+                    "duration": 31557600,
+                    "resolver": MOCK_ADDRESS,
+                    "data": ["0x01", b"\x02"],
+                    "reverseRecord": True,
+                }
+            ],
+        ),
+    ],
+)
+def test_encode_function_data_matches_web3(abi, function_name, args):
+    """Test that calldata matches what a web3 contract object produces."""
+    expected = Web3().eth.contract(abi=abi).encode_abi(function_name, args=args)
+
+    assert encode_function_data(abi, function_name, args) == expected
+
+
+def test_encode_function_data_without_args():
+    """Test encoding a function that takes no arguments."""
+    expected = Web3().eth.contract(abi=ERC20_ABI).encode_abi("decimals", args=[])
+
+    assert encode_function_data(ERC20_ABI, "decimals") == expected
+
+
+def test_encode_function_data_unknown_function():
+    """Test that an unknown function name raises a ValueError."""
+    with pytest.raises(ValueError, match="Function missing not found in ABI"):
+        encode_function_data(ERC20_ABI, "missing", [])
+
+
+def test_get_contract_abi_is_cached():
+    """Test that an ABI is only preprocessed once."""
+    assert get_contract_abi(ERC20_ABI) is get_contract_abi(ERC20_ABI)
+
+
+def test_get_contract_abi_evicts_least_recently_used(monkeypatch):
+    """Test that the registry is bounded and keeps ABIs that are still in use."""
+    monkeypatch.setattr(contract_registry, "MAX_REGISTERED_ABIS", 2)
+    monkeypatch.setattr(contract_registry, "_registry", contract_registry.OrderedDict())
+    abis = [[dict(ERC20_ABI[0])] for _ in range(3)]
+
+    get_contract_abi(abis[0])
+    get_contract_abi(abis[1])
+    get_contract_abi(abis[0])
+    get_contract_abi(abis[2])
+
+    assert list(contract_registry._registry) == [id(abis[0]), id(abis[2])]
+
+
+def test_contract_abi_fingerprint_depends_on_content():
+    """Test that equal ABIs share a fingerprint and different ABIs do not."""
+    fingerprint = get_contract_abi(ERC20_ABI).fingerprint
+
+    assert get_contract_abi([dict(entry) for entry in ERC20_ABI]).fingerprint == fingerprint
+    assert get_contract_abi(COMET_ABI).fingerprint != fingerprint
+
+
+def test_contract_function_decode():
+    """Test that return data is decoded like a web3 contract call."""
+    w3 = Web3()
+    function = get_contract_abi(ERC20_ABI).get_function("balanceOf")
+
+    assert function.decode(w3.codec.encode(["uint256"], [42])) == 42
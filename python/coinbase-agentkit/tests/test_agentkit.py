@@ -0,0 +1,109 @@
+"""Tests for AgentKit action catalog and dispatch."""
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from coinbase_agentkit import ActionProvider, AgentKit, AgentKitConfig, create_action
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import WalletProvider
+
+
+class EchoSchema(BaseModel):
+    """Input schema for the echo action."""
+
+    message: str
+
+
+class EchoActionProvider(ActionProvider[WalletProvider]):
+    """Action provider used to exercise the action catalog."""
+
+    def __init__(self):
+        super().__init__("echo", [])
+        self.supported_protocol_family = "evm"
+
+    @create_action(name="echo", description="Echo a message.", schema=EchoSchema)
+    def echo(self, wallet_provider: WalletProvider, args: dict[str, Any]) -> str:
+        """Echo the message along with the wallet address."""
+        return f"{wallet_provider.get_address()}: {args['message']}"
+
+    def supports_network(self, network: Network) -> bool:
+        """Support only the configured protocol family."""
+        return network.protocol_family == self.supported_protocol_family
+
+
+@pytest.fixture
+def wallet():
+    """Create a mock wallet provider on an EVM network."""
+    wallet = Mock(spec=WalletProvider)
+    wallet.get_address.return_value = "0xWallet"
+    wallet.get_name.return_value = "mock"
+    wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-sepolia", chain_id="84532"
+    )
+    return wallet
+
+
+@pytest.fixture
+def agent_kit(wallet):
+    """Create an AgentKit instance with a single echo provider."""
+    return AgentKit(AgentKitConfig(wallet_provider=wallet, action_providers=[EchoActionProvider()]))
+
+
+def test_get_actions_builds_catalog_once(agent_kit):
+    """Test that repeated calls reuse the same catalog."""
+    provider = agent_kit.action_providers[0]
+
+    with patch.object(provider, "get_actions", wraps=provider.get_actions) as mock_get_actions:
+        first = agent_kit.get_actions()
+        second = agent_kit.get_actions()
+
+    assert mock_get_actions.call_count == 1
+    assert [action.name for action in first] == ["EchoActionProvider_echo"]
+    assert first[0] is second[0]
+
+
+def test_catalog_is_rebuilt_when_network_changes(agent_kit, wallet):
+    """Test that changing the network invalidates the catalog."""
+    catalog = agent_kit.get_action_catalog()
+
+    wallet.get_network.return_value = Network(
+        protocol_family="svm", network_id="solana-mainnet", chain_id=None
+    )
+
+    assert agent_kit.get_action_catalog() is not catalog
+    assert agent_kit.get_actions() == []
+
+
+def test_catalog_is_rebuilt_when_providers_change(agent_kit):
+    """Test that adding an action provider invalidates the catalog."""
+    catalog = agent_kit.get_action_catalog()
+
+    agent_kit.action_providers.append(EchoActionProvider())
+
+    assert agent_kit.get_action_catalog() is not catalog
+    assert len(agent_kit.get_actions()) == 2
+
+
+def test_invalidate_actions(agent_kit):
+    """Test that invalidate_actions forces a rebuild."""
+    catalog = agent_kit.get_action_catalog()
+
+    agent_kit.invalidate_actions()
+
+    assert agent_kit.get_action_catalog() is not catalog
+
+
+def test_invoke_dispatches_by_name(agent_kit):
+    """Test that invoke routes to the named action."""
+    result = agent_kit.invoke("EchoActionProvider_echo", {"message": "hello"})
+
+    assert result == "0xWallet: hello"
+
+
+def test_invoke_unknown_action(agent_kit):
+    """Test that invoking an unknown action raises an error."""
+    with pytest.raises(ValueError, match="Action missing not found"):
+        agent_kit.invoke("missing", {})
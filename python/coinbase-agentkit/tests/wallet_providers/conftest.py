@@ -0,0 +1,19 @@
+"""Shared fixtures for wallet provider tests."""
+
+from unittest.mock import Mock
+
+import pytest
+from web3 import HTTPProvider, Web3
+
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_OTHER_TOKEN_ADDRESS = "0x4200000000000000000000000000000000000006"
+MOCK_WALLET_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_MULTICALL_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+
+@pytest.fixture
+def web3():
+    """Create a Web3 instance with mocked RPC methods and a real ABI codec."""
+    w3 = Web3(Mock(spec=HTTPProvider))
+    w3.eth.call = Mock()
+    return w3
@@ -0,0 +1,93 @@
+"""Tests for the CDP wallet provider."""
+
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from eth_account import Account
+
+from coinbase_agentkit.wallet_providers import (
+    CdpWalletProvider,
+    CdpWalletProviderConfig,
+    EthAccountWalletProvider,
+    EthAccountWalletProviderConfig,
+    cdp_wallet_provider,
+    nonce_manager,
+    rpc_pool,
+)
+
+from .conftest import MOCK_TOKEN_ADDRESS, MOCK_WALLET_ADDRESS
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state(monkeypatch):
+    """Give each test fresh nonce managers and RPC pools."""
+    monkeypatch.setattr(nonce_manager, "_nonce_managers", {})
+    monkeypatch.setattr(rpc_pool, "_rpc_pools", {})
+
+
+@pytest.fixture
+def cdp_wallet(monkeypatch):
+    """Make CDP wallet providers create a mocked CDP wallet."""
+    wallet = Mock()
+    wallet.default_address.address_id = MOCK_WALLET_ADDRESS
+    monkeypatch.setattr(cdp_wallet_provider, "Cdp", Mock())
+    monkeypatch.setattr(cdp_wallet_provider, "Wallet", Mock(create=Mock(return_value=wallet)))
+    return wallet
+
+
+@pytest.fixture
+def wallet_provider(cdp_wallet):
+    """Create a CDP wallet provider on Base Sepolia with a mocked CDP wallet."""
+    provider = CdpWalletProvider(
+        CdpWalletProviderConfig(api_key_name="name", api_key_private_key="key")
+    )
+    provider._web3.eth.get_transaction_count = Mock()
+    return provider
+
+
+@pytest.mark.parametrize(
+    "server_signed",
+    [
+        lambda provider: provider.native_transfer(MOCK_TOKEN_ADDRESS, Decimal("0.1")),
+        lambda provider: provider.trade("1", "eth", "usdc"),
+        lambda provider: provider.deploy_token("Token", "TKN", "1000"),
+    ],
+)
+def test_server_signed_transactions_resync_nonce(wallet_provider, server_signed):
+    """Test that a transaction CDP signs server-side makes the next send re-read the nonce."""
+    # The local send uses 5, CDP uses 6, so the network's pending count becomes 7
+    wallet_provider._web3.eth.get_transaction_count.side_effect = [5, 7]
+
+    assert wallet_provider._nonce_manager.send(lambda nonce: nonce) == 5
+    server_signed(wallet_provider)
+
+    assert wallet_provider._nonce_manager.send(lambda nonce: nonce) == 7
+
+
+def test_failed_server_signed_transaction_resyncs_nonce(wallet_provider):
+    """Test that the nonce is re-read even when a server-signed transfer fails after broadcast."""
+    wallet_provider._web3.eth.get_transaction_count.side_effect = [5, 7]
+    wallet_provider._wallet.transfer.return_value.wait.side_effect = Exception("timed out")
+
+    assert wallet_provider._nonce_manager.send(lambda nonce: nonce) == 5
+    with pytest.raises(Exception, match="timed out"):
+        wallet_provider.native_transfer(MOCK_TOKEN_ADDRESS, Decimal("0.1"))
+
+    assert wallet_provider._nonce_manager.send(lambda nonce: nonce) == 7
+
+
+def test_shares_nonce_manager_with_other_providers_for_the_account(cdp_wallet):
+    """Test that a CDP and an eth-account provider for one account and chain share nonces."""
+    account = Account.create()
+    cdp_wallet.default_address.address_id = account.address
+
+    cdp_provider = CdpWalletProvider(
+        CdpWalletProviderConfig(api_key_name="name", api_key_private_key="key")
+    )
+    eth_account_provider = EthAccountWalletProvider(
+        EthAccountWalletProviderConfig(account=account, chain_id="84532")
+    )
+
+    assert cdp_provider._nonce_manager is eth_account_provider._nonce_manager
+    assert list(nonce_manager._nonce_managers) == [(84532, account.address.lower())]
@@ -0,0 +1,124 @@
+"""Tests for the eth-account wallet provider."""
+
+from unittest.mock import Mock
+
+import pytest
+from eth_account import Account
+
+from coinbase_agentkit.wallet_providers import (
+    EthAccountWalletProvider,
+    EthAccountWalletProviderConfig,
+    fee_oracle,
+    gas_model,
+    nonce_manager,
+    receipt_watcher,
+    rpc_pool,
+)
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmGasConfig
+
+from .conftest import MOCK_TOKEN_ADDRESS
+
+
+def create_wallet_provider(gas: EvmGasConfig | None = None) -> EthAccountWalletProvider:
+    """Create a wallet provider on Base Sepolia with mocked RPC methods."""
+    provider = EthAccountWalletProvider(
+        EthAccountWalletProviderConfig(account=Account.create(), chain_id="84532", gas=gas)
+    )
+    provider.web3.eth.get_transaction_count = Mock(return_value=4)
+    provider.web3.eth.fee_history = Mock(
+        return_value={
+            "baseFeePerGas": [1_000_000, 1_000_000],
+            "gasUsedRatio": [0.5],
+            "reward": [[100_000_000, 200_000_000, 300_000_000]],
+        }
+    )
+    provider.web3.eth.estimate_gas = Mock(return_value=21_000)
+    provider.web3.eth.send_transaction = Mock(side_effect=lambda tx: bytes([tx["nonce"]]) * 32)
+    provider._receipt_watcher.wait = Mock(return_value={"status": 1, "gasUsed": 20_000})
+    return provider
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_state(monkeypatch):
+    """Give each test fresh nonce managers, fee oracles, gas models, receipt watchers and RPC pools."""
+    monkeypatch.setattr(nonce_manager, "_nonce_managers", {})
+    monkeypatch.setattr(fee_oracle, "_fee_oracles", {})
+    monkeypatch.setattr(gas_model, "_gas_models", {})
+    monkeypatch.setattr(receipt_watcher, "_receipt_watchers", {})
+    monkeypatch.setattr(rpc_pool, "_rpc_pools", {})
+
+
+@pytest.fixture
+def wallet_provider():
+    """Create a wallet provider on Base Sepolia with mocked RPC methods."""
+    return create_wallet_provider()
+
+
+def test_send_transaction_reserves_nonces_locally(wallet_provider):
+    """Test that back-to-back sends use consecutive nonces from a single count lookup."""
+    hashes = [wallet_provider.send_transaction({"to": MOCK_TOKEN_ADDRESS}) for _ in range(3)]
+
+    assert hashes == ["0x" + f"{nonce:02x}" * 32 for nonce in (4, 5, 6)]
+    wallet_provider.web3.eth.get_transaction_count.assert_called_once_with(
+        wallet_provider.get_address(), "pending"
+    )
+    wallet_provider.web3.eth.fee_history.assert_called_once()
+
+
+def test_send_transaction_uses_fee_strategy(wallet_provider):
+    """Test that fees are priced from fee history with the standard strategy."""
+    wallet_provider.send_transaction({"to": MOCK_TOKEN_ADDRESS})
+
+    transaction = wallet_provider.web3.eth.send_transaction.call_args.args[0]
+    assert transaction["maxPriorityFeePerGas"] == 200_000_000
+    assert transaction["maxFeePerGas"] == 1_125_000 + 200_000_000
+
+
+def test_send_transaction_resyncs_on_nonce_error(wallet_provider):
+    """Test that a nonce error resyncs from the network and retries."""
+    wallet_provider.web3.eth.get_transaction_count.side_effect = [4, 9]
+    wallet_provider.web3.eth.send_transaction.side_effect = [
+        Exception("nonce too low"),
+        b"\x09" * 32,
+    ]
+
+    assert wallet_provider.send_transaction({"to": MOCK_TOKEN_ADDRESS}) == "0x" + "09" * 32
+    assert wallet_provider.web3.eth.send_transaction.call_args.args[0]["nonce"] == 9
+
+
+def test_send_transaction_learns_gas_limits():
+    """Test that repeated transaction shapes skip gas estimation once learned."""
+    wallet_provider = create_wallet_provider(EvmGasConfig(learn_gas_limits=True))
+
+    for _ in range(3):
+        tx_hash = wallet_provider.send_transaction({"to": MOCK_TOKEN_ADDRESS, "data": "0xa9059cbb"})
+        wallet_provider.wait_for_transaction_receipt(tx_hash)
+    wallet_provider.send_transaction({"to": MOCK_TOKEN_ADDRESS, "data": "0xa9059cbb"})
+
+    assert wallet_provider.web3.eth.estimate_gas.call_count == 3
+    assert wallet_provider.web3.eth.send_transaction.call_args.args[0]["gas"] == 24_000
+    assert wallet_provider._gas_model is gas_model.get_gas_model(84532)
+
+
+def test_send_transaction_estimates_gas_by_default(wallet_provider):
+    """Test that gas is estimated for every send unless gas learning is enabled."""
+    for _ in range(4):
+        tx_hash = wallet_provider.send_transaction({"to": MOCK_TOKEN_ADDRESS})
+        wallet_provider.wait_for_transaction_receipt(tx_hash)
+
+    assert wallet_provider.web3.eth.estimate_gas.call_count == 4
+
+
+def test_send_transaction_estimates_gas_against_pending_state(wallet_provider):
+    """Test that gas is estimated against pending state so dependent steps need not wait."""
+    wallet_provider.send_transaction({"to": MOCK_TOKEN_ADDRESS})
+
+    assert wallet_provider.web3.eth.estimate_gas.call_args.args[1] == "pending"
+
+
+def test_send_transaction_keeps_caller_gas_limit(wallet_provider):
+    """Test that a gas limit set by the caller is sent without estimating."""
+    wallet_provider.send_transaction({"to": MOCK_TOKEN_ADDRESS, "gas": 90_000})
+
+    wallet_provider.web3.eth.estimate_gas.assert_not_called()
+    assert wallet_provider.web3.eth.send_transaction.call_args.args[0]["gas"] == 90_000
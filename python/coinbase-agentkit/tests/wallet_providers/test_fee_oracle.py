@@ -0,0 +1,121 @@
+"""Tests for the block-scoped fee oracle."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from coinbase_agentkit.network import base_sepolia
+from coinbase_agentkit.wallet_providers import fee_oracle
+from coinbase_agentkit.wallet_providers.fee_oracle import (
+    FALLBACK_PRIORITY_FEE,
+    FeeOracle,
+    FeeStrategy,
+    get_fee_oracle,
+)
+
+MOCK_FEE_HISTORY = {
+    "oldestBlock": 100,
+    "baseFeePerGas": [900, 1000, 1100, 1200],
+    "gasUsedRatio": [0.5, 0.0, 0.7],
+    "reward": [[10, 20, 30], [0, 0, 0], [12, 24, 36]],
+}
+
+
+@pytest.fixture
+def web3():
+    """Create a mock web3 instance that serves fee history."""
+    w3 = Mock()
+    w3.eth.fee_history.return_value = MOCK_FEE_HISTORY
+    return w3
+
+
+def test_get_fees_uses_fee_history(web3):
+    """Test that fees use the next base fee and median rewards of non-empty blocks."""
+    oracle = FeeOracle(web3, min_priority_fee=0)
+
+    assert oracle.get_fees("slow") == (11, 1200 + 11)
+    assert oracle.get_fees("standard") == (22, int(1200 * 1.125) + 22)
+    assert oracle.get_fees("fast") == (33, int(1200 * 1.25) + 33)
+    web3.eth.fee_history.assert_called_once_with(5, "latest", [10, 50, 90])
+
+
+def test_get_fees_cached_within_block(web3):
+    """Test that fee data is refetched only once a new block is expected."""
+    oracle = FeeOracle(web3, block_time=2)
+
+    with patch.object(fee_oracle.time, "monotonic", side_effect=[100.0, 101.0, 102.5, 102.5]):
+        oracle.get_fees()
+        oracle.get_fees()
+        oracle.get_fees()
+
+    assert web3.eth.fee_history.call_count == 2
+
+
+def test_get_fees_min_priority_fee(web3):
+    """Test that the priority fee never drops below the configured minimum."""
+    web3.eth.fee_history.return_value = {**MOCK_FEE_HISTORY, "reward": [[0, 0, 0]] * 3}
+    oracle = FeeOracle(web3, min_priority_fee=5)
+
+    assert oracle.get_fees("slow") == (5, 1200 + 5)
+
+
+def test_get_fees_priority_fee_floor_by_default(web3):
+    """Test that the priority fee is at least the fallback priority fee by default."""
+    oracle = FeeOracle(web3)
+
+    assert oracle.get_fees("fast") == (
+        FALLBACK_PRIORITY_FEE,
+        int(1200 * 1.25) + FALLBACK_PRIORITY_FEE,
+    )
+
+
+def test_get_fees_custom_strategy(web3):
+    """Test that a custom strategy's percentile is added to the fee history request."""
+    oracle = FeeOracle(web3, min_priority_fee=0)
+    strategy = FeeStrategy(name="urgent", reward_percentile=99, base_fee_multiplier=2)
+    web3.eth.fee_history.return_value = {
+        **MOCK_FEE_HISTORY,
+        "reward": [[10, 20, 30, 40], [0, 0, 0, 0], [12, 24, 36, 48]],
+    }
+
+    assert oracle.get_fees(strategy) == (44, 2400 + 44)
+    web3.eth.fee_history.assert_called_once_with(5, "latest", [10, 50, 90, 99])
+
+
+def test_get_fees_unknown_strategy(web3):
+    """Test that an unknown strategy name raises a ValueError."""
+    with pytest.raises(ValueError, match="Unknown fee strategy: turbo"):
+        FeeOracle(web3).get_fees("turbo")
+
+
+def test_get_fees_falls_back_without_fee_history(web3):
+    """Test that nodes without eth_feeHistory fall back to the latest block's base fee."""
+    web3.eth.fee_history.side_effect = Exception("method not found")
+    web3.eth.get_block.return_value = {"baseFeePerGas": 1000}
+
+    assert FeeOracle(web3).get_fees("slow") == (
+        FALLBACK_PRIORITY_FEE,
+        1000 + FALLBACK_PRIORITY_FEE,
+    )
+
+
+def test_async_get_fees_shares_cache(web3):
+    """Test that the async path fills the same cache as the blocking path."""
+    oracle = FeeOracle(web3, min_priority_fee=0)
+    async_web3 = Mock()
+    async_web3.eth.fee_history = AsyncMock(return_value=MOCK_FEE_HISTORY)
+
+    assert asyncio.run(oracle.async_get_fees(async_web3, "standard"))[0] == 22
+    assert oracle.get_fees("standard")[0] == 22
+    web3.eth.fee_history.assert_not_called()
+
+
+def test_get_fee_oracle_shared_per_chain(monkeypatch, web3):
+    """Test that wallet providers on the same chain share an oracle."""
+    monkeypatch.setattr(fee_oracle, "_fee_oracles", {})
+
+    oracle = get_fee_oracle(base_sepolia, web3)
+
+    assert get_fee_oracle(base_sepolia, Mock()) is oracle
+    assert oracle.block_time == base_sepolia.block_time
@@ -0,0 +1,101 @@
+"""Tests for gas limits learned from receipts."""
+
+from web3 import Web3
+
+from coinbase_agentkit.wallet_providers.gas_model import (
+    GasModel,
+    get_gas_model,
+    get_transaction_shape,
+)
+
+from .conftest import MOCK_TOKEN_ADDRESS
+
+TRANSFER = {"to": MOCK_TOKEN_ADDRESS, "data": "0xa9059cbb" + "00" * 64}
+APPROVE = {"to": MOCK_TOKEN_ADDRESS, "data": "0x095ea7b3" + "00" * 64}
+
+
+def learn(model, transaction, gas_used, status=1):
+    """Send and confirm a transaction through the model."""
+    tx_hash = Web3.to_hex(Web3.keccak(text=f"{transaction['data']}{gas_used}{status}"))
+    model.track(tx_hash, transaction)
+    model.observe(tx_hash, {"status": status, "gasUsed": gas_used})
+
+
+def test_get_transaction_shape():
+    """Test that shapes use the lowercase recipient and function selector."""
+    assert get_transaction_shape(TRANSFER) == (MOCK_TOKEN_ADDRESS.lower(), "0xa9059cbb")
+    assert get_transaction_shape(
+        {"to": Web3.to_bytes(hexstr=MOCK_TOKEN_ADDRESS), "data": bytes.fromhex("a9059cbb00")}
+    ) == (MOCK_TOKEN_ADDRESS.lower(), "0xa9059cbb")
+    assert get_transaction_shape({"to": MOCK_TOKEN_ADDRESS}) == (MOCK_TOKEN_ADDRESS.lower(), "0x")
+    assert get_transaction_shape({"data": "0x6080"}) is None
+
+
+def test_estimate_needs_min_samples():
+    """Test that a shape is only served once enough receipts are recorded."""
+    model = GasModel(min_samples=3)
+
+    learn(model, TRANSFER, 50_000)
+    learn(model, TRANSFER, 52_000)
+    assert model.estimate(TRANSFER) is None
+
+    learn(model, TRANSFER, 51_000)
+    assert model.estimate(TRANSFER) == 52_000
+
+
+def test_estimate_percentile_with_margin():
+    """Test that the estimate is a high percentile of gas used times the margin."""
+    model = GasModel(percentile=90, min_samples=1)
+    for gas_used in range(41_000, 51_000, 1_000):
+        learn(model, TRANSFER, gas_used)
+
+    assert model.estimate(TRANSFER, multiplier=1.2) == int(49_000 * 1.2)
+    assert model.estimate(APPROVE) is None
+
+
+def test_revert_discards_samples():
+    """Test that a reverted transaction sends its shape back to gas estimation."""
+    model = GasModel(min_samples=1)
+    learn(model, TRANSFER, 50_000)
+    learn(model, APPROVE, 45_000)
+
+    learn(model, TRANSFER, 60_000, status=0)
+
+    assert model.estimate(TRANSFER) is None
+    assert model.estimate(APPROVE) == 45_000
+
+
+def test_observe_ignores_untracked_transactions():
+    """Test that receipts for transactions that were not tracked are ignored."""
+    model = GasModel(min_samples=1)
+
+    model.observe("0x" + "ab" * 32, {"status": 1, "gasUsed": 50_000})
+
+    assert model.estimate(TRANSFER) is None
+
+
+def test_samples_are_bounded():
+    """Test that only the most recent receipts are kept per shape."""
+    model = GasModel(percentile=100, min_samples=1, max_samples=2)
+    for gas_used in (90_000, 50_000, 51_000):
+        learn(model, TRANSFER, gas_used)
+
+    assert model.estimate(TRANSFER) == 51_000
+
+
+def test_forget():
+    """Test that forgetting a shape discards its samples."""
+    model = GasModel(min_samples=1)
+    learn(model, TRANSFER, 50_000)
+
+    model.forget(TRANSFER)
+
+    assert model.estimate(TRANSFER) is None
+
+
+def test_get_gas_model_shared_per_chain():
+    """Test that wallet providers on the same chain share a gas model."""
+    model = get_gas_model(84532)
+
+    assert get_gas_model(84532) is model
+    assert get_gas_model(8453) is not model
@@ -0,0 +1,91 @@
+"""Tests for shared HTTP transports."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from coinbase_agentkit.network import base, base_sepolia
+from coinbase_agentkit.wallet_providers import http_transport, rpc_pool
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmRpcConfig
+from coinbase_agentkit.wallet_providers.http_transport import HttpTransport, get_http_transport
+from coinbase_agentkit.wallet_providers.rpc_pool import get_rpc_pool
+
+
+@pytest.fixture(autouse=True)
+def reset_registries(monkeypatch):
+    """Give each test empty transport and pool registries."""
+    monkeypatch.setattr(http_transport, "_http_transports", {})
+    monkeypatch.setattr(rpc_pool, "_rpc_pools", {})
+
+
+def test_transport_configures_connection_pool():
+    """Test that the session keeps the configured number of connections per host."""
+    transport = HttpTransport(pool_size=64, timeout=5)
+
+    adapter = transport.session.get_adapter("https://sepolia.base.org")
+    assert adapter._pool_connections == 64
+    assert adapter._pool_maxsize == 64
+
+
+def test_provider_sends_through_shared_session():
+    """Test that providers post through the transport's session with its timeout."""
+    transport = HttpTransport(timeout=5)
+    transport.session.post = MagicMock()
+    transport.session.post.return_value.__enter__.return_value.content = (
+        b'{"jsonrpc": "2.0", "id": 0, "result": "0x1"}'
+    )
+
+    for url in ("https://one.example", "https://two.example"):
+        assert transport.create_provider(url).make_request("eth_chainId", [])["result"] == "0x1"
+
+    assert transport.session.post.call_count == 2
+    assert transport.session.post.call_args.kwargs["timeout"] == 5
+
+
+def test_provider_uses_shared_session_from_other_threads():
+    """Test that requests made off the constructing thread still use the transport's session."""
+    transport = HttpTransport(timeout=5)
+    transport.session.post = MagicMock()
+    transport.session.post.return_value.__enter__.return_value.content = (
+        b'{"jsonrpc": "2.0", "id": 0, "result": "0x1"}'
+    )
+    provider = transport.create_provider("https://one.example")
+    provider.make_request("eth_chainId", [])
+
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(provider.make_request("eth_chainId", [])["result"])
+    )
+    thread.start()
+    thread.join()
+
+    assert results == ["0x1"]
+    assert transport.session.post.call_count == 2
+    assert (
+        provider._request_session_manager.cache_and_return_session(provider.endpoint_uri)
+        is transport.session
+    )
+
+
+def test_get_http_transport_is_shared_per_chain():
+    """Test that the same chain and settings share one transport."""
+    transport = get_http_transport(base_sepolia)
+
+    assert get_http_transport(base_sepolia) is transport
+    assert get_http_transport(base) is not transport
+    assert get_http_transport(base_sepolia, pool_size=5) is not transport
+
+
+def test_rpc_pools_on_a_chain_share_sessions():
+    """Test that pools with different routing settings still share connections."""
+    pool = get_rpc_pool(base_sepolia)
+    hedged = get_rpc_pool(base_sepolia, EvmRpcConfig(hedge_after=0.5))
+
+    assert hedged is not pool
+    assert hedged.transport is pool.transport
+    provider = hedged.endpoints[0].provider
+    assert (
+        provider._request_session_manager.cache_and_return_session(provider.endpoint_uri)
+        is pool.transport.session
+    )
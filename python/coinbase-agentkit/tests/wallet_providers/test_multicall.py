@@ -0,0 +1,162 @@
+"""Tests for batched contract reads."""
+
+import pytest
+from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput
+
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.contracts import contract_registry
+from coinbase_agentkit.network import base_sepolia
+from coinbase_agentkit.wallet_providers import ContractCall
+from coinbase_agentkit.wallet_providers.multicall import (
+    AGGREGATE3_SELECTOR,
+    get_multicall_address,
+    read_contract,
+    read_contract_many,
+)
+
+from .conftest import (
+    MOCK_MULTICALL_ADDRESS,
+    MOCK_OTHER_TOKEN_ADDRESS,
+    MOCK_TOKEN_ADDRESS,
+    MOCK_WALLET_ADDRESS,
+)
+
+
+def _calls(allow_failure=False):
+    return [
+        ContractCall(
+            contract_address=MOCK_TOKEN_ADDRESS,
+            abi=ERC20_ABI,
+            function_name="balanceOf",
+            args=[MOCK_WALLET_ADDRESS],
+        ),
+        ContractCall(
+            contract_address=MOCK_OTHER_TOKEN_ADDRESS,
+            abi=ERC20_ABI,
+            function_name="symbol",
+            allow_failure=allow_failure,
+        ),
+    ]
+
+
+def _aggregate3_response(web3, results):
+    return web3.codec.encode(["(bool,bytes)[]"], [results])
+
+
+def test_get_multicall_address():
+    """Test that the Multicall3 address is read from the chain definition."""
+    assert get_multicall_address(base_sepolia) == MOCK_MULTICALL_ADDRESS
+
+
+def test_read_contract(web3):
+    """Test that a single read is sent as one eth_call and decoded."""
+    web3.eth.call.return_value = web3.codec.encode(["uint256"], [1000])
+
+    result = read_contract(
+        web3, MOCK_TOKEN_ADDRESS, ERC20_ABI, "balanceOf", [MOCK_WALLET_ADDRESS], 123
+    )
+
+    assert result == 1000
+    transaction = web3.eth.call.call_args.args[0]
+    assert transaction["to"] == MOCK_TOKEN_ADDRESS
+    assert transaction["data"] == web3.eth.contract(abi=ERC20_ABI).encode_abi(
+        "balanceOf", args=[MOCK_WALLET_ADDRESS]
+    )
+    assert web3.eth.call.call_args.kwargs["block_identifier"] == 123
+
+
+def test_repeated_reads_reuse_one_abi_entry(web3, monkeypatch):
+    """Test that reads through ContractCall reuse the caller's preprocessed ABI."""
+    monkeypatch.setattr(contract_registry, "_registry", contract_registry.OrderedDict())
+    web3.eth.call.return_value = web3.codec.encode(["uint256"], [1000])
+
+    for _ in range(5):
+        read_contract(web3, MOCK_TOKEN_ADDRESS, ERC20_ABI, "balanceOf", [MOCK_WALLET_ADDRESS])
+    web3.eth.call.return_value = _aggregate3_response(
+        web3,
+        [(True, web3.codec.encode(["uint256"], [1])), (True, web3.codec.encode(["string"], ["A"]))],
+    )
+    read_contract_many(web3, _calls(), multicall_address=MOCK_MULTICALL_ADDRESS)
+
+    assert list(contract_registry._registry) == [id(ERC20_ABI)]
+
+
+def test_read_contract_empty_output(web3):
+    """Test that empty return data raises like a web3 contract call."""
+    web3.eth.call.return_value = b""
+
+    with pytest.raises(BadFunctionCallOutput):
+        read_contract(web3, MOCK_TOKEN_ADDRESS, ERC20_ABI, "decimals")
+
+
+def test_read_contract_many_uses_single_multicall(web3):
+    """Test that all calls are aggregated into one eth_call and decoded with their own ABI."""
+    web3.eth.call.return_value = _aggregate3_response(
+        web3,
+        [
+            (True, web3.codec.encode(["uint256"], [1000])),
+            (True, web3.codec.encode(["string"], ["WETH"])),
+        ],
+    )
+
+    results = read_contract_many(web3, _calls(), 123, MOCK_MULTICALL_ADDRESS)
+
+    assert results == [1000, "WETH"]
+    web3.eth.call.assert_called_once()
+    transaction = web3.eth.call.call_args.args[0]
+    assert transaction["to"] == MOCK_MULTICALL_ADDRESS
+    assert transaction["data"].startswith(AGGREGATE3_SELECTOR)
+    assert web3.eth.call.call_args.kwargs["block_identifier"] == 123
+
+    (encoded_calls,) = web3.codec.decode(["(address,bool,bytes)[]"], transaction["data"][4:])
+    assert [Web3.to_checksum_address(target) for target, _, _ in encoded_calls] == [
+        MOCK_TOKEN_ADDRESS,
+        MOCK_OTHER_TOKEN_ADDRESS,
+    ]
+
+
+def test_read_contract_many_allow_failure(web3):
+    """Test that failed calls yield None when failure is allowed."""
+    web3.eth.call.return_value = _aggregate3_response(
+        web3, [(True, web3.codec.encode(["uint256"], [5])), (False, b"")]
+    )
+
+    assert read_contract_many(
+        web3, _calls(allow_failure=True), "latest", MOCK_MULTICALL_ADDRESS
+    ) == [
+        5,
+        None,
+    ]
+
+
+def test_read_contract_many_raises_on_disallowed_failure(web3):
+    """Test that a failed call raises when failure is not allowed."""
+    web3.eth.call.return_value = _aggregate3_response(
+        web3, [(True, web3.codec.encode(["uint256"], [5])), (False, b"")]
+    )
+
+    with pytest.raises(Exception, match="Call to symbol"):
+        read_contract_many(web3, _calls(), "latest", MOCK_MULTICALL_ADDRESS)
+
+
+def test_read_contract_many_falls_back_to_json_rpc_batch(web3):
+    """Test that chains without Multicall3 use a single JSON-RPC batch request."""
+    web3.provider.make_batch_request.return_value = [
+        {"id": 0, "result": Web3.to_hex(web3.codec.encode(["uint256"], [7]))},
+        {"id": 1, "error": {"code": -32000, "message": "execution reverted"}},
+    ]
+
+    results = read_contract_many(web3, _calls(allow_failure=True), 10, None)
+
+    assert results == [7, None]
+    web3.eth.call.assert_not_called()
+    (requests,) = web3.provider.make_batch_request.call_args.args
+    assert [method for method, _ in requests] == ["eth_call", "eth_call"]
+    assert requests[0][1][1] == hex(10)
+
+
+def test_read_contract_many_empty(web3):
+    """Test that no calls means no requests."""
+    assert read_contract_many(web3, [], "latest", MOCK_MULTICALL_ADDRESS) == []
+    web3.eth.call.assert_not_called()
@@ -0,0 +1,130 @@
+"""Tests for local nonce management."""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.nonce_manager import (
+    NonceManager,
+    get_nonce_manager,
+    is_nonce_error,
+)
+
+from .conftest import MOCK_WALLET_ADDRESS
+
+
+def test_reserve_fetches_once():
+    """Test that only the first reservation reads the nonce from the network."""
+    fetch_nonce = Mock(return_value=5)
+    manager = NonceManager(MOCK_WALLET_ADDRESS, fetch_nonce)
+
+    assert [manager.reserve() for _ in range(3)] == [5, 6, 7]
+    fetch_nonce.assert_called_once()
+
+
+def test_reserve_is_thread_safe():
+    """Test that concurrent reservations never hand out the same nonce."""
+    manager = NonceManager(MOCK_WALLET_ADDRESS, Mock(return_value=0))
+    nonces = []
+
+    def reserve_many():
+        for _ in range(100):
+            nonces.append(manager.reserve())
+
+    threads = [threading.Thread(target=reserve_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(nonces) == list(range(800))
+
+
+def test_release_latest_nonce():
+    """Test that releasing the most recent nonce makes it available again."""
+    fetch_nonce = Mock(return_value=3)
+    manager = NonceManager(MOCK_WALLET_ADDRESS, fetch_nonce)
+
+    nonce = manager.reserve()
+    manager.release(nonce)
+
+    assert manager.reserve() == 3
+    fetch_nonce.assert_called_once()
+
+
+def test_release_with_later_nonces_resyncs():
+    """Test that releasing a nonce behind other reservations resyncs from the network."""
+    fetch_nonce = Mock(side_effect=[3, 4])
+    manager = NonceManager(MOCK_WALLET_ADDRESS, fetch_nonce)
+
+    first = manager.reserve()
+    manager.reserve()
+    manager.release(first)
+
+    assert not manager.synced
+    assert manager.reserve() == 4
+
+
+def test_send_retries_after_nonce_error():
+    """Test that a nonce error resyncs with the network and retries once."""
+    fetch_nonce = Mock(side_effect=[0, 7])
+    manager = NonceManager(MOCK_WALLET_ADDRESS, fetch_nonce)
+    send = Mock(side_effect=[Exception("nonce too low: next nonce 7, tx nonce 0"), "0xhash"])
+
+    assert manager.send(send) == "0xhash"
+    assert [c.args[0] for c in send.call_args_list] == [0, 7]
+    assert manager.reserve() == 8
+
+
+def test_send_releases_nonce_on_other_errors():
+    """Test that a failed send that was not a nonce error frees its nonce."""
+    manager = NonceManager(MOCK_WALLET_ADDRESS, Mock(return_value=2))
+
+    with pytest.raises(Exception, match="insufficient funds"):
+        manager.send(Mock(side_effect=Exception("insufficient funds")))
+
+    assert manager.reserve() == 2
+
+
+def test_send_gives_up_after_retries():
+    """Test that repeated nonce errors are raised once retries are exhausted."""
+    manager = NonceManager(MOCK_WALLET_ADDRESS, Mock(return_value=0))
+    send = Mock(side_effect=Exception("replacement transaction underpriced"))
+
+    with pytest.raises(Exception, match="replacement transaction underpriced"):
+        manager.send(send, retries=2)
+
+    assert send.call_count == 3
+
+
+def test_async_send_syncs_with_async_fetch():
+    """Test that the async path reads the nonce without the blocking fetch."""
+    fetch_nonce = Mock()
+    manager = NonceManager(MOCK_WALLET_ADDRESS, fetch_nonce)
+
+    async def send(nonce):
+        return nonce
+
+    async def async_fetch_nonce():
+        return 11
+
+    assert asyncio.run(manager.async_send(send, async_fetch_nonce)) == 11
+    assert asyncio.run(manager.async_send(send, async_fetch_nonce)) == 12
+    fetch_nonce.assert_not_called()
+
+
+def test_is_nonce_error():
+    """Test recognizing nonce errors from node messages."""
+    assert is_nonce_error(Exception("Nonce too low"))
+    assert is_nonce_error(Exception("replacement transaction underpriced"))
+    assert not is_nonce_error(Exception("execution reverted"))
+
+
+def test_get_nonce_manager_shared_per_chain_and_address():
+    """Test that providers for the same account and chain share a manager."""
+    manager = get_nonce_manager(84532, MOCK_WALLET_ADDRESS, Mock())
+
+    assert get_nonce_manager(84532, MOCK_WALLET_ADDRESS.lower(), Mock()) is manager
+    assert get_nonce_manager(8453, MOCK_WALLET_ADDRESS, Mock()) is not manager
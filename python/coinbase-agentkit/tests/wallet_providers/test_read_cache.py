@@ -0,0 +1,189 @@
+"""Tests for the block-keyed read cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from eth_account import Account
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.wallet_providers import (
+    ContractCall,
+    EthAccountWalletProvider,
+    EthAccountWalletProviderConfig,
+)
+from coinbase_agentkit.wallet_providers import read_cache as read_cache_module
+from coinbase_agentkit.wallet_providers.read_cache import ReadCache
+
+from .conftest import MOCK_TOKEN_ADDRESS, MOCK_WALLET_ADDRESS
+
+BALANCE = (42).to_bytes(32, "big")
+OTHER_ADDRESS = Web3.to_checksum_address("0x" + "22" * 20)
+
+
+def balance_call(address=MOCK_WALLET_ADDRESS):
+    """Build a balanceOf call."""
+    return ContractCall(
+        contract_address=MOCK_TOKEN_ADDRESS,
+        abi=ERC20_ABI,
+        function_name="balanceOf",
+        args=[address],
+    )
+
+
+def create_cache(head=100, **kwargs) -> ReadCache:
+    """Create a cache whose chain head is a mock."""
+    web3 = Mock()
+    web3.eth.block_number = head
+    return ReadCache(web3, **kwargs)
+
+
+@pytest.fixture
+def wallet_provider(monkeypatch):
+    """Create a wallet provider with read caching whose eth_call and head are mocked."""
+    monkeypatch.setattr(read_cache_module, "_read_caches", {})
+    provider = EthAccountWalletProvider(
+        EthAccountWalletProviderConfig(account=Account.create(), chain_id="84532", cache_reads=True)
+    )
+    provider._read_cache.web3 = Mock()
+    provider._read_cache.web3.eth.block_number = 1_000
+    provider.web3.eth.call = Mock(return_value=BALANCE)
+    return provider
+
+
+def read_balance(wallet_provider, block_identifier="latest"):
+    """Read the mock wallet's token balance."""
+    return wallet_provider.read_contract(
+        MOCK_TOKEN_ADDRESS, ERC20_ABI, "balanceOf", [MOCK_WALLET_ADDRESS], block_identifier
+    )
+
+
+def test_repeated_reads_hit_the_cache():
+    """Test that a read is made once per head and counted."""
+    cache = create_cache()
+    read = Mock(return_value=1)
+
+    assert cache.read(balance_call(), read) == 1
+    assert cache.read(balance_call(), read) == 1
+
+    read.assert_called_once()
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_cached_results_cannot_be_changed_by_callers():
+    """Test that mutating a returned result does not change what later reads see."""
+    cache = create_cache()
+    cache.read(balance_call(), lambda: [1, [2]])[1].append(3)
+    cache.read(balance_call(), Mock()).append(4)
+
+    assert cache.read(balance_call(), Mock()) == [1, [2]]
+
+
+def test_new_head_invalidates():
+    """Test that results are discarded once the head moves."""
+    cache = create_cache(block_time=1.0)
+    read = Mock(side_effect=[1, 2])
+
+    with patch.object(read_cache_module.time, "monotonic", return_value=0.0):
+        assert cache.read(balance_call(), read) == 1
+
+    cache.web3.eth.block_number = 101
+    with patch.object(read_cache_module.time, "monotonic", return_value=0.5):
+        assert cache.read(balance_call(), read) == 1
+    with patch.object(read_cache_module.time, "monotonic", return_value=1.5):
+        assert cache.read(balance_call(), read) == 2
+
+    assert cache.stats().invalidations == 1
+
+
+def test_invalidate_discards_results():
+    """Test that explicit invalidation forces the next read to the chain."""
+    cache = create_cache()
+    read = Mock(side_effect=[1, 2])
+
+    cache.read(balance_call(), read)
+    cache.invalidate()
+
+    assert cache.read(balance_call(), read) == 2
+    assert cache.stats().invalidations == 1
+
+
+def test_read_many_fetches_only_missing_calls():
+    """Test that batched reads only fetch calls not already cached."""
+    cache = create_cache()
+    cache.read(balance_call(), lambda: 1)
+    read_many = Mock(return_value=[2])
+
+    assert cache.read_many([balance_call(), balance_call(OTHER_ADDRESS)], read_many) == [1, 2]
+    (missing,) = read_many.call_args.args
+    assert [call.args for call in missing] == [[OTHER_ADDRESS]]
+
+
+def test_failed_reads_are_not_cached():
+    """Test that reads that yielded None are made again."""
+    cache = create_cache()
+    read = Mock(side_effect=[None, 3])
+
+    assert cache.read(balance_call(), read) is None
+    assert cache.read(balance_call(), read) == 3
+
+
+def test_evicts_least_recently_used():
+    """Test that the cache keeps at most max_entries results."""
+    cache = create_cache(max_entries=1)
+
+    cache.read(balance_call(), lambda: 1)
+    cache.read(balance_call(OTHER_ADDRESS), lambda: 2)
+
+    assert cache.stats().size == 1
+    assert cache.read(balance_call(), lambda: 3) == 3
+
+
+def test_wallet_reads_go_through_cache(wallet_provider):
+    """Test that latest reads are cached and pinned reads are not."""
+    assert read_balance(wallet_provider) == 42
+    assert read_balance(wallet_provider) == 42
+    read_balance(wallet_provider, block_identifier=5)
+
+    assert wallet_provider.web3.eth.call.call_count == 2
+    assert wallet_provider.get_read_cache_stats().hits == 1
+
+
+def test_wallet_balance_is_cached_until_invalidated(wallet_provider):
+    """Test that the native balance is cached and refreshed after the wallet writes."""
+    wallet_provider.web3.eth.get_balance = Mock(side_effect=[10, 20])
+
+    assert wallet_provider.get_balance() == 10
+    assert wallet_provider.get_balance() == 10
+
+    wallet_provider._invalidate_reads()
+    assert wallet_provider.get_balance() == 20
+
+
+def test_async_wallet_reads_go_through_cache(wallet_provider):
+    """Test that async latest reads share the cache with sync reads."""
+    wallet_provider.async_web3.eth.call = AsyncMock(return_value=BALANCE)
+
+    async def read_async():
+        return await wallet_provider.async_read_contract(
+            MOCK_TOKEN_ADDRESS, ERC20_ABI, "balanceOf", [MOCK_WALLET_ADDRESS]
+        )
+
+    assert asyncio.run(read_async()) == 42
+    assert asyncio.run(read_async()) == 42
+    assert read_balance(wallet_provider) == 42
+
+    wallet_provider.async_web3.eth.call.assert_awaited_once()
+    wallet_provider.web3.eth.call.assert_not_called()
+
+
+def test_caching_is_off_by_default():
+    """Test that wallet providers do not cache unless configured to."""
+    provider = EthAccountWalletProvider(
+        EthAccountWalletProviderConfig(account=Account.create(), chain_id="84532")
+    )
+
+    assert provider.get_read_cache_stats() is None
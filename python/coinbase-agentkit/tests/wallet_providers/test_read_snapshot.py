@@ -0,0 +1,163 @@
+"""Tests for block-pinned read snapshots."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from eth_account import Account
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.wallet_providers import (
+    ContractCall,
+    EthAccountWalletProvider,
+    EthAccountWalletProviderConfig,
+    ReadSnapshot,
+)
+
+from .conftest import MOCK_TOKEN_ADDRESS, MOCK_WALLET_ADDRESS
+
+BALANCE = (42).to_bytes(32, "big")
+
+
+@pytest.fixture
+def wallet_provider():
+    """Create a wallet provider whose eth_call and block number are mocked."""
+    provider = EthAccountWalletProvider(
+        EthAccountWalletProviderConfig(account=Account.create(), chain_id="84532")
+    )
+    provider.get_block_number = Mock(return_value=1_000)
+    provider.web3.eth.call = Mock(return_value=BALANCE)
+    return provider
+
+
+def read_balance(wallet_provider, block_identifier="latest"):
+    """Read the mock wallet's token balance."""
+    return wallet_provider.read_contract(
+        MOCK_TOKEN_ADDRESS, ERC20_ABI, "balanceOf", [MOCK_WALLET_ADDRESS], block_identifier
+    )
+
+
+def balance_call(address=MOCK_WALLET_ADDRESS):
+    """Build a balanceOf call."""
+    return ContractCall(
+        contract_address=MOCK_TOKEN_ADDRESS,
+        abi=ERC20_ABI,
+        function_name="balanceOf",
+        args=[address],
+    )
+
+
+def test_reads_are_pinned_and_memoized(wallet_provider):
+    """Test that reads in a snapshot use one block and repeated reads hit memory."""
+    with wallet_provider.read_snapshot() as snapshot:
+        assert read_balance(wallet_provider) == 42
+        assert read_balance(wallet_provider) == 42
+
+    assert snapshot.block_number == 1_000
+    wallet_provider.web3.eth.call.assert_called_once()
+    assert wallet_provider.web3.eth.call.call_args.kwargs["block_identifier"] == 1_000
+    wallet_provider.get_block_number.assert_called_once()
+
+
+def test_reads_outside_snapshot_are_not_pinned(wallet_provider):
+    """Test that reads go to the latest block once the snapshot is closed."""
+    with wallet_provider.read_snapshot():
+        read_balance(wallet_provider)
+
+    read_balance(wallet_provider)
+    read_balance(wallet_provider, block_identifier=5)
+
+    assert [c.kwargs["block_identifier"] for c in wallet_provider.web3.eth.call.call_args_list] == [
+        1_000,
+        "latest",
+        5,
+    ]
+
+
+def test_nested_snapshots_share_state(wallet_provider):
+    """Test that a nested snapshot joins the outer one unless it asks for another block."""
+    with wallet_provider.read_snapshot() as outer:
+        with wallet_provider.read_snapshot() as inner:
+            assert inner is outer
+        with wallet_provider.read_snapshot(block_number=900) as pinned:
+            assert pinned is not outer
+            assert pinned.block_number == 900
+        assert wallet_provider.get_read_snapshot() is outer
+
+    assert wallet_provider.get_read_snapshot() is None
+
+
+def test_snapshots_are_per_wallet(wallet_provider):
+    """Test that a snapshot on one wallet does not pin another wallet's reads."""
+    other = EthAccountWalletProvider(
+        EthAccountWalletProviderConfig(account=Account.create(), chain_id="84532")
+    )
+
+    with wallet_provider.read_snapshot():
+        assert other.get_read_snapshot() is None
+
+
+def test_async_reads_are_pinned(wallet_provider):
+    """Test that async reads in a snapshot use the snapshot's block."""
+    wallet_provider.async_web3.eth.call = AsyncMock(return_value=BALANCE)
+
+    async def read_in_snapshot():
+        with wallet_provider.read_snapshot():
+            await wallet_provider.async_read_contract(
+                MOCK_TOKEN_ADDRESS, ERC20_ABI, "balanceOf", [MOCK_WALLET_ADDRESS]
+            )
+            return read_balance(wallet_provider)
+
+    assert asyncio.run(read_in_snapshot()) == 42
+    wallet_provider.async_web3.eth.call.assert_awaited_once()
+    assert wallet_provider.async_web3.eth.call.call_args.kwargs["block_identifier"] == 1_000
+    wallet_provider.web3.eth.call.assert_not_called()
+
+
+def test_read_many_fetches_only_missing_calls():
+    """Test that batched reads only fetch calls not answered before."""
+    snapshot = ReadSnapshot(Mock(return_value=7))
+    other_address = Web3.to_checksum_address("0x" + "22" * 20)
+    snapshot.read(balance_call(), lambda block_number: 1)
+    read_many = Mock(return_value=[2])
+
+    results = snapshot.read_many([balance_call(), balance_call(other_address)], read_many)
+
+    assert results == [1, 2]
+    read_many.assert_called_once()
+    missing, block_number = read_many.call_args.args
+    assert [call.args for call in missing] == [[other_address]]
+    assert block_number == 7
+
+
+def test_failed_reads_are_not_memoized():
+    """Test that reads that yielded None are made again."""
+    snapshot = ReadSnapshot(Mock(return_value=7))
+    read = Mock(side_effect=[None, 3])
+
+    assert snapshot.read(balance_call(), read) is None
+    assert snapshot.read(balance_call(), read) == 3
+
+
+def test_reads_with_different_abis_are_kept_apart():
+    """Test that the same function read through different ABIs is not answered from memory."""
+    snapshot = ReadSnapshot(Mock(return_value=7))
+    other_abi = [{**entry, "outputs": [{"type": "int256"}]} for entry in ERC20_ABI]
+    other_call = balance_call().model_copy(update={"abi": other_abi})
+    snapshot.read(balance_call(), lambda block_number: 1)
+
+    assert snapshot.read(other_call, lambda block_number: -1) == -1
+    assert snapshot.read(balance_call().model_copy(update={"abi": list(ERC20_ABI)}), Mock()) == 1
+
+
+def test_remembered_results_cannot_be_changed_by_callers():
+    """Test that mutating a returned result does not change what later reads see."""
+    snapshot = ReadSnapshot(Mock(return_value=7))
+    first = snapshot.read(balance_call(), lambda block_number: [1, [2, 3]])
+    first[1].append(4)
+
+    second = snapshot.read(balance_call(), Mock())
+    second.append(5)
+
+    assert snapshot.read(balance_call(), Mock()) == [1, [2, 3]]
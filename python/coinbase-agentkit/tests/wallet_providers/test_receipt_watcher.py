@@ -0,0 +1,167 @@
+"""Tests for block-paced receipt polling."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from coinbase_agentkit.network import base_sepolia
+from coinbase_agentkit.wallet_providers import receipt_watcher
+from coinbase_agentkit.wallet_providers.receipt_watcher import ReceiptWatcher, get_receipt_watcher
+
+TX_HASH = "0x" + "aa" * 32
+OTHER_TX_HASH = "0x" + "bb" * 32
+
+
+def mock_receipt(tx_hash):
+    """Create a raw JSON-RPC receipt."""
+    return {"transactionHash": tx_hash, "blockNumber": "0x10", "status": "0x1", "gasUsed": "0x5208"}
+
+
+@pytest.fixture
+def web3():
+    """Create a mock web3 instance that mines transactions listed in ``mined``."""
+    w3 = Mock()
+    w3.eth.block_number = 16
+    w3.mined = set()
+    w3.provider.make_batch_request.side_effect = lambda requests: [
+        {"result": mock_receipt(params[0]) if params[0] in w3.mined else None}
+        for _, params in requests
+    ]
+    return w3
+
+
+@pytest.fixture
+def no_thread():
+    """Keep the watcher from starting its polling thread so tests can poll by hand."""
+    with patch.object(receipt_watcher.threading, "Thread"):
+        yield
+
+
+@pytest.mark.usefixtures("no_thread")
+def test_poll_batches_pending_receipts(web3):
+    """Test that all pending hashes are fetched in one batch and resolved together."""
+    watcher = ReceiptWatcher(web3)
+    futures = [watcher.watch(TX_HASH), watcher.watch(OTHER_TX_HASH)]
+    web3.mined.update({TX_HASH, OTHER_TX_HASH})
+
+    watcher._poll()
+
+    web3.provider.make_batch_request.assert_called_once()
+    assert len(web3.provider.make_batch_request.call_args.args[0]) == 2
+    receipts = [future.result(timeout=0) for future in futures]
+    assert [receipt["gasUsed"] for receipt in receipts] == [21000, 21000]
+    assert receipts[0].status == 1
+
+
+@pytest.mark.usefixtures("no_thread")
+def test_poll_once_per_block(web3):
+    """Test that receipts are only refetched after a new block."""
+    watcher = ReceiptWatcher(web3)
+    future = watcher.watch(TX_HASH)
+
+    watcher._poll()
+    watcher._poll()
+    assert web3.provider.make_batch_request.call_count == 1
+
+    web3.mined.add(TX_HASH)
+    web3.eth.block_number = 17
+    watcher._poll()
+
+    assert web3.provider.make_batch_request.call_count == 2
+    assert future.result(timeout=0)["blockNumber"] == 16
+
+
+@pytest.mark.usefixtures("no_thread")
+def test_new_hash_checked_without_new_block(web3):
+    """Test that a newly watched hash is checked even if no block arrived since the last poll."""
+    watcher = ReceiptWatcher(web3)
+    watcher.watch(TX_HASH)
+    watcher._poll()
+
+    web3.mined.add(OTHER_TX_HASH)
+    future = watcher.watch(OTHER_TX_HASH)
+    watcher._poll()
+
+    assert future.done()
+
+
+@pytest.mark.usefixtures("no_thread")
+def test_poll_without_receipt_formatter(monkeypatch, web3):
+    """Test that receipts are fetched through the public API if web3's formatter is unavailable."""
+    monkeypatch.setattr(receipt_watcher, "receipt_formatter", None)
+
+    def get_transaction_receipt(tx_hash):
+        if tx_hash not in web3.mined:
+            raise TransactionNotFound(tx_hash)
+        return AttributeDict({"transactionHash": tx_hash, "status": 1})
+
+    web3.eth.get_transaction_receipt.side_effect = get_transaction_receipt
+    watcher = ReceiptWatcher(web3)
+    futures = [watcher.watch(TX_HASH), watcher.watch(OTHER_TX_HASH)]
+    web3.mined.add(TX_HASH)
+
+    watcher._poll()
+
+    web3.provider.make_batch_request.assert_not_called()
+    assert futures[0].result(timeout=0).status == 1
+    assert not futures[1].done()
+
+
+@pytest.mark.usefixtures("no_thread")
+def test_same_hash_shares_future(web3):
+    """Test that waiters on the same transaction share one pending entry."""
+    watcher = ReceiptWatcher(web3)
+
+    assert watcher.watch(TX_HASH) is watcher.watch(bytes.fromhex("aa" * 32))
+
+
+@pytest.mark.usefixtures("no_thread")
+def test_expire_fails_overdue_waiters(web3):
+    """Test that a hash past its deadline fails with TimeExhausted and stops being polled."""
+    watcher = ReceiptWatcher(web3)
+    future = watcher.watch(TX_HASH, timeout=0)
+
+    watcher._expire()
+
+    with pytest.raises(TimeExhausted):
+        future.result(timeout=0)
+    watcher._poll()
+    assert web3.provider.make_batch_request.call_args.args[0] == []
+
+
+def test_wait(web3):
+    """Test waiting for a receipt through the polling thread."""
+    web3.mined.add(TX_HASH)
+    watcher = ReceiptWatcher(web3, block_time=0.1)
+
+    assert watcher.wait(TX_HASH, timeout=5)["status"] == 1
+
+
+def test_wait_timeout(web3):
+    """Test that waiting for a transaction that is never mined raises TimeExhausted."""
+    watcher = ReceiptWatcher(web3, block_time=0.1)
+
+    with pytest.raises(TimeExhausted):
+        watcher.wait(TX_HASH, timeout=0.2)
+
+
+def test_async_wait(web3):
+    """Test waiting for a receipt without blocking the event loop."""
+    web3.mined.add(TX_HASH)
+    watcher = ReceiptWatcher(web3, block_time=0.1)
+
+    assert asyncio.run(watcher.async_wait(TX_HASH, timeout=5))["status"] == 1
+
+
+def test_get_receipt_watcher_shared_per_chain(monkeypatch, web3):
+    """Test that wallet providers on the same chain share a watcher paced by its block time."""
+    monkeypatch.setattr(receipt_watcher, "_receipt_watchers", {})
+
+    watcher = get_receipt_watcher(base_sepolia, web3)
+
+    assert get_receipt_watcher(base_sepolia, Mock()) is watcher
+    assert watcher.poll_interval == base_sepolia.block_time / 4
+    assert list(receipt_watcher._receipt_watchers) == [84532]
@@ -0,0 +1,207 @@
+"""Tests for the RPC endpoint pool."""
+
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ReadTimeout
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+from web3 import AsyncWeb3, Web3
+
+from coinbase_agentkit.network import base_sepolia
+from coinbase_agentkit.wallet_providers import rpc_pool
+from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmRpcConfig
+from coinbase_agentkit.wallet_providers.rpc_pool import (
+    AsyncRpcPoolProvider,
+    RpcPoolProvider,
+    get_rpc_pool,
+    get_rpc_urls,
+)
+
+FAST_URL = "https://fast.example"
+SLOW_URL = "https://slow.example"
+RESPONSE = {"jsonrpc": "2.0", "id": 0, "result": "0x10"}
+RATE_LIMITED = {"jsonrpc": "2.0", "id": 0, "error": {"code": -32005, "message": "limit exceeded"}}
+
+
+def create_pool(**kwargs) -> RpcPoolProvider:
+    """Create a pool of two endpoints whose providers are mocks."""
+    pool = RpcPoolProvider([SLOW_URL, FAST_URL], **kwargs)
+    for endpoint in pool.endpoints:
+        endpoint.provider = Mock()
+        endpoint.provider.make_request.return_value = RESPONSE
+    return pool
+
+
+def providers(pool: RpcPoolProvider) -> tuple[Mock, Mock]:
+    """Get the mock providers of the slow and fast endpoints."""
+    return pool.endpoints[0].provider, pool.endpoints[1].provider
+
+
+def test_routes_to_lowest_latency_endpoint():
+    """Test that requests go to the endpoint with the lowest measured latency."""
+    pool = create_pool()
+    pool.endpoints[0].latency = 0.5
+    pool.endpoints[1].latency = 0.05
+    slow, fast = providers(pool)
+
+    assert pool.make_request("eth_blockNumber", []) == RESPONSE
+    fast.make_request.assert_called_once_with("eth_blockNumber", [])
+    slow.make_request.assert_not_called()
+    assert pool.endpoint_uri == FAST_URL
+
+
+def test_fails_over_and_opens_circuit():
+    """Test that failing endpoints are skipped and taken out of rotation."""
+    pool = create_pool(failure_threshold=2, cooldown=60)
+    slow, fast = providers(pool)
+    slow.make_request.side_effect = RequestsConnectionError("refused")
+    fast.make_request.return_value = RESPONSE
+    pool.endpoints[1].latency = 1.0
+
+    for _ in range(2):
+        assert pool.make_request("eth_chainId", []) == RESPONSE
+
+    assert pool.endpoints[0].failures == 2
+    assert pool.endpoints[0].error_rate > 0
+    assert pool._rank() == [pool.endpoints[1]]
+
+    pool.make_request("eth_chainId", [])
+    assert slow.make_request.call_count == 2
+
+
+def test_circuit_closes_after_successful_probe():
+    """Test that an endpoint back from cooldown rejoins rotation after one success."""
+    pool = create_pool(failure_threshold=1, cooldown=60)
+    slow, _ = providers(pool)
+    slow.make_request.side_effect = [RequestsConnectionError("refused"), RESPONSE]
+
+    with patch.object(rpc_pool.time, "monotonic", return_value=100.0):
+        pool.make_request("eth_chainId", [])
+        assert pool.endpoints[0].open_until == 160.0
+
+    with patch.object(rpc_pool.time, "monotonic", return_value=161.0):
+        pool.endpoints[1].latency = 1.0
+        pool.make_request("eth_chainId", [])
+
+    assert pool.endpoints[0].failures == 0
+    assert pool.endpoints[0].open_until == 0.0
+
+
+def test_rate_limit_response_fails_over():
+    """Test that rate limit errors count against the endpoint and are retried elsewhere."""
+    pool = create_pool()
+    slow, fast = providers(pool)
+    slow.make_request.return_value = RATE_LIMITED
+
+    assert pool.make_request("eth_call", []) == RESPONSE
+    assert pool.endpoints[0].failures == 1
+
+    fast.make_request.return_value = RATE_LIMITED
+    assert pool.make_request("eth_call", []) == RATE_LIMITED
+
+
+def test_all_endpoints_failing_raises():
+    """Test that the last transport error is raised when no endpoint answers."""
+    pool = create_pool()
+    for provider in providers(pool):
+        provider.make_request.side_effect = RequestsConnectionError("down")
+
+    with pytest.raises(RequestsConnectionError, match="down"):
+        pool.make_request("eth_chainId", [])
+
+
+def test_hedges_slow_reads():
+    """Test that a read is also sent to the second endpoint once the first is slow."""
+    pool = create_pool(hedge_after=0.01)
+    slow, fast = providers(pool)
+    release = threading.Event()
+    slow.make_request.side_effect = lambda *args: release.wait(5) and RESPONSE
+    fast.make_request.return_value = {**RESPONSE, "result": "0x20"}
+
+    try:
+        assert pool.make_request("eth_blockNumber", [])["result"] == "0x20"
+    finally:
+        release.set()
+    fast.make_request.assert_called_once()
+
+
+def test_never_hedges_writes():
+    """Test that sending a transaction is not duplicated to a second endpoint."""
+    pool = create_pool(hedge_after=0.0)
+    slow, fast = providers(pool)
+
+    pool.make_request("eth_sendRawTransaction", ["0x00"])
+
+    assert slow.make_request.call_count + fast.make_request.call_count == 1
+
+
+def test_writes_fail_over_only_when_never_sent():
+    """Test that a write moves on after a refused connection but not after a timeout."""
+    pool = create_pool()
+    slow, fast = providers(pool)
+    pool.endpoints[1].latency = 1.0
+    refused = NewConnectionError(None, "Connection refused")
+    slow.make_request.side_effect = RequestsConnectionError(MaxRetryError(None, "/", refused))
+
+    assert pool.make_request("eth_sendRawTransaction", ["0x00"]) == RESPONSE
+    fast.make_request.assert_called_once()
+
+    slow.make_request.side_effect = ReadTimeout("timed out")
+    pool.endpoints[0].failures = 0
+    fast.make_request.reset_mock()
+    with pytest.raises(ReadTimeout):
+        pool.make_request("eth_sendRawTransaction", ["0x00"])
+    fast.make_request.assert_not_called()
+
+
+def test_already_known_transaction_is_success():
+    """Test that a node already holding the transaction answers with its hash."""
+    pool = create_pool()
+    for provider in providers(pool):
+        provider.make_request.return_value = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "error": {"code": -32000, "message": "already known"},
+        }
+
+    response = pool.make_request("eth_sendRawTransaction", ["0x1234"])
+
+    assert response == {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": Web3.to_hex(Web3.keccak(hexstr="0x1234")),
+    }
+
+
+def test_async_requests_go_through_pool():
+    """Test that async requests are ranked and failed over like sync ones."""
+    pool = create_pool()
+    slow, fast = providers(pool)
+    slow.make_request.side_effect = RequestsConnectionError("refused")
+    pool.endpoints[1].latency = 1.0
+    async_web3 = AsyncWeb3(AsyncRpcPoolProvider(pool))
+
+    assert asyncio.run(async_web3.eth.block_number) == 16
+    assert slow.make_request.call_args.args[0] == "eth_blockNumber"
+    assert fast.make_request.call_args.args[0] == "eth_blockNumber"
+    assert pool.endpoints[0].failures == 1
+
+
+def test_get_rpc_urls_prefers_overrides():
+    """Test that user URLs come first and duplicates are dropped."""
+    default_url = base_sepolia.rpc_urls["default"].http[0]
+
+    assert get_rpc_urls(base_sepolia, [FAST_URL, default_url]) == [FAST_URL, default_url]
+
+
+def test_get_rpc_pool_is_shared_per_chain_and_config(monkeypatch):
+    """Test that wallet providers with the same settings share a pool."""
+    monkeypatch.setattr(rpc_pool, "_rpc_pools", {})
+
+    pool = get_rpc_pool(base_sepolia)
+    assert get_rpc_pool(base_sepolia, EvmRpcConfig()) is pool
+    assert get_rpc_pool(base_sepolia, EvmRpcConfig(urls=[FAST_URL])) is not pool
+    assert get_rpc_pool(base_sepolia, EvmRpcConfig(urls=[FAST_URL])).endpoints[0].url == FAST_URL
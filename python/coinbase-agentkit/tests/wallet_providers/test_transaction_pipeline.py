@@ -0,0 +1,104 @@
+"""Tests for sending transaction pipelines."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit.wallet_providers.transaction_pipeline import (
+    TransactionPipelineError,
+    run_transaction_pipeline,
+)
+
+from .conftest import MOCK_OTHER_TOKEN_ADDRESS, MOCK_TOKEN_ADDRESS
+
+APPROVE = {"to": MOCK_TOKEN_ADDRESS, "data": "0x095ea7b3"}
+DEPOSIT = {"to": MOCK_OTHER_TOKEN_ADDRESS, "data": "0xb6b55f25"}
+
+
+def create_chain(receipts=None):
+    """Create send and wait mocks that record the order of calls."""
+    events = []
+    receipts = receipts or {}
+
+    def send(transaction):
+        tx_hash = f"0x{len([e for e in events if e[0] == 'send']):02x}"
+        events.append(("send", tx_hash))
+        return tx_hash
+
+    def wait(tx_hash, timeout):
+        events.append(("wait", tx_hash))
+        return receipts.get(tx_hash, {"status": 1})
+
+    return Mock(side_effect=send), Mock(side_effect=wait), events
+
+
+def test_sends_all_before_waiting():
+    """Test that every transaction is sent before any receipt is awaited."""
+    send, wait, events = create_chain()
+
+    results = run_transaction_pipeline(send, wait, [APPROVE, DEPOSIT])
+
+    assert events == [("send", "0x00"), ("send", "0x01"), ("wait", "0x00"), ("wait", "0x01")]
+    assert [result.status for result in results] == ["confirmed", "confirmed"]
+    assert [result.transaction_hash for result in results] == ["0x00", "0x01"]
+
+
+def test_waits_and_retries_dependent_transaction():
+    """Test that a transaction that cannot be sent yet is retried after earlier ones are mined."""
+    send = Mock(side_effect=["0xapprove", Exception("execution reverted: allowance"), "0xdeposit"])
+    wait = Mock(return_value={"status": 1})
+
+    results = run_transaction_pipeline(send, wait, [APPROVE, DEPOSIT])
+
+    assert send.call_count == 3
+    assert [c.args[0] for c in wait.call_args_list] == ["0xapprove", "0xdeposit"]
+    assert results[1].transaction_hash == "0xdeposit"
+
+
+def test_send_failure_skips_remaining():
+    """Test that a transaction that fails to send stops the pipeline."""
+    send = Mock(side_effect=Exception("insufficient funds"))
+    wait = Mock()
+
+    with pytest.raises(TransactionPipelineError, match="insufficient funds") as exc_info:
+        run_transaction_pipeline(send, wait, [APPROVE, DEPOSIT])
+
+    assert exc_info.value.failed_index == 0
+    assert [result.status for result in exc_info.value.results] == ["failed", "skipped"]
+    send.assert_called_once()
+    wait.assert_not_called()
+
+
+def test_revert_reported_with_later_results():
+    """Test that an earlier revert is reported along with the outcome of later transactions."""
+    send, wait, _ = create_chain(receipts={"0x00": {"status": 0}, "0x01": {"status": 0}})
+
+    with pytest.raises(TransactionPipelineError, match="Transaction 0x00 reverted") as exc_info:
+        run_transaction_pipeline(send, wait, [APPROVE, DEPOSIT])
+
+    assert exc_info.value.failed_index == 0
+    assert [result.status for result in exc_info.value.results] == ["reverted", "reverted"]
+
+
+def test_revert_before_retry_skips_dependent_transaction():
+    """Test that a dependent transaction is not retried after the transaction it waits on reverts."""
+    send = Mock(side_effect=["0xapprove", Exception("execution reverted")])
+    wait = Mock(return_value={"status": 0})
+
+    with pytest.raises(TransactionPipelineError) as exc_info:
+        run_transaction_pipeline(send, wait, [APPROVE, DEPOSIT])
+
+    assert [result.status for result in exc_info.value.results] == ["reverted", "skipped"]
+    assert send.call_count == 2
+
+
+def test_receipt_timeout_reported():
+    """Test that a transaction that is not mined in time is reported as failed."""
+    send = Mock(return_value="0xapprove")
+    wait = Mock(side_effect=Exception("Transaction 0xapprove is not in the chain"))
+
+    with pytest.raises(TransactionPipelineError, match="not in the chain") as exc_info:
+        run_transaction_pipeline(send, wait, [APPROVE], timeout=5)
+
+    wait.assert_called_once_with("0xapprove", 5)
+    assert exc_info.value.results[0].transaction_hash == "0xapprove"